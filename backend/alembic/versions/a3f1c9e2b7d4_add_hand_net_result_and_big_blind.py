@@ -0,0 +1,37 @@
+"""Add hand net result and big blind columns
+
+Revision ID: a3f1c9e2b7d4
+Revises: c6e2f8b3a1d5
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c9e2b7d4'
+down_revision: Union[str, None] = 'c6e2f8b3a1d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('poker_hands', sa.Column('net_result', sa.DECIMAL(precision=10, scale=2), nullable=True, comment="Hero's net won or lost: amounts collected (after rake) minus chips put in"))
+    op.add_column('poker_hands', sa.Column('big_blind', sa.DECIMAL(precision=10, scale=2), nullable=True, comment='Big blind size, for win rates in big blinds'))
+    # Server defaults fill the counters of existing rows; backfill-results recomputes them
+    op.add_column('hand_facts', sa.Column('big_blind_hand', sa.Boolean(), server_default=sa.false(), nullable=False, comment='Whether the hand has a stored net result and big blind'))
+    op.add_column('hand_facts', sa.Column('big_blinds_won', sa.Integer(), server_default=sa.text('0'), nullable=False, comment='Net result in thousandths of a big blind'))
+    op.add_column('daily_statistics_rollups', sa.Column('big_blind_hands', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    op.add_column('daily_statistics_rollups', sa.Column('big_blinds_won', sa.Integer(), server_default=sa.text('0'), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('daily_statistics_rollups', 'big_blinds_won')
+    op.drop_column('daily_statistics_rollups', 'big_blind_hands')
+    op.drop_column('hand_facts', 'big_blinds_won')
+    op.drop_column('hand_facts', 'big_blind_hand')
+    op.drop_column('poker_hands', 'big_blind')
+    op.drop_column('poker_hands', 'net_result')
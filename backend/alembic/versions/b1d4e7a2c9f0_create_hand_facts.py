@@ -0,0 +1,95 @@
+"""Create hand_facts table
+
+Revision ID: b1d4e7a2c9f0
+Revises: 
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b1d4e7a2c9f0'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('hand_facts',
+        sa.Column('poker_hand_id', sa.UUID(as_uuid=False), nullable=False, comment='Hand these facts were derived from'),
+        sa.Column('user_id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('platform', sa.String(length=20), nullable=False),
+        sa.Column('game_type', sa.String(length=100), nullable=True),
+        sa.Column('game_format', sa.String(length=50), nullable=True),
+        sa.Column('stakes', sa.String(length=50), nullable=True),
+        sa.Column('position', sa.String(length=20), nullable=True),
+        sa.Column('date_played', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('is_play_money', sa.Boolean(), nullable=False),
+        sa.Column('vpip', sa.Boolean(), nullable=False),
+        sa.Column('pfr', sa.Boolean(), nullable=False),
+        sa.Column('aggressive_actions', sa.Integer(), nullable=False),
+        sa.Column('passive_actions', sa.Integer(), nullable=False),
+        sa.Column('went_to_showdown', sa.Boolean(), nullable=False),
+        sa.Column('won', sa.Boolean(), nullable=False),
+        sa.Column('steal_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('attempted_steal', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_steal_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('folded_to_steal', sa.Boolean(), nullable=False),
+        sa.Column('position_three_bet_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('position_three_bet_made', sa.Boolean(), nullable=False),
+        sa.Column('position_fold_to_three_bet_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('position_fold_to_three_bet_made', sa.Boolean(), nullable=False),
+        sa.Column('three_bet_percentage_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('three_bet_percentage_made', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_three_bet_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_three_bet_made', sa.Boolean(), nullable=False),
+        sa.Column('four_bet_percentage_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('four_bet_percentage_made', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_four_bet_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_four_bet_made', sa.Boolean(), nullable=False),
+        sa.Column('cold_call_percentage_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('cold_call_percentage_made', sa.Boolean(), nullable=False),
+        sa.Column('isolation_raise_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('isolation_raise_made', sa.Boolean(), nullable=False),
+        sa.Column('c_bet_flop_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('c_bet_flop_made', sa.Boolean(), nullable=False),
+        sa.Column('c_bet_turn_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('c_bet_turn_made', sa.Boolean(), nullable=False),
+        sa.Column('c_bet_river_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('c_bet_river_made', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_c_bet_flop_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_c_bet_flop_made', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_c_bet_turn_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_c_bet_turn_made', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_c_bet_river_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('fold_to_c_bet_river_made', sa.Boolean(), nullable=False),
+        sa.Column('check_raise_flop_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('check_raise_flop_made', sa.Boolean(), nullable=False),
+        sa.Column('check_raise_turn_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('check_raise_turn_made', sa.Boolean(), nullable=False),
+        sa.Column('check_raise_river_opportunity', sa.Boolean(), nullable=False),
+        sa.Column('check_raise_river_made', sa.Boolean(), nullable=False),
+        sa.Column('winnings', sa.DECIMAL(precision=10, scale=2), nullable=False, comment='Winnings counted by basic statistics'),
+        sa.Column('investment', sa.DECIMAL(precision=10, scale=2), nullable=False, comment='Blinds, antes and voluntary investments'),
+        sa.Column('detailed_winnings', sa.DECIMAL(precision=10, scale=2), nullable=False, comment='Amount won including side pots'),
+        sa.Column('net_result', sa.DECIMAL(precision=10, scale=2), nullable=False, comment='Stored net result of the hand, or detailed winnings minus investment'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['poker_hand_id'], ['poker_hands.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('poker_hand_id')
+    )
+    op.create_index('idx_hand_facts_user_date', 'hand_facts', ['user_id', 'date_played'], unique=False)
+    op.create_index('idx_hand_facts_user_position', 'hand_facts', ['user_id', 'position'], unique=False)
+    op.create_index(op.f('ix_hand_facts_user_id'), 'hand_facts', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_hand_facts_user_date', table_name='hand_facts')
+    op.drop_index('idx_hand_facts_user_position', table_name='hand_facts')
+    op.drop_index(op.f('ix_hand_facts_user_id'), table_name='hand_facts')
+    op.drop_table('hand_facts')
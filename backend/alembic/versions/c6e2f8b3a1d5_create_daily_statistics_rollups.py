@@ -0,0 +1,54 @@
+"""Create daily_statistics_rollups table
+
+Revision ID: c6e2f8b3a1d5
+Revises: b1d4e7a2c9f0
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e2f8b3a1d5'
+down_revision: Union[str, None] = 'b1d4e7a2c9f0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('daily_statistics_rollups',
+        sa.Column('user_id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False, comment='UTC date the hands were played'),
+        sa.Column('platform', sa.String(length=20), nullable=False),
+        sa.Column('game_type', sa.String(length=100), nullable=False),
+        sa.Column('game_format', sa.String(length=50), nullable=False),
+        sa.Column('stakes', sa.String(length=50), nullable=False),
+        sa.Column('position', sa.String(length=20), nullable=False),
+        sa.Column('is_play_money', sa.Boolean(), nullable=False),
+        sa.Column('total_hands', sa.Integer(), nullable=False),
+        sa.Column('tournament_hands', sa.Integer(), nullable=False),
+        sa.Column('vpip_hands', sa.Integer(), nullable=False),
+        sa.Column('pfr_hands', sa.Integer(), nullable=False),
+        sa.Column('aggressive_actions', sa.Integer(), nullable=False),
+        sa.Column('passive_actions', sa.Integer(), nullable=False),
+        sa.Column('total_winnings', sa.DECIMAL(precision=14, scale=2), nullable=False),
+        sa.Column('showdown_hands', sa.Integer(), nullable=False),
+        sa.Column('won_showdown', sa.Integer(), nullable=False),
+        sa.Column('steal_opportunities', sa.Integer(), nullable=False),
+        sa.Column('steal_attempts', sa.Integer(), nullable=False),
+        sa.Column('fold_to_steal_opportunities', sa.Integer(), nullable=False),
+        sa.Column('fold_to_steal_count', sa.Integer(), nullable=False),
+        sa.Column('three_bet_opportunities', sa.Integer(), nullable=False),
+        sa.Column('three_bet_count', sa.Integer(), nullable=False),
+        sa.Column('fold_to_three_bet_opportunities', sa.Integer(), nullable=False),
+        sa.Column('fold_to_three_bet_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'day', 'platform', 'game_type', 'game_format', 'stakes', 'position', 'is_play_money')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_statistics_rollups')
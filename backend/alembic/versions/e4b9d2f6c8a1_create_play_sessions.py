@@ -0,0 +1,47 @@
+"""Create play_sessions table
+
+Revision ID: e4b9d2f6c8a1
+Revises: a3f1c9e2b7d4
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9d2f6c8a1'
+down_revision: Union[str, None] = 'a3f1c9e2b7d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('play_sessions',
+        sa.Column('user_id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('start_time', sa.DateTime(timezone=True), nullable=False, comment='First hand played'),
+        sa.Column('end_time', sa.DateTime(timezone=True), nullable=False, comment='Last hand played'),
+        sa.Column('total_hands', sa.Integer(), nullable=False),
+        sa.Column('vpip_hands', sa.Integer(), nullable=False),
+        sa.Column('pfr_hands', sa.Integer(), nullable=False),
+        sa.Column('aggressive_actions', sa.Integer(), nullable=False),
+        sa.Column('passive_actions', sa.Integer(), nullable=False),
+        sa.Column('total_winnings', sa.DECIMAL(precision=14, scale=2), nullable=False),
+        sa.Column('biggest_win', sa.DECIMAL(precision=10, scale=2), nullable=False),
+        sa.Column('biggest_loss', sa.DECIMAL(precision=10, scale=2), nullable=False),
+        sa.Column('id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_play_sessions_user_end', 'play_sessions', ['user_id', 'end_time'], unique=False)
+    op.create_index('idx_play_sessions_user_start', 'play_sessions', ['user_id', 'start_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_play_sessions_user_end', table_name='play_sessions')
+    op.drop_index('idx_play_sessions_user_start', table_name='play_sessions')
+    op.drop_table('play_sessions')
@@ -68,14 +68,14 @@ async def invalidate_user_cache(
         await require_permission(db, current_user.id, "admin", "cache_management")
     
     try:
-        deleted_count = await cache_service.invalidate_user_cache(user_id)
+        generation = await cache_service.invalidate_user_cache(user_id)
         
         return {
             "status": "success",
-            "message": f"Invalidated {deleted_count} cache entries for user {user_id}",
+            "message": f"Invalidated cache entries for user {user_id}",
             "data": {
                 "user_id": user_id,
-                "deleted_entries": deleted_count,
+                "cache_generation": generation,
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
         }
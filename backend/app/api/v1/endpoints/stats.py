@@ -8,22 +8,30 @@ from fastapi import APIRouter, Depends, Query, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.core.config import settings
+from app.core.database import async_session_maker
 from app.schemas.statistics import (
     StatisticsResponse,
     StatisticsSummary,
     StatisticsFilters,
     TrendData,
+    TrendOptions,
     StatisticsExportRequest,
     StatisticsExportResponse,
     StatisticsComparisonRequest,
     StatisticsComparisonResponse,
+    StatisticsPeriodComparisonRequest,
+    StatisticsPeriodComparisonResponse,
     BasicStatistics,
     AdvancedStatistics,
-    SessionStatistics
+    SessionStatistics,
+    WinningsGraph,
+    MultiTablingAnalysis
 )
 from app.schemas.common import ErrorResponse
 from app.models.user import User
 from app.services.statistics_service import StatisticsService
+from app.services.statistics_graph import DEFAULT_GRAPH_POINTS, MIN_GRAPH_POINTS
 from app.services.cache_service import get_stats_cache, StatisticsCacheService
 
 router = APIRouter()
@@ -70,11 +78,16 @@ async def get_statistics(
     try:
         # Initialize statistics service with caching
         cache_service = await get_stats_cache()
-        stats_service = StatisticsService(db, cache_service)
+        stats_service = StatisticsService(
+            db,
+            cache_service,
+            session_factory=async_session_maker if settings.STATISTICS_CONCURRENT_COMPONENTS else None,
+            refresh_session_factory=async_session_maker if settings.STATISTICS_STALE_WHILE_REVALIDATE else None
+        )
         
         # Calculate comprehensive statistics with filtering and caching
         return await stats_service.calculate_filtered_statistics(current_user.id, filters)
-        
+    
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -98,14 +111,16 @@ async def get_statistics_summary(
     Returns essential statistics, recent session data, and trending metrics for dashboard display.
     """
     try:
-        # Initialize statistics service
+        # Initialize statistics service and load the user's hands once for every calculation below
         stats_service = StatisticsService(db)
+        snapshot = await stats_service.load_snapshot(current_user.id)
+        hands = snapshot.hands if snapshot else None
         
         # Calculate basic statistics for summary
-        basic_stats = await stats_service.calculate_basic_statistics(current_user.id)
+        basic_stats = await stats_service.calculate_basic_statistics(current_user.id, hands=hands)
         
         # Calculate positional statistics to find best/worst positions
-        positional_stats = await stats_service.calculate_positional_statistics(current_user.id)
+        positional_stats = await stats_service.calculate_positional_statistics(current_user.id, hands=hands)
         
         # Find best and worst positions by win rate
         best_position = None
@@ -117,18 +132,21 @@ async def get_statistics_summary(
             worst_position = worst_pos.position
         
         # Get recent session statistics
+        recent_start = datetime.now(timezone.utc) - timedelta(days=30)
         recent_sessions = await stats_service.calculate_session_statistics(
             current_user.id,
             StatisticsFilters(
-                start_date=datetime.now(timezone.utc) - timedelta(days=30)
-            )
+                start_date=recent_start
+            ),
+            hands=snapshot.played_since(recent_start) if snapshot else None
         )
         
         # Get trend analysis for key metrics
         trends = await stats_service.calculate_performance_trends(
             current_user.id,
             period="30d",
-            metrics=["vpip", "pfr", "win_rate", "aggression_factor"]
+            metrics=["vpip", "pfr", "win_rate", "aggression_factor"],
+            hands=hands
         )
         
         # Categorize trending metrics
@@ -154,7 +172,7 @@ async def get_statistics_summary(
             trending_up=trending_up,
             trending_down=trending_down
         )
-        
+    
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -164,8 +182,9 @@ async def get_statistics_summary(
 
 @router.get("/trends", response_model=List[TrendData], responses={400: {"model": ErrorResponse}})
 async def get_performance_trends(
-    period: str = Query("30d", pattern="^(7d|30d|90d|1y)$", description="Time period for trends"),
+    period: str = Query("30d", pattern="^(7d|30d|90d|1y|all)$", description="Time period for trends"),
     metrics: List[str] = Query(["vpip", "pfr", "win_rate"], description="Metrics to analyze trends for"),
+    options: TrendOptions = Depends(),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> List[TrendData]:
@@ -174,28 +193,39 @@ async def get_performance_trends(
     
     Analyzes trends for specified metrics over the given time period with statistical significance testing.
     
-    - **period**: Time period (7d, 30d, 90d, 1y)
+    - **period**: Time period (7d, 30d, 90d, 1y, or all for the whole history)
     - **metrics**: List of metrics to analyze trends for (vpip, pfr, win_rate, aggression_factor, etc.)
+    - **interval_days**: Days per data point (defaults to 1, 3, 7, 14 and 7 days by period)
+    - **rolling_window**: Add a hand-weighted rolling average over this many data points
+    - **ewma_span**: Add a hand-weighted exponentially weighted moving average with this span
+    - **change_points**: Detect the dates where the metric's level shifted
     
     Returns trend analysis including:
     - Data points over time
     - Trend direction (up, down, stable)
     - Trend strength (0-1)
     - Statistical significance
+    - With any of the series options, the least-squares slope per interval and its p-value
     """
     try:
-        # Initialize statistics service
-        stats_service = StatisticsService(db)
+        # Initialize statistics service with caching
+        cache_service = await get_stats_cache()
+        stats_service = StatisticsService(
+            db,
+            cache_service,
+            refresh_session_factory=async_session_maker if settings.STATISTICS_STALE_WHILE_REVALIDATE else None
+        )
         
         # Calculate performance trends
         trends = await stats_service.calculate_performance_trends(
             current_user.id,
             period=period,
-            metrics=metrics
+            metrics=metrics,
+            options=options
         )
         
         return trends
-        
+    
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -215,9 +245,10 @@ async def get_session_statistics(
     db: AsyncSession = Depends(get_db)
 ) -> List[SessionStatistics]:
     """
-    Get session-based statistics grouped by date.
+    Get statistics for each play session.
     
-    Returns statistics for each playing session (grouped by date) with filtering support.
+    A play session is a run of hands without a long idle gap. Returns statistics
+    for each session, most recent first, with filtering support.
     
     - **start_date**: Filter sessions from this date
     - **end_date**: Filter sessions until this date
@@ -233,7 +264,7 @@ async def get_session_statistics(
         sessions = await stats_service.calculate_session_statistics(current_user.id, filters)
         
         return sessions
-        
+    
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -241,6 +272,71 @@ async def get_session_statistics(
         )
 
 
+@router.get("/graph", response_model=WinningsGraph, responses={400: {"model": ErrorResponse}})
+async def get_winnings_graph(
+    filters: StatisticsFilters = Depends(),
+    points: int = Query(DEFAULT_GRAPH_POINTS, ge=MIN_GRAPH_POINTS, le=2000, description="Points per line"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> WinningsGraph:
+    """
+    Get the cumulative winnings graph with red line / blue line split.
+    
+    Hands are streamed once in date order; each line is downsampled to at most
+    the requested number of points, so the response size does not grow with
+    the number of hands.
+    
+    - **points**: Points per line (3-2000)
+    - **start_date**: Filter from this date
+    - **end_date**: Filter until this date
+    - **platform**: Filter by poker platform
+    - **game_type**: Filter by game type
+    - **game_format**: Filter by game format
+    """
+    try:
+        stats_service = StatisticsService(db)
+        
+        return await stats_service.calculate_winnings_graph(current_user.id, filters, points)
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error calculating winnings graph: {str(e)}"
+        )
+
+
+@router.get("/multitabling", response_model=MultiTablingAnalysis, responses={400: {"model": ErrorResponse}})
+async def get_multitabling_analysis(
+    filters: StatisticsFilters = Depends(),
+    timeline: bool = Query(False, description="Include the number of open tables over time"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> MultiTablingAnalysis:
+    """
+    Get how many tables were played at once, with hands per hour and win rate per table count.
+    
+    Tables are cash game tables and tournaments; a table counts as closed after
+    being idle for the configured number of minutes.
+    
+    - **timeline**: Include the open-table timeline (can be long for a full history)
+    - **start_date**: Filter from this date
+    - **end_date**: Filter until this date
+    - **platform**: Filter by poker platform
+    - **game_type**: Filter by game type
+    - **game_format**: Filter by game format
+    """
+    try:
+        stats_service = StatisticsService(db)
+        
+        return await stats_service.calculate_multitabling(current_user.id, filters, timeline)
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error calculating multi-tabling analysis: {str(e)}"
+        )
+
+
 @router.post("/export", response_model=StatisticsExportResponse, responses={400: {"model": ErrorResponse}})
 async def export_statistics(
     request: StatisticsExportRequest,
@@ -281,9 +377,73 @@ async def compare_statistics(
     - **base_period**: Base period filters for comparison
     - **comparison_period**: Comparison period filters
     - **metrics**: Metrics to compare between periods
+    
+    The base period and the comparison period share one read of the hands unless
+    they are already cached. Changes of VPIP, PFR and went to showdown are tested
+    for statistical significance.
     """
-    # TODO: Implement statistics comparison
-    raise HTTPException(
-        status_code=status.HTTP_501_NOT_IMPLEMENTED,
-        detail="Statistics comparison not implemented"
-    )
\ No newline at end of file
+    try:
+        cache_service = await get_stats_cache()
+        stats_service = StatisticsService(
+            db,
+            cache_service,
+            session_factory=async_session_maker if settings.STATISTICS_CONCURRENT_COMPONENTS else None,
+            refresh_session_factory=async_session_maker if settings.STATISTICS_STALE_WHILE_REVALIDATE else None
+        )
+        
+        return await stats_service.compare_statistics(
+            current_user.id, request.base_period, request.comparison_period, request.metrics
+        )
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error comparing statistics: {str(e)}"
+        )
+
+
+@router.post(
+    "/compare/periods",
+    response_model=StatisticsPeriodComparisonResponse,
+    responses={400: {"model": ErrorResponse}}
+)
+async def compare_statistics_periods(
+    request: StatisticsPeriodComparisonRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> StatisticsPeriodComparisonResponse:
+    """
+    Compare statistics across several periods, each against the one before it.
+    
+    Periods that differ only in their dates, such as the months of a year, are
+    calculated from one shared read of the hands; cached periods are reused.
+    
+    - **periods**: Period filters in display order (2 to 36)
+    - **metrics**: Metrics to compare between periods
+    """
+    try:
+        cache_service = await get_stats_cache()
+        stats_service = StatisticsService(
+            db,
+            cache_service,
+            session_factory=async_session_maker if settings.STATISTICS_CONCURRENT_COMPONENTS else None,
+            refresh_session_factory=async_session_maker if settings.STATISTICS_STALE_WHILE_REVALIDATE else None
+        )
+        
+        return await stats_service.compare_periods(current_user.id, request.periods, request.metrics)
+    
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error comparing statistics: {str(e)}"
+        )
\ No newline at end of file
@@ -51,6 +51,18 @@ class Settings:
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
+    # Entries each worker keeps in its in-process cache in front of Redis (0 disables the local tier)
+    CACHE_LOCAL_MAX_ENTRIES: int = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "1024"))
+    # Total serialized size in bytes of the entries each worker keeps in process memory
+    CACHE_LOCAL_MAX_BYTES: int = int(os.getenv("CACHE_LOCAL_MAX_BYTES", str(64 * 1024 * 1024)))
+    # Seconds an entry is served from process memory at most before Redis is read again
+    CACHE_LOCAL_TTL_SECONDS: int = int(os.getenv("CACHE_LOCAL_TTL_SECONDS", "60"))
+    # Serializer of cache values: orjson, msgpack or json (orjson and msgpack fall back to json when not installed)
+    CACHE_CODEC: str = os.getenv("CACHE_CODEC", "orjson")
+    # Compression of large cache values: none, zlib, zstd or lz4 (zstd and lz4 need their packages)
+    CACHE_COMPRESSION: str = os.getenv("CACHE_COMPRESSION", "zlib")
+    # Serialized size in bytes from which cache values are compressed
+    CACHE_COMPRESSION_MIN_BYTES: int = int(os.getenv("CACHE_COMPRESSION_MIN_BYTES", "4096"))
     
     # CORS
     @property
@@ -81,6 +93,38 @@ class Settings:
     # File Upload
     MAX_FILE_SIZE: int = int(os.getenv("MAX_FILE_SIZE", "10485760"))  # 10MB default
     
+    # Statistics
+    # Read statistics from the precomputed hand_facts table (run `manage_db.py backfill-facts` first)
+    STATISTICS_USE_HAND_FACTS: bool = os.getenv("STATISTICS_USE_HAND_FACTS", "false").lower() == "true"
+    # Read date-ranged statistics from daily rollups (run `manage_db.py rebuild-rollups` first)
+    STATISTICS_USE_DAILY_ROLLUPS: bool = os.getenv("STATISTICS_USE_DAILY_ROLLUPS", "false").lower() == "true"
+    # Backend for statistics computed from loaded hands: "python" (per-hand loop) or "numpy" (vectorized)
+    STATISTICS_BACKEND: str = os.getenv("STATISTICS_BACKEND", "python").lower()
+    # Stream hands for statistics in chunks of this size from a server-side cursor (0 disables streaming)
+    STATISTICS_STREAM_CHUNK_SIZE: int = int(os.getenv("STATISTICS_STREAM_CHUNK_SIZE", "0"))
+    # Most hands loaded once for all the calculators of a summary or export request; users with more are queried per calculator
+    STATISTICS_SNAPSHOT_MAX_HANDS: int = int(os.getenv("STATISTICS_SNAPSHOT_MAX_HANDS", "100000"))
+    # Compute basic, advanced, positional and tournament statistics concurrently on separate sessions
+    STATISTICS_CONCURRENT_COMPONENTS: bool = os.getenv("STATISTICS_CONCURRENT_COMPONENTS", "false").lower() == "true"
+    # Answer filtered statistics by merging cached breakdowns over position, format, platform and play money
+    STATISTICS_FILTER_LATTICE: bool = os.getenv("STATISTICS_FILTER_LATTICE", "false").lower() == "true"
+    # Answer filtered statistics from an in-memory bitmap index of each recent user's hands
+    STATISTICS_HAND_INDEX: bool = os.getenv("STATISTICS_HAND_INDEX", "false").lower() == "true"
+    # Users whose hand indexes are kept in memory per process
+    STATISTICS_HAND_INDEX_MAX_USERS: int = int(os.getenv("STATISTICS_HAND_INDEX_MAX_USERS", "32"))
+    # Total estimated size of the hand indexes kept in memory per process; larger indexes are not kept
+    STATISTICS_HAND_INDEX_MAX_BYTES: int = int(os.getenv("STATISTICS_HAND_INDEX_MAX_BYTES", str(512 * 1024 * 1024)))
+    # Idle minutes between two hands that end one play session and start the next
+    STATISTICS_SESSION_GAP_MINUTES: int = int(os.getenv("STATISTICS_SESSION_GAP_MINUTES", "30"))
+    # Idle minutes after which a table counts as closed in the multi-tabling analysis
+    STATISTICS_TABLE_IDLE_MINUTES: int = int(os.getenv("STATISTICS_TABLE_IDLE_MINUTES", "10"))
+    # Read session lists and daily views from the play_sessions table (run `manage_db.py rebuild-sessions` first)
+    STATISTICS_USE_PLAY_SESSIONS: bool = os.getenv("STATISTICS_USE_PLAY_SESSIONS", "false").lower() == "true"
+    # Seconds a worker's lock on a statistics calculation lasts; other workers wait this long for its result
+    STATISTICS_COALESCE_LOCK_SECONDS: float = float(os.getenv("STATISTICS_COALESCE_LOCK_SECONDS", "30"))
+    # Serve cached statistics and trends past their TTL while a background task refreshes them
+    STATISTICS_STALE_WHILE_REVALIDATE: bool = os.getenv("STATISTICS_STALE_WHILE_REVALIDATE", "true").lower() == "true"
+    
     # AI Provider Configuration (Development)
     # These are for local development and testing only
     # In production, users provide their own API keys
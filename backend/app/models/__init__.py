@@ -3,8 +3,10 @@ Database models for Professional Poker Analyzer.
 """
 from .user import User
 from .hand import PokerHand
+from .hand_facts import HandFacts
 from .analysis import AnalysisResult
-from .statistics import StatisticsCache
+from .statistics import StatisticsCache, DailyStatisticsRollup
+from .play_session import PlaySession
 from .monitoring import FileMonitoring
 from .file_processing import FileProcessingTask, ProcessingStatus
 from .rbac import Role, Permission, UserRole
@@ -20,8 +22,11 @@ from .encyclopedia import (
 __all__ = [
     "User",
     "PokerHand", 
+    "HandFacts",
     "AnalysisResult",
     "StatisticsCache",
+    "DailyStatisticsRollup",
+    "PlaySession",
     "FileMonitoring",
     "FileProcessingTask",
     "ProcessingStatus",
@@ -129,6 +129,16 @@ class PokerHand(Base, UUIDMixin, TimestampMixin):
         comment="Jackpot contribution amount"
     )
     
+    net_result: Mapped[Optional[Decimal]] = mapped_column(
+        DECIMAL(10, 2),
+        comment="Hero's net won or lost: amounts collected (after rake) minus chips put in"
+    )
+    
+    big_blind: Mapped[Optional[Decimal]] = mapped_column(
+        DECIMAL(10, 2),
+        comment="Big blind size, for win rates in big blinds"
+    )
+    
     # Tournament and cash game specific data
     tournament_info: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         JSON,
@@ -174,15 +184,17 @@ class PokerHand(Base, UUIDMixin, TimestampMixin):
         comment="Whether this is a play money game"
     )
     
-    # Raw hand history text for reference
+    # Raw hand history text for reference; deferred since only encryption reads it
     raw_text: Mapped[Optional[str]] = mapped_column(
         Text,
+        deferred=True,
         comment="Original hand history text"
     )
     
     # Relationships
     user = relationship("User", back_populates="poker_hands")
     analysis_results = relationship("AnalysisResult", back_populates="hand", cascade="all, delete-orphan")
+    facts = relationship("HandFacts", back_populates="hand", uselist=False, cascade="all, delete-orphan")
     
     # Constraints
     __table_args__ = (
@@ -0,0 +1,153 @@
+"""
+Hand facts model storing per-hand statistics flags derived at ingest time.
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import String, Integer, Boolean, DateTime, DECIMAL, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .base import Base, TimestampMixin
+
+
+class HandFacts(Base, TimestampMixin):
+    """
+    Narrow per-hand table of precomputed statistics flags and amounts.
+    
+    One row per poker hand, written alongside the hand at ingest. Filter columns
+    are copied from the hand so statistics can be answered with SUM/COUNT
+    aggregates over this table without reading the actions JSON.
+    """
+    
+    __tablename__ = "hand_facts"
+    
+    poker_hand_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("poker_hands.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Hand these facts were derived from"
+    )
+    
+    user_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    
+    # Filter columns copied from the hand
+    platform: Mapped[str] = mapped_column(String(20), nullable=False)
+    game_type: Mapped[Optional[str]] = mapped_column(String(100))
+    game_format: Mapped[Optional[str]] = mapped_column(String(50))
+    stakes: Mapped[Optional[str]] = mapped_column(String(50))
+    position: Mapped[Optional[str]] = mapped_column(String(20))
+    date_played: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    is_play_money: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    
+    # Basic statistics flags
+    vpip: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    pfr: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    aggressive_actions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    passive_actions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    went_to_showdown: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    won: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    steal_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    attempted_steal: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_steal_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    folded_to_steal: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    
+    # Positional 3-bet flags
+    position_three_bet_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    position_three_bet_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    position_fold_to_three_bet_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    position_fold_to_three_bet_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    
+    # Advanced statistics as (opportunity, made) pairs
+    three_bet_percentage_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    three_bet_percentage_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_three_bet_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_three_bet_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    four_bet_percentage_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    four_bet_percentage_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_four_bet_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_four_bet_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    cold_call_percentage_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    cold_call_percentage_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    isolation_raise_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    isolation_raise_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    c_bet_flop_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    c_bet_flop_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    c_bet_turn_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    c_bet_turn_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    c_bet_river_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    c_bet_river_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_c_bet_flop_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_c_bet_flop_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_c_bet_turn_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_c_bet_turn_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_c_bet_river_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    fold_to_c_bet_river_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    check_raise_flop_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    check_raise_flop_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    check_raise_turn_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    check_raise_turn_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    check_raise_river_opportunity: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    check_raise_river_made: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    
+    # Amounts
+    winnings: Mapped[Decimal] = mapped_column(
+        DECIMAL(10, 2),
+        default=Decimal('0.0'),
+        nullable=False,
+        comment="Winnings counted by basic statistics"
+    )
+    
+    investment: Mapped[Decimal] = mapped_column(
+        DECIMAL(10, 2),
+        default=Decimal('0.0'),
+        nullable=False,
+        comment="Blinds, antes and voluntary investments"
+    )
+    
+    detailed_winnings: Mapped[Decimal] = mapped_column(
+        DECIMAL(10, 2),
+        default=Decimal('0.0'),
+        nullable=False,
+        comment="Amount won including side pots"
+    )
+    
+    net_result: Mapped[Decimal] = mapped_column(
+        DECIMAL(10, 2),
+        default=Decimal('0.0'),
+        nullable=False,
+        comment="Stored net result of the hand, or detailed winnings minus investment"
+    )
+    
+    # Win rate in big blinds
+    big_blind_hand: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        nullable=False,
+        comment="Whether the hand has a stored net result and big blind"
+    )
+    
+    big_blinds_won: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Net result in thousandths of a big blind"
+    )
+    
+    # Relationships
+    hand = relationship("PokerHand", back_populates="facts")
+    
+    # Constraints
+    __table_args__ = (
+        Index("idx_hand_facts_user_date", "user_id", "date_played"),
+        Index("idx_hand_facts_user_position", "user_id", "position"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<HandFacts(poker_hand_id={self.poker_hand_id}, user_id={self.user_id})>"
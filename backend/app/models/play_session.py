@@ -0,0 +1,51 @@
+"""
+Play session model storing gap-based sessions of a user's hands.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import Integer, DateTime, DECIMAL, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, TimestampMixin, UUIDMixin
+
+
+class PlaySession(Base, UUIDMixin, TimestampMixin):
+    """
+    A run of a user's hands without an idle gap longer than the session gap.
+    
+    Rows are maintained at ingest by merging each batch of hands into the stored
+    sessions next to it. Counter columns are named after the session statistics
+    counters, so session lists and daily views are answered without regrouping
+    the hands.
+    """
+    
+    __tablename__ = "play_sessions"
+    
+    user_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    
+    start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="First hand played")
+    end_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="Last hand played")
+    
+    # Session statistics counters; total_hands is the session's hand count
+    total_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    vpip_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    pfr_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    aggressive_actions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    passive_actions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_winnings: Mapped[Decimal] = mapped_column(DECIMAL(14, 2), default=Decimal('0.0'), nullable=False)
+    biggest_win: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), default=Decimal('0.0'), nullable=False)
+    biggest_loss: Mapped[Decimal] = mapped_column(DECIMAL(10, 2), default=Decimal('0.0'), nullable=False)
+    
+    __table_args__ = (
+        Index("idx_play_sessions_user_start", "user_id", "start_time"),
+        Index("idx_play_sessions_user_end", "user_id", "end_time"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<PlaySession(id={self.id}, user_id={self.user_id}, start_time={self.start_time}, hands={self.total_hands})>"
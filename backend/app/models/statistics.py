@@ -1,10 +1,11 @@
 """
-Statistics cache model for storing computed poker statistics.
+Statistics cache and rollup models for storing computed poker statistics.
 """
-from datetime import datetime
+from datetime import datetime, date
+from decimal import Decimal
 from typing import Dict, Any
 
-from sqlalchemy import String, ForeignKey, DateTime, UniqueConstraint, Index, JSON
+from sqlalchemy import String, ForeignKey, DateTime, Date, Integer, Boolean, DECIMAL, UniqueConstraint, Index, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -62,4 +63,57 @@ class StatisticsCache(Base, UUIDMixin, TimestampMixin):
     )
     
     def __repr__(self) -> str:
-        return f"<StatisticsCache(id={self.id}, user_id={self.user_id}, stat_type={self.stat_type})>"
\ No newline at end of file
+        return f"<StatisticsCache(id={self.id}, user_id={self.user_id}, stat_type={self.stat_type})>"
+
+
+class DailyStatisticsRollup(Base):
+    """
+    Mergeable statistics counters per user, UTC day and filter dimensions.
+    
+    Rows are summed from hand_facts when hands are ingested. Counter columns are
+    named after the statistics service counters, so a date range is answered by
+    summing rows. Missing dimension values are stored as empty strings to keep
+    the primary key usable for upserts.
+    """
+    
+    __tablename__ = "daily_statistics_rollups"
+    
+    # Rollup key
+    user_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True, comment="UTC date the hands were played")
+    platform: Mapped[str] = mapped_column(String(20), primary_key=True)
+    game_type: Mapped[str] = mapped_column(String(100), primary_key=True, default="")
+    game_format: Mapped[str] = mapped_column(String(50), primary_key=True, default="")
+    stakes: Mapped[str] = mapped_column(String(50), primary_key=True, default="")
+    position: Mapped[str] = mapped_column(String(20), primary_key=True, default="")
+    is_play_money: Mapped[bool] = mapped_column(Boolean, primary_key=True, default=False)
+    
+    # Basic statistics counters
+    total_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    tournament_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    vpip_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    pfr_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    aggressive_actions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    passive_actions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_winnings: Mapped[Decimal] = mapped_column(DECIMAL(14, 2), default=Decimal('0.0'), nullable=False)
+    showdown_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    won_showdown: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    steal_opportunities: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    steal_attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    fold_to_steal_opportunities: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    fold_to_steal_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    big_blind_hands: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    big_blinds_won: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    
+    # Positional 3-bet counters
+    three_bet_opportunities: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    three_bet_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    fold_to_three_bet_opportunities: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    fold_to_three_bet_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<DailyStatisticsRollup(user_id={self.user_id}, day={self.day}, position={self.position})>"
@@ -130,6 +130,8 @@ class HandCreate(HandBase):
     pot_size: Optional[Decimal] = Field(None, ge=0, description="Total pot size")
     rake: Optional[Decimal] = Field(None, ge=0, description="Rake amount")
     jackpot_contribution: Optional[Decimal] = Field(None, ge=0, description="Jackpot contribution")
+    net_result: Optional[Decimal] = Field(None, description="Hero's net won or lost, after rake")
+    big_blind: Optional[Decimal] = Field(None, ge=0, description="Big blind size")
     tournament_info: Optional[TournamentInfo] = Field(None, description="Tournament information")
     cash_game_info: Optional[CashGameInfo] = Field(None, description="Cash game information")
     player_stacks: Optional[List[PlayerStack]] = Field(None, description="Player stack information")
@@ -165,6 +167,8 @@ class HandResponse(HandBase, UUIDMixin, TimestampMixin):
     pot_size: Optional[Decimal] = Field(None, description="Total pot size")
     rake: Optional[Decimal] = Field(None, description="Rake amount")
     jackpot_contribution: Optional[Decimal] = Field(None, description="Jackpot contribution")
+    net_result: Optional[Decimal] = Field(None, description="Hero's net won or lost, after rake")
+    big_blind: Optional[Decimal] = Field(None, description="Big blind size")
     tournament_info: Optional[Dict[str, Any]] = Field(None, description="Tournament information")
     cash_game_info: Optional[Dict[str, Any]] = Field(None, description="Cash game information")
     player_stacks: Optional[Dict[str, Any]] = Field(None, description="Player stack information")
@@ -96,6 +96,7 @@ class TournamentStatistics(BaseModel):
 class SessionStatistics(BaseModel):
     """Schema for session-based statistics."""
     session_date: datetime = Field(..., description="Session date")
+    session_id: Optional[str] = Field(None, description="Stored play session ID, for session reports")
     hands_played: int = Field(..., ge=0, description="Hands played in session")
     duration_minutes: int = Field(..., ge=0, description="Session duration in minutes")
     win_rate: Decimal = Field(..., description="Session win rate")
@@ -113,6 +114,21 @@ class TrendDataPoint(BaseModel):
     value: Decimal = Field(..., description="Metric value")
     hands_sample: int = Field(..., ge=0, description="Number of hands in sample")
     confidence: Optional[Decimal] = Field(None, ge=0, le=1, description="Confidence level")
+    rolling_average: Optional[Decimal] = Field(None, description="Hand-weighted rolling average ending at this point")
+    ewma: Optional[Decimal] = Field(None, description="Hand-weighted exponentially weighted moving average")
+
+
+class TrendOptions(BaseModel):
+    """Schema for the optional time-series analysis of trends."""
+    interval_days: Optional[int] = Field(None, ge=1, le=365, description="Days per data point (defaults by period)")
+    rolling_window: Optional[int] = Field(None, ge=2, le=365, description="Data points per rolling average")
+    ewma_span: Optional[int] = Field(None, ge=2, le=365, description="Span of the moving average, in data points")
+    change_points: bool = Field(False, description="Detect shifts in the metric's level")
+    
+    @property
+    def uses_series(self) -> bool:
+        """Whether the options ask for the NumPy series analysis."""
+        return bool(self.rolling_window or self.ewma_span or self.change_points)
 
 
 class TrendData(BaseModel):
@@ -123,6 +139,9 @@ class TrendData(BaseModel):
     trend_direction: str = Field(..., pattern="^(up|down|stable)$", description="Overall trend direction")
     trend_strength: Decimal = Field(..., ge=0, le=1, description="Strength of trend (0-1)")
     statistical_significance: bool = Field(..., description="Whether trend is statistically significant")
+    slope: Optional[Decimal] = Field(None, description="Hand-weighted least-squares change per interval")
+    p_value: Optional[Decimal] = Field(None, ge=0, le=1, description="Two-sided p-value of the slope")
+    change_points: Optional[List[datetime]] = Field(None, description="Dates of the data points where the metric shifted")
     
     @field_validator('trend_direction')
     @classmethod
@@ -133,6 +152,55 @@ class TrendData(BaseModel):
         return v
 
 
+class WinningsGraphPoint(BaseModel):
+    """Schema for one point of a cumulative winnings line."""
+    hand_number: int = Field(..., ge=1, description="Hand number in date order")
+    value: Decimal = Field(..., description="Cumulative net result after this hand")
+
+
+class WinningsGraph(BaseModel):
+    """Schema for the downsampled red line / blue line winnings graph."""
+    total_hands: int = Field(..., ge=0, description="Hands in the graph")
+    net_result: Decimal = Field(..., description="Net result over all hands")
+    showdown_result: Decimal = Field(..., description="Net result of hands that went to showdown")
+    non_showdown_result: Decimal = Field(..., description="Net result of hands without showdown")
+    expected_value: Decimal = Field(..., description="Mean net result per hand")
+    variance: Decimal = Field(..., ge=0, description="Variance of the per-hand net result")
+    standard_deviation: Decimal = Field(..., ge=0, description="Standard deviation of the per-hand net result")
+    total_line: List[WinningsGraphPoint] = Field(..., description="Downsampled cumulative net result")
+    showdown_line: List[WinningsGraphPoint] = Field(..., description="Downsampled cumulative showdown net result (blue line)")
+    non_showdown_line: List[WinningsGraphPoint] = Field(..., description="Downsampled cumulative non-showdown net result (red line)")
+
+
+class ConcurrencySegment(BaseModel):
+    """Schema for a stretch of time with a constant number of open tables."""
+    start: datetime = Field(..., description="Segment start")
+    end: datetime = Field(..., description="Segment end")
+    tables: int = Field(..., ge=1, description="Tables open during the segment")
+
+
+class MultiTablingBucket(BaseModel):
+    """Schema for play at one number of simultaneous tables."""
+    tables: int = Field(..., ge=1, description="Number of simultaneous tables")
+    hands: int = Field(..., ge=0, description="Hands played with this many tables open")
+    hours: Decimal = Field(..., ge=0, description="Hours with this many tables open")
+    hands_per_hour: Decimal = Field(..., ge=0, description="Hands per hour with this many tables open")
+    win_rate: Decimal = Field(..., description="Win rate with this many tables open")
+    net_result: Decimal = Field(..., description="Net result with this many tables open")
+
+
+class MultiTablingAnalysis(BaseModel):
+    """Schema for the number of tables played at once and its effect on results."""
+    total_hands: int = Field(..., ge=0, description="Hands with a known table")
+    tables_played: int = Field(..., ge=0, description="Distinct cash tables and tournaments played")
+    max_tables: int = Field(..., ge=0, description="Most tables open at once")
+    average_tables: Decimal = Field(..., ge=0, description="Time-weighted average of open tables while playing")
+    hours_played: Decimal = Field(..., ge=0, description="Hours with at least one table open")
+    hands_per_hour: Decimal = Field(..., ge=0, description="Hands per hour while playing")
+    buckets: List[MultiTablingBucket] = Field(..., description="Results by number of simultaneous tables")
+    timeline: Optional[List[ConcurrencySegment]] = Field(None, description="Open tables over time")
+
+
 class StatisticsResponse(BaseModel):
     """Schema for comprehensive statistics response."""
     basic_stats: BasicStatistics = Field(..., description="Basic poker statistics")
@@ -146,6 +214,7 @@ class StatisticsResponse(BaseModel):
     cache_expires: datetime = Field(..., description="When cached statistics expire")
     sample_size: int = Field(..., ge=0, description="Total hands in sample")
     confidence_level: Decimal = Field(..., ge=0, le=1, description="Statistical confidence level")
+    component_timings: Optional[Dict[str, float]] = Field(None, description="Seconds spent per statistics component")
 
 
 class StatisticsSummary(BaseModel):
@@ -222,4 +291,23 @@ class StatisticsComparisonResponse(BaseModel):
     significant_changes: List[Dict[str, Any]] = Field(..., description="Statistically significant changes")
     improvement_areas: List[str] = Field(..., description="Areas showing improvement")
     decline_areas: List[str] = Field(..., description="Areas showing decline")
-    recommendations: List[str] = Field(..., description="Recommendations based on comparison")
\ No newline at end of file
+    recommendations: List[str] = Field(..., description="Recommendations based on comparison")
+
+
+class StatisticsPeriodComparisonRequest(BaseModel):
+    """Schema for comparing statistics across several periods, such as consecutive months."""
+    periods: List[StatisticsFilters] = Field(..., min_length=2, max_length=36, description="Periods in display order")
+    metrics: List[str] = Field(
+        default_factory=lambda: ["vpip", "pfr", "win_rate", "aggression_factor"],
+        description="Metrics to compare"
+    )
+
+
+class StatisticsPeriodComparisonResponse(BaseModel):
+    """Schema for an N-way statistics comparison."""
+    period_stats: List[StatisticsResponse] = Field(..., description="Statistics of each period, in request order")
+    metric_values: Dict[str, List[Optional[Decimal]]] = Field(..., description="Value of each metric per period")
+    period_changes: Dict[str, List[Optional[Decimal]]] = Field(
+        ..., description="Change of each metric from the previous period; None for the first period"
+    )
+    significant_changes: List[Dict[str, Any]] = Field(..., description="Statistically significant period-over-period changes")
\ No newline at end of file
@@ -21,6 +21,8 @@ from ..models.file_processing import FileProcessingTask, ProcessingStatus
 from ..models.hand import PokerHand
 from ..schemas.hand import HandCreate
 from .hand_parser import HandParserService
+from .statistics_service import StatisticsService
+from .cache_service import get_stats_cache
 from .exceptions import HandParsingError, UnsupportedPlatformError
 
 
@@ -533,6 +535,9 @@ class BackgroundFileProcessor:
         
         try:
             async with self.db_session_factory() as session:
+                statistics_service = StatisticsService(session)
+                saved_hands = []
+                
                 for hand_data in hands:
                     try:
                         # Create PokerHand instance
@@ -556,6 +561,8 @@ class BackgroundFileProcessor:
                             pot_size=hand_data.pot_size,
                             rake=hand_data.rake,
                             jackpot_contribution=hand_data.jackpot_contribution,
+                            net_result=hand_data.net_result,
+                            big_blind=hand_data.big_blind,
                             tournament_info=hand_data.tournament_info if isinstance(hand_data.tournament_info, dict) else (hand_data.tournament_info.dict() if hand_data.tournament_info else None),
                             cash_game_info=hand_data.cash_game_info if isinstance(hand_data.cash_game_info, dict) else (hand_data.cash_game_info.dict() if hand_data.cash_game_info else None),
                             player_stacks=hand_data.player_stacks,
@@ -567,14 +574,28 @@ class BackgroundFileProcessor:
                             raw_text=hand_data.raw_text
                         )
                         
+                        # Precompute statistics facts in the same transaction as the hand
+                        poker_hand.facts = statistics_service.build_hand_facts(poker_hand)
+                        
                         session.add(poker_hand)
+                        saved_hands.append(poker_hand)
                         saved_count += 1
                         
                     except Exception as e:
                         self.logger.warning(f"Error saving hand {hand_data.hand_id}: {e}")
                         continue
                 
+                # Fold the batch's facts into the daily rollups and its hands into play sessions before committing
+                await session.flush()
+                await statistics_service.update_daily_rollups([hand.id for hand in saved_hands])
+                await statistics_service.update_play_sessions(user_id, saved_hands)
+                
                 await session.commit()
+            
+            # Move the user's cached statistics to a new generation once the hands are visible
+            if saved_hands:
+                stats_cache = await get_stats_cache()
+                await stats_cache.invalidate_user_cache(user_id)
                 
         except Exception as e:
             self.logger.error(f"Error saving hands batch: {e}")
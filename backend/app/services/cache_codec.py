@@ -0,0 +1,230 @@
+"""
+Codecs encoding cache values to bytes.
+
+A value is serialized as JSON (with orjson when installed, else the standard
+library) or as msgpack, then compressed if its payload reaches a size
+threshold. Decimals, datetimes and dates come back exactly as they went in:
+JSON payloads carry them as single-key tagged objects such as
+{"$dec": "12.50"}, msgpack payloads as extension types. Other objects
+are written as the original JSON serializer wrote them: Pydantic models and
+plain objects as their fields, anything else as its string.
+
+Every payload starts with a three-byte header naming its format and
+compression, so workers configured with different codecs read each other's
+entries, and JSON text written before codecs stays readable until it expires.
+
+orjson is a dependency, falling back to json where it is missing; msgpack,
+zstandard and lz4 are optional, and json and zlib come with Python.
+"""
+import json
+import logging
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    lz4 = None
+    LZ4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SERIALIZERS = ('json', 'orjson', 'msgpack')
+COMPRESSIONS = ('none', 'zlib', 'zstd', 'lz4')
+
+# First byte of every payload; JSON text never starts with it
+PAYLOAD_MARKER = b'\xca'
+
+# Payload formats and compressions by their header byte; json and orjson write the same format
+FORMAT_IDS = {'json': 1, 'orjson': 1, 'msgpack': 2}
+COMPRESSION_IDS = {'none': 0, 'zlib': 1, 'zstd': 2, 'lz4': 3}
+
+# Compression levels favouring speed, as cache values are written on the request path
+ZLIB_LEVEL = 1
+ZSTD_LEVEL = 3
+
+# msgpack extension type codes
+EXT_DECIMAL = 1
+EXT_DATETIME = 2
+EXT_DATE = 3
+
+# Decoders of the tagged objects standing for values JSON has no type for
+TAG_DECODERS: Dict[str, Callable[[str], Any]] = {
+    '$dec': Decimal,
+    '$dt': datetime.fromisoformat,
+    '$date': date.fromisoformat,
+}
+
+
+def _fields(obj: Any) -> Any:
+    """Serializable form of an object without a native or tagged encoding."""
+    if hasattr(obj, 'model_dump'):  # Pydantic models
+        return obj.model_dump()
+    elif hasattr(obj, '__dict__'):  # Regular objects
+        return obj.__dict__
+    return str(obj)
+
+
+def _tag(obj: Any) -> Any:
+    """JSON default hook: tag Decimals, datetimes and dates."""
+    if isinstance(obj, Decimal):
+        return {'$dec': str(obj)}
+    elif isinstance(obj, datetime):
+        return {'$dt': obj.isoformat()}
+    elif isinstance(obj, date):
+        return {'$date': obj.isoformat()}
+    return _fields(obj)
+
+
+def _untag(obj: Dict[str, Any]) -> Any:
+    """JSON object hook: the value a tagged object stands for, else the object."""
+    if len(obj) == 1:
+        for tag, text in obj.items():
+            decode = TAG_DECODERS.get(tag)
+            if decode is not None and isinstance(text, str):
+                return decode(text)
+    return obj
+
+
+def _to_ext(obj: Any) -> Any:
+    """msgpack default hook: Decimals, datetimes and dates as extension types."""
+    if isinstance(obj, Decimal):
+        return msgpack.ExtType(EXT_DECIMAL, str(obj).encode())
+    elif isinstance(obj, datetime):
+        return msgpack.ExtType(EXT_DATETIME, obj.isoformat().encode())
+    elif isinstance(obj, date):
+        return msgpack.ExtType(EXT_DATE, obj.isoformat().encode())
+    return _fields(obj)
+
+
+def _from_ext(code: int, data: bytes) -> Any:
+    """msgpack extension hook, the inverse of _to_ext."""
+    if code == EXT_DECIMAL:
+        return Decimal(data.decode())
+    elif code == EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    elif code == EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+class CacheCodec:
+    """Serializer and compression of cache values."""
+    
+    def __init__(self, serializer: str = 'orjson', compression: str = 'none', compression_min_bytes: int = 1024):
+        """
+        Args:
+            serializer: json, orjson or msgpack; orjson and msgpack fall back to json when not installed
+            compression: none, zlib, zstd or lz4; zstd and lz4 fall back to none when not installed
+            compression_min_bytes: Serialized size from which payloads are compressed
+        """
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown cache serializer {serializer!r}; expected one of {SERIALIZERS}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown cache compression {compression!r}; expected one of {COMPRESSIONS}")
+        
+        if (serializer == 'orjson' and not ORJSON_AVAILABLE) or (serializer == 'msgpack' and not MSGPACK_AVAILABLE):
+            logger.warning(f"Cache serializer {serializer} requested but not installed; using json")
+            serializer = 'json'
+        if (compression == 'zstd' and not ZSTD_AVAILABLE) or (compression == 'lz4' and not LZ4_AVAILABLE):
+            logger.warning(f"Cache compression {compression} requested but not installed; not compressing")
+            compression = 'none'
+        
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_min_bytes = compression_min_bytes
+    
+    def encode(self, value: Any) -> bytes:
+        """Serialize a value and compress it if large enough, behind the payload header."""
+        body = self._serialize(value)
+        compression = self.compression if len(body) >= self.compression_min_bytes else 'none'
+        header = PAYLOAD_MARKER + bytes((FORMAT_IDS[self.serializer], COMPRESSION_IDS[compression]))
+        return header + _compress(compression, body)
+    
+    def decode(self, payload: Union[bytes, str]) -> Any:
+        """
+        Decode a payload of any codec, or JSON text written before codecs.
+        
+        Raises:
+            ValueError: If the payload is not valid, or needs a library this process lacks;
+                corrupt compressed bodies raise the decompressor's own error
+        """
+        if isinstance(payload, str):
+            return json.loads(payload)
+        if not payload.startswith(PAYLOAD_MARKER):
+            return json.loads(payload)
+        
+        format_id, compression_id = payload[1:3]
+        body = _decompress(compression_id, payload[3:])
+        if format_id == FORMAT_IDS['json']:
+            if ORJSON_AVAILABLE and b'{"$' not in body:
+                return orjson.loads(body)
+            # orjson has no object hook, and walking its result is slower than this hook
+            return json.loads(body, object_hook=_untag)
+        if format_id == FORMAT_IDS['msgpack']:
+            if not MSGPACK_AVAILABLE:
+                raise ValueError("Cache value is msgpack but msgpack is not installed")
+            return msgpack.unpackb(body, ext_hook=_from_ext, raw=False, strict_map_key=False)
+        raise ValueError(f"Unknown cache payload format {format_id}")
+    
+    def describe(self) -> Dict[str, Any]:
+        """Serializer and compression in use."""
+        return {
+            "serializer": self.serializer,
+            "compression": self.compression,
+            "compression_min_bytes": self.compression_min_bytes,
+        }
+    
+    def _serialize(self, value: Any) -> bytes:
+        if self.serializer == 'orjson':
+            # Datetimes and dates go through _tag instead of becoming plain ISO strings
+            return orjson.dumps(value, default=_tag, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        if self.serializer == 'msgpack':
+            return msgpack.packb(value, default=_to_ext, use_bin_type=True, datetime=False)
+        return json.dumps(value, default=_tag, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def _compress(compression: str, body: bytes) -> bytes:
+    if compression == 'zlib':
+        return zlib.compress(body, ZLIB_LEVEL)
+    elif compression == 'zstd':
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    elif compression == 'lz4':
+        return lz4.frame.compress(body)
+    return body
+
+
+def _decompress(compression_id: int, body: bytes) -> bytes:
+    if compression_id == COMPRESSION_IDS['none']:
+        return body
+    elif compression_id == COMPRESSION_IDS['zlib']:
+        return zlib.decompress(body)
+    elif compression_id == COMPRESSION_IDS['zstd'] and ZSTD_AVAILABLE:
+        return zstandard.ZstdDecompressor().decompress(body)
+    elif compression_id == COMPRESSION_IDS['lz4'] and LZ4_AVAILABLE:
+        return lz4.frame.decompress(body)
+    raise ValueError(f"Cache value compression {compression_id} is unknown or not installed")
@@ -8,21 +8,41 @@ This service implements comprehensive caching strategy for:
 - User preferences
 - Hand parsing results
 """
+import asyncio
 import json
 import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union
-from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import redis.asyncio as redis
+from redis.client import NEVER_DECODE
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.schemas.statistics import StatisticsFilters
+from app.services.cache_codec import CacheCodec
+from app.services.local_cache import LocalCache
+from app.services.statistics_lattice import normalize_filters
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Cache types keyed by user ID whose keys carry the user's cache generation
+USER_NAMESPACED_TYPES = ('user_stats', 'filter_breakdown', 'session_data', 'user_preferences', 'trend_data')
+
+# Deletes a lock only if it still holds the releasing holder's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# Field of the envelope holding the wall-clock time until which a stale-while-revalidate entry is fresh
+FRESH_UNTIL_FIELD = '__fresh_until__'
+
 
 class CacheService:
     """Comprehensive Redis caching service."""
@@ -41,6 +61,14 @@ class CacheService:
             'parsing_results': 43200,  # 12 hours
             'trend_data': 1800,        # 30 minutes
             'leaderboard': 900,        # 15 minutes
+            'filter_breakdown': 3600,  # 1 hour
+        }
+        
+        # Lifetimes in Redis of types served stale while being refreshed; past
+        # their TTL above these entries are stale, past these they are gone
+        self.hard_ttl_config = {
+            'user_stats': 86400,       # 24 hours
+            'trend_data': 21600,       # 6 hours
         }
         
         # Cache key prefixes
@@ -53,7 +81,42 @@ class CacheService:
             'parsing_results': 'parse:file',
             'trend_data': 'trends:user',
             'leaderboard': 'leaderboard:global',
+            'filter_breakdown': 'stats:breakdown:user',
         }
+        
+        # Hash counting how filtered statistics requests were answered
+        self.filter_reuse_key = 'stats:filter_reuse'
+        
+        # Per-user counters; bumping one moves every per-user key of the user to a new namespace
+        self.generation_prefix = 'cache:generation:user'
+        
+        # Short-lived locks held by the worker calculating a value others wait for
+        self.lock_prefix = 'lock'
+        
+        # Hash counting requests that waited for another request's calculation
+        self.coalesced_key = 'stats:coalesced'
+
+        # Encoding of cached values to bytes
+        self.codec = CacheCodec(
+            settings.CACHE_CODEC,
+            settings.CACHE_COMPRESSION,
+            settings.CACHE_COMPRESSION_MIN_BYTES
+        )
+        
+        # Decoded values this worker read or wrote recently, in front of Redis
+        self.local_cache = LocalCache(
+            settings.CACHE_LOCAL_MAX_ENTRIES,
+            settings.CACHE_LOCAL_MAX_BYTES,
+            settings.CACHE_LOCAL_TTL_SECONDS
+        )
+        
+        # Channel on which deleted keys and invalidated patterns are announced to every worker
+        self.invalidation_channel = 'cache:invalidate'
+        self._invalidation_listener: Optional[asyncio.Task] = None
+        self._local_cache_active = False
+        
+        # Bumped on every invalidation, so a Redis read that raced one is not kept locally
+        self._invalidation_count = 0
     
     async def connect(self) -> bool:
         """Initialize Redis connection."""
@@ -72,6 +135,7 @@ class CacheService:
             # Test connection
             await self.redis_client.ping()
             self.connected = True
+            self._start_invalidation_listener()
             logger.info("Redis cache service connected successfully")
             return True
             
@@ -82,6 +146,9 @@ class CacheService:
     
     async def disconnect(self):
         """Close Redis connection."""
+        if self._invalidation_listener:
+            self._invalidation_listener.cancel()
+            self._invalidation_listener = None
         if self.redis_client:
             await self.redis_client.close()
             self.connected = False
@@ -99,50 +166,112 @@ class CacheService:
         
         return f"{prefix}:{identifier}"
     
-    def _serialize_data(self, data: Any) -> str:
-        """Serialize data for Redis storage."""
-        def json_serializer(obj):
-            if isinstance(obj, Decimal):
-                return float(obj)
-            elif isinstance(obj, datetime):
-                return obj.isoformat()
-            elif hasattr(obj, 'dict'):  # Pydantic models
-                return obj.dict()
-            elif hasattr(obj, '__dict__'):  # Regular objects
-                return obj.__dict__
-            return str(obj)
+    def _serialize_data(self, data: Any) -> bytes:
+        """Serialize data for Redis storage; Decimals and datetimes round-trip exactly."""
+        return self.codec.encode(data)
         
-        return json.dumps(data, default=json_serializer, ensure_ascii=False)
-    
-    def _deserialize_data(self, data: str) -> Any:
-        """Deserialize data from Redis."""
+    def _deserialize_data(self, data: Union[bytes, str]) -> Optional[Any]:
+        """Deserialize data from Redis; values that fail to decode read as None."""
         try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            return data
+            return self.codec.decode(data)
+        except Exception as e:
+            # Corrupt payloads, failed decompression or a codec library this worker lacks
+            logger.warning(f"Discarding undecodable cache value: {e}")
+            return None
     
     async def get(self, cache_type: str, identifier: str, **kwargs) -> Optional[Any]:
-        """Get cached data."""
+        """Get cached data; entries past their TTL count as misses even if kept to be served stale."""
+        value, stale = await self.get_entry(cache_type, identifier, **kwargs)
+        return None if stale else value
+    
+    async def get_entry(self, cache_type: str, identifier: str, **kwargs) -> Tuple[Optional[Any], bool]:
+        """
+        Get cached data, including entries past their TTL but within their hard TTL.
+        
+        Returns:
+            Tuple of (cached data or None, whether the data is past its TTL)
+        """
         if not self.connected:
             await self.connect()
             
         if not self.connected:
-            return None
+            return None, False
             
         try:
-            cache_key = self._generate_cache_key(cache_type, identifier, **kwargs)
-            data = await self.redis_client.get(cache_key)
+            cache_key = await self._cache_key(cache_type, identifier, **kwargs)
+            value, stale = self._unwrap(await self._get_key(cache_key))
+            if stale and self._local_cache_active:
+                # Another worker may have refreshed the entry since this worker kept it
+                self.local_cache.delete(cache_key)
+                value, stale = self._unwrap(await self._get_key(cache_key))
             
-            if data:
-                logger.debug(f"Cache hit for key: {cache_key}")
-                return self._deserialize_data(data)
+            if value is not None:
+                logger.debug(f"Cache {'stale hit' if stale else 'hit'} for key: {cache_key}")
+                return value, stale
             
             logger.debug(f"Cache miss for key: {cache_key}")
-            return None
+            return None, False
             
         except Exception as e:
             logger.error(f"Cache get error for {cache_type}:{identifier}: {e}")
+            return None, False
+    
+    def _unwrap(self, value: Any) -> Tuple[Any, bool]:
+        """Data of a cached value and whether it is stale; values without an envelope are fresh."""
+        if isinstance(value, dict) and FRESH_UNTIL_FIELD in value:
+            return value.get('value'), value[FRESH_UNTIL_FIELD] <= time.time()
+        return value, False
+    
+    async def _get_key(self, cache_key: str) -> Optional[Any]:
+        """Decoded value of a key from the local tier, else from Redis."""
+        if self._local_cache_active:
+            value = self.local_cache.get(cache_key)
+            if value is not None:
+                return value
+        
+        invalidation_count = self._invalidation_count
+        # Values are binary, while the client decodes every other reply to str
+        data = await self.redis_client.execute_command('GET', cache_key, **{NEVER_DECODE: True})
+        if not data:
+            return None
+        
+        value = self._deserialize_data(data)
+        if value is None:
             return None
+        if self._local_cache_active and invalidation_count == self._invalidation_count:
+            self.local_cache.set(cache_key, value, len(data))
+        return value
+    
+    async def _cache_key(self, cache_type: str, identifier: str, **kwargs) -> str:
+        """
+        Cache key of an entry, in the user's current generation for per-user cache types.
+        
+        Users whose cache was never invalidated are in generation 0, whose keys
+        are those of _generate_cache_key.
+        """
+        if cache_type in USER_NAMESPACED_TYPES:
+            generation = await self.get_user_generation(identifier)
+            if generation:
+                identifier = f"{identifier}:g{generation}"
+        return self._generate_cache_key(cache_type, identifier, **kwargs)
+    
+    def _generation_key(self, user_id: str) -> str:
+        return f"{self.generation_prefix}:{user_id}"
+    
+    async def get_user_generation(self, user_id: str) -> int:
+        """The user's cache generation, 0 until the user's cache is first invalidated."""
+        generation_key = self._generation_key(user_id)
+        if self._local_cache_active:
+            generation = self.local_cache.get(generation_key)
+            if generation is not None:
+                return generation
+        
+        # Generation 0 is kept locally too, so users never invalidated cost no extra reads
+        invalidation_count = self._invalidation_count
+        generation = int(await self.redis_client.get(generation_key) or 0)
+        if self._local_cache_active and invalidation_count == self._invalidation_count:
+            self.local_cache.set(generation_key, generation, len(generation_key))
+        return generation
     
     async def set(
         self, 
@@ -160,14 +289,25 @@ class CacheService:
             return False
             
         try:
-            cache_key = self._generate_cache_key(cache_type, identifier, **kwargs)
-            serialized_data = self._serialize_data(data)
+            cache_key = await self._cache_key(cache_type, identifier, **kwargs)
             
             # Use configured TTL or provided TTL
             ttl_seconds = ttl or self.ttl_config.get(cache_type, 3600)
             
-            await self.redis_client.setex(cache_key, ttl_seconds, serialized_data)
-            logger.debug(f"Cache set for key: {cache_key} (TTL: {ttl_seconds}s)")
+            # Types served stale are kept until their hard TTL, marked with the end of their TTL
+            redis_ttl_seconds = ttl_seconds
+            if cache_type in self.hard_ttl_config:
+                data = {FRESH_UNTIL_FIELD: time.time() + ttl_seconds, 'value': data}
+                redis_ttl_seconds = max(ttl_seconds, self.hard_ttl_config[cache_type])
+            serialized_data = self._serialize_data(data)
+            
+            await self.redis_client.setex(cache_key, redis_ttl_seconds, serialized_data)
+            if self._local_cache_active:
+                # Keep the decoded form, so local hits return what a Redis hit would
+                self.local_cache.set(
+                    cache_key, self._deserialize_data(serialized_data), len(serialized_data), redis_ttl_seconds
+                )
+            logger.debug(f"Cache set for key: {cache_key} (TTL: {ttl_seconds}s, kept: {redis_ttl_seconds}s)")
             return True
             
         except Exception as e:
@@ -180,8 +320,10 @@ class CacheService:
             return False
             
         try:
-            cache_key = self._generate_cache_key(cache_type, identifier, **kwargs)
+            cache_key = await self._cache_key(cache_type, identifier, **kwargs)
+            self._invalidate_local(cache_key)
             result = await self.redis_client.delete(cache_key)
+            await self._publish_invalidation(cache_key)
             logger.debug(f"Cache delete for key: {cache_key}")
             return result > 0
             
@@ -189,39 +331,155 @@ class CacheService:
             logger.error(f"Cache delete error for {cache_type}:{identifier}: {e}")
             return False
     
-    async def invalidate_pattern(self, pattern: str) -> int:
-        """Invalidate all keys matching pattern."""
+    async def invalidate_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Invalidate all keys matching pattern.
+        
+        Keys are found with SCAN and deleted batch by batch, so Redis keeps
+        serving other clients between batches. Per-user data is invalidated
+        with invalidate_user_cache instead, which touches no keys.
+        """
         if not self.connected:
             return 0
             
         try:
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                deleted = await self.redis_client.delete(*keys)
+            self._invalidate_local(pattern)
+            deleted = 0
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.redis_client.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis_client.delete(*batch)
+            if deleted:
                 logger.info(f"Invalidated {deleted} cache entries matching pattern: {pattern}")
-                return deleted
-            return 0
+            await self._publish_invalidation(pattern)
+            return deleted
             
         except Exception as e:
             logger.error(f"Cache pattern invalidation error for {pattern}: {e}")
             return 0
     
+    def _invalidate_local(self, pattern: str) -> None:
+        """Drop local entries matching a key or pattern."""
+        self._invalidation_count += 1
+        self.local_cache.invalidate_pattern(pattern)
+    
+    async def _publish_invalidation(self, pattern: str) -> None:
+        """Tell every worker to drop its local entries matching a key or pattern."""
+        if not self.local_cache.enabled:
+            return
+        
+        try:
+            await self.redis_client.publish(self.invalidation_channel, pattern)
+        except Exception as e:
+            logger.error(f"Cache invalidation publish error for {pattern}: {e}")
+    
+    def _start_invalidation_listener(self) -> None:
+        """Start listening for invalidations unless already listening or the local tier is disabled."""
+        if not self.local_cache.enabled:
+            return
+        if self._invalidation_listener is not None and not self._invalidation_listener.done():
+            return
+        self._invalidation_listener = asyncio.create_task(self._listen_for_invalidations())
+    
+    async def _listen_for_invalidations(self, retry_delay: float = 5.0) -> None:
+        """
+        Drop local entries as invalidations are announced, resubscribing after errors.
+        
+        The local tier is only used while subscribed; entries kept before a
+        disconnect may have missed invalidations and are dropped.
+        """
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.invalidation_channel)
+                self._local_cache_active = True
+                async for message in pubsub.listen():
+                    if message.get('type') == 'message':
+                        self._invalidate_local(message['data'])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener disconnected: {e}")
+            finally:
+                self._local_cache_active = False
+                self.local_cache.clear()
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(retry_delay)
+    
     async def invalidate_user_cache(self, user_id: str) -> int:
-        """Invalidate all cache entries for a specific user."""
-        patterns = [
-            f"stats:user:{user_id}:*",
-            f"session:user:{user_id}:*", 
-            f"prefs:user:{user_id}:*",
-            f"trends:user:{user_id}:*"
-        ]
+        """
+        Invalidate all per-user cache entries of a user by bumping the user's generation.
         
-        total_deleted = 0
-        for pattern in patterns:
-            deleted = await self.invalidate_pattern(pattern)
-            total_deleted += deleted
-            
-        logger.info(f"Invalidated {total_deleted} cache entries for user {user_id}")
-        return total_deleted
+        One INCR moves the user's statistics, breakdown, session, preference and
+        trend keys to a new namespace; entries of older generations are no longer
+        read and expire with their TTLs.
+        
+        Returns:
+            The user's new cache generation, or 0 if Redis is unavailable
+        """
+        if not self.connected:
+            return 0
+        
+        try:
+            generation_key = self._generation_key(user_id)
+            generation = await self.redis_client.incr(generation_key)
+            self._invalidate_local(generation_key)
+            await self._publish_invalidation(generation_key)
+            logger.info(f"Invalidated cache for user {user_id}, now at generation {generation}")
+            return generation
+        
+        except Exception as e:
+            logger.error(f"Cache invalidation error for user {user_id}: {e}")
+            return 0
+    
+    async def acquire_lock(self, name: str, ttl_seconds: float) -> Optional[str]:
+        """
+        Take a short-lived lock shared by every worker.
+        
+        Returns:
+            Token to release the lock with, or None if another holder has it
+            or Redis is unavailable
+        """
+        if not self.connected:
+            return None
+        
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis_client.set(
+                f"{self.lock_prefix}:{name}", token, nx=True, px=int(ttl_seconds * 1000)
+            )
+            return token if acquired else None
+        except Exception as e:
+            logger.error(f"Cache lock error for {name}: {e}")
+            return None
+    
+    async def release_lock(self, name: str, token: str) -> None:
+        """Release a lock unless it expired and was taken by another holder."""
+        if not self.connected:
+            return
+        
+        try:
+            await self.redis_client.eval(RELEASE_LOCK_SCRIPT, 1, f"{self.lock_prefix}:{name}", token)
+        except Exception as e:
+            logger.error(f"Cache lock release error for {name}: {e}")
+    
+    async def is_locked(self, name: str) -> bool:
+        """Whether any worker holds a lock."""
+        if not self.connected:
+            return False
+        
+        try:
+            return bool(await self.redis_client.exists(f"{self.lock_prefix}:{name}"))
+        except Exception as e:
+            logger.error(f"Cache lock check error for {name}: {e}")
+            return False
     
     async def get_cache_stats(self) -> Dict[str, Any]:
         """Get Redis cache statistics."""
@@ -230,6 +488,15 @@ class CacheService:
             
         try:
             info = await self.redis_client.info()
+            
+            # Reuse counters are optional; a failed read must not hide the Redis stats
+            try:
+                filter_reuse = await self.redis_client.hgetall(self.filter_reuse_key)
+                coalesced = await self.redis_client.hgetall(self.coalesced_key)
+            except Exception as e:
+                logger.warning(f"Error reading filter reuse counters: {e}")
+                filter_reuse = coalesced = {}
+            
             return {
                 "connected": True,
                 "used_memory": info.get("used_memory_human", "N/A"),
@@ -240,7 +507,14 @@ class CacheService:
                 "hit_rate": self._calculate_hit_rate(
                     info.get("keyspace_hits", 0),
                     info.get("keyspace_misses", 0)
-                )
+                ),
+                "filter_reuse": self._filter_reuse_stats(filter_reuse),
+                "coalesced_requests": {
+                    "in_process": int(coalesced.get('in_process', 0)),
+                    "cross_worker": int(coalesced.get('cross_worker', 0))
+                },
+                "local_cache": {**self.local_cache.stats(), "active": self._local_cache_active},
+                "codec": self.codec.describe()
             }
             
         except Exception as e:
@@ -253,20 +527,45 @@ class CacheService:
         if total == 0:
             return 0.0
         return round((hits / total) * 100, 2)
+    
+    def _filter_reuse_stats(self, counts: Dict[str, Any]) -> Dict[str, Any]:
+        """Filtered statistics answered from cache: exact hits, lattice (breakdown) hits and misses."""
+        exact_hits = int(counts.get('exact_hits', 0))
+        lattice_hits = int(counts.get('lattice_hits', 0))
+        misses = int(counts.get('misses', 0))
+        return {
+            "exact_hits": exact_hits,
+            "lattice_hits": lattice_hits,
+            "misses": misses,
+            "reuse_rate": self._calculate_hit_rate(exact_hits + lattice_hits, misses)
+        }
 
 
 # Specialized cache methods for common use cases
 class StatisticsCacheService(CacheService):
     """Specialized caching for statistics data."""
     
+    def _filters_key(self, filters: StatisticsFilters) -> Dict[str, Any]:
+        """Cache key parameters of filters; equivalent filters share one key."""
+        if isinstance(filters, StatisticsFilters):
+            return normalize_filters(filters).dict()
+        return filters.dict() if hasattr(filters, 'dict') else filters.__dict__
+    
     async def get_user_statistics(
         self, 
         user_id: str, 
         filters: StatisticsFilters
     ) -> Optional[Dict[str, Any]]:
         """Get cached user statistics."""
-        filters_dict = filters.dict() if hasattr(filters, 'dict') else filters.__dict__
-        return await self.get('user_stats', user_id, filters=filters_dict)
+        return await self.get('user_stats', user_id, filters=self._filters_key(filters))
+    
+    async def get_user_statistics_entry(
+        self,
+        user_id: str,
+        filters: StatisticsFilters
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Get cached user statistics, fresh or stale, and whether they are stale."""
+        return await self.get_entry('user_stats', user_id, filters=self._filters_key(filters))
     
     async def set_user_statistics(
         self, 
@@ -275,39 +574,94 @@ class StatisticsCacheService(CacheService):
         statistics: Dict[str, Any]
     ) -> bool:
         """Cache user statistics."""
-        filters_dict = filters.dict() if hasattr(filters, 'dict') else filters.__dict__
-        return await self.set('user_stats', user_id, statistics, filters=filters_dict)
+        return await self.set('user_stats', user_id, statistics, filters=self._filters_key(filters))
+    
+    async def get_filter_breakdown(
+        self,
+        user_id: str,
+        base_filters: StatisticsFilters
+    ) -> Optional[List[list]]:
+        """Get the cached per-dimension statistics breakdown for base filters."""
+        return await self.get('filter_breakdown', user_id, filters=self._filters_key(base_filters))
+    
+    async def set_filter_breakdown(
+        self,
+        user_id: str,
+        base_filters: StatisticsFilters,
+        breakdown: List[list]
+    ) -> bool:
+        """Cache the per-dimension statistics breakdown for base filters."""
+        return await self.set('filter_breakdown', user_id, breakdown, filters=self._filters_key(base_filters))
+    
+    async def record_filter_reuse(self, outcome: str) -> None:
+        """Count a filtered statistics request as an exact hit, lattice hit or miss."""
+        if not self.connected:
+            return
+        
+        try:
+            await self.redis_client.hincrby(self.filter_reuse_key, outcome, 1)
+        except Exception as e:
+            logger.error(f"Cache reuse counter error for {outcome}: {e}")
+    
+    async def record_coalesced(self, scope: str) -> None:
+        """Count a statistics request answered by another request's calculation, in_process or cross_worker."""
+        if not self.connected:
+            return
+        
+        try:
+            await self.redis_client.hincrby(self.coalesced_key, scope, 1)
+        except Exception as e:
+            logger.error(f"Cache coalescing counter error for {scope}: {e}")
     
     async def get_trend_data(
         self, 
         user_id: str, 
         time_period: str,
-        filters: StatisticsFilters
+        filters: StatisticsFilters,
+        options: Optional[Dict[str, Any]] = None,
+        metrics: Optional[List[str]] = None
     ) -> Optional[Dict[str, Any]]:
-        """Get cached trend data."""
+        """Get cached trend data; options are the trend series options and metrics the trended metrics, if any."""
+        return await self.get('trend_data', user_id, **self._trend_key(time_period, filters, options, metrics))
+    
+    async def get_trend_data_entry(
+        self,
+        user_id: str,
+        time_period: str,
+        filters: StatisticsFilters,
+        options: Optional[Dict[str, Any]] = None,
+        metrics: Optional[List[str]] = None
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Get cached trend data, fresh or stale, and whether it is stale."""
+        return await self.get_entry('trend_data', user_id, **self._trend_key(time_period, filters, options, metrics))
+    
+    def _trend_key(
+        self,
+        time_period: str,
+        filters: StatisticsFilters,
+        options: Optional[Dict[str, Any]],
+        metrics: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Cache key parameters of trend data."""
         filters_dict = filters.dict() if hasattr(filters, 'dict') else filters.__dict__
-        return await self.get(
-            'trend_data', 
-            user_id, 
-            period=time_period,
-            filters=filters_dict
-        )
+        # Trends without options or metrics keep their original key
+        extra = {'options': options} if options else {}
+        if metrics:
+            extra['metrics'] = metrics
+        return {'period': time_period, 'filters': filters_dict, **extra}
     
     async def set_trend_data(
         self, 
         user_id: str, 
         time_period: str,
         filters: StatisticsFilters,
-        trend_data: Dict[str, Any]
+        trend_data: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None,
+        metrics: Optional[List[str]] = None
     ) -> bool:
-        """Cache trend data."""
-        filters_dict = filters.dict() if hasattr(filters, 'dict') else filters.__dict__
+        """Cache trend data; options are the trend series options and metrics the trended metrics, if any."""
         return await self.set(
-            'trend_data', 
-            user_id, 
-            trend_data,
-            period=time_period,
-            filters=filters_dict
+            'trend_data', user_id, trend_data, **self._trend_key(time_period, filters, options, metrics)
         )
 
 
@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
+from sqlalchemy.orm import undefer
 from fastapi import HTTPException, status
 
 from app.core.security import EncryptionManager
@@ -216,7 +217,9 @@ class DataEncryptionService:
             from app.models.hand import PokerHand
             
             hands_result = await db.execute(
-                select(PokerHand).where(PokerHand.user_id == user_id)
+                select(PokerHand)
+                .options(undefer(PokerHand.raw_text))
+                .where(PokerHand.user_id == user_id)
             )
             hands = hands_result.scalars().all()
             
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 
 from .exceptions import HandParsingError, UnsupportedPlatformError
 
+# Money or chip amount in a hand history line, with an optional currency symbol
+_AMOUNT = r'[$€£]?([\d,]+(?:\.\d+)?)'
+
 
 class AbstractHandParser(ABC):
     """Abstract base class for platform-specific hand parsers."""
@@ -113,6 +116,86 @@ class AbstractHandParser(ABC):
             self.logger.warning(f"Hand validation failed: {e}")
             return False
     
+    def calculate_net_result(self, text: str) -> Optional[Decimal]:
+        """
+        Calculate the hero's net result for a hand: amounts collected minus chips put in.
+        
+        Blinds, antes, calls and bets count as put in; a raise counts up to its
+        "to" amount on that street, and uncalled bets returned to the hero are
+        taken back out. A small blind posted together with the big blind is dead,
+        so it does not count towards a raise. Collected amounts are reported
+        after rake, so the result is what the hero actually won or lost. The
+        hero is player_username, or the player dealt hole cards when no
+        username is set.
+        
+        Args:
+            text: Single hand history in PokerStars-style format
+        
+        Returns:
+            Net result, or None if the hero cannot be identified in the hand
+        """
+        hero = self.player_username
+        if not hero:
+            dealt_match = re.search(r'^Dealt to (.+?) \[', text, re.MULTILINE)
+            if not dealt_match:
+                return None
+            hero = dealt_match.group(1)
+        
+        hero_prefix = f'{hero}: '
+        # Stakes in the header, e.g. ($0.05/$0.10), for players posting both blinds
+        stakes_match = re.search(rf'\({_AMOUNT}/{_AMOUNT}', text)
+        big_blind = self._parse_decimal(stakes_match.group(2)) if stakes_match else None
+        invested = Decimal('0')
+        collected = Decimal('0')
+        street_committed = Decimal('0')
+        seen = False
+        
+        for line in text.splitlines():
+            line = line.strip()
+            if line.startswith('*** SUMMARY'):
+                break
+            if line.startswith('*** '):
+                # Blinds posted before the hole cards count towards preflop raises
+                if not line.startswith('*** HOLE CARDS'):
+                    street_committed = Decimal('0')
+                continue
+            
+            if line.startswith(hero_prefix):
+                action = line[len(hero_prefix):]
+                raise_match = re.match(rf'raises {_AMOUNT} to {_AMOUNT}', action)
+                if raise_match:
+                    raised_to = self._parse_decimal(raise_match.group(2))
+                    invested += raised_to - street_committed
+                    street_committed = raised_to
+                    seen = True
+                    continue
+                
+                post_match = re.match(rf'(posts (?:the )?ante|posts [a-z& ]*blinds?|calls|bets) {_AMOUNT}', action)
+                if post_match:
+                    amount = self._parse_decimal(post_match.group(2))
+                    invested += amount
+                    if '&' in post_match.group(1) and big_blind:
+                        # The small blind part is dead; only the big blind counts towards a raise
+                        street_committed += min(amount, big_blind)
+                    elif 'ante' not in post_match.group(1):
+                        street_committed += amount
+                    seen = True
+                continue
+            
+            returned_match = re.match(rf'Uncalled bet \({_AMOUNT}\) returned to {re.escape(hero)}$', line)
+            if returned_match:
+                invested -= self._parse_decimal(returned_match.group(1))
+                continue
+            
+            collected_match = re.match(rf'{re.escape(hero)} collected {_AMOUNT}', line)
+            if collected_match:
+                collected += self._parse_decimal(collected_match.group(1))
+                seen = True
+        
+        if not seen and not re.search(rf'^Seat \d+: {re.escape(hero)} \(', text, re.MULTILINE):
+            return None
+        return collected - invested
+    
     def _is_valid_card(self, card: str) -> bool:
         """
         Validate card format (e.g., 'As', 'Kh', '2c', 'Td').
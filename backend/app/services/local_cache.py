@@ -0,0 +1,121 @@
+"""
+In-process cache tier in front of Redis.
+
+A LocalCache keeps decoded cache values in process memory, least recently
+used first out, so a worker that served a key a moment ago answers the next
+request for it without a Redis round trip or a JSON decode. Entries are
+bounded three ways: by count, by the total size of their serialized payloads
+and by a TTL no longer than the Redis entry's.
+
+Every worker has its own LocalCache. CacheService keeps them in step with
+Redis by publishing each deleted key and invalidated pattern on a Redis
+channel; every worker's listener drops the matching local entries. While a
+worker is not subscribed to that channel it cannot hear invalidations, so
+its local tier is bypassed.
+"""
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class LocalEntry(NamedTuple):
+    """A decoded cache value with its expiry on the monotonic clock and its serialized size."""
+    value: Any
+    expires_at: float
+    size: int
+
+
+class LocalCache:
+    """Bounded LRU/TTL cache of decoded values for one process."""
+    
+    def __init__(self, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, LocalEntry]' = OrderedDict()
+        self._bytes = 0
+        
+        # Lookup and eviction counters since the process started
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0 and self.ttl_seconds > 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        """The live value of a key, or None. Values are shared, so callers must not modify them."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+    
+    def set(self, key: str, value: Any, size: int, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Keep a value for at most the local TTL, or ttl_seconds if shorter.
+        
+        Args:
+            key: Cache key, the same as in Redis
+            value: Decoded value
+            size: Size of the serialized value, counted against max_bytes
+            ttl_seconds: Remaining lifetime of the Redis entry, if known
+        """
+        if not self.enabled or size > self.max_bytes:
+            return
+        
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._remove(key)
+        self._entries[key] = LocalEntry(value, time.monotonic() + ttl, size)
+        self._bytes += size
+        
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+    
+    def delete(self, key: str) -> None:
+        """Drop a key."""
+        self._remove(key)
+    
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Drop the keys matching a Redis-style glob pattern; returns how many were dropped."""
+        keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+    
+    def clear(self) -> None:
+        """Drop every key."""
+        self._entries.clear()
+        self._bytes = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        """Size, limits and hit counters of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0.0,
+        }
+    
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
@@ -73,13 +73,15 @@ class PokerStarsParser(AbstractHandParser):
             # Determine if this is a tournament or cash game
             is_tournament = 'Tournament #' in hand_text
             
+            blinds = self._extract_blinds(hand_text)
+            
             hand_data = HandCreate(
                 hand_id=hand_id,
                 platform='pokerstars',
                 game_type=self._extract_game_type(hand_text),
                 game_format='tournament' if is_tournament else 'cash',
                 stakes=self._extract_stakes(hand_text),
-                blinds=self._extract_blinds(hand_text),
+                blinds=blinds,
                 table_size=self._extract_table_size(hand_text),
                 date_played=self._extract_date(hand_text),
                 player_cards=self._extract_player_cards(hand_text),
@@ -91,6 +93,8 @@ class PokerStarsParser(AbstractHandParser):
                 result=self._extract_result(hand_text),
                 pot_size=self._extract_pot_size(hand_text),
                 rake=self._extract_rake(hand_text),
+                net_result=self.calculate_net_result(hand_text),
+                big_blind=blinds.get('big') if blinds else None,
                 tournament_info=self._extract_tournament_info(hand_text) if is_tournament else None,
                 cash_game_info=self._extract_cash_game_info(hand_text) if not is_tournament else None,
                 player_stacks=self._extract_player_stacks(hand_text),
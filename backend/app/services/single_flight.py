@@ -0,0 +1,64 @@
+"""
+Single-flight execution of identical concurrent calculations.
+
+When several requests of one process need the same result at the same time,
+the first runs the calculation and the others await its future instead of
+repeating it. Followers share the leader's result or exception; if the
+leader is cancelled, such as when its client disconnects, the next follower
+takes over and runs the calculation itself.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """Calculations in flight in this process, by key."""
+    
+    def __init__(self):
+        self._flights: Dict[str, asyncio.Future] = {}
+        
+        # Requests answered by joining a calculation already in flight
+        self.coalesced = 0
+    
+    async def run(self, key: str, calculate: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run calculate unless a calculation with the same key is in flight, then await that one.
+        
+        Args:
+            key: Identity of the calculation
+            calculate: Runs the calculation
+        
+        Returns:
+            Tuple of (result, whether the result came from another request's calculation)
+        """
+        while True:
+            future = self._flights.get(key)
+            if future is None:
+                break
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled rather than this request: take over
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    continue
+                raise
+            self.coalesced += 1
+            return result, True
+        
+        future = asyncio.get_running_loop().create_future()
+        # Retrieve the exception even when no follower awaits it
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._flights[key] = future
+        try:
+            result = await calculate()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            del self._flights[key]
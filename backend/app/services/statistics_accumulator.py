@@ -0,0 +1,261 @@
+"""
+Mergeable accumulators for poker statistics.
+
+Each accumulator keeps the counters one statistics calculation needs in
+``__slots__`` attributes. ``add`` folds a hand in, ``merge`` combines two
+accumulators of the same type (built over different time buckets, positions,
+files or worker processes) and ``finalize`` turns the counters into the
+statistics schema.
+
+Money amounts are accumulated as integer cents (see ``to_cents``) and only
+converted back to Decimal when finalizing, so the per-hand loops never touch
+Decimal.
+
+Hand flag detection and the finalize math live in StatisticsService, which an
+accumulator receives as ``features``. Pickled accumulators drop it, so merged
+results from worker processes must be given a service again before finalizing.
+"""
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+
+# Advanced statistics counted as (opportunity, made) pairs, in AdvancedStatistics field order
+ADVANCED_PERCENTAGE_STATS = (
+    'three_bet_percentage',
+    'fold_to_three_bet',
+    'four_bet_percentage',
+    'fold_to_four_bet',
+    'cold_call_percentage',
+    'isolation_raise',
+    'c_bet_flop',
+    'c_bet_turn',
+    'c_bet_river',
+    'fold_to_c_bet_flop',
+    'fold_to_c_bet_turn',
+    'fold_to_c_bet_river',
+    'check_raise_flop',
+    'check_raise_turn',
+    'check_raise_river',
+)
+
+
+def to_cents(amount: Any, places: int = 2) -> int:
+    """
+    Convert a money amount to an integer count of 10**-places units (cents by default).
+    
+    Integers and two-place amounts convert exactly; floats are rounded to the
+    nearest unit, which is exact for the two-decimal amounts hand histories carry.
+    """
+    if isinstance(amount, int):
+        return amount * 10 ** places
+    if isinstance(amount, float):
+        return round(amount * 10 ** places)
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return int(amount.scaleb(places).to_integral_value())
+
+
+def cents_to_decimal(cents: int, places: int = 2) -> Decimal:
+    """Convert an integer count of 10**-places units back to a Decimal amount."""
+    return Decimal(int(cents)).scaleb(-places)
+
+
+class StatisticsAccumulator:
+    """Base class for accumulators whose counters are summed on merge."""
+    
+    __slots__ = ('features',)
+    
+    # Integer counters and integer-cent amounts, summed by merge()
+    COUNTERS: tuple = ()
+    AMOUNTS: tuple = ()
+    # Decimal places of amounts not held in cents
+    AMOUNT_PLACES: Dict[str, int] = {}
+    
+    def __init__(self, features: Any = None):
+        self.features = features
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+        for name in self.AMOUNTS:
+            setattr(self, name, 0)
+    
+    def add(self, hand: Any) -> 'StatisticsAccumulator':
+        """Fold a single hand into the counters."""
+        raise NotImplementedError
+    
+    def add_all(self, hands: Iterable[Any]) -> 'StatisticsAccumulator':
+        """Fold every hand of an iterable into the counters."""
+        for hand in hands:
+            self.add(hand)
+        return self
+    
+    def merge(self, other: 'StatisticsAccumulator') -> 'StatisticsAccumulator':
+        """Add the counters of another accumulator of the same type into this one."""
+        for name in self.COUNTERS + self.AMOUNTS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Counter values keyed by name, with amounts converted back to Decimal."""
+        values = {name: getattr(self, name) for name in self.COUNTERS}
+        for name in self.AMOUNTS:
+            values[name] = cents_to_decimal(getattr(self, name), self.AMOUNT_PLACES.get(name, 2))
+        return values
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self._state_names()}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.features = None
+        for name, value in state.items():
+            setattr(self, name, value)
+    
+    def _state_names(self) -> List[str]:
+        names = []
+        for cls in type(self).__mro__:
+            names.extend(name for name in getattr(cls, '__slots__', ()) if name != 'features')
+        return names
+    
+    def __eq__(self, other: Any) -> bool:
+        return type(self) is type(other) and self.__getstate__() == other.__getstate__()
+    
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}({self.__getstate__()})>"
+
+
+class BasicStatisticsAccumulator(StatisticsAccumulator):
+    """Counters behind BasicStatistics."""
+    
+    COUNTERS = (
+        'total_hands',
+        'tournament_hands',
+        'vpip_hands',
+        'pfr_hands',
+        'aggressive_actions',
+        'passive_actions',
+        'showdown_hands',
+        'won_showdown',
+        'steal_opportunities',
+        'steal_attempts',
+        'fold_to_steal_opportunities',
+        'fold_to_steal_count',
+        # Hands with a stored net result and big blind, and their results in thousandths of a big blind
+        'big_blind_hands',
+        'big_blinds_won',
+    )
+    AMOUNTS = ('total_winnings',)
+    
+    __slots__ = COUNTERS + AMOUNTS
+    
+    def add(self, hand: Any) -> 'BasicStatisticsAccumulator':
+        self.features._accumulate_basic(hand, self)
+        return self
+    
+    def finalize(self, user_id: Optional[str] = None):
+        """Build BasicStatistics from the counters."""
+        return self.features._finalize_basic(self, user_id)
+
+
+class PositionalStatisticsAccumulator(BasicStatisticsAccumulator):
+    """Counters behind PositionalStatistics for one position."""
+    
+    THREE_BET_COUNTERS = (
+        'three_bet_opportunities',
+        'three_bet_count',
+        'fold_to_three_bet_opportunities',
+        'fold_to_three_bet_count',
+    )
+    COUNTERS = BasicStatisticsAccumulator.COUNTERS + THREE_BET_COUNTERS
+    
+    __slots__ = THREE_BET_COUNTERS
+    
+    def add(self, hand: Any) -> 'PositionalStatisticsAccumulator':
+        actions = self.features._accumulate_basic(hand, self)
+        self.features._accumulate_positional(self, actions)
+        return self
+    
+    def finalize(self, position: str):
+        """Build PositionalStatistics for the position, or None below the minimum sample."""
+        return self.features._finalize_position(position, self)
+
+
+class AdvancedStatisticsAccumulator(StatisticsAccumulator):
+    """
+    Counters behind AdvancedStatistics.
+    
+    Per-hand net results are kept as their count, sum in cents and sum of
+    squares in square cents, so the expected value and variance can be merged
+    exactly.
+    """
+    
+    COUNTERS = ('result_count',)
+    AMOUNTS = (
+        'showdown_winnings',
+        'non_showdown_winnings',
+        'total_invested',
+        'result_sum',
+        'result_sum_squares',
+    )
+    AMOUNT_PLACES = {'result_sum_squares': 4}
+    
+    __slots__ = COUNTERS + AMOUNTS + ('opportunities', 'counts')
+    
+    def __init__(self, features: Any = None):
+        super().__init__(features)
+        # Indices follow ADVANCED_PERCENTAGE_STATS
+        self.opportunities = [0] * len(ADVANCED_PERCENTAGE_STATS)
+        self.counts = [0] * len(ADVANCED_PERCENTAGE_STATS)
+    
+    def add(self, hand: Any) -> 'AdvancedStatisticsAccumulator':
+        self.features._accumulate_advanced(self, hand)
+        return self
+    
+    def merge(self, other: 'AdvancedStatisticsAccumulator') -> 'AdvancedStatisticsAccumulator':
+        super().merge(other)
+        self.opportunities = [a + b for a, b in zip(self.opportunities, other.opportunities)]
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        return self
+    
+    def finalize(self):
+        """Build AdvancedStatistics from the counters."""
+        return self.features._finalize_advanced(self)
+
+
+class SessionStatisticsAccumulator(StatisticsAccumulator):
+    """Counters behind SessionStatistics for one session or day."""
+    
+    COUNTERS = (
+        'total_hands',
+        'vpip_hands',
+        'pfr_hands',
+        'aggressive_actions',
+        'passive_actions',
+    )
+    AMOUNTS = ('total_winnings',)
+    
+    __slots__ = COUNTERS + AMOUNTS + ('biggest_win', 'biggest_loss', 'first_played', 'last_played')
+    
+    def __init__(self, features: Any = None):
+        super().__init__(features)
+        self.biggest_win = 0
+        self.biggest_loss = 0
+        self.first_played: Optional[datetime] = None
+        self.last_played: Optional[datetime] = None
+    
+    def add(self, hand: Any) -> 'SessionStatisticsAccumulator':
+        self.features._accumulate_session(self, hand)
+        return self
+    
+    def merge(self, other: 'SessionStatisticsAccumulator') -> 'SessionStatisticsAccumulator':
+        super().merge(other)
+        self.biggest_win = max(self.biggest_win, other.biggest_win)
+        self.biggest_loss = min(self.biggest_loss, other.biggest_loss)
+        if other.first_played and (self.first_played is None or other.first_played < self.first_played):
+            self.first_played = other.first_played
+        if other.last_played and (self.last_played is None or other.last_played > self.last_played):
+            self.last_played = other.last_played
+        return self
+    
+    def finalize(self, session_date: datetime):
+        """Build SessionStatistics for the session starting on session_date."""
+        return self.features._finalize_session(self, session_date)
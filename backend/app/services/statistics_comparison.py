@@ -0,0 +1,195 @@
+"""
+Comparison of statistics between periods.
+
+Metrics are read from each period's StatisticsResponse, so a comparison
+costs nothing beyond getting the periods' statistics, which usually come
+from the cache. Changes of the rates taken over all hands (VPIP, PFR, went
+to showdown) are tested with a two-proportion z-test; the response does not
+keep the sample sizes of other metrics, so their changes are reported as
+differences only.
+"""
+import math
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.schemas.statistics import (
+    AdvancedStatistics,
+    BasicStatistics,
+    StatisticsComparisonResponse,
+    StatisticsPeriodComparisonResponse,
+    StatisticsResponse
+)
+
+
+# Percentage metrics whose denominator is every hand of the period
+HAND_RATE_METRICS = ('vpip', 'pfr', 'went_to_showdown')
+
+# Two-sided 5% critical value of the standard normal distribution
+Z_CRITICAL = 1.96
+
+# Metrics where a change in one direction is an improvement
+HIGHER_IS_BETTER = ('win_rate', 'won_at_showdown')
+LOWER_IS_BETTER = ('fold_to_steal', 'fold_to_three_bet')
+
+# Periods with fewer hands get a sample size warning
+MIN_COMPARISON_HANDS = 1000
+
+
+def validate_metrics(metrics: Sequence[str]) -> None:
+    """
+    Check that every metric is a basic or advanced statistic.
+    
+    Raises:
+        ValueError: For the first unknown metric
+    """
+    for metric in metrics:
+        if metric not in BasicStatistics.model_fields and metric not in AdvancedStatistics.model_fields:
+            raise ValueError(f"Unknown metric {metric!r}")
+
+
+def metric_value(response: StatisticsResponse, metric: str) -> Optional[Decimal]:
+    """Value of a basic or advanced metric in a statistics response."""
+    if metric in BasicStatistics.model_fields:
+        return getattr(response.basic_stats, metric)
+    return getattr(response.advanced_stats, metric)
+
+
+def rate_change_z_score(base_rate: Decimal, base_hands: int, rate: Decimal, hands: int) -> Optional[float]:
+    """z statistic of the change between two percentages of hands, or None if it cannot be tested."""
+    if not base_hands or not hands:
+        return None
+    pooled = (float(base_rate) * base_hands + float(rate) * hands) / (base_hands + hands) / 100
+    variance = pooled * (1 - pooled) * (1 / base_hands + 1 / hands)
+    if variance <= 0:
+        return None
+    return (float(rate) - float(base_rate)) / 100 / math.sqrt(variance)
+
+
+def significant_change(
+    metric: str,
+    base: StatisticsResponse,
+    comparison: StatisticsResponse
+) -> Optional[Dict[str, Any]]:
+    """The change of a metric between two periods if it is statistically significant."""
+    if metric not in HAND_RATE_METRICS:
+        return None
+    base_value, value = metric_value(base, metric), metric_value(comparison, metric)
+    if base_value is None or value is None:
+        return None
+    
+    z_score = rate_change_z_score(base_value, base.sample_size, value, comparison.sample_size)
+    if z_score is None or abs(z_score) < Z_CRITICAL:
+        return None
+    return {
+        'metric': metric,
+        'base_value': base_value,
+        'comparison_value': value,
+        'difference': value - base_value,
+        'z_score': round(z_score, 2),
+    }
+
+
+def compare_responses(
+    base: StatisticsResponse,
+    comparison: StatisticsResponse,
+    metrics: Sequence[str]
+) -> StatisticsComparisonResponse:
+    """
+    Compare the statistics of two periods.
+    
+    Args:
+        base: Statistics of the base period
+        comparison: Statistics of the period compared against it
+        metrics: Basic or advanced metric names
+    
+    Returns:
+        StatisticsComparisonResponse with comparison minus base differences
+    """
+    differences = {}
+    significant_changes = []
+    improvement_areas = []
+    decline_areas = []
+    recommendations = []
+    
+    for metric in metrics:
+        base_value, value = metric_value(base, metric), metric_value(comparison, metric)
+        if base_value is None or value is None:
+            continue
+        differences[metric] = value - base_value
+        
+        change = significant_change(metric, base, comparison)
+        if change is not None:
+            significant_changes.append(change)
+            recommendations.append(
+                f"{_label(metric)} {'rose' if change['difference'] > 0 else 'fell'} from {base_value} "
+                f"to {value}; check that the change in your game was intended."
+            )
+        
+        # Untestable metrics count any change; testable ones only significant changes
+        if metric in HAND_RATE_METRICS and change is None:
+            continue
+        if (metric in HIGHER_IS_BETTER and value > base_value) or (metric in LOWER_IS_BETTER and value < base_value):
+            improvement_areas.append(metric)
+        elif (metric in HIGHER_IS_BETTER and value < base_value) or (metric in LOWER_IS_BETTER and value > base_value):
+            decline_areas.append(metric)
+    
+    for area in decline_areas:
+        recommendations.append(f"{_label(area)} declined; review the hands of the comparison period.")
+    if min(base.sample_size, comparison.sample_size) < MIN_COMPARISON_HANDS:
+        recommendations.append(
+            f"A period has fewer than {MIN_COMPARISON_HANDS} hands, so small differences may be noise."
+        )
+    
+    return StatisticsComparisonResponse(
+        base_period_stats=base,
+        comparison_period_stats=comparison,
+        differences=differences,
+        significant_changes=significant_changes,
+        improvement_areas=improvement_areas,
+        decline_areas=decline_areas,
+        recommendations=recommendations
+    )
+
+
+def compare_period_responses(
+    responses: Sequence[StatisticsResponse],
+    metrics: Sequence[str]
+) -> StatisticsPeriodComparisonResponse:
+    """
+    Compare the statistics of consecutive periods, each against the one before it.
+    
+    Args:
+        responses: Statistics of each period, in order
+        metrics: Basic or advanced metric names
+    
+    Returns:
+        StatisticsPeriodComparisonResponse with the metric values and changes per period
+    """
+    metric_values: Dict[str, List[Optional[Decimal]]] = {}
+    period_changes: Dict[str, List[Optional[Decimal]]] = {}
+    significant_changes = []
+    
+    for metric in metrics:
+        values = [metric_value(response, metric) for response in responses]
+        metric_values[metric] = values
+        period_changes[metric] = [None] + [
+            value - previous if value is not None and previous is not None else None
+            for previous, value in zip(values, values[1:])
+        ]
+        for index in range(1, len(responses)):
+            change = significant_change(metric, responses[index - 1], responses[index])
+            if change is not None:
+                significant_changes.append({'period': index, **change})
+    
+    return StatisticsPeriodComparisonResponse(
+        period_stats=list(responses),
+        metric_values=metric_values,
+        period_changes=period_changes,
+        significant_changes=significant_changes
+    )
+
+
+def _label(metric: str) -> str:
+    if metric in ('vpip', 'pfr'):
+        return metric.upper()
+    return metric.replace('_', ' ').capitalize()
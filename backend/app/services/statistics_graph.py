@@ -0,0 +1,247 @@
+"""
+Streaming winnings graph for the red line / blue line chart.
+
+WinningsGraphBuilder folds hands in date order in a single pass. It keeps the
+running mean and variance of the per-hand net result (Welford's algorithm) and
+the cumulative total, showdown (blue line) and non-showdown (red line) net
+results, without holding on to the hands.
+
+The cumulative series are not kept point by point. Each series is cut into
+buckets of consecutive hands that only remember their first, last, lowest and
+highest point; when there are too many buckets, neighbours are merged and the
+bucket width doubles. Memory therefore stays proportional to the requested
+number of points however many hands are added. At the end the bucket
+candidates are reduced to the requested number of points with
+Largest-Triangle-Three-Buckets (LTTB), which keeps the visual shape of the
+line.
+"""
+import math
+from decimal import Decimal
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from app.schemas.statistics import WinningsGraph, WinningsGraphPoint
+from app.services.statistics_accumulator import cents_to_decimal
+
+
+# Points per series returned when the caller does not ask for a number
+DEFAULT_GRAPH_POINTS = 200
+
+# Smallest number of points LTTB can produce (first, one bucket, last)
+MIN_GRAPH_POINTS = 3
+
+Point = Tuple[int, int]
+
+
+class RunningMoments:
+    """Running count, mean and variance of a stream of values (Welford's algorithm)."""
+    
+    __slots__ = ('count', 'mean', 'm2')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        # Sum of squared differences from the current mean
+        self.m2 = 0.0
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    def merge(self, other: 'RunningMoments') -> 'RunningMoments':
+        """Combine with the moments of another stream (Chan et al.)."""
+        if not other.count:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        return self
+    
+    @property
+    def variance(self) -> float:
+        """Population variance, 0 for fewer than two values."""
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+
+class SeriesSampler:
+    """
+    Bounded-memory candidate points of a line, for downsampling with LTTB.
+    
+    Points must be added in increasing x order. Each bucket is a list of
+    [count, first, last, lowest, highest].
+    """
+    
+    __slots__ = ('max_buckets', 'width', 'buckets')
+    
+    def __init__(self, max_buckets: int):
+        self.max_buckets = max(max_buckets, 1)
+        self.width = 1
+        self.buckets: List[list] = []
+    
+    def add(self, x: int, y: int) -> None:
+        point = (x, y)
+        buckets = self.buckets
+        if buckets and buckets[-1][0] < self.width:
+            bucket = buckets[-1]
+            bucket[0] += 1
+            bucket[2] = point
+            if y < bucket[3][1]:
+                bucket[3] = point
+            elif y > bucket[4][1]:
+                bucket[4] = point
+            return
+        
+        if len(buckets) == self.max_buckets:
+            self._halve()
+            self.add(x, y)
+            return
+        buckets.append([1, point, point, point, point])
+    
+    def _halve(self) -> None:
+        """Merge neighbouring buckets pairwise and double the bucket width."""
+        merged = []
+        for index in range(0, len(self.buckets), 2):
+            left = self.buckets[index]
+            if index + 1 == len(self.buckets):
+                merged.append(left)
+                continue
+            right = self.buckets[index + 1]
+            merged.append([
+                left[0] + right[0],
+                left[1],
+                right[2],
+                left[3] if left[3][1] <= right[3][1] else right[3],
+                left[4] if left[4][1] >= right[4][1] else right[4],
+            ])
+        self.buckets = merged
+        self.width *= 2
+    
+    def candidates(self) -> List[Point]:
+        """Distinct candidate points in x order."""
+        points = set()
+        for _, first, last, lowest, highest in self.buckets:
+            points.update((first, last, lowest, highest))
+        return sorted(points)
+
+
+def lttb(points: Sequence[Point], threshold: int) -> List[Point]:
+    """
+    Downsample a line to threshold points with Largest-Triangle-Three-Buckets.
+    
+    Args:
+        points: (x, y) points in increasing x order
+        threshold: Number of points to keep, at least MIN_GRAPH_POINTS
+    
+    Returns:
+        The first and last point plus, for each bucket in between, the point
+        forming the largest triangle with the previously kept point and the
+        average of the next bucket
+    """
+    size = len(points)
+    if threshold >= size or threshold < MIN_GRAPH_POINTS:
+        return list(points)
+    
+    sampled = [points[0]]
+    every = (size - 2) / (threshold - 2)
+    kept = 0
+    
+    for bucket in range(threshold - 2):
+        average_start = int((bucket + 1) * every) + 1
+        average_end = min(int((bucket + 2) * every) + 1, size)
+        average_count = average_end - average_start
+        average_x = sum(points[index][0] for index in range(average_start, average_end)) / average_count
+        average_y = sum(points[index][1] for index in range(average_start, average_end)) / average_count
+        
+        kept_x, kept_y = points[kept]
+        largest_area = -1.0
+        largest_index = None
+        for index in range(int(bucket * every) + 1, int((bucket + 1) * every) + 1):
+            x, y = points[index]
+            area = abs((kept_x - average_x) * (y - kept_y) - (kept_x - x) * (average_y - kept_y))
+            if area > largest_area:
+                largest_area = area
+                largest_index = index
+        
+        sampled.append(points[largest_index])
+        kept = largest_index
+    
+    sampled.append(points[-1])
+    return sampled
+
+
+class WinningsGraphBuilder:
+    """
+    Single-pass builder of the winnings graph.
+    
+    Amounts are integer cents from the service's per-hand helpers, the same
+    values the advanced statistics accumulate. The red and blue lines are the
+    cumulative net results of hands that did not reach and that went to
+    showdown; together they add up to the total line.
+    """
+    
+    def __init__(self, features: Any, points: int = DEFAULT_GRAPH_POINTS):
+        if points < MIN_GRAPH_POINTS:
+            raise ValueError(f"A winnings graph needs at least {MIN_GRAPH_POINTS} points")
+        self.features = features
+        self.points = points
+        self.moments = RunningMoments()
+        self.total = 0
+        self.showdown = 0
+        self.non_showdown = 0
+        self.total_line = SeriesSampler(points)
+        self.showdown_line = SeriesSampler(points)
+        self.non_showdown_line = SeriesSampler(points)
+    
+    def add(self, hand: Any) -> 'WinningsGraphBuilder':
+        features = self.features
+        actions = hand.actions or {}
+        result = features._hand_net_result_cents(hand, actions)
+        
+        self.moments.add(result)
+        hand_number = self.moments.count
+        
+        self.total += result
+        self.total_line.add(hand_number, self.total)
+        if features._went_to_showdown(actions):
+            self.showdown += result
+            self.showdown_line.add(hand_number, self.showdown)
+        else:
+            self.non_showdown += result
+            self.non_showdown_line.add(hand_number, self.non_showdown)
+        return self
+    
+    def add_all(self, hands: Iterable[Any]) -> 'WinningsGraphBuilder':
+        for hand in hands:
+            self.add(hand)
+        return self
+    
+    def finalize(self) -> WinningsGraph:
+        """Build the WinningsGraph with each line downsampled to the requested points."""
+        moments = self.moments
+        variance = moments.variance / 10000
+        return WinningsGraph(
+            total_hands=moments.count,
+            net_result=cents_to_decimal(self.total),
+            showdown_result=cents_to_decimal(self.showdown),
+            non_showdown_result=cents_to_decimal(self.non_showdown),
+            expected_value=_float_to_decimal(moments.mean / 100),
+            variance=_float_to_decimal(variance),
+            standard_deviation=_float_to_decimal(math.sqrt(variance)),
+            total_line=self._downsample(self.total_line),
+            showdown_line=self._downsample(self.showdown_line),
+            non_showdown_line=self._downsample(self.non_showdown_line)
+        )
+    
+    def _downsample(self, sampler: SeriesSampler) -> List[WinningsGraphPoint]:
+        return [
+            WinningsGraphPoint(hand_number=x, value=cents_to_decimal(y))
+            for x, y in lttb(sampler.candidates(), self.points)
+        ]
+
+
+def _float_to_decimal(value: float, places: int = 6) -> Decimal:
+    """Decimal of a float moment, rounded to keep the reported precision short."""
+    return Decimal(str(round(value, places)))
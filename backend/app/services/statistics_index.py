@@ -0,0 +1,291 @@
+"""
+Per-user bitmap index over a user's hands for interactive filtering.
+
+A HandBitmapIndex holds one user's projected hands in date order, so each hand
+has an ordinal and every date range is a contiguous run of ordinals found by
+bisecting the sorted dates. For every value of the filterable dimensions
+(position, stakes, game format, game type, platform and play money) it keeps a
+bitmap with bit ``i`` set when hand ``i`` has that value. Any combination of
+StatisticsFilters then resolves to an AND of a few bitmaps, and the selected
+hands feed the column reductions of the vectorized backend (or the per-hand
+accumulators when NumPy is not installed) without running SQL.
+
+Bitmaps are plain Python integers: AND and OR run in C over one bit per hand,
+which for the few values of each dimension is about as compact as a compressed
+bitmap and needs no extra dependency.
+
+Indexes live in process memory in a HandIndexRegistry, least recently used
+first out, bounded by a number of users and by the total estimated size of
+their indexes. Each index records the user's hand count and latest update
+time when it was built and is rebuilt when they change.
+"""
+import bisect
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.hand import PokerHand
+from app.schemas.statistics import StatisticsFilters
+from app.services import statistics_vectorized
+from app.services.statistics_snapshot import SNAPSHOT_COLUMNS, _as_utc
+
+
+# Hand attributes with one bitmap per value
+INDEXED_DIMENSIONS = ('position', 'stakes', 'game_format', 'game_type', 'platform', 'is_play_money')
+
+# (hand count, latest updated_at) identifying the hands an index was built from
+IndexVersion = Tuple[int, Optional[datetime]]
+
+# Hands measured to estimate the size of an index's rows
+SIZE_SAMPLE_HANDS = 64
+
+
+def bitmap_from_ordinals(ordinals: Sequence[int], size: int) -> int:
+    """Bitmap with the bits of the given ordinals set."""
+    bits = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        bits[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def bitmap_ordinals(bitmap: int) -> List[int]:
+    """Ordinals of the set bits of a bitmap, in increasing order."""
+    # Least significant bit first, without the '0b' prefix
+    bits = bin(bitmap)[:1:-1]
+    ordinals = []
+    ordinal = bits.find('1')
+    while ordinal != -1:
+        ordinals.append(ordinal)
+        ordinal = bits.find('1', ordinal + 1)
+    return ordinals
+
+
+def deep_size(value: Any) -> int:
+    """Approximate bytes of a value, including the items of the lists and dicts it holds."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_size(key) + deep_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(deep_size(item) for item in value)
+    return size
+
+
+class HandBitmapIndex:
+    """One user's hands in date order with a bitmap per dimension value."""
+    
+    def __init__(self, user_id: str, hands: Sequence[Any], version: Optional[IndexVersion] = None):
+        self.user_id = str(user_id)
+        self.version = version
+        
+        # Dated hands first, by date; hands without a date never match a date filter
+        dated = sorted((hand for hand in hands if hand.date_played is not None), key=lambda hand: _as_utc(hand.date_played))
+        self.hands = dated + [hand for hand in hands if hand.date_played is None]
+        self.size = len(self.hands)
+        self.dates = [_as_utc(hand.date_played) for hand in dated]
+        self.all = (1 << self.size) - 1
+        
+        self.bitmaps: Dict[str, Dict[Hashable, int]] = {}
+        for dimension in INDEXED_DIMENSIONS:
+            ordinals: Dict[Hashable, List[int]] = {}
+            for ordinal, hand in enumerate(self.hands):
+                value = getattr(hand, dimension)
+                if dimension == 'is_play_money' and value is not None:
+                    value = bool(value)
+                ordinals.setdefault(value, []).append(ordinal)
+            self.bitmaps[dimension] = {
+                value: bitmap_from_ordinals(value_ordinals, self.size)
+                for value, value_ordinals in ordinals.items()
+            }
+        
+        self._columns = None
+        self.nbytes = self._estimate_size()
+    
+    @staticmethod
+    async def current_version(db: AsyncSession, user_id: str) -> IndexVersion:
+        """Hand count and latest update time of the user's hands."""
+        result = await db.execute(
+            select(func.count(PokerHand.id), func.max(PokerHand.updated_at))
+            .where(PokerHand.user_id == user_id)
+        )
+        count, updated_at = result.one()
+        return count, updated_at
+    
+    @classmethod
+    async def load(cls, db: AsyncSession, user_id: str, version: Optional[IndexVersion] = None) -> 'HandBitmapIndex':
+        """
+        Load every hand of the user in one query and index it.
+        
+        Args:
+            db: Database session
+            user_id: User whose hands to index
+            version: Version read before loading, see current_version
+        
+        Returns:
+            HandBitmapIndex over the user's hands
+        """
+        result = await db.execute(select(*SNAPSHOT_COLUMNS).where(PokerHand.user_id == user_id))
+        return cls(user_id, result.all(), version)
+    
+    def _estimate_size(self) -> int:
+        """
+        Approximate bytes held by the index, including the columns it decodes on first use.
+        
+        Row sizes are measured on a sample of the hands spread over the index
+        and scaled up, since measuring each hand's actions would cost about as
+        much as building the index.
+        """
+        size = sys.getsizeof(self.hands) + sys.getsizeof(self.dates) + sum(map(sys.getsizeof, self.dates))
+        size += sum(sys.getsizeof(bitmap) for bitmaps in self.bitmaps.values() for bitmap in bitmaps.values())
+        
+        if self.size:
+            step = max(1, self.size // SIZE_SAMPLE_HANDS)
+            sample = self.hands[::step]
+            keys = [column.key for column in SNAPSHOT_COLUMNS]
+            sample_size = sum(
+                sys.getsizeof(hand) + sum(deep_size(getattr(hand, key)) for key in keys)
+                for hand in sample
+            )
+            size += sample_size * self.size // len(sample)
+        
+        if statistics_vectorized.NUMPY_AVAILABLE:
+            size += self.size * len(statistics_vectorized.COLUMNS) * 8
+        return size
+    
+    def bitmap(self, dimension: str, value: Hashable) -> int:
+        """Hands with a dimension value; empty for values no hand has."""
+        return self.bitmaps[dimension].get(value, 0)
+    
+    def date_range(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> int:
+        """Hands played from start through end, both inclusive."""
+        low = 0 if start is None else bisect.bisect_left(self.dates, _as_utc(start))
+        high = len(self.dates) if end is None else bisect.bisect_right(self.dates, _as_utc(end))
+        if high <= low:
+            return 0
+        return ((1 << high) - 1) ^ ((1 << low) - 1)
+    
+    def resolve(self, filters: Optional[StatisticsFilters]) -> int:
+        """
+        Bitmap of the hands matching filters, as StatisticsService._apply_filters selects them.
+        
+        Args:
+            filters: Filters to resolve, or None for every hand
+        
+        Returns:
+            Bitmap over the index's hand ordinals
+        """
+        selected = self.all
+        if filters is None:
+            return selected
+        
+        if filters.start_date or filters.end_date:
+            selected &= self.date_range(filters.start_date, filters.end_date)
+        if filters.platform:
+            selected &= self.bitmap('platform', filters.platform)
+        if filters.game_type:
+            selected &= self.bitmap('game_type', filters.game_type)
+        if filters.game_format:
+            selected &= self.bitmap('game_format', filters.game_format)
+        if filters.position:
+            selected &= self.bitmap('position', filters.position)
+        if filters.stakes_filter:
+            stakes = 0
+            for value in filters.stakes_filter:
+                stakes |= self.bitmap('stakes', value)
+            selected &= stakes
+        if filters.tournament_only:
+            selected &= self.bitmap('game_format', 'tournament')
+        if filters.cash_only:
+            selected &= self.bitmap('game_format', 'cash')
+        if filters.play_money_only:
+            selected &= self.bitmap('is_play_money', True)
+        if filters.exclude_play_money:
+            selected &= self.bitmap('is_play_money', False)
+        return selected
+    
+    def hands_for(self, bitmap: int) -> List[Any]:
+        """Selected hands in date order."""
+        hands = self.hands
+        return [hands[ordinal] for ordinal in bitmap_ordinals(bitmap)]
+    
+    def mask(self, bitmap: int):
+        """Boolean NumPy row mask of a bitmap."""
+        np = statistics_vectorized.np
+        bits = np.frombuffer(bitmap.to_bytes((self.size + 7) // 8, 'little'), dtype=np.uint8)
+        return np.unpackbits(bits, count=self.size, bitorder='little').view(bool)
+    
+    def columns(self, features: Any) -> statistics_vectorized.HandColumns:
+        """Every indexed hand decoded for the vectorized backend, decoded on first use."""
+        if self._columns is None:
+            self._columns = statistics_vectorized.HandColumns.decode(features, self.hands)
+        return self._columns
+
+
+class HandIndexRegistry:
+    """Process-wide hand indexes for the most recently used users, bounded by count and size."""
+    
+    def __init__(self, max_users: int, max_bytes: int):
+        self.max_users = max_users
+        self.max_bytes = max_bytes
+        self._indexes: 'OrderedDict[str, HandBitmapIndex]' = OrderedDict()
+        self._bytes = 0
+    
+    async def get(self, db: AsyncSession, user_id: str) -> HandBitmapIndex:
+        """
+        The user's index, rebuilt when the user's hands changed since it was built.
+        
+        Args:
+            db: Database session for the version check and, if needed, the rebuild
+            user_id: User whose index to return
+        
+        Returns:
+            Up-to-date HandBitmapIndex of the user; an index larger than
+            max_bytes is returned without being kept
+        """
+        user_id = str(user_id)
+        version = await HandBitmapIndex.current_version(db, user_id)
+        
+        index = self._indexes.get(user_id)
+        if index is not None and index.version == version:
+            self._indexes.move_to_end(user_id)
+            return index
+        
+        index = await HandBitmapIndex.load(db, user_id, version)
+        self._remove(user_id)
+        if index.nbytes > self.max_bytes:
+            return index
+        
+        self._indexes[user_id] = index
+        self._bytes += index.nbytes
+        while len(self._indexes) > self.max_users or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._indexes)))
+        return index
+    
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes held by the kept indexes."""
+        return self._bytes
+    
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop the index of a user, or of every user."""
+        if user_id is None:
+            self._indexes.clear()
+            self._bytes = 0
+        else:
+            self._remove(str(user_id))
+    
+    def _remove(self, user_id: str) -> None:
+        index = self._indexes.pop(user_id, None)
+        if index is not None:
+            self._bytes -= index.nbytes
+
+
+# Indexes shared by the statistics services of this process
+hand_index_registry = HandIndexRegistry(
+    settings.STATISTICS_HAND_INDEX_MAX_USERS,
+    settings.STATISTICS_HAND_INDEX_MAX_BYTES
+)
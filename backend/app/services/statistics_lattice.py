@@ -0,0 +1,190 @@
+"""
+Filter lattice for reusing cached statistics across related filters.
+
+StatisticsFilters are first normalised, so equivalent filters
+(``tournament_only=True`` and ``game_format='tournament'``, reordered stakes
+lists, ``False`` flags) share one canonical form and one cache key.
+
+The canonical filters are then split into the base filters (dates, game type,
+stakes) and a selection over the mergeable dimensions: position, game format,
+platform and play money. For one set of base filters, a StatisticsCube keeps
+positional and advanced accumulators for every combination of the mergeable
+dimensions. Any selection over those dimensions, including none, is answered
+by merging the matching cells, so a cached cube for a date range answers
+``position=BTN`` or ``game_format=cash`` over that range without touching
+the hands again.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.schemas.statistics import StatisticsFilters
+from app.services.statistics_accumulator import (
+    AdvancedStatisticsAccumulator,
+    PositionalStatisticsAccumulator
+)
+
+
+# Hand attributes a filter selection can be answered from by merging cube cells
+MERGEABLE_DIMENSIONS = ('position', 'game_format', 'platform', 'is_play_money')
+
+# StatisticsFilters fields that only restrict mergeable dimensions
+_MERGEABLE_FIELDS = (
+    'position',
+    'game_format',
+    'platform',
+    'tournament_only',
+    'cash_only',
+    'play_money_only',
+    'exclude_play_money',
+)
+
+CellKey = Tuple[Optional[str], Optional[str], Optional[str], Optional[bool]]
+
+
+def normalize_filters(filters: Optional[StatisticsFilters]) -> StatisticsFilters:
+    """
+    Canonical form of filters that selects the same hands.
+    
+    Format flags become game_format, false flags and empty lists become None and
+    stakes are sorted. Contradictory filters (tournament_only with cash_only, or
+    with another game_format) are returned unchanged.
+    
+    Args:
+        filters: Filters to normalise, or None for no filters
+    
+    Returns:
+        Normalised copy of the filters
+    """
+    if filters is None:
+        return StatisticsFilters()
+    
+    game_format = filters.game_format
+    formats = {game_format} if game_format else set()
+    if filters.tournament_only:
+        formats.add('tournament')
+    if filters.cash_only:
+        formats.add('cash')
+    if len(formats) > 1 or (filters.play_money_only and filters.exclude_play_money):
+        return filters
+    
+    return filters.model_copy(update={
+        'game_format': formats.pop() if formats else None,
+        'tournament_only': None,
+        'cash_only': None,
+        'play_money_only': filters.play_money_only or None,
+        'exclude_play_money': filters.exclude_play_money or None,
+        'stakes_filter': sorted(set(filters.stakes_filter)) if filters.stakes_filter else None,
+    })
+
+
+def split_filters(filters: Optional[StatisticsFilters]) -> Optional[Tuple[StatisticsFilters, Dict[str, Any]]]:
+    """
+    Split filters into base filters and a selection over the mergeable dimensions.
+    
+    Args:
+        filters: Filters to split
+    
+    Returns:
+        (base filters, selection) where the selection maps each restricted
+        dimension to its required value, or None for contradictory filters
+    """
+    filters = normalize_filters(filters)
+    if filters.tournament_only or filters.cash_only or (filters.play_money_only and filters.exclude_play_money):
+        return None
+    
+    selection = {}
+    if filters.position:
+        selection['position'] = filters.position
+    if filters.game_format:
+        selection['game_format'] = filters.game_format
+    if filters.platform:
+        selection['platform'] = filters.platform
+    if filters.play_money_only:
+        selection['is_play_money'] = True
+    elif filters.exclude_play_money:
+        selection['is_play_money'] = False
+    
+    base = filters.model_copy(update={name: None for name in _MERGEABLE_FIELDS})
+    return base, selection
+
+
+class StatisticsCube:
+    """Positional and advanced accumulators per combination of the mergeable dimensions."""
+    
+    def __init__(self, features: Any):
+        self.features = features
+        self.cells: Dict[CellKey, Tuple[PositionalStatisticsAccumulator, AdvancedStatisticsAccumulator]] = {}
+    
+    def cell(self, key: CellKey) -> Tuple[PositionalStatisticsAccumulator, AdvancedStatisticsAccumulator]:
+        """Accumulators of one cell, created empty on first use."""
+        counters = self.cells.get(key)
+        if counters is None:
+            counters = self.cells[key] = (
+                PositionalStatisticsAccumulator(self.features),
+                AdvancedStatisticsAccumulator(self.features),
+            )
+        return counters
+    
+    def add(self, hand: Any) -> 'StatisticsCube':
+        """Fold a hand into the cell of its dimension values."""
+        positional, advanced = self.cell(_cell_key(hand))
+        positional.add(hand)
+        advanced.add(hand)
+        return self
+    
+    def add_all(self, hands: Iterable[Any]) -> 'StatisticsCube':
+        for hand in hands:
+            self.add(hand)
+        return self
+    
+    def select(
+        self,
+        selection: Dict[str, Any]
+    ) -> Tuple[PositionalStatisticsAccumulator, AdvancedStatisticsAccumulator, Dict[Optional[str], PositionalStatisticsAccumulator]]:
+        """
+        Merge the cells matching a selection.
+        
+        Args:
+            selection: Required value per restricted dimension
+        
+        Returns:
+            Merged positional counters (a superset of the basic counters), merged
+            advanced counters and the positional counters per position
+        """
+        indexed = [(MERGEABLE_DIMENSIONS.index(name), value) for name, value in selection.items()]
+        totals = PositionalStatisticsAccumulator(self.features)
+        advanced = AdvancedStatisticsAccumulator(self.features)
+        positions: Dict[Optional[str], PositionalStatisticsAccumulator] = {}
+        
+        for key, (cell_positional, cell_advanced) in self.cells.items():
+            if any(key[index] != value for index, value in indexed):
+                continue
+            totals.merge(cell_positional)
+            advanced.merge(cell_advanced)
+            position = key[0]
+            if position not in positions:
+                positions[position] = PositionalStatisticsAccumulator(self.features)
+            positions[position].merge(cell_positional)
+        
+        return totals, advanced, positions
+    
+    def to_state(self) -> List[list]:
+        """JSON-serialisable cells: dimension values followed by the counter states."""
+        return [
+            list(key) + [positional.__getstate__(), advanced.__getstate__()]
+            for key, (positional, advanced) in self.cells.items()
+        ]
+    
+    @classmethod
+    def from_state(cls, features: Any, state: List[list]) -> 'StatisticsCube':
+        """Rebuild a cube from to_state output."""
+        cube = cls(features)
+        for *key, positional_state, advanced_state in state:
+            positional, advanced = cube.cell(tuple(key))
+            positional.__setstate__(positional_state)
+            advanced.__setstate__(advanced_state)
+            positional.features = advanced.features = features
+        return cube
+
+
+def _cell_key(hand: Any) -> CellKey:
+    return (hand.position, hand.game_format, hand.platform, bool(hand.is_play_money))
@@ -0,0 +1,231 @@
+"""
+Multi-tabling analysis: how many tables were running at once.
+
+Every hand is assigned to its table: the table name of a cash game, or the
+tournament for a tournament hand (a tournament is played at one table at a
+time). Each table's hands are cut into activity intervals wherever the table
+was idle for longer than the idle gap. An interval runs from its first hand to
+its last hand plus the interval's average time per hand, so the last hand is
+counted as played rather than ending the table the moment it was dealt.
+
+A sweep over the sorted interval starts and ends then gives the number of open
+tables over time as a list of constant segments, in O(n log n) for n
+intervals. Hands are matched to segments with a single merge pass, giving
+hands per hour and win rate by the number of tables in play.
+"""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from operator import itemgetter
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from app.models.hand import PokerHand
+from app.schemas.statistics import ConcurrencySegment, MultiTablingAnalysis, MultiTablingBucket
+from app.services.statistics_accumulator import cents_to_decimal
+from app.services.statistics_snapshot import _as_utc
+
+
+# Hand columns the analysis reads
+MULTITABLING_COLUMNS = (
+    PokerHand.date_played,
+    PokerHand.platform,
+    PokerHand.game_format,
+    PokerHand.cash_game_info,
+    PokerHand.tournament_info,
+    PokerHand.result,
+    PokerHand.pot_size,
+    PokerHand.net_result,
+    PokerHand.big_blind,
+    PokerHand.blinds,
+)
+
+# Seconds a table counts as open for a hand with no other hand at that table within the idle gap
+LONE_HAND_SECONDS = 60.0
+
+# (timestamp, table, winnings in cents, thousandths of a big blind won or None, tournament hand)
+HandRecord = Tuple[float, Hashable, int, Optional[int], bool]
+
+
+def table_key(hand: Any) -> Optional[Hashable]:
+    """Identity of the table a hand was played at, or None if the hand does not say."""
+    if hand.game_format == 'tournament':
+        tournament_id = (hand.tournament_info or {}).get('tournament_id')
+        return (hand.platform, 'tournament', tournament_id) if tournament_id else None
+    table_name = (hand.cash_game_info or {}).get('table_name')
+    return (hand.platform, 'cash', table_name) if table_name else None
+
+
+def table_intervals(records: List[HandRecord], idle_seconds: float) -> List[Tuple[float, float]]:
+    """
+    Activity intervals of every table.
+    
+    Args:
+        records: Hand records sorted by timestamp
+        idle_seconds: Longest pause between two hands at a table that is still open
+    
+    Returns:
+        (start, end) timestamps of each interval, in no particular order
+    """
+    intervals = []
+    # table -> [first hand, last hand, hands] of its current interval
+    open_tables: Dict[Hashable, List[float]] = {}
+    
+    def close(state: List[float]) -> Tuple[float, float]:
+        start, last, hands = state
+        per_hand = (last - start) / (hands - 1) if last > start else LONE_HAND_SECONDS
+        return start, last + per_hand
+    
+    for timestamp, table, *_ in records:
+        state = open_tables.get(table)
+        if state is not None and timestamp - state[1] <= idle_seconds:
+            state[1] = timestamp
+            state[2] += 1
+            continue
+        if state is not None:
+            intervals.append(close(state))
+        open_tables[table] = [timestamp, timestamp, 1]
+    
+    intervals.extend(close(state) for state in open_tables.values())
+    return intervals
+
+
+def concurrency_segments(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float, int]]:
+    """
+    Sweep interval ends and starts into segments with a constant number of open tables.
+    
+    An interval ending where another starts does not overlap it. Adjacent
+    segments with the same count are joined and gaps with no open table are
+    left out.
+    
+    Returns:
+        (start, end, open tables) in time order
+    """
+    # Ends sort before starts at the same instant
+    events = sorted([(start, 1) for start, _ in intervals] + [(end, -1) for _, end in intervals])
+    
+    segments: List[Tuple[float, float, int]] = []
+    active = 0
+    previous = None
+    for timestamp, delta in events:
+        if active and timestamp > previous:
+            if segments and segments[-1][2] == active and segments[-1][1] == previous:
+                segments[-1] = (segments[-1][0], timestamp, active)
+            else:
+                segments.append((previous, timestamp, active))
+        active += delta
+        previous = timestamp
+    return segments
+
+
+class MultiTablingBuilder:
+    """Collects hands and analyses how many tables were played at once."""
+    
+    def __init__(self, features: Any, idle_gap: timedelta):
+        self.features = features
+        self.idle_seconds = idle_gap.total_seconds()
+        self.records: List[HandRecord] = []
+    
+    def add(self, hand: Any) -> 'MultiTablingBuilder':
+        """Record a hand; hands without a date or table are left out."""
+        table = table_key(hand)
+        if table is None or hand.date_played is None:
+            return self
+        
+        features = self.features
+        self.records.append((
+            _as_utc(hand.date_played).timestamp(),
+            table,
+            features._hand_winnings_cents(hand),
+            features._hand_big_blinds_won(hand),
+            hand.game_format == 'tournament',
+        ))
+        return self
+    
+    def add_all(self, hands) -> 'MultiTablingBuilder':
+        for hand in hands:
+            self.add(hand)
+        return self
+    
+    def finalize(self, include_timeline: bool = False) -> MultiTablingAnalysis:
+        """
+        Build the analysis from the recorded hands.
+        
+        Args:
+            include_timeline: Include the open-table segments, which number
+                about as many as the table intervals
+        
+        Returns:
+            MultiTablingAnalysis with per-table-count buckets
+        """
+        records = self.records
+        records.sort(key=itemgetter(0))
+        segments = concurrency_segments(table_intervals(records, self.idle_seconds))
+        
+        # tables -> [seconds, hands, winnings, tournament hands, big blind hands, big blinds won]
+        buckets: Dict[int, List[float]] = {}
+        for start, end, tables in segments:
+            buckets.setdefault(tables, [0.0, 0, 0, 0, 0, 0])[0] += end - start
+        
+        # Every hand lies inside a segment of its own table's interval
+        segment_index = 0
+        for timestamp, _, winnings, big_blinds_won, tournament in records:
+            while segments[segment_index][1] <= timestamp:
+                segment_index += 1
+            bucket = buckets[segments[segment_index][2]]
+            bucket[1] += 1
+            bucket[2] += winnings
+            bucket[3] += tournament
+            if big_blinds_won is not None:
+                bucket[4] += 1
+                bucket[5] += big_blinds_won
+        
+        active_seconds = sum(bucket[0] for bucket in buckets.values())
+        table_seconds = sum(tables * bucket[0] for tables, bucket in buckets.items())
+        
+        return MultiTablingAnalysis(
+            total_hands=len(records),
+            tables_played=len({record[1] for record in records}),
+            max_tables=max(buckets, default=0),
+            average_tables=_ratio(table_seconds, active_seconds),
+            hours_played=_ratio(active_seconds, 3600),
+            hands_per_hour=_ratio(len(records) * 3600, active_seconds),
+            buckets=[
+                self._bucket(tables, *buckets[tables])
+                for tables in sorted(buckets)
+            ],
+            timeline=[
+                ConcurrencySegment(start=_as_datetime(start), end=_as_datetime(end), tables=tables)
+                for start, end, tables in segments
+            ] if include_timeline else None,
+        )
+    
+    def _bucket(
+        self,
+        tables: int,
+        seconds: float,
+        hands: int,
+        winnings: int,
+        tournament_hands: int,
+        big_blind_hands: int,
+        big_blinds_won: int
+    ) -> MultiTablingBucket:
+        return MultiTablingBucket(
+            tables=tables,
+            hands=hands,
+            hours=_ratio(seconds, 3600),
+            hands_per_hour=_ratio(hands * 3600, seconds),
+            win_rate=self.features._calculate_win_rate_from_counts(
+                winnings, hands, tournament_hands, big_blinds_won, big_blind_hands
+            ).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
+            net_result=cents_to_decimal(winnings),
+        )
+
+
+def _ratio(numerator: float, denominator: float) -> Decimal:
+    """numerator / denominator to two places, 0 for an empty denominator."""
+    if not denominator:
+        return Decimal('0.00')
+    return Decimal(str(numerator / denominator)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def _as_datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
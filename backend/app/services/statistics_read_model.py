@@ -0,0 +1,44 @@
+"""
+Column-projected read model for statistics queries.
+
+Statistics only read a handful of PokerHand columns. Selecting those columns
+as Core rows skips ORM hydration, identity-map bookkeeping and the large
+columns (raw_text, player_stacks, timebank_info, ...) entirely. Rows expose
+the columns as attributes, so the statistics calculators read them exactly
+like PokerHand instances.
+"""
+from typing import Any
+
+from sqlalchemy import Select, select
+
+from app.models.hand import PokerHand
+
+
+# Columns read by the statistics calculators
+STATISTICS_HAND_COLUMNS = (
+    PokerHand.id,
+    PokerHand.position,
+    PokerHand.actions,
+    PokerHand.result,
+    PokerHand.pot_size,
+    PokerHand.game_format,
+    PokerHand.blinds,
+    PokerHand.date_played,
+    PokerHand.tournament_info,
+    PokerHand.net_result,
+    PokerHand.big_blind,
+)
+
+
+def select_statistics_hands(*conditions: Any) -> Select:
+    """
+    Select the statistics columns of the hands matching the conditions.
+
+    Args:
+        *conditions: WHERE clauses on PokerHand
+
+    Returns:
+        Select statement; filters, ordering and limits can be chained onto it
+    """
+    return select(*STATISTICS_HAND_COLUMNS).where(*conditions)
+
@@ -0,0 +1,252 @@
+"""
+NumPy time-series engine for trend analytics.
+
+A series is a metric's values in time order with a weight per value: the
+hands behind each trend interval, or unit weights for a per-hand series.
+Every analysis is a fixed number of vectorized passes over the arrays, so
+a series of years of daily buckets or of individual hands costs a few
+array operations rather than a Python loop per value:
+
+- rolling_mean: weighted mean of the last window values, from cumulative sums
+- ewma: weighted exponentially weighted moving average, decayed block by
+  block so the scaled cumulative sums stay within floating-point range
+- linear_trend: weighted least-squares slope with a two-sided t-test
+- change_points: binary segmentation of the weighted mean, each split found
+  with one cumulative-sum pass over its segment
+"""
+import math
+from typing import List, NamedTuple, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# Slopes whose two-sided p-value is below this are statistically significant
+SIGNIFICANCE_LEVEL = 0.05
+
+# Splits must explain this many times log(n) noise variances to count as a change point
+CHANGE_POINT_PENALTY = 3.0
+
+# Fewest values on either side of a change point
+MIN_SEGMENT_SIZE = 2
+
+# Largest exponent of the decay factor applied within one EWMA block
+_EWMA_BLOCK_EXPONENT = 50.0
+
+# Median of the chi-squared distribution with one degree of freedom
+_CHI2_1_MEDIAN = 0.4549364231195724
+
+
+class LinearTrend(NamedTuple):
+    """Least-squares trend of a series."""
+    slope: float
+    intercept: float
+    p_value: float
+    
+    @property
+    def is_significant(self) -> bool:
+        return self.p_value < SIGNIFICANCE_LEVEL
+
+
+def rolling_mean(values, weights=None, window: int = 7):
+    """
+    Weighted mean of each value and the window - 1 values before it.
+    
+    Args:
+        values: Metric values in time order
+        weights: Weight of each value (unit weights if None)
+        window: Values per window
+    
+    Returns:
+        Array of window means, NaN until the first window is full
+    """
+    values, weights = _as_arrays(values, weights)
+    weighted_sums = np.concatenate(([0.0], np.cumsum(values * weights)))
+    weight_sums = np.concatenate(([0.0], np.cumsum(weights)))
+    
+    means = np.full(len(values), np.nan)
+    if len(values) >= window:
+        window_weights = weight_sums[window:] - weight_sums[:-window]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means[window - 1:] = (weighted_sums[window:] - weighted_sums[:-window]) / window_weights
+    return means
+
+
+def ewma(values, weights=None, span: int = 10):
+    """
+    Weighted exponentially weighted moving average.
+    
+    Each value counts with its weight times (1 - alpha) to the power of its
+    age, alpha = 2 / (span + 1), normalized by the sum of those factors.
+    
+    Args:
+        values: Metric values in time order
+        weights: Weight of each value (unit weights if None)
+        span: Span of the average, in values
+    
+    Returns:
+        Array of averages, one per value
+    """
+    values, weights = _as_arrays(values, weights)
+    decay = 1.0 - 2.0 / (span + 1)
+    return _decayed_sums(values * weights, decay) / _decayed_sums(weights, decay)
+
+
+def linear_trend(positions, values, weights=None) -> Optional[LinearTrend]:
+    """
+    Weighted least-squares line through a series with a t-test of its slope.
+    
+    Args:
+        positions: Time of each value, such as its interval index
+        values: Metric values
+        weights: Weight of each value (unit weights if None)
+    
+    Returns:
+        LinearTrend with the slope per position unit, or None for fewer than
+        three values or a single position
+    """
+    values, weights = _as_arrays(values, weights)
+    positions = np.asarray(positions, dtype=float)
+    if len(values) < 3:
+        return None
+    
+    total_weight = weights.sum()
+    mean_x = (weights * positions).sum() / total_weight
+    mean_y = (weights * values).sum() / total_weight
+    dx = positions - mean_x
+    sxx = (weights * dx * dx).sum()
+    if sxx == 0:
+        return None
+    
+    slope = (weights * dx * (values - mean_y)).sum() / sxx
+    intercept = mean_y - slope * mean_x
+    residuals = values - intercept - slope * positions
+    
+    # Weights are relative precisions, so only their ratios enter the slope's variance
+    degrees_of_freedom = len(values) - 2
+    slope_variance = (weights * residuals * residuals).sum() / degrees_of_freedom / sxx
+    if slope_variance == 0:
+        return LinearTrend(float(slope), float(intercept), 0.0 if slope else 1.0)
+    
+    t_statistic = slope / math.sqrt(slope_variance)
+    return LinearTrend(float(slope), float(intercept), _t_test_p_value(float(t_statistic), degrees_of_freedom))
+
+
+def change_points(values, weights=None, penalty: float = CHANGE_POINT_PENALTY) -> List[int]:
+    """
+    Indices where the weighted mean of a series shifts.
+    
+    A value of weight w is taken to vary around its segment's mean with
+    variance s^2 / w, as a bucket's rate does with s^2 the per-hand variance;
+    s^2 is estimated from the median squared difference of neighbouring
+    values, which level shifts barely move. Segments are split where the
+    split reduces the weighted squared error the most, as long as that
+    reduction exceeds penalty * log(n) * s^2.
+    
+    Args:
+        values: Metric values in time order
+        weights: Weight of each value (unit weights if None)
+        penalty: Penalty per change point, in units of log(n) noise variances
+    
+    Returns:
+        Sorted indices of the first value after each change
+    """
+    values, weights = _as_arrays(values, weights)
+    count = len(values)
+    if count < 2 * MIN_SEGMENT_SIZE:
+        return []
+    
+    noise_variance = np.median(np.diff(values) ** 2 / (1.0 / weights[1:] + 1.0 / weights[:-1])) / _CHI2_1_MEDIAN
+    if noise_variance <= 0:
+        noise_variance = np.finfo(float).tiny
+    threshold = penalty * math.log(count) * noise_variance
+    
+    found = []
+    segments = [(0, count)]
+    while segments:
+        start, end = segments.pop()
+        if end - start < 2 * MIN_SEGMENT_SIZE:
+            continue
+        
+        segment_values = values[start:end]
+        segment_weights = weights[start:end]
+        left_weights = np.cumsum(segment_weights)[:-1]
+        left_sums = np.cumsum(segment_values * segment_weights)[:-1]
+        total_weight = left_weights[-1] + segment_weights[-1]
+        total_sum = left_sums[-1] + segment_values[-1] * segment_weights[-1]
+        
+        # Reduction in weighted squared error of splitting after each value
+        right_weights = total_weight - left_weights
+        gains = (left_sums / left_weights - (total_sum - left_sums) / right_weights) ** 2
+        gains *= left_weights * right_weights / total_weight
+        gains[:MIN_SEGMENT_SIZE - 1] = -np.inf
+        gains[len(gains) - MIN_SEGMENT_SIZE + 1:] = -np.inf
+        
+        best = int(np.argmax(gains))
+        if gains[best] > threshold:
+            split = start + best + 1
+            found.append(split)
+            segments.extend([(start, split), (split, end)])
+    return sorted(found)
+
+
+def _as_arrays(values, weights):
+    values = np.asarray(values, dtype=float)
+    weights = np.ones_like(values) if weights is None else np.asarray(weights, dtype=float)
+    return values, weights
+
+
+def _decayed_sums(values, decay: float):
+    """sum over i <= t of values[i] * decay ** (t - i), for every t."""
+    if decay <= 0:
+        return values.copy()
+    
+    # Within a block decay ** -offset stays below exp(_EWMA_BLOCK_EXPONENT)
+    block = max(1, int(_EWMA_BLOCK_EXPONENT / -math.log(decay)))
+    sums = np.empty(len(values))
+    carried = 0.0
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(len(chunk), dtype=float)
+        sums[start:start + len(chunk)] = (np.cumsum(chunk / powers) + carried * decay) * powers
+        carried = sums[start + len(chunk) - 1]
+    return sums
+
+
+def _t_test_p_value(t_statistic: float, degrees_of_freedom: int) -> float:
+    """Two-sided p-value of Student's t statistic."""
+    x = degrees_of_freedom / (degrees_of_freedom + t_statistic * t_statistic)
+    return _regularized_incomplete_beta(degrees_of_freedom / 2.0, 0.5, x)
+
+
+def _regularized_incomplete_beta(a: float, b: float, x: float) -> float:
+    """I_x(a, b) by its continued fraction (modified Lentz's method)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    if x > (a + 1.0) / (a + b + 2.0):
+        return 1.0 - _regularized_incomplete_beta(b, a, 1.0 - x)
+    
+    log_front = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    fraction = d
+    for m in range(1, 300):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            fraction *= c * d
+        if abs(c * d - 1.0) < 1e-15:
+            break
+    return math.exp(log_front) * fraction / a
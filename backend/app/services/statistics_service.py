@@ -3,16 +3,27 @@ Statistics calculation service for poker hand analysis.
 Enhanced with reliability features including retry logic, caching, and data integrity validation.
 """
 import asyncio
-from datetime import datetime, timezone, timedelta
+import copy
+import hashlib
+import json
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, date, timezone, timedelta
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Dict, List, Optional, Any, Tuple, Callable
-from sqlalchemy import select, func, and_, or_, desc
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Any, Sequence, Tuple, Callable
+from sqlalchemy import select, func, and_, or_, not_, desc, case, cast, delete, Date, DateTime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 from sqlalchemy.exc import SQLAlchemyError, DisconnectionError, TimeoutError as SQLTimeoutError
 import statistics
+import pytz
 
+from app.core.config import settings
 from app.models.hand import PokerHand
-from app.models.statistics import StatisticsCache
+from app.models.hand_facts import HandFacts
+from app.models.statistics import StatisticsCache, DailyStatisticsRollup
+from app.models.play_session import PlaySession
 from app.services.session_service import SessionService
 from app.schemas.statistics import (
     BasicStatistics,
@@ -21,16 +32,57 @@ from app.schemas.statistics import (
     TournamentStatistics,
     StatisticsFilters,
     StatisticsResponse,
+    StatisticsComparisonResponse,
+    StatisticsPeriodComparisonResponse,
     TrendData,
     TrendDataPoint,
-    SessionStatistics
+    TrendOptions,
+    SessionStatistics,
+    WinningsGraph,
+    MultiTablingAnalysis
 )
 from app.services.cache_service import StatisticsCacheService
+from app.services.statistics_accumulator import (
+    ADVANCED_PERCENTAGE_STATS,
+    StatisticsAccumulator,
+    BasicStatisticsAccumulator,
+    PositionalStatisticsAccumulator,
+    AdvancedStatisticsAccumulator,
+    SessionStatisticsAccumulator,
+    cents_to_decimal,
+    to_cents
+)
+from app.services import statistics_comparison, statistics_series, statistics_vectorized
+from app.services.statistics_graph import DEFAULT_GRAPH_POINTS, WinningsGraphBuilder
+from app.services.statistics_index import hand_index_registry
+from app.services.statistics_lattice import MERGEABLE_DIMENSIONS, StatisticsCube, normalize_filters, split_filters
+from app.services.statistics_multitabling import MULTITABLING_COLUMNS, MultiTablingBuilder
+from app.services.statistics_read_model import select_statistics_hands
+from app.services.statistics_sessions import (
+    MIN_SESSION_HANDS,
+    merge_sessions,
+    session_counters,
+    session_values,
+    sessionize
+)
+from app.services.statistics_snapshot import SNAPSHOT_COLUMNS, HandSnapshot, _as_utc
+from app.services.single_flight import SingleFlight
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Standard table order used to sort positional statistics
+POSITION_ORDER = ['UTG', 'UTG+1', 'UTG+2', 'MP', 'MP+1', 'MP+2', 'CO', 'BTN', 'SB', 'BB']
+
+# Backends for statistics computed from loaded hands
+STATISTICS_BACKENDS = ('python', 'numpy')
+
+# Statistics calculations in flight in this process, joined by identical concurrent requests
+statistics_flights = SingleFlight()
+
+# Background refreshes of stale cached results in flight in this process, by calculation
+statistics_refreshes: Dict[str, asyncio.Task] = {}
 
 class StatisticsReliabilityError(Exception):
     """Custom exception for statistics reliability issues."""
@@ -45,10 +97,91 @@ class DataIntegrityError(Exception):
 class StatisticsService:
     """Service for calculating comprehensive poker statistics with enhanced reliability features."""
     
-    def __init__(self, db: AsyncSession, cache_service: Optional[StatisticsCacheService] = None):
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache_service: Optional[StatisticsCacheService] = None,
+        use_hand_facts: Optional[bool] = None,
+        use_daily_rollups: Optional[bool] = None,
+        backend: Optional[str] = None,
+        stream_chunk_size: Optional[int] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+        reduction_executor: Optional[Executor] = None,
+        use_filter_lattice: Optional[bool] = None,
+        use_hand_index: Optional[bool] = None,
+        use_play_sessions: Optional[bool] = None,
+        session_gap_minutes: Optional[int] = None,
+        table_idle_minutes: Optional[int] = None,
+        coalesce_lock_seconds: Optional[float] = None,
+        refresh_session_factory: Optional[Callable[[], AsyncSession]] = None,
+        snapshot_max_hands: Optional[int] = None
+    ):
         self.db = db
         self.cache_service = cache_service
         
+        # Aggregate the precomputed hand_facts table in SQL instead of loading hands
+        self.use_hand_facts = settings.STATISTICS_USE_HAND_FACTS if use_hand_facts is None else use_hand_facts
+        
+        # Answer date-ranged basic, positional and trend queries from daily rollups
+        self.use_daily_rollups = (
+            settings.STATISTICS_USE_DAILY_ROLLUPS if use_daily_rollups is None else use_daily_rollups
+        )
+        
+        # Default backend for statistics computed from loaded hands; overridable per call
+        self.backend = settings.STATISTICS_BACKEND if backend is None else backend
+        
+        # Most hands load_snapshot holds in memory for the calculators of one request
+        self.snapshot_max_hands = (
+            settings.STATISTICS_SNAPSHOT_MAX_HANDS if snapshot_max_hands is None else snapshot_max_hands
+        )
+        
+        # Stream hands from a server-side cursor in chunks of this size; 0 loads them all at once
+        self.stream_chunk_size = (
+            settings.STATISTICS_STREAM_CHUNK_SIZE if stream_chunk_size is None else stream_chunk_size
+        )
+        
+        # Session factory for computing independent statistics components concurrently
+        self.session_factory = session_factory
+        
+        # Thread or process pool for folding loaded hands into counters; None folds inline
+        self.reduction_executor = reduction_executor
+        
+        # Answer filtered statistics from cached per-dimension breakdowns (needs cache_service)
+        self.use_filter_lattice = (
+            settings.STATISTICS_FILTER_LATTICE if use_filter_lattice is None else use_filter_lattice
+        )
+        
+        # Answer filtered statistics from per-user bitmap indexes kept in process memory
+        self.use_hand_index = settings.STATISTICS_HAND_INDEX if use_hand_index is None else use_hand_index
+        self.hand_indexes = hand_index_registry
+        
+        # Answer session lists and daily views from the play_sessions table
+        self.use_play_sessions = (
+            settings.STATISTICS_USE_PLAY_SESSIONS if use_play_sessions is None else use_play_sessions
+        )
+        
+        # Idle time between two hands that ends a play session
+        self.session_gap = timedelta(minutes=(
+            settings.STATISTICS_SESSION_GAP_MINUTES if session_gap_minutes is None else session_gap_minutes
+        ))
+        
+        # Idle time after which a table counts as closed when analysing multi-tabling
+        self.table_idle_gap = timedelta(minutes=(
+            settings.STATISTICS_TABLE_IDLE_MINUTES if table_idle_minutes is None else table_idle_minutes
+        ))
+        
+        # Identical concurrent calculations run once: in this process through shared futures,
+        # across workers through a Redis lock held this long while the others wait
+        self.flights = statistics_flights
+        self.coalesce_lock_seconds = (
+            settings.STATISTICS_COALESCE_LOCK_SECONDS if coalesce_lock_seconds is None else coalesce_lock_seconds
+        )
+        
+        # Session factory for refreshing stale cached statistics and trends in the background while
+        # the stale result is served; without one, results past their cache TTL are recalculated
+        self.refresh_session_factory = refresh_session_factory
+        self.refreshes = statistics_refreshes
+        
         # Retry configuration for exponential backoff
         self.retry_config = {
             'max_attempts': 3,
@@ -80,10 +213,10 @@ class StatisticsService:
             operation: The async function to execute
             operation_name: Name of the operation for logging
             *args, **kwargs: Arguments to pass to the operation
-            
+        
         Returns:
             Result of the operation
-            
+        
         Raises:
             StatisticsReliabilityError: If all retry attempts fail
         """
@@ -98,7 +231,7 @@ class StatisticsService:
                     logger.info(f"Operation {operation_name} succeeded on attempt {attempt + 1}")
                 
                 return result
-                
+            
             except (SQLAlchemyError, DisconnectionError, SQLTimeoutError, ConnectionError) as e:
                 last_exception = e
                 attempt_num = attempt + 1
@@ -147,7 +280,7 @@ class StatisticsService:
             calculation_func: Function to calculate fresh data
             operation_name: Name of the operation for logging
             *args, **kwargs: Arguments for calculation function
-            
+        
         Returns:
             Statistics data (fresh or cached)
         """
@@ -165,8 +298,8 @@ class StatisticsService:
             except Exception as e:
                 logger.warning(f"Cache retrieval failed for {operation_name}: {e}")
         
-        # Calculate fresh data with retry logic
-        try:
+        async def calculate() -> Any:
+            # Calculate fresh data with retry logic
             fresh_data = await self._execute_with_retry(
                 calculation_func,
                 operation_name,
@@ -190,7 +323,21 @@ class StatisticsService:
                     logger.warning(f"Cache storage failed for {operation_name}: {e}")
             
             return fresh_data
-            
+        
+        async def get_cached() -> Any:
+            return await self.cache_service.get_user_statistics(
+                cache_key_params.get('user_id'),
+                cache_key_params.get('filters')
+            )
+        
+        try:
+            # Rows passed to the calculation give the same result as its own query
+            params = {name: value for name, value in kwargs.items() if name != 'hands'}
+            flight_key = self._flight_key(
+                operation_name, cache_key_params.get('user_id'), cache_key_params.get('filters'), **params
+            )
+            return await self._coalesced(flight_key, get_cached, calculate)
+        
         except StatisticsReliabilityError as e:
             # If calculation fails and we have cached data, use it as fallback
             if cached_data:
@@ -202,6 +349,110 @@ class StatisticsService:
                 logger.error(f"No cached data available for fallback in {operation_name}")
                 raise
     
+    def _flight_key(self, operation_name: str, user_id: str, filters: Optional[StatisticsFilters], **params) -> str:
+        """Identity of a calculation, equal for identical requests in every worker."""
+        filters_key = normalize_filters(filters).model_dump_json() if filters else ''
+        params_key = json.dumps(params, sort_keys=True, default=str)
+        digest = hashlib.md5(f"{filters_key}|{params_key}".encode()).hexdigest()[:16]
+        return f"{operation_name}:{user_id}:{digest}"
+    
+    async def _coalesced(
+        self,
+        flight_key: str,
+        get_cached: Callable[[], Any],
+        calculate: Callable[[], Any]
+    ) -> Any:
+        """
+        Run a calculation once for all identical concurrent requests.
+        
+        Requests of this process join the calculation in flight. With a cache,
+        the calculating worker also holds a short Redis lock; a worker finding
+        the lock taken waits for the result to appear in the cache, and
+        calculates itself if the lock is released or expires without one.
+        
+        Args:
+            flight_key: Identity of the calculation (see _flight_key)
+            get_cached: Reads the calculation's cached result, None if absent
+            calculate: Calculates the result and caches it
+        
+        Returns:
+            The calculated or cached result
+        """
+        async def lead() -> Any:
+            if not self.cache_service:
+                return await calculate()
+            
+            token = await self.cache_service.acquire_lock(flight_key, self.coalesce_lock_seconds)
+            if token is None:
+                cached = await self._wait_for_cached(flight_key, get_cached)
+                if cached is not None:
+                    await self.cache_service.record_coalesced('cross_worker')
+                    return cached
+            try:
+                return await calculate()
+            finally:
+                if token is not None:
+                    await self.cache_service.release_lock(flight_key, token)
+        
+        result, coalesced = await self.flights.run(flight_key, lead)
+        if coalesced:
+            logger.debug(f"Joined calculation in flight for {flight_key}")
+            if self.cache_service:
+                await self.cache_service.record_coalesced('in_process')
+        return result
+    
+    async def _wait_for_cached(self, flight_key: str, get_cached: Callable[[], Any]) -> Any:
+        """Poll the cache for another worker's result while that worker holds the calculation's lock."""
+        deadline = time.monotonic() + self.coalesce_lock_seconds
+        delay = 0.02
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.25)
+            
+            cached = await get_cached()
+            if cached is not None:
+                return cached
+            if not await self.cache_service.is_locked(flight_key):
+                # Released without a cached result (the other calculation failed), or cached just now
+                return await get_cached()
+        return None
+    
+    def _schedule_refresh(self, flight_key: str, refresh: Callable[['StatisticsService'], Awaitable[Any]]) -> None:
+        """
+        Recalculate a stale cached result in the background, unless its refresh is already in flight.
+        
+        Args:
+            flight_key: Identity of the calculation (see _flight_key)
+            refresh: Recalculates and caches the result with the service it is given
+        """
+        if flight_key in self.refreshes:
+            return
+        
+        task = asyncio.create_task(self._refresh_stale(flight_key, refresh))
+        self.refreshes[flight_key] = task
+        task.add_done_callback(lambda done: self.refreshes.pop(flight_key, None))
+    
+    async def _refresh_stale(self, flight_key: str, refresh: Callable[['StatisticsService'], Awaitable[Any]]) -> None:
+        """Run a refresh on its own session while holding the calculation's refresh lock."""
+        # One worker refreshes a key at a time; the others keep serving the stale result
+        lock_name = f"refresh:{flight_key}"
+        token = await self.cache_service.acquire_lock(lock_name, self.coalesce_lock_seconds)
+        if token is None:
+            return
+        
+        try:
+            async with self.refresh_session_factory() as session:
+                # The request's session may be gone by now
+                service = copy.copy(self)
+                service.db = session
+                service.refresh_session_factory = None
+                await refresh(service)
+            logger.debug(f"Refreshed stale cached result for {flight_key}")
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {flight_key}: {e}")
+        finally:
+            await self.cache_service.release_lock(lock_name, token)
+    
     def _validate_data_integrity(self, data: Any, operation_name: str) -> None:
         """
         Validate data integrity before returning statistics.
@@ -209,7 +460,7 @@ class StatisticsService:
         Args:
             data: Statistics data to validate
             operation_name: Name of the operation for logging
-            
+        
         Raises:
             DataIntegrityError: If data integrity validation fails
         """
@@ -246,7 +497,7 @@ class StatisticsService:
                     )
             
             logger.debug(f"Data integrity validation passed for {operation_name}")
-            
+        
         except Exception as e:
             logger.error(f"Data integrity validation failed for {operation_name}: {e}")
             raise DataIntegrityError(f"Data integrity validation failed: {str(e)}") from e
@@ -254,7 +505,9 @@ class StatisticsService:
     async def calculate_basic_statistics(
         self, 
         user_id: str, 
-        filters: Optional[StatisticsFilters] = None
+        filters: Optional[StatisticsFilters] = None,
+        backend: Optional[str] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> BasicStatistics:
         """
         Calculate basic poker statistics with enhanced reliability and caching.
@@ -262,10 +515,12 @@ class StatisticsService:
         Args:
             user_id: User ID to calculate statistics for
             filters: Optional filters to apply to the calculation
-            
+            backend: 'python' or 'numpy' for hands loaded row by row (defaults to settings)
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
+        
         Returns:
             BasicStatistics object with calculated metrics
-            
+        
         Raises:
             StatisticsReliabilityError: If calculation fails after retries
             DataIntegrityError: If data integrity validation fails
@@ -282,13 +537,17 @@ class StatisticsService:
             self._calculate_basic_statistics_internal,
             "calculate_basic_statistics",
             user_id,
-            filters
+            filters,
+            backend=backend,
+            hands=hands
         )
     
     async def _calculate_basic_statistics_internal(
         self, 
         user_id: str, 
-        filters: Optional[StatisticsFilters] = None
+        filters: Optional[StatisticsFilters] = None,
+        backend: Optional[str] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> BasicStatistics:
         """
         Internal method to calculate basic poker statistics (VPIP, PFR, aggression factor, win rate).
@@ -296,125 +555,45 @@ class StatisticsService:
         Args:
             user_id: User ID to calculate statistics for
             filters: Optional filters to apply to the calculation
-            
+            backend: 'python' or 'numpy' for hands loaded row by row (defaults to settings)
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
+        
         Returns:
             BasicStatistics object with calculated metrics
         """
+        if hands is None and self._can_use_daily_rollups(filters):
+            return await self._calculate_basic_statistics_from_rollups(user_id, filters)
+        
+        if hands is None and self.use_hand_facts:
+            return await self._calculate_basic_statistics_from_facts(user_id, filters)
+        
         # Build base query
-        query = select(PokerHand).where(PokerHand.user_id == user_id)
+        query = select_statistics_hands(PokerHand.user_id == user_id)
         
         # Apply filters
         if filters:
             query = self._apply_filters(query, filters)
         
-        # Execute query to get hands
-        result = await self.db.execute(query)
-        hands = result.scalars().all()
-        
-        if not hands:
-            return BasicStatistics(
-                total_hands=0,
-                vpip=Decimal('0.0'),
-                pfr=Decimal('0.0'),
-                aggression_factor=Decimal('0.0'),
-                win_rate=Decimal('0.0')
-            )
-        
-        total_hands = len(hands)
-        
-        # Calculate VPIP (Voluntarily Put In Pot)
-        vpip_hands = 0
-        pfr_hands = 0
-        aggressive_actions = 0
-        passive_actions = 0
-        total_winnings = Decimal('0.0')
-        showdown_hands = 0
-        won_showdown = 0
-        steal_opportunities = 0
-        steal_attempts = 0
-        fold_to_steal_opportunities = 0
-        fold_to_steal_count = 0
-        
-        for hand in hands:
-            actions = hand.actions or {}
-            
-            # Calculate VPIP - did player voluntarily put money in pot preflop?
-            if self._is_vpip_hand(actions, hand.position):
-                vpip_hands += 1
-            
-            # Calculate PFR - did player raise preflop?
-            if self._is_pfr_hand(actions):
-                pfr_hands += 1
-            
-            # Calculate aggression factor
-            agg_actions = self._count_aggressive_actions(actions)
-            pass_actions = self._count_passive_actions(actions)
-            aggressive_actions += agg_actions
-            passive_actions += pass_actions
-            
-            # Calculate win rate
-            if hand.result and hand.pot_size:
-                winnings = self._calculate_hand_winnings(hand)
-                total_winnings += winnings
-            
-            # Calculate showdown stats
-            if self._went_to_showdown(actions):
-                showdown_hands += 1
-                if hand.result == 'won':
-                    won_showdown += 1
-            
-            # Calculate steal stats
-            if self._is_steal_opportunity(hand.position, actions):
-                steal_opportunities += 1
-                if self._attempted_steal(actions):
-                    steal_attempts += 1
-            
-            # Calculate fold to steal
-            if self._is_fold_to_steal_opportunity(hand.position, actions):
-                fold_to_steal_opportunities += 1
-                if self._folded_to_steal(actions):
-                    fold_to_steal_count += 1
-        
-        # Calculate percentages
-        vpip = self._calculate_percentage(vpip_hands, total_hands)
-        pfr = self._calculate_percentage(pfr_hands, total_hands)
-        
-        # Ensure mathematical consistency: PFR should never exceed VPIP
-        if pfr > vpip:
-            logger.warning(f"PFR ({pfr}) exceeds VPIP ({vpip}) for user {user_id}. Adjusting PFR to match VPIP.")
-            pfr = vpip
-        
-        # Calculate aggression factor
-        if passive_actions > 0:
-            aggression_factor = Decimal(str(aggressive_actions)) / Decimal(str(passive_actions))
-        else:
-            aggression_factor = Decimal('0.0') if aggressive_actions == 0 else Decimal('999.0')
-        
-        # Calculate win rate (bb/100 for cash games, ROI% for tournaments)
-        win_rate = self._calculate_win_rate(total_winnings, total_hands, hands)
+        vectorized = self._use_vectorized_backend(backend)
+        counters = BasicStatisticsAccumulator(self)
         
-        # Calculate optional stats
-        went_to_showdown = self._calculate_percentage(showdown_hands, total_hands) if total_hands > 0 else None
-        won_at_showdown = self._calculate_percentage(won_showdown, showdown_hands) if showdown_hands > 0 else None
-        attempt_to_steal = self._calculate_percentage(steal_attempts, steal_opportunities) if steal_opportunities > 0 else None
-        fold_to_steal = self._calculate_percentage(fold_to_steal_count, fold_to_steal_opportunities) if fold_to_steal_opportunities > 0 else None
+        # Execute query and count hands chunk by chunk
+        async for hands in self._iter_hand_chunks(query, hands):
+            if vectorized:
+                counters.merge(statistics_vectorized.basic_statistics_counters(
+                    self, statistics_vectorized.HandColumns.decode(self, hands)
+                ))
+                continue
+            await self._add_hands(counters, hands)
         
-        return BasicStatistics(
-            total_hands=total_hands,
-            vpip=vpip,
-            pfr=pfr,
-            aggression_factor=aggression_factor.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-            win_rate=win_rate,
-            went_to_showdown=went_to_showdown,
-            won_at_showdown=won_at_showdown,
-            attempt_to_steal=attempt_to_steal,
-            fold_to_steal=fold_to_steal
-        )
+        return self._finalize_basic(counters, user_id)
     
     async def calculate_positional_statistics(
         self, 
         user_id: str, 
-        filters: Optional[StatisticsFilters] = None
+        filters: Optional[StatisticsFilters] = None,
+        backend: Optional[str] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> List[PositionalStatistics]:
         """
         Calculate position-based statistics with enhanced reliability.
@@ -422,7 +601,9 @@ class StatisticsService:
         Args:
             user_id: User ID to calculate statistics for
             filters: Optional filters to apply to the calculation
-            
+            backend: 'python' or 'numpy' for hands loaded row by row (defaults to settings)
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
+        
         Returns:
             List of PositionalStatistics for each position
         """
@@ -436,13 +617,17 @@ class StatisticsService:
             self._calculate_positional_statistics_internal,
             "calculate_positional_statistics",
             user_id,
-            filters
+            filters,
+            backend=backend,
+            hands=hands
         )
     
     async def _calculate_positional_statistics_internal(
         self, 
         user_id: str, 
-        filters: Optional[StatisticsFilters] = None
+        filters: Optional[StatisticsFilters] = None,
+        backend: Optional[str] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> List[PositionalStatistics]:
         """
         Internal method to calculate position-based statistics.
@@ -450,12 +635,21 @@ class StatisticsService:
         Args:
             user_id: User ID to calculate statistics for
             filters: Optional filters to apply to the calculation
-            
+            backend: 'python' or 'numpy' for hands loaded row by row (defaults to settings)
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
+        
         Returns:
             List of PositionalStatistics for each position
         """
+        if hands is not None:
+            hands = [hand for hand in hands if hand.position is not None]
+        elif self._can_use_daily_rollups(filters):
+            return await self._calculate_positional_statistics_from_rollups(user_id, filters)
+        elif self.use_hand_facts:
+            return await self._calculate_positional_statistics_from_facts(user_id, filters)
+        
         # Build base query
-        query = select(PokerHand).where(
+        query = select_statistics_hands(
             and_(
                 PokerHand.user_id == user_id,
                 PokerHand.position.isnot(None)
@@ -466,238 +660,532 @@ class StatisticsService:
         if filters:
             query = self._apply_filters(query, filters)
         
-        # Execute query
-        result = await self.db.execute(query)
-        hands = result.scalars().all()
-        
-        # Group hands by position
-        position_hands = {}
-        for hand in hands:
-            position = hand.position
-            if position not in position_hands:
-                position_hands[position] = []
-            position_hands[position].append(hand)
+        vectorized = self._use_vectorized_backend(backend)
         
-        # Calculate stats for each position
-        positional_stats = []
-        for position, hands_list in position_hands.items():
-            if len(hands_list) < 5:  # Skip positions with too few hands
+        # Execute query and group hand counters by position, chunk by chunk
+        position_counters = {}
+        async for hands in self._iter_hand_chunks(query, hands):
+            if vectorized:
+                chunk_counters = statistics_vectorized.positional_statistics_counters(
+                    self, statistics_vectorized.HandColumns.decode(self, hands)
+                )
+                for position, counters in chunk_counters.items():
+                    if position in position_counters:
+                        position_counters[position].merge(counters)
+                    else:
+                        position_counters[position] = counters
                 continue
-            
-            total_hands = len(hands_list)
-            vpip_hands = 0
-            pfr_hands = 0
-            aggressive_actions = 0
-            passive_actions = 0
-            total_winnings = Decimal('0.0')
-            three_bet_opportunities = 0
-            three_bet_count = 0
-            fold_to_three_bet_opportunities = 0
-            fold_to_three_bet_count = 0
-            
-            for hand in hands_list:
-                actions = hand.actions or {}
-                
-                # VPIP calculation
-                if self._is_vpip_hand(actions, position):
-                    vpip_hands += 1
-                
-                # PFR calculation
-                if self._is_pfr_hand(actions):
-                    pfr_hands += 1
-                
-                # Aggression factor
-                agg_actions = self._count_aggressive_actions(actions)
-                pass_actions = self._count_passive_actions(actions)
-                aggressive_actions += agg_actions
-                passive_actions += pass_actions
-                
-                # Win rate
-                if hand.result and hand.pot_size:
-                    winnings = self._calculate_hand_winnings(hand)
-                    total_winnings += winnings
-                
-                # 3-bet stats
-                if self._is_three_bet_opportunity(actions):
-                    three_bet_opportunities += 1
-                    if self._made_three_bet(actions):
-                        three_bet_count += 1
-                
-                if self._is_fold_to_three_bet_opportunity(actions):
-                    fold_to_three_bet_opportunities += 1
-                    if self._folded_to_three_bet(actions):
-                        fold_to_three_bet_count += 1
-            
-            # Calculate percentages
-            vpip = self._calculate_percentage(vpip_hands, total_hands)
-            pfr = self._calculate_percentage(pfr_hands, total_hands)
-            
-            # Ensure mathematical consistency: PFR should never exceed VPIP
-            if pfr > vpip:
-                logger.warning(f"Position {position}: PFR ({pfr}) exceeds VPIP ({vpip}). Adjusting PFR to match VPIP.")
-                pfr = vpip
-            
-            # Aggression factor
-            if passive_actions > 0:
-                aggression_factor = Decimal(str(aggressive_actions)) / Decimal(str(passive_actions))
-            else:
-                aggression_factor = Decimal('0.0') if aggressive_actions == 0 else Decimal('999.0')
-            
-            # Win rate
-            win_rate = self._calculate_win_rate(total_winnings, total_hands, hands_list)
-            
-            # 3-bet stats
-            three_bet_percentage = self._calculate_percentage(three_bet_count, three_bet_opportunities) if three_bet_opportunities > 0 else None
-            fold_to_three_bet = self._calculate_percentage(fold_to_three_bet_count, fold_to_three_bet_opportunities) if fold_to_three_bet_opportunities > 0 else None
-            
-            positional_stats.append(PositionalStatistics(
-                position=position,
-                hands_played=total_hands,
-                vpip=vpip,
-                pfr=pfr,
-                win_rate=win_rate,
-                aggression_factor=aggression_factor.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-                three_bet_percentage=three_bet_percentage,
-                fold_to_three_bet=fold_to_three_bet
-            ))
+            hands_by_position = {}
+            for hand in hands:
+                hands_by_position.setdefault(hand.position, []).append(hand)
+            for position, position_hands in hands_by_position.items():
+                counters = position_counters.get(position)
+                if counters is None:
+                    counters = position_counters[position] = PositionalStatisticsAccumulator(self)
+                await self._add_hands(counters, position_hands)
+        
+        return self._finalize_positional(position_counters)
+    
+    def _use_vectorized_backend(self, backend: Optional[str]) -> bool:
+        """
+        Whether statistics over loaded hands should use the NumPy backend.
         
-        # Sort by standard position order
-        position_order = ['UTG', 'UTG+1', 'UTG+2', 'MP', 'MP+1', 'MP+2', 'CO', 'BTN', 'SB', 'BB']
-        positional_stats.sort(key=lambda x: position_order.index(x.position) if x.position in position_order else 999)
+        Args:
+            backend: Per-call backend, or None for the service default
         
-        return positional_stats
+        Returns:
+            True for the vectorized backend, False for the per-hand loop
+        """
+        backend = backend or self.backend
+        if backend not in STATISTICS_BACKENDS:
+            raise ValueError(f"Unknown statistics backend {backend!r}; expected one of {STATISTICS_BACKENDS}")
+        
+        if backend == 'numpy' and not statistics_vectorized.NUMPY_AVAILABLE:
+            logger.warning("NumPy statistics backend requested but NumPy is not installed; using the per-hand loop")
+            return False
+        
+        return backend == 'numpy'
+    
+    async def _iter_hand_chunks(self, query, hands: Optional[Sequence[Any]] = None) -> AsyncIterator[Sequence[Any]]:
+        """
+        Execute a hand query and yield its rows in chunks.
+        
+        Rows the caller already loaded are yielded as they are. Otherwise,
+        with stream_chunk_size set the rows come from a server-side cursor in
+        chunks of that size, so memory stays bounded by the chunk size rather
+        than the number of matching hands. Without it all rows are yielded as
+        a single chunk.
+        
+        Args:
+            query: Hand query, usually built with select_statistics_hands
+            hands: Loaded rows matching the query, yielded instead of executing it
+        
+        Yields:
+            Sequences of hand rows
+        """
+        if hands is not None:
+            yield hands
+            return
+        
+        if not self.stream_chunk_size:
+            result = await self.db.execute(query)
+            yield result.all()
+            return
+        
+        result = await self.db.stream(query.execution_options(yield_per=self.stream_chunk_size))
+        async for hands in result.partitions():
+            yield hands
+    
+    async def _load_hands(self, query, hands: Optional[Sequence[Any]] = None) -> List[Any]:
+        """Execute a hand query and return all of its rows, or the loaded rows given for it."""
+        if hands is not None:
+            return list(hands)
+        
+        hands = []
+        async for chunk in self._iter_hand_chunks(query):
+            hands.extend(chunk)
+        return hands
+    
+    async def _add_hands(self, counters: StatisticsAccumulator, hands: Sequence[Any]) -> None:
+        """
+        Fold hands into an accumulator, in the reduction executor when one is set.
+        
+        A process pool gets the hands pickled and returns a chunk accumulator
+        that is merged back in; a thread pool folds into the accumulator directly.
+        """
+        if self.reduction_executor is None:
+            counters.add_all(hands)
+            return
+        
+        loop = asyncio.get_running_loop()
+        if isinstance(self.reduction_executor, ProcessPoolExecutor):
+            chunk_counters = await loop.run_in_executor(
+                self.reduction_executor, _accumulate_in_worker, type(counters), list(hands)
+            )
+            chunk_counters.features = self
+            counters.merge(chunk_counters)
+        else:
+            await loop.run_in_executor(self.reduction_executor, counters.add_all, hands)
+    
+    async def load_snapshot(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None
+    ) -> Optional[HandSnapshot]:
+        """
+        Load the user's hands matching the filters in one projected query.
+        
+        Meant for a single request that runs several calculators over the same
+        hands: pass snapshot.hands to each calculator as its hands argument.
+        
+        Args:
+            user_id: User whose hands to load
+            filters: Optional filters the hands must match
+        
+        Returns:
+            The loaded HandSnapshot, or None if more than snapshot_max_hands hands match
+        """
+        query = select(*SNAPSHOT_COLUMNS).where(PokerHand.user_id == user_id)
+        if filters:
+            query = self._apply_filters(query, filters)
+        return await HandSnapshot.load(self.db, user_id, query, self.snapshot_max_hands)
     
-    def _apply_filters(self, query, filters: StatisticsFilters):
-        """Apply comprehensive filters to the query with support for multiple criteria."""
+    def _apply_filters(self, query, filters: StatisticsFilters, model=PokerHand):
+        """
+        Apply comprehensive filters to the query with support for multiple criteria.
+        
+        ``model`` is the table being filtered; HandFacts carries the same filter columns as model.
+        """
         if filters.start_date:
-            query = query.where(PokerHand.date_played >= filters.start_date)
+            query = query.where(model.date_played >= filters.start_date)
         
         if filters.end_date:
-            query = query.where(PokerHand.date_played <= filters.end_date)
+            query = query.where(model.date_played <= filters.end_date)
         
         if filters.platform:
-            query = query.where(PokerHand.platform == filters.platform)
+            query = query.where(model.platform == filters.platform)
         
         if filters.game_type:
-            query = query.where(PokerHand.game_type == filters.game_type)
+            query = query.where(model.game_type == filters.game_type)
         
         if filters.game_format:
-            query = query.where(PokerHand.game_format == filters.game_format)
+            query = query.where(model.game_format == filters.game_format)
         
         if filters.position:
-            query = query.where(PokerHand.position == filters.position)
+            query = query.where(model.position == filters.position)
         
         if filters.stakes_filter:
-            query = query.where(PokerHand.stakes.in_(filters.stakes_filter))
+            query = query.where(model.stakes.in_(filters.stakes_filter))
         
         if filters.tournament_only:
-            query = query.where(PokerHand.game_format == 'tournament')
+            query = query.where(model.game_format == 'tournament')
         
         if filters.cash_only:
-            query = query.where(PokerHand.game_format == 'cash')
+            query = query.where(model.game_format == 'cash')
         
         if filters.play_money_only:
-            query = query.where(PokerHand.is_play_money == True)
+            query = query.where(model.is_play_money == True)
         
         if filters.exclude_play_money:
-            query = query.where(PokerHand.is_play_money == False)
+            query = query.where(model.is_play_money == False)
         
         return query
     
-    async def calculate_filtered_statistics(
-        self, 
-        user_id: str, 
-        filters: StatisticsFilters
-    ) -> StatisticsResponse:
+    async def _calculate_components_concurrently(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None
+    ) -> Tuple[Tuple[BasicStatistics, AdvancedStatistics, List[PositionalStatistics], Optional[TournamentStatistics]], Dict[str, float]]:
         """
-        Calculate comprehensive statistics with enhanced reliability, caching, and data integrity validation.
+        Calculate basic, advanced, positional and tournament statistics concurrently.
+        
+        Each component runs its own query on its own session from session_factory,
+        so the queries overlap instead of queueing on one connection. Loaded hands
+        are folded in the reduction executor when one is configured.
         
         Args:
             user_id: User ID to calculate statistics for
-            filters: Comprehensive filters to apply
-            
+            filters: Optional filters to apply to the calculation
+        
         Returns:
-            StatisticsResponse with all calculated statistics
-            
-        Raises:
-            StatisticsReliabilityError: If calculation fails after retries
-            DataIntegrityError: If data integrity validation fails
+            Tuple of (basic, advanced, positional, tournament) statistics, and the
+            seconds each component took plus the wall-clock 'total'
         """
-        operation_name = "calculate_filtered_statistics"
+        components = (
+            ('basic', '_calculate_basic_statistics_internal'),
+            ('advanced', '_calculate_advanced_statistics_internal'),
+            ('positional', '_calculate_positional_statistics_internal'),
+            ('tournament', '_calculate_tournament_statistics_internal'),
+        )
+        timings = {}
+        
+        async def run_component(name: str, method_name: str) -> Any:
+            started = time.perf_counter()
+            async with self.session_factory() as session:
+                component_service = StatisticsService(
+                    session,
+                    use_hand_facts=self.use_hand_facts,
+                    use_daily_rollups=self.use_daily_rollups,
+                    backend=self.backend,
+                    stream_chunk_size=self.stream_chunk_size,
+                    reduction_executor=self.reduction_executor
+                )
+                result = await getattr(component_service, method_name)(user_id, filters)
+            timings[name] = round(time.perf_counter() - started, 4)
+            return result
         
-        # Try to get from cache first
-        if self.cache_service:
-            try:
-                cached_stats = await self.cache_service.get_user_statistics(user_id, filters)
-                if cached_stats:
-                    logger.debug(f"Cache hit for user {user_id} filtered statistics")
-                    return StatisticsResponse(**cached_stats)
-            except Exception as e:
-                logger.warning(f"Cache retrieval failed for user {user_id}: {e}")
+        started = time.perf_counter()
+        results = await asyncio.gather(*(run_component(name, method) for name, method in components))
+        timings['total'] = round(time.perf_counter() - started, 4)
         
-        # Calculate all statistics with retry logic and error handling
-        try:
-            logger.debug(f"Calculating fresh filtered statistics for user {user_id}")
-            
-            # Calculate each component with individual retry logic
-            basic_stats = await self._execute_with_retry(
-                self._calculate_basic_statistics_internal,
-                f"{operation_name}_basic",
-                user_id, filters
-            )
-            
-            advanced_stats = await self._execute_with_retry(
-                self._calculate_advanced_statistics_internal,
-                f"{operation_name}_advanced", 
-                user_id, filters
-            )
-            
-            positional_stats = await self._execute_with_retry(
-                self._calculate_positional_statistics_internal,
-                f"{operation_name}_positional",
-                user_id, filters
-            )
-            
-            tournament_stats = await self._execute_with_retry(
-                self._calculate_tournament_statistics_internal,
-                f"{operation_name}_tournament",
-                user_id, filters
-            )
-            
-            # Validate minimum hands requirement
-            if filters.min_hands and basic_stats.total_hands < filters.min_hands:
-                raise ValueError(
-                    f"Insufficient hands for statistical significance. "
-                    f"Found {basic_stats.total_hands}, minimum required: {filters.min_hands}"
-                )
-            
-            # Calculate confidence level based on sample size
-            confidence_level = min(
-                Decimal('0.95'), 
-                Decimal(str(basic_stats.total_hands)) / Decimal('1000')
-            ) if basic_stats.total_hands > 0 else Decimal('0.0')
-            
-            # Create response
-            response = StatisticsResponse(
-                basic_stats=basic_stats,
-                advanced_stats=advanced_stats,
-                positional_stats=positional_stats,
-                tournament_stats=tournament_stats,
-                filters_applied=filters,
-                calculation_date=datetime.now(timezone.utc),
-                cache_expires=datetime.now(timezone.utc) + timedelta(hours=1),  # Cache for 1 hour
-                sample_size=basic_stats.total_hands,
-                confidence_level=confidence_level
+        return tuple(results), timings
+    
+    async def _calculate_all_statistics_internal(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None
+    ) -> Tuple[BasicStatistics, AdvancedStatistics, List[PositionalStatistics], Optional[TournamentStatistics]]:
+        """
+        Calculate basic, advanced, positional and tournament statistics in a single pass.
+        
+        The filtered hand set is loaded once and every hand's features are extracted once,
+        then fed to all four counter sets. Results are identical to running the four
+        ``_calculate_*_statistics_internal`` methods separately.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            filters: Optional filters to apply to the calculation
+        
+        Returns:
+            Tuple of (basic, advanced, positional, tournament) statistics
+        """
+        if self.use_hand_facts:
+            # Three aggregate queries; tournament stats are per tournament and stay row-based
+            return (
+                await self._calculate_basic_statistics_from_facts(user_id, filters),
+                await self._calculate_advanced_statistics_from_facts(user_id, filters),
+                await self._calculate_positional_statistics_from_facts(user_id, filters),
+                await self._calculate_tournament_statistics_internal(user_id, filters)
             )
-            
-            # Validate overall response integrity
-            self._validate_response_integrity(response, operation_name)
-            
-            # Cache the results
-            if self.cache_service:
-                try:
-                    await self.cache_service.set_user_statistics(
-                        user_id, 
+        
+        # Build base query
+        query = select_statistics_hands(PokerHand.user_id == user_id)
+        
+        # Apply filters
+        if filters:
+            query = self._apply_filters(query, filters)
+        
+        counters = self._new_fused_counters()
+        
+        # Execute query and count hands chunk by chunk
+        async for hands in self._iter_hand_chunks(query):
+            for hand in hands:
+                self._accumulate_fused(counters, hand)
+        
+        return self._finalize_fused(counters, user_id)
+    
+    def _new_fused_counters(self) -> Tuple[Any, ...]:
+        """Create empty (basic, advanced, per-position, tournament) counters for the fused pass."""
+        return (
+            BasicStatisticsAccumulator(self),
+            AdvancedStatisticsAccumulator(self),
+            {},
+            self._new_tournament_counters()
+        )
+    
+    def _accumulate_fused(self, counters: Tuple[Any, ...], hand: PokerHand) -> None:
+        """Add one hand to every counter set of the fused pass."""
+        basic_counters, advanced_counters, position_counters, tournament_counters = counters
+        
+        position = position_counters.get(hand.position)
+        if position is None:
+            position = position_counters[hand.position] = PositionalStatisticsAccumulator(self)
+        
+        # Basic and positional counters share one derivation of the basic flags
+        actions = self._accumulate_basic(hand, basic_counters, position)
+        self._accumulate_positional(position, actions)
+        self._accumulate_advanced(advanced_counters, hand)
+        
+        # Tournament stats only cover tournament hands
+        if hand.game_format == 'tournament':
+            self._accumulate_tournament(tournament_counters, hand)
+    
+    def _finalize_fused(
+        self,
+        counters: Tuple[Any, ...],
+        user_id: str
+    ) -> Tuple[BasicStatistics, AdvancedStatistics, List[PositionalStatistics], Optional[TournamentStatistics]]:
+        """Turn the fused pass counters into (basic, advanced, positional, tournament) statistics."""
+        basic_counters, advanced_counters, position_counters, tournament_counters = counters
+        return (
+            self._finalize_basic(basic_counters, user_id),
+            self._finalize_advanced(advanced_counters),
+            self._finalize_positional(position_counters),
+            self._finalize_tournament(tournament_counters)
+        )
+    
+    async def _build_statistics_cube(self, user_id: str, filters: StatisticsFilters) -> StatisticsCube:
+        """
+        Count the user's hands matching the base filters per combination of the mergeable dimensions.
+        
+        Args:
+            user_id: User ID to count hands for
+            filters: Base filters, without restrictions on the mergeable dimensions
+        
+        Returns:
+            StatisticsCube over the matching hands
+        """
+        cube = StatisticsCube(self)
+        
+        if self.use_hand_facts:
+            dimensions = [getattr(HandFacts, name) for name in MERGEABLE_DIMENSIONS]
+            query = self._facts_query(
+                dimensions + self._positional_fact_columns() + self._advanced_fact_columns(), user_id, filters
+            ).group_by(*dimensions)
+            
+            result = await self.db.execute(query)
+            for row in result.all():
+                positional, advanced = cube.cell(tuple(row[:len(dimensions)]))
+                self._fill_counters(positional, row)
+                self._fill_advanced_counters(advanced, row)
+            return cube
+        
+        query = select_statistics_hands(PokerHand.user_id == user_id).add_columns(
+            PokerHand.platform, PokerHand.is_play_money
+        )
+        query = self._apply_filters(query, filters)
+        
+        async for hands in self._iter_hand_chunks(query):
+            cube.add_all(hands)
+        return cube
+    
+    async def _calculate_from_filter_lattice(
+        self,
+        user_id: str,
+        filters: StatisticsFilters
+    ) -> Optional[Tuple[BasicStatistics, AdvancedStatistics, List[PositionalStatistics], Optional[TournamentStatistics]]]:
+        """
+        Calculate basic, advanced and positional statistics from a cached breakdown.
+        
+        The filters are split into base filters and a selection over the mergeable
+        dimensions. The breakdown for the base filters is read from the cache, or
+        counted and cached, and the selected cells are merged. Tournament statistics
+        are per tournament and are only queried when the selection has tournament hands.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            filters: Filters to apply
+        
+        Returns:
+            Tuple of (basic, advanced, positional, tournament) statistics, or None
+            when the filters cannot be answered from a breakdown
+        """
+        plan = split_filters(filters)
+        if plan is None:
+            return None
+        base_filters, selection = plan
+        
+        state = await self.cache_service.get_filter_breakdown(user_id, base_filters)
+        if state is not None:
+            cube = StatisticsCube.from_state(self, state)
+            await self.cache_service.record_filter_reuse('lattice_hits')
+        else:
+            cube = await self._build_statistics_cube(user_id, base_filters)
+            await self.cache_service.set_filter_breakdown(user_id, base_filters, cube.to_state())
+            await self.cache_service.record_filter_reuse('misses')
+        
+        totals, advanced, position_counters = cube.select(selection)
+        tournament_stats = None
+        if totals.tournament_hands:
+            tournament_stats = await self._calculate_tournament_statistics_internal(user_id, filters)
+        
+        return (
+            self._finalize_basic(totals, user_id),
+            self._finalize_advanced(advanced),
+            self._finalize_positional(position_counters),
+            tournament_stats
+        )
+    
+    async def _calculate_from_hand_index(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None
+    ) -> Tuple[BasicStatistics, AdvancedStatistics, List[PositionalStatistics], Optional[TournamentStatistics]]:
+        """
+        Calculate basic, advanced, positional and tournament statistics from the user's hand index.
+        
+        The filters resolve to an AND of the index's bitmaps. With the vectorized
+        backend the selected rows of the index's decoded columns are reduced;
+        otherwise the selected hands are folded as in the fused pass.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            filters: Optional filters to apply to the calculation
+        
+        Returns:
+            Tuple of (basic, advanced, positional, tournament) statistics
+        """
+        index = await self.hand_indexes.get(self.db, user_id)
+        selected = index.resolve(filters)
+        
+        tournament_counters = self._new_tournament_counters()
+        for hand in index.hands_for(selected & index.bitmap('game_format', 'tournament')):
+            self._accumulate_tournament(tournament_counters, hand)
+        
+        if self._use_vectorized_backend(None):
+            columns = index.columns(self).select(index.mask(selected))
+            basic_counters = statistics_vectorized.basic_statistics_counters(self, columns)
+            advanced_counters = statistics_vectorized.advanced_statistics_counters(self, columns)
+            position_counters = statistics_vectorized.positional_statistics_counters(self, columns)
+        else:
+            basic_counters = BasicStatisticsAccumulator(self)
+            advanced_counters = AdvancedStatisticsAccumulator(self)
+            position_counters = {}
+            for hand in index.hands_for(selected):
+                counters = position_counters.get(hand.position)
+                if counters is None:
+                    counters = position_counters[hand.position] = PositionalStatisticsAccumulator(self)
+                actions = self._accumulate_basic(hand, basic_counters, counters)
+                self._accumulate_positional(counters, actions)
+                self._accumulate_advanced(advanced_counters, hand)
+        
+        return (
+            self._finalize_basic(basic_counters, user_id),
+            self._finalize_advanced(advanced_counters),
+            self._finalize_positional(position_counters),
+            self._finalize_tournament(tournament_counters)
+        )
+    
+    async def calculate_filtered_statistics(
+        self, 
+        user_id: str, 
+        filters: StatisticsFilters
+    ) -> StatisticsResponse:
+        """
+        Calculate comprehensive statistics with enhanced reliability, caching, and data integrity validation.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            filters: Comprehensive filters to apply
+        
+        Returns:
+            StatisticsResponse with all calculated statistics
+        
+        Raises:
+            StatisticsReliabilityError: If calculation fails after retries
+            DataIntegrityError: If data integrity validation fails
+        """
+        operation_name = "calculate_filtered_statistics"
+        flight_key = self._flight_key(operation_name, user_id, filters)
+        
+        # Try to get from cache first
+        if self.cache_service:
+            try:
+                if self.refresh_session_factory is not None:
+                    cached_stats, stale = await self.cache_service.get_user_statistics_entry(user_id, filters)
+                else:
+                    cached_stats, stale = await self.cache_service.get_user_statistics(user_id, filters), False
+                if cached_stats:
+                    logger.debug(f"Cache {'stale hit' if stale else 'hit'} for user {user_id} filtered statistics")
+                    if self.use_filter_lattice:
+                        await self.cache_service.record_filter_reuse('exact_hits')
+                    if stale:
+                        self._schedule_refresh(
+                            flight_key, lambda service: service.calculate_filtered_statistics(user_id, filters)
+                        )
+                    return StatisticsResponse(**cached_stats)
+            except Exception as e:
+                logger.warning(f"Cache retrieval failed for user {user_id}: {e}")
+        
+        # Calculate all statistics with retry logic and error handling
+        async def calculate() -> StatisticsResponse:
+            logger.debug(f"Calculating fresh filtered statistics for user {user_id}")
+            
+            components = None
+            if self.use_hand_index:
+                # AND the bitmaps of the user's in-memory hand index
+                started = time.perf_counter()
+                components = await self._execute_with_retry(
+                    self._calculate_from_hand_index,
+                    f"{operation_name}_hand_index",
+                    user_id, filters
+                )
+                component_timings = {'hand_index': round(time.perf_counter() - started, 4)}
+            elif self.use_filter_lattice and self.cache_service:
+                # Merge the selected cells of a cached breakdown for the base filters
+                started = time.perf_counter()
+                components = await self._execute_with_retry(
+                    self._calculate_from_filter_lattice,
+                    f"{operation_name}_lattice",
+                    user_id, filters
+                )
+                component_timings = {'lattice': round(time.perf_counter() - started, 4)}
+            
+            if components is None and self.session_factory is not None:
+                # Calculate the components concurrently on separate sessions
+                components, component_timings = await self._execute_with_retry(
+                    self._calculate_components_concurrently,
+                    f"{operation_name}_concurrent",
+                    user_id, filters
+                )
+            elif components is None:
+                # Calculate every component from a single read of the filtered hands
+                started = time.perf_counter()
+                components = await self._execute_with_retry(
+                    self._calculate_all_statistics_internal,
+                    f"{operation_name}_fused",
+                    user_id, filters
+                )
+                component_timings = {'fused': round(time.perf_counter() - started, 4)}
+            
+            logger.info(f"Statistics component timings for user {user_id}: {component_timings}")
+            response = self._build_statistics_response(filters, components, component_timings, operation_name)
+            
+            # Cache the results
+            if self.cache_service:
+                try:
+                    await self.cache_service.set_user_statistics(
+                        user_id, 
                         filters, 
                         response.dict()
                     )
@@ -706,7 +1194,14 @@ class StatisticsService:
                     logger.warning(f"Cache storage failed for user {user_id}: {e}")
             
             return response
-            
+        
+        async def get_cached() -> Optional[StatisticsResponse]:
+            cached_stats = await self.cache_service.get_user_statistics(user_id, filters)
+            return StatisticsResponse(**cached_stats) if cached_stats else None
+        
+        try:
+            return await self._coalesced(flight_key, get_cached, calculate)
+        
         except Exception as e:
             # Try to fallback to cached data if available
             if self.cache_service:
@@ -726,6 +1221,218 @@ class StatisticsService:
                 f"Failed to calculate filtered statistics for user {user_id}: {str(e)}"
             ) from e
     
+    async def calculate_statistics_for_periods(
+        self,
+        user_id: str,
+        periods: Sequence[StatisticsFilters]
+    ) -> List[StatisticsResponse]:
+        """
+        Calculate statistics for several periods, reusing cached results.
+        
+        Periods already in the cache are read from it. With hand facts, the hand
+        index or the filter lattice, each remaining period is an aggregate lookup
+        through calculate_filtered_statistics. Otherwise the remaining periods that
+        differ only in their dates share one scan over the union of their date
+        ranges, each hand being counted in every period containing it.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            periods: Filters of each period
+        
+        Returns:
+            StatisticsResponse per period, in the order of periods
+        
+        Raises:
+            StatisticsReliabilityError: If calculation fails after retries
+        """
+        if (
+            self.use_hand_facts or self.use_hand_index or self.session_factory is not None
+            or (self.use_filter_lattice and self.cache_service)
+        ):
+            return [await self.calculate_filtered_statistics(user_id, filters) for filters in periods]
+        
+        responses: List[Optional[StatisticsResponse]] = [None] * len(periods)
+        groups: Dict[str, List[int]] = {}
+        for position, filters in enumerate(periods):
+            if self.cache_service:
+                try:
+                    cached_stats = await self.cache_service.get_user_statistics(user_id, filters)
+                    if cached_stats:
+                        responses[position] = StatisticsResponse(**cached_stats)
+                        continue
+                except Exception as e:
+                    logger.warning(f"Cache retrieval failed for user {user_id}: {e}")
+            undated = filters.model_copy(update={'start_date': None, 'end_date': None})
+            groups.setdefault(undated.model_dump_json(), []).append(position)
+        
+        for positions in groups.values():
+            group = [periods[position] for position in positions]
+            try:
+                calculated = await self._execute_with_retry(
+                    self._calculate_periods_internal,
+                    "calculate_statistics_for_periods",
+                    user_id, group
+                )
+            except Exception as e:
+                logger.error(f"Period statistics calculation failed for user {user_id}: {e}")
+                raise StatisticsReliabilityError(
+                    f"Failed to calculate period statistics for user {user_id}: {str(e)}"
+                ) from e
+            
+            for position, response in zip(positions, calculated):
+                responses[position] = response
+                if self.cache_service:
+                    try:
+                        await self.cache_service.set_user_statistics(user_id, periods[position], response.dict())
+                    except Exception as e:
+                        logger.warning(f"Cache storage failed for user {user_id}: {e}")
+        
+        return responses
+    
+    async def _calculate_periods_internal(
+        self,
+        user_id: str,
+        periods: Sequence[StatisticsFilters]
+    ) -> List[StatisticsResponse]:
+        """
+        Calculate statistics for periods that differ only in their dates from one scan.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            periods: Filters of each period, equal apart from start_date and end_date
+        
+        Returns:
+            StatisticsResponse per period, in the order of periods
+        """
+        starts = [_as_utc(filters.start_date) for filters in periods]
+        ends = [_as_utc(filters.end_date) for filters in periods]
+        union = periods[0].model_copy(update={
+            'start_date': None if None in starts else min(starts),
+            'end_date': None if None in ends else max(ends),
+        })
+        
+        query = self._apply_filters(select_statistics_hands(PokerHand.user_id == user_id), union)
+        
+        started = time.perf_counter()
+        counters = [self._new_fused_counters() for _ in periods]
+        bounds = list(zip(starts, ends, counters))
+        async for hands in self._iter_hand_chunks(query):
+            for hand in hands:
+                played = _as_utc(hand.date_played)
+                for start, end, period_counters in bounds:
+                    if played is None:
+                        if start is None and end is None:
+                            self._accumulate_fused(period_counters, hand)
+                    elif (start is None or played >= start) and (end is None or played <= end):
+                        self._accumulate_fused(period_counters, hand)
+        component_timings = {'shared_scan': round(time.perf_counter() - started, 4)}
+        
+        return [
+            self._build_statistics_response(
+                filters, self._finalize_fused(period_counters, user_id), component_timings,
+                "calculate_statistics_for_periods"
+            )
+            for filters, period_counters in zip(periods, counters)
+        ]
+    
+    async def compare_statistics(
+        self,
+        user_id: str,
+        base_period: StatisticsFilters,
+        comparison_period: StatisticsFilters,
+        metrics: Sequence[str]
+    ) -> StatisticsComparisonResponse:
+        """
+        Compare the statistics of two periods.
+        
+        Args:
+            user_id: User ID to compare statistics for
+            base_period: Filters of the base period
+            comparison_period: Filters of the period compared against it
+            metrics: Basic or advanced metric names
+        
+        Returns:
+            StatisticsComparisonResponse
+        
+        Raises:
+            ValueError: If a metric is unknown
+            StatisticsReliabilityError: If calculation fails after retries
+        """
+        statistics_comparison.validate_metrics(metrics)
+        base, comparison = await self.calculate_statistics_for_periods(user_id, [base_period, comparison_period])
+        return statistics_comparison.compare_responses(base, comparison, metrics)
+    
+    async def compare_periods(
+        self,
+        user_id: str,
+        periods: Sequence[StatisticsFilters],
+        metrics: Sequence[str]
+    ) -> StatisticsPeriodComparisonResponse:
+        """
+        Compare the statistics of consecutive periods, such as month over month.
+        
+        Args:
+            user_id: User ID to compare statistics for
+            periods: Filters of each period, in order
+            metrics: Basic or advanced metric names
+        
+        Returns:
+            StatisticsPeriodComparisonResponse
+        
+        Raises:
+            ValueError: If a metric is unknown
+            StatisticsReliabilityError: If calculation fails after retries
+        """
+        statistics_comparison.validate_metrics(metrics)
+        responses = await self.calculate_statistics_for_periods(user_id, periods)
+        return statistics_comparison.compare_period_responses(responses, metrics)
+    
+    def _build_statistics_response(
+        self,
+        filters: StatisticsFilters,
+        components: Tuple[BasicStatistics, AdvancedStatistics, List[PositionalStatistics], Optional[TournamentStatistics]],
+        component_timings: Dict[str, float],
+        operation_name: str
+    ) -> StatisticsResponse:
+        """
+        Assemble and validate the response for calculated statistics components.
+        
+        Raises:
+            ValueError: If fewer hands than filters.min_hands were found
+        """
+        basic_stats, advanced_stats, positional_stats, tournament_stats = components
+        
+        # Validate minimum hands requirement
+        if filters.min_hands and basic_stats.total_hands < filters.min_hands:
+            raise ValueError(
+                f"Insufficient hands for statistical significance. "
+                f"Found {basic_stats.total_hands}, minimum required: {filters.min_hands}"
+            )
+        
+        # Calculate confidence level based on sample size
+        confidence_level = min(
+            Decimal('0.95'), 
+            Decimal(str(basic_stats.total_hands)) / Decimal('1000')
+        ) if basic_stats.total_hands > 0 else Decimal('0.0')
+        
+        # Create response
+        response = StatisticsResponse(
+            basic_stats=basic_stats,
+            advanced_stats=advanced_stats,
+            positional_stats=positional_stats,
+            tournament_stats=tournament_stats,
+            filters_applied=filters,
+            calculation_date=datetime.now(timezone.utc),
+            cache_expires=datetime.now(timezone.utc) + timedelta(hours=1),  # Cache for 1 hour
+            sample_size=basic_stats.total_hands,
+            confidence_level=confidence_level,
+            component_timings=component_timings
+        )
+        
+        # Validate overall response integrity
+        self._validate_response_integrity(response, operation_name)
+        return response
+    
     def _validate_response_integrity(self, response: StatisticsResponse, operation_name: str) -> None:
         """
         Validate the integrity of a complete StatisticsResponse.
@@ -733,7 +1440,7 @@ class StatisticsService:
         Args:
             response: StatisticsResponse to validate
             operation_name: Name of the operation for logging
-            
+        
         Raises:
             DataIntegrityError: If response integrity validation fails
         """
@@ -763,7 +1470,7 @@ class StatisticsService:
                 )
             
             logger.debug(f"Response integrity validation passed for {operation_name}")
-            
+        
         except Exception as e:
             logger.error(f"Response integrity validation failed for {operation_name}: {e}")
             raise DataIntegrityError(f"Response integrity validation failed: {str(e)}") from e
@@ -772,31 +1479,52 @@ class StatisticsService:
         self, 
         user_id: str, 
         period: str = "30d",
-        metrics: List[str] = None
+        metrics: List[str] = None,
+        options: Optional[TrendOptions] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> List[TrendData]:
         """
         Calculate performance trends over time with enhanced reliability and caching.
         
         Args:
             user_id: User ID to calculate trends for
-            period: Time period for trends (7d, 30d, 90d, 1y)
+            period: Time period for trends (7d, 30d, 90d, 1y, all)
             metrics: List of metrics to analyze trends for
-            
+            options: Optional interval and time-series analysis of the data points
+            hands: Loaded rows of all the user's hands, used instead of querying the period
+        
         Returns:
             List of TrendData objects with trend analysis
         """
         if metrics is None:
             metrics = ["vpip", "pfr", "win_rate", "aggression_factor"]
         
+        if options and options.uses_series and not statistics_series.NUMPY_AVAILABLE:
+            raise ValueError("Rolling averages, EWMA and change points require NumPy")
+        options_key = options.model_dump(exclude_defaults=True) if options else None
+        
         # Try to get from cache first
         if self.cache_service:
             try:
                 cache_filters = StatisticsFilters()
-                cached_trends = await self.cache_service.get_trend_data(
-                    user_id, period, cache_filters
-                )
+                if self.refresh_session_factory is not None:
+                    cached_trends, stale = await self.cache_service.get_trend_data_entry(
+                        user_id, period, cache_filters, options_key, metrics
+                    )
+                else:
+                    cached_trends, stale = await self.cache_service.get_trend_data(
+                        user_id, period, cache_filters, options_key, metrics
+                    ), False
                 if cached_trends:
-                    logger.debug(f"Cache hit for user {user_id} trends")
+                    logger.debug(f"Cache {'stale hit' if stale else 'hit'} for user {user_id} trends")
+                    if stale:
+                        flight_key = self._flight_key(
+                            "calculate_performance_trends", user_id, None,
+                            period=period, metrics=metrics, options=options_key
+                        )
+                        self._schedule_refresh(
+                            flight_key, lambda service: service.calculate_performance_trends(user_id, period, metrics, options)
+                        )
                     return [TrendData(**trend) for trend in cached_trends]
             except Exception as e:
                 logger.warning(f"Trend cache retrieval failed for user {user_id}: {e}")
@@ -806,7 +1534,7 @@ class StatisticsService:
             trend_results = await self._execute_with_retry(
                 self._calculate_performance_trends_internal,
                 "calculate_performance_trends",
-                user_id, period, metrics
+                user_id, period, metrics, options, hands
             )
             
             # Cache the results
@@ -815,21 +1543,21 @@ class StatisticsService:
                     cache_filters = StatisticsFilters()
                     trend_dicts = [trend.dict() for trend in trend_results]
                     await self.cache_service.set_trend_data(
-                        user_id, period, cache_filters, trend_dicts
+                        user_id, period, cache_filters, trend_dicts, options_key, metrics
                     )
                     logger.debug(f"Cached trends for user {user_id}")
                 except Exception as e:
                     logger.warning(f"Trend cache storage failed for user {user_id}: {e}")
             
             return trend_results
-            
+        
         except Exception as e:
             # Try to fallback to cached data
             if self.cache_service:
                 try:
                     cache_filters = StatisticsFilters()
                     cached_trends = await self.cache_service.get_trend_data(
-                        user_id, period, cache_filters
+                        user_id, period, cache_filters, options_key, metrics
                     )
                     if cached_trends:
                         logger.warning(
@@ -848,16 +1576,20 @@ class StatisticsService:
         self, 
         user_id: str, 
         period: str = "30d",
-        metrics: List[str] = None
+        metrics: List[str] = None,
+        options: Optional[TrendOptions] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> List[TrendData]:
         """
         Internal method to calculate performance trends over time for specified metrics.
         
         Args:
             user_id: User ID to calculate trends for
-            period: Time period for trends (7d, 30d, 90d, 1y)
+            period: Time period for trends (7d, 30d, 90d, 1y, all)
             metrics: List of metrics to analyze trends for
-            
+            options: Optional interval and time-series analysis of the data points
+            hands: Loaded rows of all the user's hands, used instead of querying the period
+        
         Returns:
             List of TrendData objects with trend analysis
         """
@@ -879,15 +1611,34 @@ class StatisticsService:
         elif period == "1y":
             start_date = end_date - timedelta(days=365)
             interval_days = 14
+        elif period == "all":
+            if hands is not None:
+                first_played = min((_as_utc(hand.date_played) for hand in hands if hand.date_played), default=None)
+            else:
+                result = await self.db.execute(
+                    select(func.min(PokerHand.date_played)).where(PokerHand.user_id == user_id)
+                )
+                first_played = _as_utc(result.scalar())
+            start_date = first_played or end_date
+            interval_days = 7
         else:
             raise ValueError(f"Invalid period: {period}")
         
+        if options and options.interval_days:
+            interval_days = options.interval_days
+        
+        # Intervals start at UTC midnight so they are made of whole days
+        start_date = self._utc_midnight(start_date)
+        
+        # One pass over the period produces the data points of every metric
+        data_points_by_metric = await self._calculate_bucketed_trends(
+            user_id, metrics, start_date, end_date, interval_days, hands
+        )
+        
         trend_results = []
         
         for metric in metrics:
-            data_points = await self._calculate_metric_trend(
-                user_id, metric, start_date, end_date, interval_days
-            )
+            data_points = data_points_by_metric[metric]
             
             if len(data_points) < 2:
                 # Not enough data for trend analysis
@@ -905,63 +1656,138 @@ class StatisticsService:
             values = [float(dp.value) for dp in data_points]
             trend_direction, trend_strength, is_significant = self._analyze_trend(values)
             
-            trend_results.append(TrendData(
+            trend = TrendData(
                 metric_name=metric,
                 time_period=period,
                 data_points=data_points,
                 trend_direction=trend_direction,
                 trend_strength=trend_strength,
                 statistical_significance=is_significant
-            ))
+            )
+            if options and options.uses_series:
+                self._analyze_trend_series(trend, start_date, timedelta(days=interval_days), options)
+            trend_results.append(trend)
         
         return trend_results
     
-    async def _calculate_metric_trend(
-        self, 
-        user_id: str, 
-        metric: str, 
-        start_date: datetime, 
-        end_date: datetime, 
-        interval_days: int
-    ) -> List[TrendDataPoint]:
-        """Calculate trend data points for a specific metric over time intervals."""
-        data_points = []
-        current_date = start_date
-        
-        while current_date < end_date:
-            interval_end = min(current_date + timedelta(days=interval_days), end_date)
-            
-            # Create filters for this time interval
-            filters = StatisticsFilters(
-                start_date=current_date,
-                end_date=interval_end
+    async def _calculate_bucketed_trends(
+        self,
+        user_id: str,
+        metrics: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval_days: int,
+        hands: Optional[Sequence[Any]] = None
+    ) -> Dict[str, List[TrendDataPoint]]:
+        """
+        Calculate trend data points for several metrics over time intervals in one pass.
+        
+        Hands in the period are bucketed by interval index and accumulated into basic
+        counters per bucket, so the period is read once instead of once per interval
+        and metric.
+        
+        Args:
+            hands: Loaded rows of all the user's hands; the period's are taken from them
+        
+        Returns:
+            Dictionary mapping each metric to its data points in date order
+        """
+        interval = timedelta(days=interval_days)
+        bucket_count = max(1, -(-(end_date - start_date) // interval))
+        
+        if hands is None and self.use_daily_rollups and start_date == self._utc_midnight(start_date):
+            filters = StatisticsFilters(start_date=start_date, end_date=end_date)
+            bucket_counters = {}
+            for day, counters in (await self._range_counters(user_id, filters, group_by='day')).items():
+                day_start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+                bucket = min((day_start - start_date) // interval, bucket_count - 1)
+                if bucket in bucket_counters:
+                    bucket_counters[bucket].merge(counters)
+                else:
+                    bucket_counters[bucket] = counters
+        elif hands is None and self.use_hand_facts:
+            bucket_counters = await self._bucket_counters_from_facts(
+                user_id, start_date, end_date, interval, bucket_count
+            )
+        else:
+            if hands is not None:
+                hands = [
+                    hand for hand in hands
+                    if hand.date_played is not None and start_date <= _as_utc(hand.date_played) <= end_date
+                ]
+            query = select_statistics_hands(
+                and_(
+                    PokerHand.user_id == user_id,
+                    PokerHand.date_played >= start_date,
+                    PokerHand.date_played <= end_date
+                )
             )
             
-            # Calculate statistics for this interval
-            try:
-                basic_stats = await self.calculate_basic_statistics(user_id, filters)
-                
-                # Extract the requested metric value
-                metric_value = self._extract_metric_value(basic_stats, metric)
-                
-                # Only add data point if we have sufficient hands (minimum 5 for testing)
-                if basic_stats.total_hands >= 5:
-                    confidence = min(Decimal('1.0'), Decimal(str(basic_stats.total_hands)) / Decimal('50'))
-                    
-                    data_points.append(TrendDataPoint(
-                        date=current_date,
-                        value=metric_value,
-                        hands_sample=basic_stats.total_hands,
-                        confidence=confidence
-                    ))
+            bucket_counters = {}
+            async for hands in self._iter_hand_chunks(query, hands):
+                for hand in hands:
+                    # A hand played exactly at the end of the period belongs to the last interval
+                    bucket = min(int((_as_utc(hand.date_played) - start_date) // interval), bucket_count - 1)
+                    counters = bucket_counters.get(bucket)
+                    if counters is None:
+                        counters = bucket_counters[bucket] = BasicStatisticsAccumulator(self)
+                    self._accumulate_basic(hand, counters)
+        
+        data_points_by_metric = {metric: [] for metric in metrics}
+        
+        for bucket in sorted(bucket_counters):
+            basic_stats = self._finalize_basic(bucket_counters[bucket], user_id)
+            
+            # Only add data point if we have sufficient hands (minimum 5 for testing)
+            if basic_stats.total_hands < 5:
+                continue
             
-            except Exception:
-                # Skip intervals with calculation errors
-                pass
+            bucket_date = start_date + interval * bucket
+            confidence = min(Decimal('1.0'), Decimal(str(basic_stats.total_hands)) / Decimal('50'))
             
-            current_date = interval_end
+            for metric in metrics:
+                data_points_by_metric[metric].append(TrendDataPoint(
+                    date=bucket_date,
+                    value=self._extract_metric_value(basic_stats, metric),
+                    hands_sample=basic_stats.total_hands,
+                    confidence=confidence
+                ))
+        
+        return data_points_by_metric
+    
+    async def _bucket_counters_from_facts(
+        self,
+        user_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: timedelta,
+        bucket_count: int
+    ) -> Dict[int, BasicStatisticsAccumulator]:
+        """Aggregate basic counters per trend interval with one GROUP BY query over hand_facts."""
+        bucket = func.floor(
+            func.extract('epoch', HandFacts.date_played - start_date) / interval.total_seconds()
+        ).label('bucket')
+        
+        query = select(bucket, *self._basic_fact_columns()).where(
+            and_(
+                HandFacts.user_id == user_id,
+                HandFacts.date_played >= start_date,
+                HandFacts.date_played <= end_date
+            )
+        ).group_by(bucket)
+        
+        result = await self.db.execute(query)
+        
+        bucket_counters = {}
+        for row in result.all():
+            counters = self._fill_counters(BasicStatisticsAccumulator(self), row)
+            index = min(int(row.bucket), bucket_count - 1)
+            if index in bucket_counters:
+                bucket_counters[index].merge(counters)
+            else:
+                bucket_counters[index] = counters
         
-        return data_points
+        return bucket_counters
     
     def _extract_metric_value(self, stats: BasicStatistics, metric: str) -> Decimal:
         """Extract the value for a specific metric from statistics."""
@@ -978,6 +1804,43 @@ class StatisticsService:
         
         return metric_map.get(metric, Decimal('0.0'))
     
+    def _analyze_trend_series(
+        self,
+        trend: TrendData,
+        start_date: datetime,
+        interval: timedelta,
+        options: TrendOptions
+    ) -> None:
+        """
+        Add the requested time-series analysis to a trend's data points.
+        
+        Data points are weighted by their hands, so rolling averages and the
+        slope are those of the metric over the hands rather than over equally
+        counted intervals. Intervals skipped for too few hands keep their place
+        on the time axis of the regression.
+        """
+        points = trend.data_points
+        values = [float(point.value) for point in points]
+        weights = [point.hands_sample for point in points]
+        
+        if options.rolling_window:
+            for point, average in zip(points, statistics_series.rolling_mean(values, weights, options.rolling_window)):
+                point.rolling_average = None if average != average else _series_decimal(average, '0.01')
+        if options.ewma_span:
+            for point, average in zip(points, statistics_series.ewma(values, weights, options.ewma_span)):
+                point.ewma = _series_decimal(average, '0.01')
+        
+        positions = [(point.date - start_date) / interval for point in points]
+        line = statistics_series.linear_trend(positions, values, weights)
+        if line is not None:
+            trend.slope = _series_decimal(line.slope, '0.0001')
+            trend.p_value = _series_decimal(line.p_value, '0.0001')
+        
+        if options.change_points:
+            trend.change_points = [
+                points[index].date for index in statistics_series.change_points(values, weights)
+            ]
+    
     def _analyze_trend(self, values: List[float]) -> Tuple[str, Decimal, bool]:
         """
         Analyze trend direction, strength, and statistical significance.
@@ -1031,20 +1894,38 @@ class StatisticsService:
     async def calculate_session_statistics(
         self, 
         user_id: str, 
-        filters: Optional[StatisticsFilters] = None
+        filters: Optional[StatisticsFilters] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> List[SessionStatistics]:
         """
-        Calculate session-based statistics grouped by date using timezone-aware calculations.
+        Calculate statistics for each play session, a run of hands without a long idle gap.
+        
+        Sessions are read from the play_sessions table when only dates are
+        filtered, listing the sessions started in the date range. Other filters
+        split the matching hands into sessions with the same idle gap.
         
         Args:
             user_id: User ID to calculate statistics for
             filters: Optional filters to apply
-            
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
+        
         Returns:
-            List of SessionStatistics objects
+            List of SessionStatistics objects, most recent first
         """
+        if hands is None and self._answers_from_play_sessions(filters):
+            rows = await self._play_session_rows(
+                user_id,
+                filters.start_date if filters else None,
+                filters.end_date if filters else None
+            )
+            return [
+                session_counters(self, row).finalize(_as_utc(row.start_time)).model_copy(update={'session_id': row.id})
+                for row in rows
+                if row.total_hands >= MIN_SESSION_HANDS
+            ]
+        
         # Build base query
-        query = select(PokerHand).where(PokerHand.user_id == user_id)
+        query = select_statistics_hands(PokerHand.user_id == user_id, PokerHand.date_played.isnot(None))
         
         # Apply filters
         if filters:
@@ -1053,99 +1934,84 @@ class StatisticsService:
         # Order by date
         query = query.order_by(PokerHand.date_played)
         
-        # Execute query
-        result = await self.db.execute(query)
-        hands = result.scalars().all()
-        
-        if not hands:
-            return []
+        if hands is not None:
+            hands = sorted(
+                (hand for hand in hands if hand.date_played is not None), key=lambda hand: _as_utc(hand.date_played)
+            )
         
-        # Group hands by session using timezone-aware date boundaries
-        sessions = await self._group_hands_by_timezone_aware_date(user_id, hands)
+        # Execute query
+        hands = await self._load_hands(query, hands)
         
-        # Calculate statistics for each session
-        session_stats = []
-        for session_date, session_hands in sessions.items():
-            if len(session_hands) < 5:  # Skip sessions with too few hands
-                continue
-            
-            # Calculate session duration
-            session_start = min(hand.date_played for hand in session_hands if hand.date_played)
-            session_end = max(hand.date_played for hand in session_hands if hand.date_played)
-            duration_minutes = int((session_end - session_start).total_seconds() / 60) if session_start and session_end else 0
-            
-            # Calculate session statistics
-            total_hands = len(session_hands)
-            vpip_hands = 0
-            pfr_hands = 0
-            aggressive_actions = 0
-            passive_actions = 0
-            total_winnings = Decimal('0.0')
-            biggest_win = Decimal('0.0')
-            biggest_loss = Decimal('0.0')
-            
-            for hand in session_hands:
-                actions = hand.actions or {}
-                
-                # VPIP and PFR
-                if self._is_vpip_hand(actions, hand.position):
-                    vpip_hands += 1
-                
-                if self._is_pfr_hand(actions):
-                    pfr_hands += 1
-                
-                # Aggression factor
-                agg_actions = self._count_aggressive_actions(actions)
-                pass_actions = self._count_passive_actions(actions)
-                aggressive_actions += agg_actions
-                passive_actions += pass_actions
-                
-                # Winnings tracking
-                if hand.result and hand.pot_size:
-                    hand_winnings = self._calculate_hand_winnings(hand)
-                    total_winnings += hand_winnings
-                    
-                    if hand_winnings > biggest_win:
-                        biggest_win = hand_winnings
-                    elif hand_winnings < biggest_loss:
-                        biggest_loss = hand_winnings
-            
-            # Calculate percentages
-            vpip = self._calculate_percentage(vpip_hands, total_hands)
-            pfr = self._calculate_percentage(pfr_hands, total_hands)
-            
-            # Ensure mathematical consistency: PFR should never exceed VPIP
-            if pfr > vpip:
-                logger.warning(f"Session {session_date}: PFR ({pfr}) exceeds VPIP ({vpip}). Adjusting PFR to match VPIP.")
-                pfr = vpip
-            
-            # Aggression factor
-            if passive_actions > 0:
-                aggression_factor = Decimal(str(aggressive_actions)) / Decimal(str(passive_actions))
-            else:
-                aggression_factor = Decimal('0.0') if aggressive_actions == 0 else Decimal('999.0')
-            
-            # Win rate (simplified)
-            win_rate = total_winnings / Decimal(str(total_hands)) if total_hands > 0 else Decimal('0.0')
-            
-            session_stats.append(SessionStatistics(
-                session_date=datetime.combine(session_date, datetime.min.time()).replace(tzinfo=timezone.utc),
-                hands_played=total_hands,
-                duration_minutes=duration_minutes,
-                win_rate=win_rate,
-                vpip=vpip,
-                pfr=pfr,
-                aggression_factor=aggression_factor.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-                biggest_win=biggest_win,
-                biggest_loss=biggest_loss,
-                net_result=total_winnings
-            ))
+        # Split the hands at idle gaps and calculate statistics for each session
+        session_stats = [
+            counters.finalize(counters.first_played)
+            for counters in sessionize(self, hands, self.session_gap)
+            if counters.total_hands >= MIN_SESSION_HANDS
+        ]
         
         # Sort by date (most recent first)
         session_stats.sort(key=lambda x: x.session_date, reverse=True)
         
         return session_stats
     
+    async def calculate_winnings_graph(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None,
+        points: int = DEFAULT_GRAPH_POINTS
+    ) -> WinningsGraph:
+        """
+        Calculate the red line / blue line winnings graph in one streaming pass.
+        
+        Args:
+            user_id: User ID to calculate the graph for
+            filters: Optional filters to apply
+            points: Number of points to downsample each line to
+        
+        Returns:
+            WinningsGraph with running moments and downsampled cumulative lines
+        """
+        query = select_statistics_hands(PokerHand.user_id == user_id)
+        
+        if filters:
+            query = self._apply_filters(query, filters)
+        
+        query = query.order_by(PokerHand.date_played, PokerHand.id)
+        
+        graph = WinningsGraphBuilder(self, points)
+        async for hands in self._iter_hand_chunks(query):
+            graph.add_all(hands)
+        
+        return graph.finalize()
+    
+    async def calculate_multitabling(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None,
+        include_timeline: bool = False
+    ) -> MultiTablingAnalysis:
+        """
+        Analyse how many tables were played at once, with hands per hour and win rate per table count.
+        
+        Args:
+            user_id: User ID to analyse
+            filters: Optional filters to apply
+            include_timeline: Include the number of open tables over time
+        
+        Returns:
+            MultiTablingAnalysis built by a sweep over per-table activity intervals
+        """
+        query = select(*MULTITABLING_COLUMNS).where(PokerHand.user_id == user_id, PokerHand.date_played.isnot(None))
+        
+        if filters:
+            query = self._apply_filters(query, filters)
+        
+        builder = MultiTablingBuilder(self, self.table_idle_gap)
+        async for hands in self._iter_hand_chunks(query):
+            builder.add_all(hands)
+        
+        return builder.finalize(include_timeline)
+    
     def _is_vpip_hand(self, actions: Dict[str, Any], position: str) -> bool:
         """
         Determine if this hand counts as VPIP.
@@ -1246,21 +2112,77 @@ class StatisticsService:
             # Estimate loss based on actions (simplified)
             return Decimal('0.0')  # TODO: Implement proper loss calculation
     
+    def _hand_winnings_cents(self, hand: PokerHand) -> int:
+        """
+        Winnings of a single hand in integer cents, as counted by basic statistics.
+        
+        The parsed net result when stored; hands stored before it was parsed fall
+        back to _calculate_hand_winnings (the pot on a win).
+        """
+        if hand.net_result is not None:
+            return to_cents(hand.net_result)
+        if hand.result == 'won' and hand.pot_size:
+            return to_cents(hand.pot_size)
+        return 0
+    
+    def _hand_net_result_cents(self, hand: PokerHand, actions: Dict[str, Any]) -> int:
+        """Net result of a single hand in integer cents: stored, or estimated from the actions."""
+        if hand.net_result is not None:
+            return to_cents(hand.net_result)
+        return self._detailed_hand_winnings_cents(hand, actions) - self._hand_investment_cents(hand, actions)
+    
+    def _hand_big_blinds_won(self, hand: PokerHand) -> Optional[int]:
+        """
+        Stored net result of a hand in thousandths of a big blind.
+        
+        Returns:
+            The rounded result, or None for hands without a stored net result or big blind
+        """
+        if hand.net_result is None:
+            return None
+        big_blind = hand.big_blind if hand.big_blind is not None else (hand.blinds or {}).get('big')
+        big_blind_cents = to_cents(big_blind) if big_blind else 0
+        if big_blind_cents <= 0:
+            return None
+        return _divide_half_up(to_cents(hand.net_result) * 1000, big_blind_cents)
+    
+    def _calculate_aggression_factor(self, aggressive_actions: int, passive_actions: int) -> Decimal:
+        """Calculate aggression factor (bets and raises per call or check)."""
+        if passive_actions > 0:
+            return Decimal(aggressive_actions) / Decimal(passive_actions)
+        return Decimal('0.0') if aggressive_actions == 0 else Decimal('999.0')
+    
     def _calculate_percentage(self, numerator: int, denominator: int) -> Decimal:
         """Calculate percentage with proper rounding."""
         if denominator == 0:
             return Decimal('0.0')
         
-        percentage = (Decimal(str(numerator)) / Decimal(str(denominator))) * Decimal('100')
-        return percentage.quantize(Decimal('0.1'), rounding=ROUND_HALF_UP)
+        # Tenths of a percent, rounded half up with exact integer arithmetic
+        tenths = _divide_half_up(numerator * 1000, denominator)
+        return Decimal(tenths).scaleb(-1)
     
-    def _calculate_win_rate(self, total_winnings: Decimal, total_hands: int, hands: List[PokerHand]) -> Decimal:
-        """Calculate win rate (bb/100 for cash, ROI% for tournaments)."""
+    def _calculate_win_rate_from_counts(
+        self,
+        total_winnings: int,
+        total_hands: int,
+        tournament_hands: int,
+        big_blinds_won: int = 0,
+        big_blind_hands: int = 0
+    ) -> Decimal:
+        """
+        Calculate win rate from pre-counted totals (bb/100 for cash, ROI% for tournaments).
+        
+        Args:
+            total_winnings: Winnings in integer cents
+            total_hands: Number of hands
+            tournament_hands: Number of those hands played in tournaments
+            big_blinds_won: Stored net results in thousandths of a big blind
+            big_blind_hands: Number of hands with a stored net result and big blind
+        """
         if total_hands == 0:
             return Decimal('0.0')
         
         # Determine if this is primarily tournament or cash game data
-        tournament_hands = sum(1 for hand in hands if hand.game_format == 'tournament')
         cash_hands = total_hands - tournament_hands
         
         if tournament_hands > cash_hands:
@@ -1268,9 +2190,12 @@ class StatisticsService:
             # TODO: Implement proper tournament ROI calculation
             return Decimal('0.0')
         else:
-            # Cash game bb/100 calculation (simplified)
-            # TODO: Implement proper bb/100 calculation with big blind tracking
-            return total_winnings / Decimal(str(total_hands)) * Decimal('100')
+            if big_blind_hands:
+                # bb/100 over the hands with a stored net result and big blind
+                return Decimal(big_blinds_won) / Decimal(big_blind_hands) / Decimal('10')
+            
+            # Hands stored before net results were parsed: winnings per 100 hands
+            return cents_to_decimal(total_winnings) / Decimal(total_hands) * Decimal('100')
     
     def _went_to_showdown(self, actions: Dict[str, Any]) -> bool:
         """Determine if hand went to showdown."""
@@ -1338,7 +2263,9 @@ class StatisticsService:
     async def calculate_advanced_statistics(
         self, 
         user_id: str, 
-        filters: Optional[StatisticsFilters] = None
+        filters: Optional[StatisticsFilters] = None,
+        backend: Optional[str] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> AdvancedStatistics:
         """
         Calculate advanced poker statistics with enhanced reliability.
@@ -1346,7 +2273,9 @@ class StatisticsService:
         Args:
             user_id: User ID to calculate statistics for
             filters: Optional filters to apply to the calculation
-            
+            backend: 'python' or 'numpy' for hands loaded row by row (defaults to settings)
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
+        
         Returns:
             AdvancedStatistics object with calculated metrics
         """
@@ -1360,13 +2289,17 @@ class StatisticsService:
             self._calculate_advanced_statistics_internal,
             "calculate_advanced_statistics",
             user_id,
-            filters
+            filters,
+            backend=backend,
+            hands=hands
         )
     
     async def _calculate_advanced_statistics_internal(
         self, 
         user_id: str, 
-        filters: Optional[StatisticsFilters] = None
+        filters: Optional[StatisticsFilters] = None,
+        backend: Optional[str] = None,
+        hands: Optional[Sequence[Any]] = None
     ) -> AdvancedStatistics:
         """
         Internal method to calculate advanced poker statistics including 3-bet %, c-bet %, check-raise %, 
@@ -1375,232 +2308,409 @@ class StatisticsService:
         Args:
             user_id: User ID to calculate statistics for
             filters: Optional filters to apply to the calculation
-            
+            backend: 'python' or 'numpy' for hands loaded row by row (defaults to settings)
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
+        
         Returns:
             AdvancedStatistics object with calculated metrics
         """
+        if hands is None and self.use_hand_facts:
+            return await self._calculate_advanced_statistics_from_facts(user_id, filters)
+        
         # Build base query
-        query = select(PokerHand).where(PokerHand.user_id == user_id)
+        query = select_statistics_hands(PokerHand.user_id == user_id)
         
         # Apply filters
         if filters:
             query = self._apply_filters(query, filters)
         
-        # Execute query to get hands
-        result = await self.db.execute(query)
-        hands = result.scalars().all()
+        vectorized = self._use_vectorized_backend(backend)
+        counters = AdvancedStatisticsAccumulator(self)
+        
+        # Execute query and count hands chunk by chunk
+        async for hands in self._iter_hand_chunks(query, hands):
+            if vectorized:
+                counters.merge(statistics_vectorized.advanced_statistics_counters(
+                    self, statistics_vectorized.HandColumns.decode(self, hands)
+                ))
+                continue
+            await self._add_hands(counters, hands)
+        
+        return self._finalize_advanced(counters)
+    
+    async def calculate_tournament_statistics(
+        self, 
+        user_id: str, 
+        filters: Optional[StatisticsFilters] = None,
+        hands: Optional[Sequence[Any]] = None
+    ) -> Optional[TournamentStatistics]:
+        """
+        Calculate tournament-specific statistics with enhanced reliability.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            filters: Optional filters to apply to the calculation
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
+        
+        Returns:
+            TournamentStatistics object with calculated metrics, or None if no tournament data
+        """
+        cache_params = {
+            'user_id': user_id,
+            'filters': filters or StatisticsFilters()
+        }
+        
+        return await self._get_cached_or_calculate(
+            cache_params,
+            self._calculate_tournament_statistics_internal,
+            "calculate_tournament_statistics",
+            user_id,
+            filters,
+            hands=hands
+        )
+    
+    async def _calculate_tournament_statistics_internal(
+        self, 
+        user_id: str, 
+        filters: Optional[StatisticsFilters] = None,
+        hands: Optional[Sequence[Any]] = None
+    ) -> Optional[TournamentStatistics]:
+        """
+        Internal method to calculate tournament-specific statistics including ROI, cash rate, and ICM metrics.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            filters: Optional filters to apply to the calculation
+            hands: Loaded rows of the user's hands matching the filters, used instead of querying
         
-        if not hands:
-            return AdvancedStatistics(
-                three_bet_percentage=Decimal('0.0'),
-                fold_to_three_bet=Decimal('0.0'),
-                four_bet_percentage=Decimal('0.0'),
-                fold_to_four_bet=Decimal('0.0'),
-                cold_call_percentage=Decimal('0.0'),
-                isolation_raise=Decimal('0.0'),
-                c_bet_flop=Decimal('0.0'),
-                c_bet_turn=Decimal('0.0'),
-                c_bet_river=Decimal('0.0'),
-                fold_to_c_bet_flop=Decimal('0.0'),
-                fold_to_c_bet_turn=Decimal('0.0'),
-                fold_to_c_bet_river=Decimal('0.0'),
-                check_raise_flop=Decimal('0.0'),
-                check_raise_turn=Decimal('0.0'),
-                check_raise_river=Decimal('0.0'),
-                red_line_winnings=Decimal('0.0'),
-                blue_line_winnings=Decimal('0.0'),
-                expected_value=Decimal('0.0'),
-                variance=Decimal('0.0'),
-                standard_deviations=Decimal('0.0')
+        Returns:
+            TournamentStatistics object with calculated metrics, or None if no tournament data
+        """
+        # Build base query for tournament hands only
+        query = select_statistics_hands(
+            and_(
+                PokerHand.user_id == user_id,
+                PokerHand.game_format == 'tournament'
             )
+        )
+        
+        # Apply filters
+        if filters:
+            query = self._apply_filters(query, filters)
         
-        # Initialize counters for advanced statistics
-        three_bet_opportunities = 0
-        three_bet_count = 0
-        fold_to_three_bet_opportunities = 0
-        fold_to_three_bet_count = 0
-        four_bet_opportunities = 0
-        four_bet_count = 0
-        fold_to_four_bet_opportunities = 0
-        fold_to_four_bet_count = 0
-        cold_call_opportunities = 0
-        cold_call_count = 0
-        isolation_opportunities = 0
-        isolation_count = 0
-        
-        # C-bet opportunities and counts
-        c_bet_flop_opportunities = 0
-        c_bet_flop_count = 0
-        c_bet_turn_opportunities = 0
-        c_bet_turn_count = 0
-        c_bet_river_opportunities = 0
-        c_bet_river_count = 0
-        
-        # Fold to c-bet opportunities and counts
-        fold_to_c_bet_flop_opportunities = 0
-        fold_to_c_bet_flop_count = 0
-        fold_to_c_bet_turn_opportunities = 0
-        fold_to_c_bet_turn_count = 0
-        fold_to_c_bet_river_opportunities = 0
-        fold_to_c_bet_river_count = 0
-        
-        # Check-raise opportunities and counts
-        check_raise_flop_opportunities = 0
-        check_raise_flop_count = 0
-        check_raise_turn_opportunities = 0
-        check_raise_turn_count = 0
-        check_raise_river_opportunities = 0
-        check_raise_river_count = 0
-        
-        # Red line/blue line analysis
-        showdown_winnings = Decimal('0.0')
-        non_showdown_winnings = Decimal('0.0')
-        total_invested = Decimal('0.0')
-        
-        # Variance calculation
-        hand_results = []
+        if hands is not None:
+            hands = [hand for hand in hands if hand.game_format == 'tournament']
         
-        for hand in hands:
-            actions = hand.actions or {}
-            
-            # Calculate hand investment and winnings
-            hand_investment = self._calculate_hand_investment(hand, actions)
-            hand_winnings = self._calculate_detailed_hand_winnings(hand, actions)
-            total_invested += hand_investment
-            
-            # Track individual hand results for variance calculation
-            net_result = hand_winnings - hand_investment
-            hand_results.append(float(net_result))
-            
-            # Red line vs Blue line analysis
-            if self._went_to_showdown(actions):
-                showdown_winnings += hand_winnings
-            else:
-                non_showdown_winnings += hand_winnings
-            
-            # Preflop advanced statistics
-            preflop_actions = actions.get('preflop', [])
-            
-            # 3-bet analysis
-            if self._is_advanced_three_bet_opportunity(preflop_actions):
-                three_bet_opportunities += 1
-                if self._made_advanced_three_bet(preflop_actions):
-                    three_bet_count += 1
-            
-            if self._is_advanced_fold_to_three_bet_opportunity(preflop_actions):
-                fold_to_three_bet_opportunities += 1
-                if self._folded_to_advanced_three_bet(preflop_actions):
-                    fold_to_three_bet_count += 1
-            
-            # 4-bet analysis
-            if self._is_four_bet_opportunity(preflop_actions):
-                four_bet_opportunities += 1
-                if self._made_four_bet(preflop_actions):
-                    four_bet_count += 1
-            
-            if self._is_fold_to_four_bet_opportunity(preflop_actions):
-                fold_to_four_bet_opportunities += 1
-                if self._folded_to_four_bet(preflop_actions):
-                    fold_to_four_bet_count += 1
-            
-            # Cold call analysis
-            if self._is_cold_call_opportunity(preflop_actions):
-                cold_call_opportunities += 1
-                if self._made_cold_call(preflop_actions):
-                    cold_call_count += 1
-            
-            # Isolation raise analysis
-            if self._is_isolation_opportunity(preflop_actions, hand.position):
-                isolation_opportunities += 1
-                if self._made_isolation_raise(preflop_actions):
-                    isolation_count += 1
-            
-            # Postflop advanced statistics
-            was_preflop_aggressor = self._was_preflop_aggressor(preflop_actions)
-            
-            # C-bet analysis
-            flop_actions = actions.get('flop', [])
-            if self._is_c_bet_opportunity(was_preflop_aggressor, flop_actions):
-                c_bet_flop_opportunities += 1
-                if self._made_c_bet(flop_actions):
-                    c_bet_flop_count += 1
-            
-            turn_actions = actions.get('turn', [])
-            if self._is_c_bet_opportunity(was_preflop_aggressor, turn_actions):
-                c_bet_turn_opportunities += 1
-                if self._made_c_bet(turn_actions):
-                    c_bet_turn_count += 1
-            
-            river_actions = actions.get('river', [])
-            if self._is_c_bet_opportunity(was_preflop_aggressor, river_actions):
-                c_bet_river_opportunities += 1
-                if self._made_c_bet(river_actions):
-                    c_bet_river_count += 1
-            
-            # Fold to c-bet analysis
-            if self._is_fold_to_c_bet_opportunity(flop_actions):
-                fold_to_c_bet_flop_opportunities += 1
-                if self._folded_to_c_bet(flop_actions):
-                    fold_to_c_bet_flop_count += 1
-            
-            if self._is_fold_to_c_bet_opportunity(turn_actions):
-                fold_to_c_bet_turn_opportunities += 1
-                if self._folded_to_c_bet(turn_actions):
-                    fold_to_c_bet_turn_count += 1
-            
-            if self._is_fold_to_c_bet_opportunity(river_actions):
-                fold_to_c_bet_river_opportunities += 1
-                if self._folded_to_c_bet(river_actions):
-                    fold_to_c_bet_river_count += 1
-            
-            # Check-raise analysis
-            if self._is_check_raise_opportunity(flop_actions):
-                check_raise_flop_opportunities += 1
-                if self._made_check_raise(flop_actions):
-                    check_raise_flop_count += 1
-            
-            if self._is_check_raise_opportunity(turn_actions):
-                check_raise_turn_opportunities += 1
-                if self._made_check_raise(turn_actions):
-                    check_raise_turn_count += 1
-            
-            if self._is_check_raise_opportunity(river_actions):
-                check_raise_river_opportunities += 1
-                if self._made_check_raise(river_actions):
-                    check_raise_river_count += 1
+        # Execute query and count tournament hands chunk by chunk
+        counters = self._new_tournament_counters()
+        async for hands in self._iter_hand_chunks(query, hands):
+            for hand in hands:
+                self._accumulate_tournament(counters, hand)
+        
+        return self._finalize_tournament(counters)
+    
+    # Per-hand feature extraction and counter accumulation
+    #
+    # Every calculator follows the same pattern: add each hand to a set of counters,
+    # then finalize the counters into a schema object. Each helper derives only the
+    # flags its counters need, and the fused kernel reuses them to fill all counter
+    # sets in one pass.
+    
+    def _accumulate_basic(self, hand: PokerHand, *counter_sets: BasicStatisticsAccumulator) -> Dict[str, Any]:
+        """
+        Derive a hand's basic flags once and add them to each of the given accumulators.
+        
+        Args:
+            hand: Poker hand to inspect
+            *counter_sets: Basic or positional accumulators to update
+        
+        Returns:
+            The hand's actions, for callers that derive further flags from them
+        """
+        actions = hand.actions or {}
+        position = hand.position
+        
+        is_tournament = hand.game_format == 'tournament'
+        vpip = self._is_vpip_hand(actions, position)
+        pfr = self._is_pfr_hand(actions)
+        aggressive_actions = self._count_aggressive_actions(actions)
+        passive_actions = self._count_passive_actions(actions)
+        winnings = self._hand_winnings_cents(hand)
+        big_blinds_won = self._hand_big_blinds_won(hand)
+        went_to_showdown = self._went_to_showdown(actions)
+        won_showdown = went_to_showdown and hand.result == 'won'
+        steal_opportunity = self._is_steal_opportunity(position, actions)
+        attempted_steal = steal_opportunity and self._attempted_steal(actions)
+        fold_to_steal_opportunity = self._is_fold_to_steal_opportunity(position, actions)
+        folded_to_steal = fold_to_steal_opportunity and self._folded_to_steal(actions)
+        
+        for counters in counter_sets:
+            counters.total_hands += 1
+            if is_tournament:
+                counters.tournament_hands += 1
+            if vpip:
+                counters.vpip_hands += 1
+            if pfr:
+                counters.pfr_hands += 1
+            counters.aggressive_actions += aggressive_actions
+            counters.passive_actions += passive_actions
+            counters.total_winnings += winnings
+            if big_blinds_won is not None:
+                counters.big_blind_hands += 1
+                counters.big_blinds_won += big_blinds_won
+            
+            if went_to_showdown:
+                counters.showdown_hands += 1
+                if won_showdown:
+                    counters.won_showdown += 1
+            
+            if steal_opportunity:
+                counters.steal_opportunities += 1
+                if attempted_steal:
+                    counters.steal_attempts += 1
+            
+            if fold_to_steal_opportunity:
+                counters.fold_to_steal_opportunities += 1
+                if folded_to_steal:
+                    counters.fold_to_steal_count += 1
+        
+        return actions
+    
+    def _finalize_basic(self, counters: BasicStatisticsAccumulator, user_id: Optional[str]) -> BasicStatistics:
+        """Turn basic statistics counters into a BasicStatistics object."""
+        total_hands = counters.total_hands
+        
+        if total_hands == 0:
+            return BasicStatistics(
+                total_hands=0,
+                vpip=Decimal('0.0'),
+                pfr=Decimal('0.0'),
+                aggression_factor=Decimal('0.0'),
+                win_rate=Decimal('0.0')
+            )
         
         # Calculate percentages
-        three_bet_percentage = self._calculate_percentage(three_bet_count, three_bet_opportunities)
-        fold_to_three_bet = self._calculate_percentage(fold_to_three_bet_count, fold_to_three_bet_opportunities)
-        four_bet_percentage = self._calculate_percentage(four_bet_count, four_bet_opportunities)
-        fold_to_four_bet = self._calculate_percentage(fold_to_four_bet_count, fold_to_four_bet_opportunities)
-        cold_call_percentage = self._calculate_percentage(cold_call_count, cold_call_opportunities)
-        isolation_raise = self._calculate_percentage(isolation_count, isolation_opportunities)
+        vpip = self._calculate_percentage(counters.vpip_hands, total_hands)
+        pfr = self._calculate_percentage(counters.pfr_hands, total_hands)
         
-        c_bet_flop = self._calculate_percentage(c_bet_flop_count, c_bet_flop_opportunities)
-        c_bet_turn = self._calculate_percentage(c_bet_turn_count, c_bet_turn_opportunities)
-        c_bet_river = self._calculate_percentage(c_bet_river_count, c_bet_river_opportunities)
+        # Ensure mathematical consistency: PFR should never exceed VPIP
+        if pfr > vpip:
+            logger.warning(f"PFR ({pfr}) exceeds VPIP ({vpip}) for user {user_id}. Adjusting PFR to match VPIP.")
+            pfr = vpip
         
-        fold_to_c_bet_flop = self._calculate_percentage(fold_to_c_bet_flop_count, fold_to_c_bet_flop_opportunities)
-        fold_to_c_bet_turn = self._calculate_percentage(fold_to_c_bet_turn_count, fold_to_c_bet_turn_opportunities)
-        fold_to_c_bet_river = self._calculate_percentage(fold_to_c_bet_river_count, fold_to_c_bet_river_opportunities)
+        aggression_factor = self._calculate_aggression_factor(
+            counters.aggressive_actions, counters.passive_actions
+        )
         
-        check_raise_flop = self._calculate_percentage(check_raise_flop_count, check_raise_flop_opportunities)
-        check_raise_turn = self._calculate_percentage(check_raise_turn_count, check_raise_turn_opportunities)
-        check_raise_river = self._calculate_percentage(check_raise_river_count, check_raise_river_opportunities)
+        # Calculate win rate (bb/100 for cash games, ROI% for tournaments)
+        win_rate = self._calculate_win_rate_from_counts(
+            counters.total_winnings,
+            total_hands,
+            counters.tournament_hands,
+            counters.big_blinds_won,
+            counters.big_blind_hands
+        )
         
-        # Red line (non-showdown) and blue line (showdown) winnings
-        red_line_winnings = non_showdown_winnings
-        blue_line_winnings = showdown_winnings
+        # Calculate optional stats
+        showdown_hands = counters.showdown_hands
+        steal_opportunities = counters.steal_opportunities
+        fold_to_steal_opportunities = counters.fold_to_steal_opportunities
+        went_to_showdown = self._calculate_percentage(showdown_hands, total_hands)
+        won_at_showdown = self._calculate_percentage(counters.won_showdown, showdown_hands) if showdown_hands > 0 else None
+        attempt_to_steal = self._calculate_percentage(counters.steal_attempts, steal_opportunities) if steal_opportunities > 0 else None
+        fold_to_steal = self._calculate_percentage(counters.fold_to_steal_count, fold_to_steal_opportunities) if fold_to_steal_opportunities > 0 else None
         
-        # Calculate expected value and variance
-        if hand_results:
-            expected_value = Decimal(str(sum(hand_results) / len(hand_results)))
+        return BasicStatistics(
+            total_hands=total_hands,
+            vpip=vpip,
+            pfr=pfr,
+            aggression_factor=aggression_factor.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
+            win_rate=win_rate,
+            went_to_showdown=went_to_showdown,
+            won_at_showdown=won_at_showdown,
+            attempt_to_steal=attempt_to_steal,
+            fold_to_steal=fold_to_steal
+        )
+    
+    def _accumulate_positional(self, counters: PositionalStatisticsAccumulator, actions: Dict[str, Any]) -> None:
+        """
+        Add a hand's 3-bet flags to the counters of the position it was played from.
+        
+        The counters shared with basic statistics are filled by _accumulate_basic.
+        """
+        if self._is_three_bet_opportunity(actions):
+            counters.three_bet_opportunities += 1
+            if self._made_three_bet(actions):
+                counters.three_bet_count += 1
+        
+        if self._is_fold_to_three_bet_opportunity(actions):
+            counters.fold_to_three_bet_opportunities += 1
+            if self._folded_to_three_bet(actions):
+                counters.fold_to_three_bet_count += 1
+    
+    def _finalize_positional(
+        self,
+        position_counters: Dict[Optional[str], PositionalStatisticsAccumulator]
+    ) -> List[PositionalStatistics]:
+        """Turn per-position accumulators into PositionalStatistics sorted by table order."""
+        positional_stats = []
+        for position, counters in position_counters.items():
+            position_stats = self._finalize_position(position, counters)
+            if position_stats is not None:
+                positional_stats.append(position_stats)
+        
+        # Sort by standard position order
+        position_order = POSITION_ORDER
+        positional_stats.sort(key=lambda x: position_order.index(x.position) if x.position in position_order else 999)
+        
+        return positional_stats
+    
+    def _finalize_position(
+        self,
+        position: Optional[str],
+        counters: PositionalStatisticsAccumulator
+    ) -> Optional[PositionalStatistics]:
+        """Turn one position's accumulator into PositionalStatistics, or None if it is not reported."""
+        if position is None:  # Hands without a recorded position have no positional stats
+            return None
+        
+        total_hands = counters.total_hands
+        if total_hands < 5:  # Skip positions with too few hands
+            return None
+        
+        # Calculate percentages
+        vpip = self._calculate_percentage(counters.vpip_hands, total_hands)
+        pfr = self._calculate_percentage(counters.pfr_hands, total_hands)
+        
+        # Ensure mathematical consistency: PFR should never exceed VPIP
+        if pfr > vpip:
+            logger.warning(f"Position {position}: PFR ({pfr}) exceeds VPIP ({vpip}). Adjusting PFR to match VPIP.")
+            pfr = vpip
+        
+        aggression_factor = self._calculate_aggression_factor(
+            counters.aggressive_actions, counters.passive_actions
+        )
+        
+        win_rate = self._calculate_win_rate_from_counts(
+            counters.total_winnings,
+            total_hands,
+            counters.tournament_hands,
+            counters.big_blinds_won,
+            counters.big_blind_hands
+        )
+        
+        # 3-bet stats
+        three_bet_opportunities = counters.three_bet_opportunities
+        fold_to_three_bet_opportunities = counters.fold_to_three_bet_opportunities
+        three_bet_percentage = self._calculate_percentage(counters.three_bet_count, three_bet_opportunities) if three_bet_opportunities > 0 else None
+        fold_to_three_bet = self._calculate_percentage(counters.fold_to_three_bet_count, fold_to_three_bet_opportunities) if fold_to_three_bet_opportunities > 0 else None
+        
+        return PositionalStatistics(
+            position=position,
+            hands_played=total_hands,
+            vpip=vpip,
+            pfr=pfr,
+            win_rate=win_rate,
+            aggression_factor=aggression_factor.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
+            three_bet_percentage=three_bet_percentage,
+            fold_to_three_bet=fold_to_three_bet
+        )
+    
+    def _accumulate_advanced(self, counters: AdvancedStatisticsAccumulator, hand: PokerHand) -> None:
+        """Add a hand to advanced statistics counters."""
+        actions = hand.actions or {}
+        
+        # Calculate hand investment and winnings in cents
+        hand_investment = self._hand_investment_cents(hand, actions)
+        hand_winnings = self._detailed_hand_winnings_cents(hand, actions)
+        counters.total_invested += hand_investment
+        
+        # Track the moments of the hand results for expected value and variance
+        if hand.net_result is not None:
+            hand_result = to_cents(hand.net_result)
+        else:
+            hand_result = hand_winnings - hand_investment
+        counters.result_count += 1
+        counters.result_sum += hand_result
+        counters.result_sum_squares += hand_result * hand_result
+        
+        # Red line vs Blue line analysis
+        if self._went_to_showdown(actions):
+            counters.showdown_winnings += hand_winnings
+        else:
+            counters.non_showdown_winnings += hand_winnings
+        
+        # Counter indices follow ADVANCED_PERCENTAGE_STATS
+        opportunities = counters.opportunities
+        counts = counters.counts
+        
+        # Preflop advanced statistics
+        preflop_actions = actions.get('preflop', [])
+        
+        if self._is_advanced_three_bet_opportunity(preflop_actions):
+            opportunities[0] += 1
+            if self._made_advanced_three_bet(preflop_actions):
+                counts[0] += 1
+        
+        if self._is_advanced_fold_to_three_bet_opportunity(preflop_actions):
+            opportunities[1] += 1
+            if self._folded_to_advanced_three_bet(preflop_actions):
+                counts[1] += 1
+        
+        if self._is_four_bet_opportunity(preflop_actions):
+            opportunities[2] += 1
+            if self._made_four_bet(preflop_actions):
+                counts[2] += 1
+        
+        if self._is_fold_to_four_bet_opportunity(preflop_actions):
+            opportunities[3] += 1
+            if self._folded_to_four_bet(preflop_actions):
+                counts[3] += 1
+        
+        if self._is_cold_call_opportunity(preflop_actions):
+            opportunities[4] += 1
+            if self._made_cold_call(preflop_actions):
+                counts[4] += 1
+        
+        if self._is_isolation_opportunity(preflop_actions, hand.position):
+            opportunities[5] += 1
+            if self._made_isolation_raise(preflop_actions):
+                counts[5] += 1
+        
+        # Postflop advanced statistics: c-bet, fold to c-bet and check-raise per street
+        was_preflop_aggressor = self._was_preflop_aggressor(preflop_actions)
+        
+        for street_index, street in enumerate(('flop', 'turn', 'river')):
+            street_actions = actions.get(street, [])
+            
+            if self._is_c_bet_opportunity(was_preflop_aggressor, street_actions):
+                opportunities[6 + street_index] += 1
+                if self._made_c_bet(street_actions):
+                    counts[6 + street_index] += 1
             
-            # Calculate variance
-            mean_result = sum(hand_results) / len(hand_results)
-            variance_sum = sum((result - mean_result) ** 2 for result in hand_results)
-            variance = Decimal(str(variance_sum / len(hand_results)))
+            if self._is_fold_to_c_bet_opportunity(street_actions):
+                opportunities[9 + street_index] += 1
+                if self._folded_to_c_bet(street_actions):
+                    counts[9 + street_index] += 1
+            
+            if self._is_check_raise_opportunity(street_actions):
+                opportunities[12 + street_index] += 1
+                if self._made_check_raise(street_actions):
+                    counts[12 + street_index] += 1
+    
+    def _finalize_advanced(self, counters: AdvancedStatisticsAccumulator) -> AdvancedStatistics:
+        """Turn advanced statistics counters into an AdvancedStatistics object."""
+        percentages = {
+            stat: self._calculate_percentage(count, opportunities)
+            for stat, count, opportunities in zip(
+                ADVANCED_PERCENTAGE_STATS, counters.counts, counters.opportunities
+            )
+        }
+        
+        # Calculate expected value and variance
+        moments = self._result_moments(counters)
+        if moments:
+            expected_value, variance = moments
             
             # Calculate standard deviations from expected
             if variance > 0:
@@ -1617,237 +2727,840 @@ class StatisticsService:
             standard_deviations = Decimal('0.0')
         
         return AdvancedStatistics(
-            three_bet_percentage=three_bet_percentage,
-            fold_to_three_bet=fold_to_three_bet,
-            four_bet_percentage=four_bet_percentage,
-            fold_to_four_bet=fold_to_four_bet,
-            cold_call_percentage=cold_call_percentage,
-            isolation_raise=isolation_raise,
-            c_bet_flop=c_bet_flop,
-            c_bet_turn=c_bet_turn,
-            c_bet_river=c_bet_river,
-            fold_to_c_bet_flop=fold_to_c_bet_flop,
-            fold_to_c_bet_turn=fold_to_c_bet_turn,
-            fold_to_c_bet_river=fold_to_c_bet_river,
-            check_raise_flop=check_raise_flop,
-            check_raise_turn=check_raise_turn,
-            check_raise_river=check_raise_river,
-            red_line_winnings=red_line_winnings,
-            blue_line_winnings=blue_line_winnings,
+            **percentages,
+            red_line_winnings=cents_to_decimal(counters.non_showdown_winnings),
+            blue_line_winnings=cents_to_decimal(counters.showdown_winnings),
             expected_value=expected_value,
             variance=variance,
             standard_deviations=standard_deviations
         )
     
-    async def calculate_tournament_statistics(
-        self, 
-        user_id: str, 
-        filters: Optional[StatisticsFilters] = None
-    ) -> Optional[TournamentStatistics]:
+    def _result_moments(self, counters: AdvancedStatisticsAccumulator) -> Optional[Tuple[Decimal, Decimal]]:
+        """Mean and variance of the per-hand net results, or None when there are no hands."""
+        result_count = counters.result_count
+        if not result_count:
+            return None
+        
+        # Exact integer moments in cents; converted through float to keep the reported precision
+        mean_result = (Decimal(counters.result_sum) / result_count).scaleb(-2)
+        variance_numerator = result_count * counters.result_sum_squares - counters.result_sum ** 2
+        variance = (Decimal(variance_numerator) / (result_count * result_count)).scaleb(-4)
+        return Decimal(str(float(mean_result))), Decimal(str(float(variance)))
+    
+    def _accumulate_session(self, counters: SessionStatisticsAccumulator, hand: PokerHand) -> None:
+        """Add one hand to session statistics counters."""
+        actions = hand.actions or {}
+        
+        counters.total_hands += 1
+        if self._is_vpip_hand(actions, hand.position):
+            counters.vpip_hands += 1
+        if self._is_pfr_hand(actions):
+            counters.pfr_hands += 1
+        counters.aggressive_actions += self._count_aggressive_actions(actions)
+        counters.passive_actions += self._count_passive_actions(actions)
+        
+        # Winnings tracking; losses are only known for hands with a stored net result
+        if hand.net_result is not None or (hand.result and hand.pot_size):
+            hand_winnings = self._hand_winnings_cents(hand)
+            counters.total_winnings += hand_winnings
+            
+            if hand_winnings > counters.biggest_win:
+                counters.biggest_win = hand_winnings
+            elif hand_winnings < counters.biggest_loss:
+                counters.biggest_loss = hand_winnings
+        
+        if hand.date_played:
+            # Aware, so counters of hands merge with those of stored sessions
+            played = _as_utc(hand.date_played)
+            if counters.first_played is None or played < counters.first_played:
+                counters.first_played = played
+            if counters.last_played is None or played > counters.last_played:
+                counters.last_played = played
+    
+    def _finalize_session(self, counters: SessionStatisticsAccumulator, session_date: datetime) -> SessionStatistics:
+        """Turn session statistics counters into a SessionStatistics object."""
+        total_hands = counters.total_hands
+        
+        # Calculate percentages
+        vpip = self._calculate_percentage(counters.vpip_hands, total_hands)
+        pfr = self._calculate_percentage(counters.pfr_hands, total_hands)
+        
+        # Ensure mathematical consistency: PFR should never exceed VPIP
+        if pfr > vpip:
+            logger.warning(f"Session {session_date}: PFR ({pfr}) exceeds VPIP ({vpip}). Adjusting PFR to match VPIP.")
+            pfr = vpip
+        
+        aggression_factor = self._calculate_aggression_factor(
+            counters.aggressive_actions, counters.passive_actions
+        )
+        
+        # Win rate (simplified)
+        net_result = cents_to_decimal(counters.total_winnings)
+        win_rate = net_result / Decimal(total_hands) if total_hands > 0 else Decimal('0.0')
+        
+        # Session duration
+        if counters.first_played and counters.last_played:
+            duration_minutes = int((counters.last_played - counters.first_played).total_seconds() / 60)
+        else:
+            duration_minutes = 0
+        
+        return SessionStatistics(
+            session_date=session_date,
+            hands_played=total_hands,
+            duration_minutes=duration_minutes,
+            win_rate=win_rate,
+            vpip=vpip,
+            pfr=pfr,
+            aggression_factor=aggression_factor.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
+            biggest_win=cents_to_decimal(counters.biggest_win),
+            biggest_loss=cents_to_decimal(counters.biggest_loss),
+            net_result=net_result
+        )
+    
+    def _new_tournament_counters(self) -> Dict[str, Any]:
+        """Create empty counters for tournament statistics."""
+        return {
+            'tournaments': {},
+            'icm_pressure_spots': 0,
+        }
+    
+    def _accumulate_tournament(self, counters: Dict[str, Any], hand: PokerHand) -> None:
+        """Add a tournament hand to the per-tournament counters."""
+        tournaments = counters['tournaments']
+        tournament_info = hand.tournament_info or {}
+        tournament_id = tournament_info.get('tournament_id', f"unknown_{hand.date_played}")
+        
+        if tournament_id not in tournaments:
+            tournaments[tournament_id] = {
+                'buy_in': Decimal(str(tournament_info.get('buy_in', 0.0))),  # Convert to Decimal
+                'total_winnings': Decimal('0.0'),
+                'finished': False,
+                'finish_position': None,
+                'total_players': tournament_info.get('total_players', 0),
+                'is_final_table': False,
+                'bubble_position': tournament_info.get('bubble_position', 0)
+            }
+        
+        tournament = tournaments[tournament_id]
+        
+        # Update tournament results
+        if hand.result == 'won' and hand.pot_size:
+            tournament['total_winnings'] += hand.pot_size
+        
+        # Check if this is a final hand (tournament finish)
+        if tournament_info.get('finish_position'):
+            tournament['finished'] = True
+            tournament['finish_position'] = tournament_info.get('finish_position')
+            tournament['is_final_table'] = tournament_info.get('finish_position', 999) <= 9
+        
+        # ICM pressure spots (simplified - consider ICM pressure if within 20% of bubble)
+        players_left = tournament_info.get('players_remaining', 0)
+        bubble_position = tournament_info.get('bubble_position', 0)
+        if bubble_position > 0 and players_left > 0:
+            if players_left <= bubble_position * 1.2:
+                counters['icm_pressure_spots'] += 1
+    
+    def _finalize_tournament(self, counters: Dict[str, Any]) -> Optional[TournamentStatistics]:
+        """Turn per-tournament counters into a TournamentStatistics object."""
+        tournaments = counters['tournaments']
+        if not tournaments:
+            return None
+        
+        # Calculate tournament statistics
+        tournaments_played = len(tournaments)
+        tournaments_cashed = 0
+        total_buy_ins = Decimal('0.0')
+        total_winnings = Decimal('0.0')
+        finish_positions = []
+        final_table_appearances = 0
+        bubble_spots = 0
+        
+        for tournament_id, tournament_data in tournaments.items():
+            buy_in = Decimal(str(tournament_data['buy_in']))  # Convert to Decimal
+            winnings = tournament_data['total_winnings']
+            
+            total_buy_ins += buy_in
+            total_winnings += winnings
+            
+            # Check if cashed (winnings > buy_in)
+            if winnings > buy_in:
+                tournaments_cashed += 1
+            
+            # Track finish positions
+            if tournament_data['finish_position']:
+                finish_positions.append(tournament_data['finish_position'])
+            
+            # Final table appearances
+            if tournament_data['is_final_table']:
+                final_table_appearances += 1
+            
+            # Bubble analysis (finished just outside money)
+            bubble_position = tournament_data['bubble_position']
+            finish_position = tournament_data['finish_position']
+            if bubble_position > 0 and finish_position and finish_position == bubble_position + 1:
+                bubble_spots += 1
+        
+        # Calculate metrics
+        cash_percentage = self._calculate_percentage(tournaments_cashed, tournaments_played)
+        
+        # Calculate average finish position
+        if finish_positions:
+            average_finish = Decimal(str(sum(finish_positions) / len(finish_positions)))
+        else:
+            average_finish = Decimal('0.0')
+        
+        # Calculate ROI
+        if total_buy_ins > 0:
+            profit = total_winnings - total_buy_ins
+            roi = (profit / total_buy_ins) * Decimal('100')
+        else:
+            profit = Decimal('0.0')
+            roi = Decimal('0.0')
+        
+        # Calculate bubble factor (simplified)
+        bubble_factor = Decimal(str(bubble_spots / tournaments_played))
+        
+        return TournamentStatistics(
+            tournaments_played=tournaments_played,
+            tournaments_cashed=tournaments_cashed,
+            cash_percentage=cash_percentage,
+            average_finish=average_finish,
+            roi=roi,
+            total_buy_ins=total_buy_ins,
+            total_winnings=total_winnings,
+            profit=profit,
+            bubble_factor=bubble_factor,
+            icm_pressure_spots=counters['icm_pressure_spots'],
+            final_table_appearances=final_table_appearances
+        )
+    
+    # Hand facts: per-hand flags stored at ingest and aggregated in SQL
+    
+    def build_hand_facts(self, hand: PokerHand) -> HandFacts:
         """
-        Calculate tournament-specific statistics with enhanced reliability.
+        Derive the hand_facts row for a hand.
+        
+        The flags come from the same accumulators the row-based calculators use,
+        so summing facts rows reproduces their counters exactly.
         
         Args:
-            user_id: User ID to calculate statistics for
-            filters: Optional filters to apply to the calculation
+            hand: Poker hand to derive facts for
+        
+        Returns:
+            HandFacts instance (not yet added to a session)
+        """
+        counters = PositionalStatisticsAccumulator(self)
+        actions = self._accumulate_basic(hand, counters)
+        self._accumulate_positional(counters, actions)
+        
+        advanced = AdvancedStatisticsAccumulator(self)
+        self._accumulate_advanced(advanced, hand)
+        
+        advanced_flags = {}
+        for stat, opportunity, made in zip(ADVANCED_PERCENTAGE_STATS, advanced.opportunities, advanced.counts):
+            advanced_flags[f'{stat}_opportunity'] = bool(opportunity)
+            advanced_flags[f'{stat}_made'] = bool(made)
+        
+        detailed_winnings = advanced.showdown_winnings + advanced.non_showdown_winnings
+        
+        return HandFacts(
+            user_id=hand.user_id,
+            platform=hand.platform,
+            game_type=hand.game_type,
+            game_format=hand.game_format,
+            stakes=hand.stakes,
+            position=hand.position,
+            date_played=hand.date_played,
+            is_play_money=bool(hand.is_play_money),
+            vpip=bool(counters.vpip_hands),
+            pfr=bool(counters.pfr_hands),
+            aggressive_actions=counters.aggressive_actions,
+            passive_actions=counters.passive_actions,
+            went_to_showdown=bool(counters.showdown_hands),
+            won=hand.result == 'won',
+            steal_opportunity=bool(counters.steal_opportunities),
+            attempted_steal=bool(counters.steal_attempts),
+            fold_to_steal_opportunity=bool(counters.fold_to_steal_opportunities),
+            folded_to_steal=bool(counters.fold_to_steal_count),
+            position_three_bet_opportunity=bool(counters.three_bet_opportunities),
+            position_three_bet_made=bool(counters.three_bet_count),
+            position_fold_to_three_bet_opportunity=bool(counters.fold_to_three_bet_opportunities),
+            position_fold_to_three_bet_made=bool(counters.fold_to_three_bet_count),
+            winnings=cents_to_decimal(counters.total_winnings),
+            investment=cents_to_decimal(advanced.total_invested),
+            detailed_winnings=cents_to_decimal(detailed_winnings),
+            net_result=cents_to_decimal(advanced.result_sum),
+            big_blind_hand=bool(counters.big_blind_hands),
+            big_blinds_won=counters.big_blinds_won,
+            **advanced_flags
+        )
+    
+    async def backfill_hand_facts(self, user_id: Optional[str] = None, batch_size: int = 1000) -> int:
+        """
+        Create missing hand_facts rows for hands stored before facts were written at ingest.
+        
+        Args:
+            user_id: Only backfill this user's hands (all users if None)
+            batch_size: Number of hands to load and commit per batch
+        
+        Returns:
+            Number of facts rows created
+        """
+        created = 0
+        
+        while True:
+            query = (
+                select(PokerHand)
+                .outerjoin(HandFacts, HandFacts.poker_hand_id == PokerHand.id)
+                .where(HandFacts.poker_hand_id.is_(None))
+                .limit(batch_size)
+            )
+            if user_id:
+                query = query.where(PokerHand.user_id == user_id)
+            
+            result = await self.db.execute(query)
+            hands = result.scalars().all()
+            if not hands:
+                break
+            
+            for hand in hands:
+                facts = self.build_hand_facts(hand)
+                facts.poker_hand_id = hand.id
+                self.db.add(facts)
             
+            await self.db.commit()
+            created += len(hands)
+            logger.info(f"Backfilled hand facts for {created} hands")
+        
+        return created
+    
+    async def backfill_hand_results(self, user_id: Optional[str] = None, batch_size: int = 1000) -> int:
+        """
+        Store net results and big blinds for hands imported before they were parsed.
+        
+        The net result is re-parsed from the stored hand history text and the big
+        blind copied from the blinds JSON; the hand's facts row is rebuilt so the
+        facts and rollup queries see the new values. Hands are walked in id order,
+        so hands whose text cannot be parsed are visited once.
+        
+        Args:
+            user_id: Only backfill this user's hands (all users if None)
+            batch_size: Number of hands to load and commit per batch
+        
         Returns:
-            TournamentStatistics object with calculated metrics, or None if no tournament data
+            Number of hands updated
         """
-        cache_params = {
-            'user_id': user_id,
-            'filters': filters or StatisticsFilters()
+        from app.services.hand_parser import HandParserService
+        
+        parsers = HandParserService().parsers
+        updated = 0
+        last_id = None
+        
+        while True:
+            query = (
+                select(PokerHand)
+                .options(undefer(PokerHand.raw_text))
+                .where(or_(PokerHand.net_result.is_(None), PokerHand.big_blind.is_(None)))
+                .order_by(PokerHand.id)
+                .limit(batch_size)
+            )
+            if user_id:
+                query = query.where(PokerHand.user_id == user_id)
+            if last_id is not None:
+                query = query.where(PokerHand.id > last_id)
+            
+            result = await self.db.execute(query)
+            hands = result.scalars().all()
+            if not hands:
+                break
+            last_id = hands[-1].id
+            
+            for hand in hands:
+                parser = parsers.get(hand.platform)
+                if hand.net_result is None and parser and hand.raw_text:
+                    hand.net_result = parser.calculate_net_result(hand.raw_text)
+                big_blind = (hand.blinds or {}).get('big')
+                if hand.big_blind is None and big_blind is not None:
+                    hand.big_blind = Decimal(str(big_blind))
+                
+                facts = self.build_hand_facts(hand)
+                facts.poker_hand_id = hand.id
+                await self.db.merge(facts)
+            
+            await self.db.commit()
+            updated += len(hands)
+            logger.info(f"Backfilled net results for {updated} hands")
+        
+        return updated
+    
+    def _sum_flag(self, condition):
+        """SQL sum of a boolean condition, 0 for an empty set."""
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+    
+    def _sum_amount(self, column):
+        """SQL sum of a numeric column, 0 for an empty set."""
+        return func.coalesce(func.sum(column), 0)
+    
+    def _basic_fact_columns(self) -> List[Any]:
+        """Aggregate columns over hand_facts labelled with the basic counter names."""
+        return [
+            func.count().label('total_hands'),
+            self._sum_flag(HandFacts.game_format == 'tournament').label('tournament_hands'),
+            self._sum_flag(HandFacts.vpip).label('vpip_hands'),
+            self._sum_flag(HandFacts.pfr).label('pfr_hands'),
+            self._sum_amount(HandFacts.aggressive_actions).label('aggressive_actions'),
+            self._sum_amount(HandFacts.passive_actions).label('passive_actions'),
+            self._sum_amount(HandFacts.winnings).label('total_winnings'),
+            self._sum_flag(HandFacts.went_to_showdown).label('showdown_hands'),
+            self._sum_flag(and_(HandFacts.went_to_showdown, HandFacts.won)).label('won_showdown'),
+            self._sum_flag(HandFacts.steal_opportunity).label('steal_opportunities'),
+            self._sum_flag(HandFacts.attempted_steal).label('steal_attempts'),
+            self._sum_flag(HandFacts.fold_to_steal_opportunity).label('fold_to_steal_opportunities'),
+            self._sum_flag(HandFacts.folded_to_steal).label('fold_to_steal_count'),
+            self._sum_flag(HandFacts.big_blind_hand).label('big_blind_hands'),
+            self._sum_amount(HandFacts.big_blinds_won).label('big_blinds_won'),
+        ]
+    
+    def _sum_to_decimal(self, value: Any, places: str = '0.01') -> Decimal:
+        """
+        Convert an aggregated amount to Decimal.
+        
+        Sums of DECIMAL(10, 2) columns are exact in PostgreSQL but may come back as
+        floats from other drivers, so they are rounded back to the column precision.
+        """
+        return Decimal(str(value or 0)).quantize(Decimal(places), rounding=ROUND_HALF_UP)
+    
+    def _positional_fact_columns(self) -> List[Any]:
+        """Aggregate columns over hand_facts labelled with the positional counter names."""
+        return self._basic_fact_columns() + [
+            self._sum_flag(HandFacts.position_three_bet_opportunity).label('three_bet_opportunities'),
+            self._sum_flag(HandFacts.position_three_bet_made).label('three_bet_count'),
+            self._sum_flag(HandFacts.position_fold_to_three_bet_opportunity).label('fold_to_three_bet_opportunities'),
+            self._sum_flag(HandFacts.position_fold_to_three_bet_made).label('fold_to_three_bet_count'),
+        ]
+    
+    def _fill_counters(self, counters: BasicStatisticsAccumulator, row: Any) -> BasicStatisticsAccumulator:
+        """Copy labelled aggregate values into an accumulator's counters."""
+        values = row._mapping
+        for name in counters.COUNTERS:
+            if name in values:
+                setattr(counters, name, int(values[name] or 0))
+        for name in counters.AMOUNTS:
+            if name in values:
+                setattr(counters, name, to_cents(self._sum_to_decimal(values[name])))
+        return counters
+    
+    def _facts_query(self, columns: List[Any], user_id: str, filters: Optional[StatisticsFilters]):
+        """Build an aggregate query over the user's filtered hand_facts rows."""
+        query = select(*columns).where(HandFacts.user_id == user_id)
+        if filters:
+            query = self._apply_filters(query, filters, model=HandFacts)
+        return query
+    
+    async def _calculate_basic_statistics_from_facts(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None
+    ) -> BasicStatistics:
+        """Calculate basic statistics with one aggregate query over hand_facts."""
+        result = await self.db.execute(self._facts_query(self._basic_fact_columns(), user_id, filters))
+        counters = self._fill_counters(BasicStatisticsAccumulator(self), result.one())
+        return self._finalize_basic(counters, user_id)
+    
+    async def _calculate_positional_statistics_from_facts(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None
+    ) -> List[PositionalStatistics]:
+        """Calculate positional statistics with one aggregate query grouped by position."""
+        columns = [HandFacts.position] + self._positional_fact_columns()
+        query = self._facts_query(columns, user_id, filters)
+        query = query.where(HandFacts.position.isnot(None)).group_by(HandFacts.position)
+        
+        result = await self.db.execute(query)
+        position_counters = {
+            row.position: self._fill_counters(PositionalStatisticsAccumulator(self), row)
+            for row in result.all()
         }
+        return self._finalize_positional(position_counters)
+    
+    async def _calculate_advanced_statistics_from_facts(
+        self,
+        user_id: str,
+        filters: Optional[StatisticsFilters] = None
+    ) -> AdvancedStatistics:
+        """Calculate advanced statistics with one aggregate query over hand_facts."""
+        result = await self.db.execute(self._facts_query(self._advanced_fact_columns(), user_id, filters))
+        counters = self._fill_advanced_counters(AdvancedStatisticsAccumulator(self), result.one())
+        return self._finalize_advanced(counters)
+    
+    def _advanced_fact_columns(self) -> List[Any]:
+        """Aggregate columns over hand_facts for the advanced counters."""
+        columns = []
+        for stat in ADVANCED_PERCENTAGE_STATS:
+            columns.append(self._sum_flag(getattr(HandFacts, f'{stat}_opportunity')).label(f'{stat}_opportunity'))
+            columns.append(self._sum_flag(getattr(HandFacts, f'{stat}_made')).label(f'{stat}_made'))
+        return columns + [
+            self._sum_amount(
+                case((HandFacts.went_to_showdown, HandFacts.detailed_winnings), else_=0)
+            ).label('showdown_winnings'),
+            self._sum_amount(
+                case((HandFacts.went_to_showdown, 0), else_=HandFacts.detailed_winnings)
+            ).label('non_showdown_winnings'),
+            self._sum_amount(HandFacts.investment).label('total_invested'),
+            func.count().label('result_count'),
+            self._sum_amount(HandFacts.net_result).label('result_sum'),
+            self._sum_amount(HandFacts.net_result * HandFacts.net_result).label('result_sum_squares'),
+        ]
+    
+    def _fill_advanced_counters(self, counters: AdvancedStatisticsAccumulator, row: Any) -> AdvancedStatisticsAccumulator:
+        """Copy the values of _advanced_fact_columns into advanced counters."""
+        row = row._mapping
+        counters.opportunities = [int(row[f'{stat}_opportunity'] or 0) for stat in ADVANCED_PERCENTAGE_STATS]
+        counters.counts = [int(row[f'{stat}_made'] or 0) for stat in ADVANCED_PERCENTAGE_STATS]
+        counters.showdown_winnings = to_cents(self._sum_to_decimal(row['showdown_winnings']))
+        counters.non_showdown_winnings = to_cents(self._sum_to_decimal(row['non_showdown_winnings']))
+        counters.total_invested = to_cents(self._sum_to_decimal(row['total_invested']))
+        counters.result_count = int(row['result_count'] or 0)
+        counters.result_sum = to_cents(self._sum_to_decimal(row['result_sum']))
+        counters.result_sum_squares = to_cents(self._sum_to_decimal(row['result_sum_squares'], '0.0001'), places=4)
+        return counters
+    
+    # Daily rollups: per-day counters summed from hand_facts
+    
+    def _can_use_daily_rollups(self, filters: Optional[StatisticsFilters]) -> bool:
+        """Daily rollups only answer date-ranged queries; undated hands have no rollup day."""
+        return bool(self.use_daily_rollups and filters and (filters.start_date or filters.end_date))
+    
+    def _utc_midnight(self, moment: datetime, round_up: bool = False) -> datetime:
+        """Start of the UTC day containing moment, or of the next day when rounding up."""
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=timezone.utc)
+        else:
+            moment = moment.astimezone(timezone.utc)
         
-        return await self._get_cached_or_calculate(
-            cache_params,
-            self._calculate_tournament_statistics_internal,
-            "calculate_tournament_statistics",
-            user_id,
-            filters
+        midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        if round_up and midnight < moment:
+            midnight += timedelta(days=1)
+        return midnight
+    
+    def _rollup_insert(self, *conditions):
+        """
+        INSERT ... SELECT statement summing the matching hand_facts rows into daily rollups.
+        
+        Existing rollup rows are incremented, so the statement can be run for each
+        ingested batch inside the batch's transaction.
+        """
+        day = cast(func.timezone('UTC', HandFacts.date_played), Date)
+        dimensions = [
+            HandFacts.user_id,
+            day.label('day'),
+            HandFacts.platform.label('platform'),
+            func.coalesce(HandFacts.game_type, '').label('game_type'),
+            func.coalesce(HandFacts.game_format, '').label('game_format'),
+            func.coalesce(HandFacts.stakes, '').label('stakes'),
+            func.coalesce(HandFacts.position, '').label('position'),
+            HandFacts.is_play_money.label('is_play_money'),
+        ]
+        counter_columns = self._positional_fact_columns()
+        
+        source = (
+            select(*dimensions, *counter_columns)
+            .where(HandFacts.date_played.isnot(None), *conditions)
+            .group_by(*dimensions)
+        )
+        
+        key_names = ['user_id', 'day', 'platform', 'game_type', 'game_format', 'stakes', 'position', 'is_play_money']
+        counter_names = [column.name for column in counter_columns]
+        statement = pg_insert(DailyStatisticsRollup).from_select(key_names + counter_names, source)
+        
+        return statement.on_conflict_do_update(
+            index_elements=key_names,
+            set_={
+                name: getattr(DailyStatisticsRollup, name) + getattr(statement.excluded, name)
+                for name in counter_names
+            }
         )
     
-    async def _calculate_tournament_statistics_internal(
-        self, 
-        user_id: str, 
-        filters: Optional[StatisticsFilters] = None
-    ) -> Optional[TournamentStatistics]:
+    async def update_daily_rollups(self, poker_hand_ids: List[str]) -> None:
+        """
+        Add the facts of newly ingested hands to the daily rollups.
+        
+        Must run in the same transaction that inserted the hands and their facts,
+        after they have been flushed.
+        """
+        if poker_hand_ids:
+            await self.db.execute(self._rollup_insert(HandFacts.poker_hand_id.in_(poker_hand_ids)))
+    
+    async def rebuild_daily_rollups(self, user_id: Optional[str] = None) -> None:
+        """
+        Recompute daily rollups from hand_facts.
+        
+        Args:
+            user_id: Only rebuild this user's rollups (all users if None)
+        """
+        clear = delete(DailyStatisticsRollup)
+        conditions = []
+        if user_id:
+            clear = clear.where(DailyStatisticsRollup.user_id == user_id)
+            conditions.append(HandFacts.user_id == user_id)
+        
+        await self.db.execute(clear)
+        await self.db.execute(self._rollup_insert(*conditions))
+        await self.db.commit()
+    
+    # Play sessions: gap-based sessions maintained at ingest
+    
+    async def update_play_sessions(self, user_id: str, hands: Sequence[Any]) -> None:
         """
-        Internal method to calculate tournament-specific statistics including ROI, cash rate, and ICM metrics.
+        Fold newly ingested hands into the user's play sessions.
+        
+        The batch is split into sessions, which are merged with the stored
+        sessions within one gap of them; a stored session joined with others
+        keeps its id. Must run in the transaction that inserted the hands.
         
         Args:
-            user_id: User ID to calculate statistics for
-            filters: Optional filters to apply to the calculation
-            
-        Returns:
-            TournamentStatistics object with calculated metrics, or None if no tournament data
+            user_id: User the hands belong to
+            hands: Newly ingested hands
         """
-        # Build base query for tournament hands only
-        query = select(PokerHand).where(
-            and_(
-                PokerHand.user_id == user_id,
-                PokerHand.game_format == 'tournament'
+        new_sessions = sessionize(self, hands, self.session_gap)
+        if not new_sessions:
+            return
+        
+        window_start = new_sessions[0].first_played - self.session_gap
+        window_end = max(counters.last_played for counters in new_sessions) + self.session_gap
+        result = await self.db.execute(
+            select(PlaySession).where(
+                PlaySession.user_id == user_id,
+                PlaySession.end_time >= window_start,
+                PlaySession.start_time <= window_end
             )
         )
+        stored = result.scalars().all()
         
-        # Apply filters
-        if filters:
-            query = self._apply_filters(query, filters)
+        sessions = [(session_counters(self, row), row) for row in stored]
+        sessions.extend((counters, None) for counters in new_sessions)
         
-        # Execute query to get tournament hands
-        result = await self.db.execute(query)
-        hands = result.scalars().all()
+        for counters, tags in merge_sessions(sessions, self.session_gap):
+            rows = [tag for tag in tags if tag is not None]
+            if len(tags) == 1 and rows:
+                # A stored session no new hand joined
+                continue
+            
+            if rows:
+                session = rows[0]
+                for row in rows[1:]:
+                    await self.db.delete(row)
+            else:
+                session = PlaySession(user_id=user_id)
+                self.db.add(session)
+            for name, value in session_values(counters).items():
+                setattr(session, name, value)
+    
+    async def rebuild_play_sessions(self, user_id: Optional[str] = None) -> int:
+        """
+        Recompute play sessions from the stored hands.
         
-        if not hands:
-            return None
+        Args:
+            user_id: Only rebuild this user's sessions (all users if None)
         
-        # Group hands by tournament
-        tournaments = {}
-        for hand in hands:
-            tournament_info = hand.tournament_info or {}
-            tournament_id = tournament_info.get('tournament_id', f"unknown_{hand.date_played}")
-            
-            if tournament_id not in tournaments:
-                tournaments[tournament_id] = {
-                    'hands': [],
-                    'buy_in': Decimal(str(tournament_info.get('buy_in', 0.0))),  # Convert to Decimal
-                    'total_winnings': Decimal('0.0'),
-                    'finished': False,
-                    'finish_position': None,
-                    'total_players': tournament_info.get('total_players', 0),
-                    'is_final_table': False,
-                    'bubble_position': tournament_info.get('bubble_position', 0)
-                }
-            
-            tournaments[tournament_id]['hands'].append(hand)
-            
-            # Update tournament results
-            if hand.result == 'won' and hand.pot_size:
-                tournaments[tournament_id]['total_winnings'] += hand.pot_size
-            
-            # Check if this is a final hand (tournament finish)
-            if tournament_info.get('finish_position'):
-                tournaments[tournament_id]['finished'] = True
-                tournaments[tournament_id]['finish_position'] = tournament_info.get('finish_position')
-                tournaments[tournament_id]['is_final_table'] = tournament_info.get('finish_position', 999) <= 9
+        Returns:
+            Number of sessions stored
+        """
+        if user_id:
+            user_ids = [user_id]
+        else:
+            result = await self.db.execute(select(PokerHand.user_id).distinct())
+            user_ids = result.scalars().all()
+        
+        stored = 0
+        for hand_user_id in user_ids:
+            await self.db.execute(delete(PlaySession).where(PlaySession.user_id == hand_user_id))
+            hands = await self._load_hands(
+                select_statistics_hands(PokerHand.user_id == hand_user_id, PokerHand.date_played.isnot(None))
+            )
+            for counters in sessionize(self, hands, self.session_gap):
+                self.db.add(PlaySession(user_id=hand_user_id, **session_values(counters)))
+                stored += 1
+            await self.db.commit()
+            logger.info(f"Rebuilt play sessions for user {hand_user_id}")
         
-        # Calculate tournament statistics
-        tournaments_played = len(tournaments)
-        tournaments_cashed = 0
-        total_buy_ins = Decimal('0.0')
-        total_winnings = Decimal('0.0')
-        finish_positions = []
-        final_table_appearances = 0
-        bubble_spots = 0
+        return stored
+    
+    def _answers_from_play_sessions(self, filters: Optional[StatisticsFilters]) -> bool:
+        """Whether stored play sessions answer a query: they are enabled and only dates are filtered."""
+        if not self.use_play_sessions:
+            return False
+        undated = normalize_filters(filters).model_copy(update={'start_date': None, 'end_date': None})
+        return undated == StatisticsFilters()
+    
+    async def _play_session_rows(
+        self,
+        user_id: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[PlaySession]:
+        """The user's stored play sessions started between start and end, most recent first."""
+        query = select(PlaySession).where(PlaySession.user_id == user_id)
+        if start:
+            query = query.where(PlaySession.start_time >= start)
+        if end:
+            query = query.where(PlaySession.start_time <= end)
+        result = await self.db.execute(query.order_by(PlaySession.start_time.desc()))
+        return result.scalars().all()
+    
+    async def _range_counters(
+        self,
+        user_id: str,
+        filters: StatisticsFilters,
+        group_by: Optional[str] = None
+    ) -> Dict[Any, PositionalStatisticsAccumulator]:
+        """
+        Positional counters for a date-ranged query from daily rollups plus raw edge hands.
         
-        for tournament_id, tournament_data in tournaments.items():
-            buy_in = Decimal(str(tournament_data['buy_in']))  # Convert to Decimal
-            winnings = tournament_data['total_winnings']
-            
-            total_buy_ins += buy_in
-            total_winnings += winnings
-            
-            # Check if cashed (winnings > buy_in)
-            if winnings > buy_in:
-                tournaments_cashed += 1
-            
-            # Track finish positions
-            if tournament_data['finish_position']:
-                finish_positions.append(tournament_data['finish_position'])
-            
-            # Final table appearances
-            if tournament_data['is_final_table']:
-                final_table_appearances += 1
-            
-            # Bubble analysis (finished just outside money)
-            bubble_position = tournament_data['bubble_position']
-            finish_position = tournament_data['finish_position']
-            if bubble_position > 0 and finish_position and finish_position == bubble_position + 1:
-                bubble_spots += 1
+        Whole UTC days inside the range are summed from rollups. The partial days at
+        either end of the range are counted from their hands, so the result is the
+        same as counting every hand in the range.
         
-        # Calculate metrics
-        cash_percentage = self._calculate_percentage(tournaments_cashed, tournaments_played)
+        Args:
+            user_id: User ID to calculate counters for
+            filters: Filters with a start and/or end date
+            group_by: None for one set of counters, 'position' or 'day' to group them
         
-        # Calculate average finish position
-        if finish_positions:
-            average_finish = Decimal(str(sum(finish_positions) / len(finish_positions)))
+        Returns:
+            Counters keyed by position, by day, or under None when not grouped
+        """
+        start_date, end_date = filters.start_date, filters.end_date
+        first_day = self._utc_midnight(start_date, round_up=True) if start_date else None
+        last_day = self._utc_midnight(end_date) if end_date else None
+        has_whole_days = not (first_day and last_day and first_day >= last_day)
+        undated_filters = filters.model_copy(update={'start_date': None, 'end_date': None})
+        
+        grouped_counters = {}
+        
+        def counters_for(key):
+            counters = grouped_counters.get(key)
+            if counters is None:
+                counters = grouped_counters[key] = PositionalStatisticsAccumulator(self)
+            return counters
+        
+        if has_whole_days:
+            columns = [
+                func.coalesce(func.sum(getattr(DailyStatisticsRollup, name)), 0).label(name)
+                for name in PositionalStatisticsAccumulator.COUNTERS + PositionalStatisticsAccumulator.AMOUNTS
+            ]
+            query = select(*columns).where(DailyStatisticsRollup.user_id == user_id)
+            if first_day:
+                query = query.where(DailyStatisticsRollup.day >= first_day.date())
+            if last_day:
+                query = query.where(DailyStatisticsRollup.day < last_day.date())
+            if group_by == 'position':
+                query = query.where(DailyStatisticsRollup.position != '')
+            if group_by:
+                group_column = getattr(DailyStatisticsRollup, group_by)
+                query = query.add_columns(group_column.label('group_key')).group_by(group_column)
+            query = self._apply_filters(query, undated_filters, model=DailyStatisticsRollup)
+            
+            result = await self.db.execute(query)
+            for row in result.all():
+                key = row.group_key if group_by else None
+                self._fill_counters(counters_for(key), row)
+        
+        # Hands on the partial days at the edges of the range
+        if has_whole_days:
+            edges = []
+            if start_date:
+                edges.append(and_(PokerHand.date_played >= start_date, PokerHand.date_played < first_day))
+            if end_date:
+                edges.append(and_(PokerHand.date_played >= last_day, PokerHand.date_played <= end_date))
+            date_condition = or_(*edges)
         else:
-            average_finish = Decimal('0.0')
+            date_condition = and_(PokerHand.date_played >= start_date, PokerHand.date_played <= end_date)
         
-        # Calculate ROI
-        if total_buy_ins > 0:
-            profit = total_winnings - total_buy_ins
-            roi = (profit / total_buy_ins) * Decimal('100')
-        else:
-            profit = Decimal('0.0')
-            roi = Decimal('0.0')
+        query = select_statistics_hands(PokerHand.user_id == user_id, date_condition)
+        if group_by == 'position':
+            query = query.where(PokerHand.position.isnot(None))
+        query = self._apply_filters(query, undated_filters)
         
-        # Calculate bubble factor (simplified)
-        bubble_factor = None
-        if tournaments_played > 0:
-            bubble_factor = Decimal(str(bubble_spots / tournaments_played))
-        
-        # ICM pressure spots (simplified - count hands near bubble)
-        icm_pressure_spots = 0
-        for tournament_data in tournaments.values():
-            for hand in tournament_data['hands']:
-                tournament_info = hand.tournament_info or {}
-                players_left = tournament_info.get('players_remaining', 0)
-                bubble_position = tournament_info.get('bubble_position', 0)
-                
-                # Consider ICM pressure if within 20% of bubble
-                if bubble_position > 0 and players_left > 0:
-                    if players_left <= bubble_position * 1.2:
-                        icm_pressure_spots += 1
+        async for hands in self._iter_hand_chunks(query):
+            for hand in hands:
+                if group_by == 'position':
+                    key = hand.position
+                elif group_by == 'day':
+                    key = self._utc_midnight(hand.date_played).date()
+                else:
+                    key = None
+                counters = counters_for(key)
+                actions = self._accumulate_basic(hand, counters)
+                self._accumulate_positional(counters, actions)
         
-        return TournamentStatistics(
-            tournaments_played=tournaments_played,
-            tournaments_cashed=tournaments_cashed,
-            cash_percentage=cash_percentage,
-            average_finish=average_finish,
-            roi=roi,
-            total_buy_ins=total_buy_ins,
-            total_winnings=total_winnings,
-            profit=profit,
-            bubble_factor=bubble_factor,
-            icm_pressure_spots=icm_pressure_spots,
-            final_table_appearances=final_table_appearances
-        )
+        return grouped_counters
+    
+    async def _calculate_basic_statistics_from_rollups(
+        self,
+        user_id: str,
+        filters: StatisticsFilters
+    ) -> BasicStatistics:
+        """Calculate date-ranged basic statistics from daily rollups and edge hands."""
+        grouped_counters = await self._range_counters(user_id, filters)
+        counters = grouped_counters.get(None) or BasicStatisticsAccumulator(self)
+        return self._finalize_basic(counters, user_id)
+    
+    async def _calculate_positional_statistics_from_rollups(
+        self,
+        user_id: str,
+        filters: StatisticsFilters
+    ) -> List[PositionalStatistics]:
+        """Calculate date-ranged positional statistics from daily rollups and edge hands."""
+        position_counters = await self._range_counters(user_id, filters, group_by='position')
+        return self._finalize_positional(position_counters)
     
     # Advanced helper methods for detailed statistics calculations
     
     def _calculate_hand_investment(self, hand: PokerHand, actions: Dict[str, Any]) -> Decimal:
         """Calculate total amount invested in a hand."""
-        total_investment = Decimal('0.0')
-        
-        # Add blinds if applicable
-        if hand.position == 'SB' and hand.blinds:
-            total_investment += Decimal(str(hand.blinds.get('small', 0)))
-        elif hand.position == 'BB' and hand.blinds:
-            total_investment += Decimal(str(hand.blinds.get('big', 0)))
-        
-        # Add ante if applicable
-        if hand.blinds and hand.blinds.get('ante'):
-            total_investment += Decimal(str(hand.blinds.get('ante', 0)))
+        return cents_to_decimal(self._hand_investment_cents(hand, actions))
+    
+    def _hand_investment_cents(self, hand: PokerHand, actions: Dict[str, Any]) -> int:
+        """Total amount invested in a hand, in integer cents."""
+        total_investment = 0
+        blinds = hand.blinds
+        
+        if blinds:
+            # Add blinds if applicable
+            if hand.position == 'SB':
+                total_investment += to_cents(blinds.get('small', 0))
+            elif hand.position == 'BB':
+                total_investment += to_cents(blinds.get('big', 0))
+            
+            # Add ante if applicable
+            ante = blinds.get('ante')
+            if ante:
+                total_investment += to_cents(ante)
         
         # Add voluntary investments from actions
-        for street in ['preflop', 'flop', 'turn', 'river']:
-            street_actions = actions.get(street, [])
-            for action in street_actions:
-                if action.get('action') in ['bet', 'raise', 'call'] and action.get('amount'):
-                    total_investment += Decimal(str(action.get('amount', 0)))
+        for street in ('preflop', 'flop', 'turn', 'river'):
+            for action in actions.get(street, ()):
+                if action.get('action') in ('bet', 'raise', 'call'):
+                    amount = action.get('amount')
+                    if amount:
+                        total_investment += to_cents(amount)
         
         return total_investment
     
     def _calculate_detailed_hand_winnings(self, hand: PokerHand, actions: Dict[str, Any]) -> Decimal:
         """Calculate detailed winnings for a hand including side pots."""
+        return cents_to_decimal(self._detailed_hand_winnings_cents(hand, actions))
+    
+    def _detailed_hand_winnings_cents(self, hand: PokerHand, actions: Dict[str, Any]) -> int:
+        """Detailed winnings of a hand including side pots, in integer cents."""
         if not hand.pot_size or hand.result != 'won':
-            return Decimal('0.0')
+            return 0
         
         # For now, return the pot size if won
         # In a more sophisticated implementation, we would calculate
         # the exact amount won from main pot and side pots
-        return hand.pot_size
+        return to_cents(hand.pot_size)
     
     def _is_advanced_three_bet_opportunity(self, preflop_actions: List[Dict[str, Any]]) -> bool:
         """Determine if this was a 3-bet opportunity (facing a raise)."""
@@ -2051,7 +3764,7 @@ class StatisticsService:
                     return True
         
         return False
-
+    
     # Additional methods for ExportService compatibility
     
     async def get_comprehensive_statistics(
@@ -2063,12 +3776,14 @@ class StatisticsService:
         Get comprehensive statistics for export functionality.
         This is a compatibility method for ExportService.
         """
-        # Calculate all statistics
-        basic_stats = await self.calculate_basic_statistics(user_id, filters)
-        advanced_stats = await self.calculate_advanced_statistics(user_id, filters)
-        positional_stats = await self.calculate_positional_statistics(user_id, filters)
-        tournament_stats = await self.calculate_tournament_statistics(user_id, filters)
-        session_stats = await self.calculate_session_statistics(user_id, filters)
+        # Calculate all statistics from one load of the matching hands
+        snapshot = await self.load_snapshot(user_id, filters)
+        hands = snapshot.hands if snapshot else None
+        basic_stats = await self.calculate_basic_statistics(user_id, filters, hands=hands)
+        advanced_stats = await self.calculate_advanced_statistics(user_id, filters, hands=hands)
+        positional_stats = await self.calculate_positional_statistics(user_id, filters, hands=hands)
+        tournament_stats = await self.calculate_tournament_statistics(user_id, filters, hands=hands)
+        session_stats = await self.calculate_session_statistics(user_id, filters, hands=hands)
         
         # Create a mock object with all the attributes ExportService expects
         class ComprehensiveStats:
@@ -2154,29 +3869,62 @@ class StatisticsService:
         session_id: str
     ) -> Any:
         """
-        Get session details for export functionality.
-        This is a compatibility method for ExportService.
+        Get a stored play session's details for export functionality.
+        
+        Args:
+            user_id: Owner of the session
+            session_id: PlaySession ID
+        
+        Returns:
+            Session summary with date, duration, hands, win rate, profit, the most
+            played game type and stakes, and the session's statistics
+        
+        Raises:
+            ValueError: If the user has no such session
         """
-        # For now, return a mock session object
-        # In a real implementation, this would query session data
+        result = await self.db.execute(
+            select(PlaySession).where(PlaySession.id == session_id, PlaySession.user_id == user_id)
+        )
+        row = result.scalars().first()
+        if row is None:
+            raise ValueError(f"Session {session_id} not found")
+        
+        summary = session_counters(self, row).finalize(_as_utc(row.start_time))
+        session_filters = StatisticsFilters(start_date=row.start_time, end_date=row.end_time)
+        advanced = await self._calculate_advanced_statistics_internal(user_id, session_filters)
+        
+        # Most played game type and stakes of the session
+        games = await self.db.execute(
+            select(PokerHand.game_type, PokerHand.stakes)
+            .where(
+                PokerHand.user_id == user_id,
+                PokerHand.date_played >= row.start_time,
+                PokerHand.date_played <= row.end_time
+            )
+            .group_by(PokerHand.game_type, PokerHand.stakes)
+            .order_by(desc(func.count()))
+            .limit(1)
+        )
+        game_type, stakes = games.first() or (None, None)
+        
         class SessionDetails:
             def __init__(self):
-                self.date = datetime.now(timezone.utc)
-                self.duration_minutes = Decimal('125.0')
-                self.hands = 45
-                self.win_rate = Decimal('6.2')
-                self.profit = Decimal('87.50')
-                self.game_type = "Hold'em"
-                self.stakes = "$0.50/$1.00"
+                self.date = summary.session_date
+                self.duration_minutes = Decimal(summary.duration_minutes)
+                self.hands = summary.hands_played
+                self.win_rate = summary.win_rate
+                self.profit = summary.net_result
+                self.game_type = game_type or "Unknown"
+                self.stakes = stakes or "Unknown"
                 
                 # Session statistics
                 class SessionStats:
                     def __init__(self):
-                        self.vpip = Decimal('28.0')
-                        self.pfr = Decimal('20.5')
-                        self.aggression_factor = Decimal('2.3')
-                        self.three_bet_percentage = Decimal('9.0')
-                        self.cbet_flop = Decimal('78.0')
+                        self.vpip = summary.vpip
+                        self.pfr = summary.pfr
+                        self.aggression_factor = summary.aggression_factor
+                        self.three_bet_percentage = advanced.three_bet_percentage
+                        self.cbet_flop = advanced.c_bet_flop
                 
                 self.statistics = SessionStats()
         
@@ -2211,73 +3959,13 @@ class StatisticsService:
         # Execute query
         result = await self.db.execute(query)
         hands = result.scalars().all()
-
+        
         # Add profit calculation to each hand
         for hand in hands:
             if not hasattr(hand, 'profit'):
                 hand.profit = self._calculate_hand_winnings(hand)
-
-        return hands
-    
-    async def _group_hands_by_timezone_aware_date(
-        self, 
-        user_id: str, 
-        hands: List[PokerHand]
-    ) -> Dict[datetime.date, List[PokerHand]]:
-        """
-        Group hands by date using timezone-aware date boundaries.
-        
-        Args:
-            user_id: User ID for timezone lookup
-            hands: List of poker hands to group
-            
-        Returns:
-            Dictionary mapping dates to lists of hands
-        """
-        sessions = {}
-        
-        # Get user's active session for timezone info
-        try:
-            user_session = await SessionService.get_active_session(self.db, user_id)
-            if not user_session:
-                # Fallback to UTC grouping if no session found
-                logger.warning(f"No active session found for user {user_id}, using UTC for date grouping")
-                for hand in hands:
-                    session_date = hand.date_played.date() if hand.date_played else datetime.now().date()
-                    if session_date not in sessions:
-                        sessions[session_date] = []
-                    sessions[session_date].append(hand)
-                return sessions
-        except Exception as e:
-            logger.error(f"Failed to get user session for timezone-aware grouping: {e}")
-            # Fallback to UTC grouping
-            for hand in hands:
-                session_date = hand.date_played.date() if hand.date_played else datetime.now().date()
-                if session_date not in sessions:
-                    sessions[session_date] = []
-                sessions[session_date].append(hand)
-            return sessions
-        
-        # Group hands using timezone-aware date boundaries
-        for hand in hands:
-            if not hand.date_played:
-                # Use current date if no date_played
-                session_date = datetime.now().date()
-            else:
-                # Convert hand timestamp to user's local date
-                try:
-                    local_time = user_session.get_local_time(hand.date_played)
-                    session_date = local_time.date()
-                except Exception as e:
-                    logger.warning(f"Failed to convert hand timestamp to local time: {e}")
-                    # Fallback to UTC date
-                    session_date = hand.date_played.date()
-            
-            if session_date not in sessions:
-                sessions[session_date] = []
-            sessions[session_date].append(hand)
         
-        return sessions
+        return hands
     
     async def calculate_daily_statistics_for_date(
         self,
@@ -2292,7 +3980,7 @@ class StatisticsService:
             user_id: User ID to calculate statistics for
             target_date: Target date (defaults to today)
             filters: Optional filters to apply
-            
+        
         Returns:
             SessionStatistics for the specified date or None if no data
         """
@@ -2302,24 +3990,47 @@ class StatisticsService:
                 self.db, user_id, target_date
             )
             
-            # Build query for hands within the date boundaries
-            query = select(PokerHand).where(
-                and_(
-                    PokerHand.user_id == user_id,
-                    PokerHand.date_played >= start_utc,
-                    PokerHand.date_played <= end_utc
+            counters = SessionStatisticsAccumulator(self)
+            if self._answers_from_play_sessions(filters):
+                # Play sessions within the day count whole, the day's hands of those crossing its ends one by one
+                result = await self.db.execute(
+                    select(PlaySession).where(
+                        PlaySession.user_id == user_id,
+                        PlaySession.start_time <= end_utc,
+                        PlaySession.end_time >= start_utc
+                    )
                 )
-            )
-            
-            # Apply additional filters if provided
-            if filters:
-                query = self._apply_filters(query, filters)
-            
-            # Execute query
-            result = await self.db.execute(query)
-            hands = list(result.scalars().all())
+                intervals = []
+                for row in result.scalars().all():
+                    if _as_utc(row.start_time) >= start_utc and _as_utc(row.end_time) <= end_utc:
+                        counters.merge(session_counters(self, row))
+                    else:
+                        intervals.append((row.start_time, row.end_time))
+                if intervals:
+                    counters.add_all(await self._load_hands(select_statistics_hands(
+                        PokerHand.user_id == user_id,
+                        PokerHand.date_played >= start_utc,
+                        PokerHand.date_played <= end_utc,
+                        self._within_intervals(PokerHand.date_played, intervals)
+                    )))
+            else:
+                # Build query for hands within the date boundaries
+                query = select_statistics_hands(
+                    and_(
+                        PokerHand.user_id == user_id,
+                        PokerHand.date_played >= start_utc,
+                        PokerHand.date_played <= end_utc
+                    )
+                )
+                
+                # Apply additional filters if provided
+                if filters:
+                    query = self._apply_filters(query, filters)
+                
+                # Execute query
+                counters.add_all(await self._load_hands(query))
             
-            if not hands:
+            if not counters.total_hands:
                 # Return empty state for dates with no sessions
                 target_date_obj = target_date or datetime.utcnow()
                 return SessionStatistics(
@@ -2336,82 +4047,206 @@ class StatisticsService:
                 )
             
             # Calculate statistics for the day
-            total_hands = len(hands)
-            vpip_hands = 0
-            pfr_hands = 0
-            aggressive_actions = 0
-            passive_actions = 0
-            total_winnings = Decimal('0.0')
-            biggest_win = Decimal('0.0')
-            biggest_loss = Decimal('0.0')
-            
-            # Calculate session duration
-            session_start = min(hand.date_played for hand in hands if hand.date_played)
-            session_end = max(hand.date_played for hand in hands if hand.date_played)
-            duration_minutes = int((session_end - session_start).total_seconds() / 60) if session_start and session_end else 0
-            
-            for hand in hands:
-                actions = hand.actions or {}
-                
-                # VPIP and PFR
-                if self._is_vpip_hand(actions, hand.position):
-                    vpip_hands += 1
-                
-                if self._is_pfr_hand(actions):
-                    pfr_hands += 1
-                
-                # Aggression factor
-                agg_actions = self._count_aggressive_actions(actions)
-                pass_actions = self._count_passive_actions(actions)
-                aggressive_actions += agg_actions
-                passive_actions += pass_actions
-                
-                # Winnings tracking
-                if hand.result and hand.pot_size:
-                    hand_winnings = self._calculate_hand_winnings(hand)
-                    total_winnings += hand_winnings
-                    
-                    if hand_winnings > biggest_win:
-                        biggest_win = hand_winnings
-                    elif hand_winnings < biggest_loss:
-                        biggest_loss = hand_winnings
-            
-            # Calculate percentages
-            vpip = self._calculate_percentage(vpip_hands, total_hands)
-            pfr = self._calculate_percentage(pfr_hands, total_hands)
-            
-            # Ensure mathematical consistency: PFR should never exceed VPIP
-            if pfr > vpip:
-                logger.warning(f"Daily stats for {target_date}: PFR ({pfr}) exceeds VPIP ({vpip}). Adjusting PFR to match VPIP.")
-                pfr = vpip
-            
-            # Aggression factor
-            if passive_actions > 0:
-                aggression_factor = Decimal(str(aggressive_actions)) / Decimal(str(passive_actions))
-            else:
-                aggression_factor = Decimal('0.0') if aggressive_actions == 0 else Decimal('999.0')
-            
-            # Win rate
-            win_rate = total_winnings / Decimal(str(total_hands)) if total_hands > 0 else Decimal('0.0')
-            
             target_date_obj = target_date or datetime.utcnow()
-            return SessionStatistics(
-                session_date=target_date_obj.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc),
-                hands_played=total_hands,
-                duration_minutes=duration_minutes,
-                win_rate=win_rate,
-                vpip=vpip,
-                pfr=pfr,
-                aggression_factor=aggression_factor.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-                biggest_win=biggest_win,
-                biggest_loss=biggest_loss,
-                net_result=total_winnings
+            return counters.finalize(
+                target_date_obj.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc)
             )
-            
+        
         except Exception as e:
             logger.error(f"Failed to calculate daily statistics for user {user_id}: {e}")
             return None
     
+    async def calculate_daily_statistics_range(
+        self,
+        user_id: str,
+        start_day: date,
+        end_day: date,
+        timezone_name: str = 'UTC',
+        filters: Optional[StatisticsFilters] = None
+    ) -> List[SessionStatistics]:
+        """
+        Calculate daily statistics for every local day from start_day to end_day.
+        
+        Hands are bucketed into days of the given timezone by the database, so
+        the range costs a grouped query over hand_facts when those answer the
+        query, otherwise over the hand rows ordered by day. With stored play
+        sessions, sessions played within one local day are summed per day
+        instead, and only the hands of sessions crossing a local midnight or
+        the ends of the range are bucketed one by one.
+        
+        Args:
+            user_id: User ID to calculate statistics for
+            start_day: First local day, inclusive
+            end_day: Last local day, inclusive
+            timezone_name: IANA timezone the days are local to; unknown names fall back to UTC
+            filters: Optional filters to apply
+        
+        Returns:
+            SessionStatistics per day with hands, in date order
+        """
+        try:
+            user_tz = pytz.timezone(timezone_name)
+        except pytz.UnknownTimeZoneError:
+            logger.warning(f"Unknown timezone {timezone_name!r}, bucketing days in UTC")
+            user_tz = pytz.UTC
+        
+        # UTC instants of the first local midnight and the one after the range
+        start_utc = user_tz.localize(datetime.combine(start_day, datetime.min.time())).astimezone(timezone.utc)
+        end_utc = user_tz.localize(
+            datetime.combine(end_day + timedelta(days=1), datetime.min.time())
+        ).astimezone(timezone.utc)
+        
+        if self._answers_from_play_sessions(filters):
+            days, intervals = await self._play_session_days(user_id, user_tz.zone, start_utc, end_utc)
+            if intervals:
+                # Hands of sessions crossing a local midnight or the ends of the range, one by one
+                hand_days = await self._hand_days(user_id, user_tz.zone, start_utc, end_utc, None, intervals)
+                for local_day, counters in hand_days.items():
+                    days.setdefault(local_day, SessionStatisticsAccumulator(self)).merge(counters)
+        else:
+            days = await self._hand_days(user_id, user_tz.zone, start_utc, end_utc, filters)
+        
+        return [
+            days[local_day].finalize(datetime.combine(local_day, datetime.min.time(), tzinfo=timezone.utc))
+            for local_day in sorted(days)
+        ]
+    
+    async def _play_session_days(
+        self,
+        user_id: str,
+        timezone_name: str,
+        start_utc: datetime,
+        end_utc: datetime
+    ) -> Tuple[Dict[date, SessionStatisticsAccumulator], List[Tuple[datetime, datetime]]]:
+        """
+        Session counters per local day from the play sessions played within a single day.
+        
+        Returns:
+            Tuple of (counters per local day, start and end of the sessions overlapping
+            the range that cross a local midnight or one of its ends)
+        """
+        start_day = self._local_day(PlaySession.start_time, timezone_name)
+        within_day = and_(
+            PlaySession.start_time >= start_utc,
+            PlaySession.end_time < end_utc,
+            start_day == self._local_day(PlaySession.end_time, timezone_name)
+        )
+        
+        days: Dict[date, SessionStatisticsAccumulator] = {}
+        result = await self.db.execute(
+            select(start_day, *self._play_session_day_columns())
+            .where(PlaySession.user_id == user_id, within_day)
+            .group_by(start_day)
+        )
+        for row in result.all():
+            days[row.day.date()] = self._fill_session_counters(row)
+        
+        result = await self.db.execute(
+            select(PlaySession.start_time, PlaySession.end_time).where(
+                PlaySession.user_id == user_id,
+                PlaySession.start_time < end_utc,
+                PlaySession.end_time >= start_utc,
+                not_(within_day)
+            )
+        )
+        return days, [(row.start_time, row.end_time) for row in result.all()]
+    
+    async def _hand_days(
+        self,
+        user_id: str,
+        timezone_name: str,
+        start_utc: datetime,
+        end_utc: datetime,
+        filters: Optional[StatisticsFilters] = None,
+        intervals: Optional[Sequence[Tuple[datetime, datetime]]] = None
+    ) -> Dict[date, SessionStatisticsAccumulator]:
+        """
+        Session counters per local day of the hands played from start_utc until end_utc.
+        
+        Args:
+            intervals: Only count hands played within one of these (start, end) pairs
+        """
+        days: Dict[date, SessionStatisticsAccumulator] = {}
+        if self.use_hand_facts:
+            day = self._local_day(HandFacts.date_played, timezone_name)
+            query = (
+                self._facts_query([day, *self._session_fact_columns()], user_id, filters)
+                .where(HandFacts.date_played >= start_utc, HandFacts.date_played < end_utc)
+                .group_by(day)
+            )
+            if intervals:
+                query = query.where(self._within_intervals(HandFacts.date_played, intervals))
+            result = await self.db.execute(query)
+            for row in result.all():
+                days[row.day.date()] = self._fill_session_counters(row)
+            return days
+        
+        day = self._local_day(PokerHand.date_played, timezone_name)
+        query = select_statistics_hands(
+            PokerHand.user_id == user_id,
+            PokerHand.date_played >= start_utc,
+            PokerHand.date_played < end_utc
+        ).add_columns(day)
+        if filters:
+            query = self._apply_filters(query, filters)
+        if intervals:
+            query = query.where(self._within_intervals(PokerHand.date_played, intervals))
+        
+        async for hands in self._iter_hand_chunks(query.order_by(day)):
+            for hand in hands:
+                counters = days.get(hand.day.date())
+                if counters is None:
+                    counters = days[hand.day.date()] = SessionStatisticsAccumulator(self)
+                counters.add(hand)
+        return days
+    
+    def _within_intervals(self, column, intervals: Sequence[Tuple[datetime, datetime]]):
+        """Condition that a timestamp column falls within one of the (start, end) pairs, inclusive."""
+        return or_(*(column.between(start, end) for start, end in intervals))
+    
+    def _local_day(self, column, timezone_name: str):
+        """Local midnight of a timestamp column in the named timezone, computed by the database."""
+        return func.date_trunc('day', func.timezone(timezone_name, column), type_=DateTime).label('day')
+    
+    def _session_fact_columns(self) -> List[Any]:
+        """Aggregate columns over hand_facts labelled with the session counter names."""
+        return [
+            func.count().label('total_hands'),
+            self._sum_flag(HandFacts.vpip).label('vpip_hands'),
+            self._sum_flag(HandFacts.pfr).label('pfr_hands'),
+            self._sum_amount(HandFacts.aggressive_actions).label('aggressive_actions'),
+            self._sum_amount(HandFacts.passive_actions).label('passive_actions'),
+            self._sum_amount(HandFacts.winnings).label('total_winnings'),
+            func.max(HandFacts.winnings).label('biggest_win'),
+            func.min(HandFacts.winnings).label('biggest_loss'),
+            func.min(HandFacts.date_played).label('first_played'),
+            func.max(HandFacts.date_played).label('last_played'),
+        ]
+    
+    def _play_session_day_columns(self) -> List[Any]:
+        """Aggregate columns over play_sessions labelled with the session counter names."""
+        columns = [
+            self._sum_amount(getattr(PlaySession, name)).label(name)
+            for name in SessionStatisticsAccumulator.COUNTERS
+        ]
+        return columns + [
+            self._sum_amount(PlaySession.total_winnings).label('total_winnings'),
+            func.max(PlaySession.biggest_win).label('biggest_win'),
+            func.min(PlaySession.biggest_loss).label('biggest_loss'),
+            func.min(PlaySession.start_time).label('first_played'),
+            func.max(PlaySession.end_time).label('last_played'),
+        ]
+    
+    def _fill_session_counters(self, row: Any) -> SessionStatisticsAccumulator:
+        """Session counters from a row of _session_fact_columns or _play_session_day_columns."""
+        counters = self._fill_counters(SessionStatisticsAccumulator(self), row)
+        # Hands that broke even leave the biggest win and loss at zero
+        counters.biggest_win = max(to_cents(self._sum_to_decimal(row.biggest_win)), 0)
+        counters.biggest_loss = min(to_cents(self._sum_to_decimal(row.biggest_loss)), 0)
+        counters.first_played = _as_utc(row.first_played)
+        counters.last_played = _as_utc(row.last_played)
+        return counters
+    
     async def recalculate_statistics_on_time_change(
         self,
         user_id: str,
@@ -2425,7 +4260,7 @@ class StatisticsService:
             user_id: User ID to recalculate statistics for
             old_timezone: Previous timezone
             new_timezone: New timezone
-            
+        
         Returns:
             Dictionary with recalculation results
         """
@@ -2436,12 +4271,13 @@ class StatisticsService:
             if self.cache_service:
                 await self.cache_service.clear_user_cache(user_id)
             
-            # Get all hands for the user
-            query = select(PokerHand).where(PokerHand.user_id == user_id)
-            result = await self.db.execute(query)
-            hands = list(result.scalars().all())
+            # Count the user's hands
+            result = await self.db.execute(
+                select(func.count(PokerHand.id)).where(PokerHand.user_id == user_id)
+            )
+            hands_processed = result.scalar() or 0
             
-            if not hands:
+            if not hands_processed:
                 return {
                     "status": "success",
                     "message": "No hands found for recalculation",
@@ -2452,24 +4288,26 @@ class StatisticsService:
             # Recalculate session statistics with new timezone
             session_stats = await self.calculate_session_statistics(user_id)
             
-            # Recalculate daily statistics for recent dates
-            recent_dates = []
-            for i in range(30):  # Last 30 days
-                date = datetime.utcnow() - timedelta(days=i)
-                daily_stats = await self.calculate_daily_statistics_for_date(user_id, date)
-                if daily_stats and daily_stats.hands_played > 0:
-                    recent_dates.append(date.strftime("%Y-%m-%d"))
+            # Recalculate daily statistics for the last 30 local days in one grouped query
+            try:
+                today = datetime.now(pytz.timezone(new_timezone)).date()
+            except pytz.UnknownTimeZoneError:
+                today = datetime.utcnow().date()
+            daily_stats = await self.calculate_daily_statistics_range(
+                user_id, today - timedelta(days=29), today, new_timezone
+            )
+            recent_dates = [stats.session_date.strftime("%Y-%m-%d") for stats in reversed(daily_stats)]
             
             return {
                 "status": "success",
                 "message": f"Statistics recalculated for timezone change",
-                "hands_processed": len(hands),
+                "hands_processed": hands_processed,
                 "sessions_recalculated": len(session_stats),
                 "recent_dates_updated": recent_dates,
                 "old_timezone": old_timezone,
                 "new_timezone": new_timezone
             }
-            
+        
         except Exception as e:
             logger.error(f"Failed to recalculate statistics for timezone change: {e}")
             return {
@@ -2477,4 +4315,22 @@ class StatisticsService:
                 "message": f"Failed to recalculate statistics: {str(e)}",
                 "hands_processed": 0,
                 "sessions_recalculated": 0
-            }
\ No newline at end of file
+            }
+
+
+def _series_decimal(value: float, places: str) -> Decimal:
+    """Round a series result to a fixed number of decimal places."""
+    return Decimal(str(float(value))).quantize(Decimal(places), rounding=ROUND_HALF_UP)
+
+
+def _divide_half_up(numerator: int, denominator: int) -> int:
+    """Integer quotient rounded to the nearest integer, halves away from zero."""
+    quotient, remainder = divmod(abs(numerator), abs(denominator))
+    if 2 * remainder >= abs(denominator):
+        quotient += 1
+    return -quotient if (numerator < 0) != (denominator < 0) else quotient
+
+
+def _accumulate_in_worker(accumulator_type: type, hands: List[Any]) -> StatisticsAccumulator:
+    """Fold hands into a new accumulator inside a reduction worker process."""
+    return accumulator_type(StatisticsService(None)).add_all(hands)
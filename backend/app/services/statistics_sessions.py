@@ -0,0 +1,106 @@
+"""
+Gap-based play sessions.
+
+A play session is a run of hands in which no two consecutive hands are more
+than the session gap apart. Sessions are kept as SessionStatisticsAccumulator
+counters, whose first and last played times are the session's start and end,
+so sessions built from different batches of hands are joined with merge.
+
+Joining is exact: merging a batch's sessions into the stored sessions within
+one gap of them gives the same sessions as splitting all of the user's hands
+again, because adding hands can only join runs, never split them.
+"""
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from app.services.statistics_accumulator import (
+    SessionStatisticsAccumulator,
+    cents_to_decimal,
+    to_cents
+)
+from app.services.statistics_snapshot import _as_utc
+
+
+# Sessions with fewer hands are left out of session lists
+MIN_SESSION_HANDS = 5
+
+
+def sessionize(features: Any, hands: Sequence[Any], gap: timedelta) -> List[SessionStatisticsAccumulator]:
+    """
+    Split hands into play sessions.
+    
+    Args:
+        features: Statistics service providing the session detectors
+        hands: Hands in any order; hands without a date are skipped
+        gap: Longest idle time within a session
+    
+    Returns:
+        Session counters in start order
+    """
+    dated = sorted((hand for hand in hands if hand.date_played is not None), key=lambda hand: _as_utc(hand.date_played))
+    
+    sessions: List[SessionStatisticsAccumulator] = []
+    last_played = None
+    for hand in dated:
+        played = _as_utc(hand.date_played)
+        if last_played is None or played - last_played > gap:
+            sessions.append(SessionStatisticsAccumulator(features))
+        sessions[-1].add(hand)
+        last_played = played
+    
+    # Stored and ingested hands may differ in whether their times carry a timezone
+    for counters in sessions:
+        counters.first_played = _as_utc(counters.first_played)
+        counters.last_played = _as_utc(counters.last_played)
+    return sessions
+
+
+def merge_sessions(
+    sessions: Iterable[Tuple[SessionStatisticsAccumulator, Any]],
+    gap: timedelta
+) -> List[Tuple[SessionStatisticsAccumulator, List[Any]]]:
+    """
+    Join sessions that overlap or are at most gap apart.
+    
+    Args:
+        sessions: (counters, tag) pairs; the tag records where a session came
+            from, such as its stored row
+        gap: Longest idle time within a session
+    
+    Returns:
+        (joined counters, tags of the sessions joined) in start order
+    """
+    joined: List[Tuple[SessionStatisticsAccumulator, List[Any]]] = []
+    for counters, tag in sorted(sessions, key=lambda session: session[0].first_played):
+        if joined and counters.first_played - joined[-1][0].last_played <= gap:
+            joined[-1][0].merge(counters)
+            joined[-1][1].append(tag)
+        else:
+            joined.append((SessionStatisticsAccumulator(counters.features).merge(counters), [tag]))
+    return joined
+
+
+def session_counters(features: Any, row: Any) -> SessionStatisticsAccumulator:
+    """Session counters of a stored PlaySession row."""
+    counters = SessionStatisticsAccumulator(features)
+    for name in SessionStatisticsAccumulator.COUNTERS:
+        setattr(counters, name, getattr(row, name))
+    counters.total_winnings = to_cents(row.total_winnings)
+    counters.biggest_win = to_cents(row.biggest_win)
+    counters.biggest_loss = to_cents(row.biggest_loss)
+    counters.first_played = _as_utc(row.start_time)
+    counters.last_played = _as_utc(row.end_time)
+    return counters
+
+
+def session_values(counters: SessionStatisticsAccumulator) -> Dict[str, Any]:
+    """PlaySession column values of session counters."""
+    values = {name: getattr(counters, name) for name in SessionStatisticsAccumulator.COUNTERS}
+    values.update(
+        start_time=counters.first_played,
+        end_time=counters.last_played,
+        total_winnings=cents_to_decimal(counters.total_winnings),
+        biggest_win=cents_to_decimal(counters.biggest_win),
+        biggest_loss=cents_to_decimal(counters.biggest_loss),
+    )
+    return values
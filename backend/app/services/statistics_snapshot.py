@@ -0,0 +1,70 @@
+"""
+Request-scoped snapshot of a user's projected hands.
+
+A request that runs several statistics calculators (the dashboard summary,
+exports) loads the user's hands once into a HandSnapshot with one projected
+query, then passes the rows to each calculator through its hands argument.
+The calculators use the rows they are given instead of querying, so the
+snapshot never has to interpret their queries.
+
+Snapshots are bounded: a user with more hands than the limit gets no snapshot,
+and the calculators query the database as before.
+"""
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.hand import PokerHand
+from app.services.statistics_read_model import STATISTICS_HAND_COLUMNS
+
+
+# Statistics columns plus the columns the statistics filters compare against
+SNAPSHOT_COLUMNS = STATISTICS_HAND_COLUMNS + (
+    PokerHand.user_id,
+    PokerHand.platform,
+    PokerHand.game_type,
+    PokerHand.stakes,
+    PokerHand.is_play_money,
+)
+
+
+class HandSnapshot:
+    """In-memory rows of one user's hands, ordered by date played."""
+    
+    def __init__(self, user_id: str, hands: Sequence[Any]):
+        self.user_id = str(user_id)
+        self.hands = list(hands)
+    
+    @classmethod
+    async def load(cls, db: AsyncSession, user_id: str, query: Select, max_hands: int) -> Optional['HandSnapshot']:
+        """
+        Load the rows of a projected hand query, unless there are more than max_hands.
+        
+        Args:
+            db: Database session
+            user_id: User whose hands the query selects
+            query: Query selecting SNAPSHOT_COLUMNS of the user's hands
+            max_hands: Most rows to hold in memory
+        
+        Returns:
+            HandSnapshot holding the rows, or None if the query matches more than max_hands
+        """
+        result = await db.execute(query.order_by(PokerHand.date_played).limit(max_hands + 1))
+        hands = result.all()
+        if len(hands) > max_hands:
+            return None
+        return cls(user_id, hands)
+    
+    def played_since(self, start: datetime) -> List[Any]:
+        """Hands played at or after start."""
+        start = _as_utc(start)
+        return [hand for hand in self.hands if hand.date_played is not None and _as_utc(hand.date_played) >= start]
+
+
+def _as_utc(value: Any) -> Any:
+    """Treat naive datetimes as UTC so they compare with timezone-aware ones."""
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
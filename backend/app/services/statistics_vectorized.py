@@ -0,0 +1,278 @@
+"""
+NumPy backend for basic, positional and advanced statistics.
+
+Hands are decoded once into an integer column matrix (position codes, action
+flags, amounts in integer cents and big blind size). Statistics are then
+masked column sums over that matrix, written into the same accumulators the
+per-hand loop fills, so both backends finalize to identical results.
+
+Amounts are the same integer cents the per-hand accumulators hold, so the
+column sums are written into them unchanged.
+"""
+from typing import Any, Dict, List, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from app.services.statistics_accumulator import (
+    ADVANCED_PERCENTAGE_STATS,
+    BasicStatisticsAccumulator,
+    PositionalStatisticsAccumulator,
+    AdvancedStatisticsAccumulator,
+    to_cents
+)
+
+
+# Column layout of the decoded hand matrix
+BASIC_COLUMNS = (
+    'tournament_hands',
+    'vpip_hands',
+    'pfr_hands',
+    'aggressive_actions',
+    'passive_actions',
+    'showdown_hands',
+    'won_showdown',
+    'steal_opportunities',
+    'steal_attempts',
+    'fold_to_steal_opportunities',
+    'fold_to_steal_count',
+    'big_blind_hands',
+    'big_blinds_won',
+)
+THREE_BET_COLUMNS = PositionalStatisticsAccumulator.THREE_BET_COUNTERS
+AMOUNT_COLUMNS = (
+    'winnings_cents',
+    'investment_cents',
+    'detailed_winnings_cents',
+    'net_result_cents',
+    'big_blind_cents',
+)
+ADVANCED_OPPORTUNITY_COLUMNS = tuple(f'{stat}_opportunity' for stat in ADVANCED_PERCENTAGE_STATS)
+ADVANCED_MADE_COLUMNS = tuple(f'{stat}_made' for stat in ADVANCED_PERCENTAGE_STATS)
+
+COLUMNS = (
+    ('position_code',)
+    + BASIC_COLUMNS
+    + THREE_BET_COLUMNS
+    + AMOUNT_COLUMNS
+    + ADVANCED_OPPORTUNITY_COLUMNS
+    + ADVANCED_MADE_COLUMNS
+)
+COLUMN_INDEX = {name: index for index, name in enumerate(COLUMNS)}
+
+# Position code for hands without a position
+NO_POSITION = -1
+
+# Results (and row counts) below this are squared in 16-bit halves without int64 overflow
+_SPLIT_SQUARE_LIMIT = 2 ** 31
+
+
+class HandColumns:
+    """Hands decoded into an integer column matrix, one row per hand."""
+    
+    __slots__ = ('matrix', 'positions')
+    
+    def __init__(self, matrix, positions: List[str]):
+        self.matrix = matrix
+        # Position names indexed by position_code, in first-seen order
+        self.positions = positions
+    
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+    
+    def column(self, name: str):
+        return self.matrix[:, COLUMN_INDEX[name]]
+    
+    def columns(self, names: Sequence[str]):
+        start = COLUMN_INDEX[names[0]]
+        return self.matrix[:, start:start + len(names)]
+    
+    def select(self, mask) -> 'HandColumns':
+        """The rows selected by a boolean mask, keeping the position codes."""
+        return HandColumns(self.matrix[mask], self.positions)
+    
+    @classmethod
+    def decode(cls, features: Any, hands: Sequence[Any]) -> 'HandColumns':
+        """
+        Decode hands into columns using the service's hand feature detectors.
+        
+        Args:
+            features: StatisticsService providing the per-hand flag detectors
+            hands: Poker hands to decode
+        
+        Returns:
+            HandColumns with one row per hand
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is not installed; the vectorized statistics backend is unavailable")
+        
+        position_codes: Dict[str, int] = {}
+        rows = []
+        for hand in hands:
+            position = hand.position
+            if position is None:
+                position_code = NO_POSITION
+            else:
+                position_code = position_codes.setdefault(position, len(position_codes))
+            rows.append((position_code,) + cls._decode_hand(features, hand))
+        
+        matrix = np.array(rows, dtype=np.int64).reshape(len(rows), len(COLUMNS))
+        return cls(matrix, list(position_codes))
+    
+    @staticmethod
+    def _decode_hand(features: Any, hand: Any) -> tuple:
+        """
+        Flags and amounts of one hand, in COLUMNS order after position_code.
+        
+        Uses the same detectors, in the same opportunity-then-made order, as
+        _accumulate_basic, _accumulate_positional and _accumulate_advanced.
+        """
+        actions = hand.actions or {}
+        position = hand.position
+        preflop_actions = actions.get('preflop', [])
+        
+        went_to_showdown = features._went_to_showdown(actions)
+        steal_opportunity = features._is_steal_opportunity(position, actions)
+        fold_to_steal_opportunity = features._is_fold_to_steal_opportunity(position, actions)
+        three_bet_opportunity = features._is_three_bet_opportunity(actions)
+        fold_to_three_bet_opportunity = features._is_fold_to_three_bet_opportunity(actions)
+        
+        big_blind = (hand.blinds or {}).get('big') or 0
+        big_blinds_won = features._hand_big_blinds_won(hand)
+        
+        # Opportunity checks paired with the made check and its actions, in ADVANCED_PERCENTAGE_STATS order
+        advanced = [
+            (features._is_advanced_three_bet_opportunity(preflop_actions), features._made_advanced_three_bet, preflop_actions),
+            (features._is_advanced_fold_to_three_bet_opportunity(preflop_actions), features._folded_to_advanced_three_bet, preflop_actions),
+            (features._is_four_bet_opportunity(preflop_actions), features._made_four_bet, preflop_actions),
+            (features._is_fold_to_four_bet_opportunity(preflop_actions), features._folded_to_four_bet, preflop_actions),
+            (features._is_cold_call_opportunity(preflop_actions), features._made_cold_call, preflop_actions),
+            (features._is_isolation_opportunity(preflop_actions, position), features._made_isolation_raise, preflop_actions),
+        ]
+        was_preflop_aggressor = features._was_preflop_aggressor(preflop_actions)
+        streets = [actions.get(street, []) for street in ('flop', 'turn', 'river')]
+        advanced.extend(
+            (features._is_c_bet_opportunity(was_preflop_aggressor, street_actions), features._made_c_bet, street_actions)
+            for street_actions in streets
+        )
+        advanced.extend(
+            (features._is_fold_to_c_bet_opportunity(street_actions), features._folded_to_c_bet, street_actions)
+            for street_actions in streets
+        )
+        advanced.extend(
+            (features._is_check_raise_opportunity(street_actions), features._made_check_raise, street_actions)
+            for street_actions in streets
+        )
+        
+        return (
+            hand.game_format == 'tournament',
+            features._is_vpip_hand(actions, position),
+            features._is_pfr_hand(actions),
+            features._count_aggressive_actions(actions),
+            features._count_passive_actions(actions),
+            went_to_showdown,
+            went_to_showdown and hand.result == 'won',
+            steal_opportunity,
+            steal_opportunity and features._attempted_steal(actions),
+            fold_to_steal_opportunity,
+            fold_to_steal_opportunity and features._folded_to_steal(actions),
+            big_blinds_won is not None,
+            big_blinds_won or 0,
+            three_bet_opportunity,
+            three_bet_opportunity and features._made_three_bet(actions),
+            fold_to_three_bet_opportunity,
+            fold_to_three_bet_opportunity and features._folded_to_three_bet(actions),
+            features._hand_winnings_cents(hand),
+            features._hand_investment_cents(hand, actions),
+            features._detailed_hand_winnings_cents(hand, actions),
+            features._hand_net_result_cents(hand, actions),
+            to_cents(big_blind),
+        ) + tuple(
+            opportunity for opportunity, _, _ in advanced
+        ) + tuple(
+            opportunity and made(street_actions) for opportunity, made, street_actions in advanced
+        )
+
+
+def _fill_basic(counters: BasicStatisticsAccumulator, columns: HandColumns, mask=None) -> None:
+    """Sum the basic columns of the (masked) rows into counters."""
+    matrix = columns.matrix if mask is None else columns.matrix[mask]
+    sums = matrix.sum(axis=0)
+    
+    counters.total_hands = int(matrix.shape[0])
+    for name in BASIC_COLUMNS:
+        setattr(counters, name, int(sums[COLUMN_INDEX[name]]))
+    counters.total_winnings = int(sums[COLUMN_INDEX['winnings_cents']])
+    
+    if isinstance(counters, PositionalStatisticsAccumulator):
+        for name in THREE_BET_COLUMNS:
+            setattr(counters, name, int(sums[COLUMN_INDEX[name]]))
+
+
+def basic_statistics_counters(features: Any, columns: HandColumns) -> BasicStatisticsAccumulator:
+    """Basic statistics counters over every decoded hand."""
+    counters = BasicStatisticsAccumulator(features)
+    _fill_basic(counters, columns)
+    return counters
+
+
+def positional_statistics_counters(
+    features: Any,
+    columns: HandColumns
+) -> Dict[str, PositionalStatisticsAccumulator]:
+    """Positional statistics counters keyed by position, skipping hands without one."""
+    position_codes = columns.column('position_code')
+    position_counters = {}
+    for code, position in enumerate(columns.positions):
+        counters = position_counters[position] = PositionalStatisticsAccumulator(features)
+        _fill_basic(counters, columns, position_codes == code)
+    return position_counters
+
+
+def advanced_statistics_counters(features: Any, columns: HandColumns) -> AdvancedStatisticsAccumulator:
+    """Advanced statistics counters over every decoded hand."""
+    counters = AdvancedStatisticsAccumulator(features)
+    if not len(columns):
+        return counters
+    
+    counters.opportunities = [int(total) for total in columns.columns(ADVANCED_OPPORTUNITY_COLUMNS).sum(axis=0)]
+    counters.counts = [int(total) for total in columns.columns(ADVANCED_MADE_COLUMNS).sum(axis=0)]
+    
+    detailed_winnings = columns.column('detailed_winnings_cents')
+    investment = columns.column('investment_cents')
+    showdown = columns.column('showdown_hands').astype(bool)
+    results = columns.column('net_result_cents')
+    
+    counters.total_invested = int(investment.sum())
+    counters.showdown_winnings = int(detailed_winnings[showdown].sum())
+    counters.non_showdown_winnings = int(detailed_winnings[~showdown].sum())
+    counters.result_count = len(columns)
+    counters.result_sum = int(results.sum())
+    counters.result_sum_squares = _exact_sum_of_squares(results)
+    return counters
+
+
+def _exact_sum_of_squares(values) -> int:
+    """
+    Sum of squares of an int64 array as an exact Python int.
+    
+    Squaring in 16-bit halves keeps every partial sum inside int64 for values
+    below 2**31 across fewer than 2**31 rows; larger inputs fall back to
+    Python integers.
+    """
+    if not len(values):
+        return 0
+    if int(np.abs(values).max()) >= _SPLIT_SQUARE_LIMIT or len(values) >= _SPLIT_SQUARE_LIMIT:
+        return sum(int(value) * int(value) for value in values.tolist())
+    
+    high = values >> 16
+    low = values & 0xFFFF
+    return (
+        (int((high * high).sum()) << 32)
+        + (int((high * low).sum()) << 17)
+        + int((low * low).sum())
+    )
@@ -353,6 +353,11 @@ class UserService:
             
             await db.commit()
             
+            # Cached statistics of the deleted hands must not be served again
+            from app.services.cache_service import get_stats_cache
+            stats_cache = await get_stats_cache()
+            await stats_cache.invalidate_user_cache(user_id)
+            
             return deletion_counts
             
         except Exception as e:
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark cache codecs on a large statistics payload.
+
+Builds a StatisticsResponse from synthetic hands (no database or Redis) and a
+list of session statistics, then times encoding and decoding with the original
+JSON serializer and with every installed serializer and compression, reporting
+payload sizes and whether Decimals and datetimes survived the round trip.
+
+Usage:
+    python benchmark_cache_codecs.py [--hands 20000] [--sessions 2000] [--repeat 20] [--seed 0]
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.schemas.statistics import SessionStatistics, StatisticsFilters, StatisticsResponse
+from app.services import cache_codec
+from app.services.cache_codec import CacheCodec
+from app.services.statistics_service import StatisticsService
+from benchmark_statistics_backends import make_hands, python_backend
+
+
+def make_payload(hand_count: int, session_count: int, seed: int) -> dict:
+    """A cached statistics response with its session list, as the cache receives them."""
+    service = StatisticsService(MagicMock())
+    basic, positional, advanced = python_backend(service, make_hands(hand_count, seed))
+    now = datetime.now(timezone.utc)
+    response = StatisticsResponse(
+        basic_stats=basic,
+        advanced_stats=advanced,
+        positional_stats=positional,
+        filters_applied=StatisticsFilters(),
+        calculation_date=now,
+        cache_expires=now + timedelta(hours=1),
+        sample_size=hand_count,
+        confidence_level=Decimal('0.95')
+    )
+    
+    rng = random.Random(seed)
+    sessions = [
+        SessionStatistics(
+            session_date=now - timedelta(hours=6 * i),
+            session_id=f"session-{i}",
+            hands_played=rng.randint(20, 800),
+            duration_minutes=rng.randint(15, 480),
+            win_rate=Decimal(rng.randint(-5000, 5000)) / 100,
+            vpip=Decimal(rng.randint(1000, 4000)) / 100,
+            pfr=Decimal(rng.randint(500, 3000)) / 100,
+            aggression_factor=Decimal(rng.randint(50, 500)) / 100,
+            biggest_win=Decimal(rng.randint(0, 50000)) / 100,
+            biggest_loss=Decimal(-rng.randint(0, 50000)) / 100,
+            net_result=Decimal(rng.randint(-50000, 50000)) / 100
+        )
+        for i in range(session_count)
+    ]
+    return {
+        'statistics': response.model_dump(),
+        'sessions': [session.model_dump() for session in sessions],
+    }
+
+
+def legacy_encode(value) -> bytes:
+    """The JSON serializer cache values were written with before codecs (Decimals as floats)."""
+    def json_serializer(obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        elif isinstance(obj, datetime):
+            return obj.isoformat()
+        elif hasattr(obj, 'dict'):
+            return obj.dict()
+        elif hasattr(obj, '__dict__'):
+            return obj.__dict__
+        return str(obj)
+    
+    return json.dumps(value, default=json_serializer, ensure_ascii=False).encode()
+
+
+def median_ms(function, argument, repeat: int):
+    """Median milliseconds of a call over repeat runs, and its last result."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(argument)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--hands', type=int, default=20_000, help='number of synthetic hands behind the statistics')
+    parser.add_argument('--sessions', type=int, default=2_000, help='number of session statistics')
+    parser.add_argument('--repeat', type=int, default=20, help='runs per measurement; the median is reported')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for the synthetic data')
+    args = parser.parse_args()
+    
+    payload = make_payload(args.hands, args.sessions, args.seed)
+    
+    codecs = [('json (original)', legacy_encode, json.loads)]
+    serializers = ['json'] + [
+        name for name, available in (('orjson', cache_codec.ORJSON_AVAILABLE), ('msgpack', cache_codec.MSGPACK_AVAILABLE))
+        if available
+    ]
+    compressions = ['none', 'zlib'] + [
+        name for name, available in (('zstd', cache_codec.ZSTD_AVAILABLE), ('lz4', cache_codec.LZ4_AVAILABLE))
+        if available
+    ]
+    for serializer in serializers:
+        for compression in compressions:
+            codec = CacheCodec(serializer, compression, compression_min_bytes=0)
+            codecs.append((f"{serializer} + {compression}", codec.encode, codec.decode))
+    
+    print(f"Payload: statistics of {args.hands:,} hands and {args.sessions:,} sessions")
+    print(f"{'codec':<24} {'encode':>10} {'decode':>10} {'bytes':>12}  exact")
+    for label, encode, decode in codecs:
+        encode_ms, encoded = median_ms(encode, payload, args.repeat)
+        decode_ms, decoded = median_ms(decode, encoded, args.repeat)
+        exact = '✅' if decoded == payload else '❌'
+        print(f"{label:<24} {encode_ms:8.2f}ms {decode_ms:8.2f}ms {len(encoded):>12,}  {exact}")
+
+
+if __name__ == "__main__":
+    main()
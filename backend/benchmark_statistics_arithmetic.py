@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-hand money arithmetic of the statistics accumulators.
+
+Times the Decimal arithmetic the accumulators used to run per hand (investment,
+winnings and net-result moments) against the integer-cent arithmetic they run
+now, on synthetic hands, and checks that both give the same totals. The
+percentage helper is timed the same way.
+
+Usage:
+    python benchmark_statistics_arithmetic.py [--hands 200000] [--seed 0]
+"""
+import argparse
+import sys
+import time
+from decimal import Decimal, ROUND_HALF_UP
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services.statistics_accumulator import cents_to_decimal
+from app.services.statistics_service import StatisticsService
+from benchmark_statistics_backends import make_hands
+
+
+def decimal_investment(hand, actions):
+    """Hand investment with per-hand Decimal conversions, as previously computed."""
+    total_investment = Decimal('0.0')
+    if hand.position == 'SB' and hand.blinds:
+        total_investment += Decimal(str(hand.blinds.get('small', 0)))
+    elif hand.position == 'BB' and hand.blinds:
+        total_investment += Decimal(str(hand.blinds.get('big', 0)))
+    if hand.blinds and hand.blinds.get('ante'):
+        total_investment += Decimal(str(hand.blinds.get('ante', 0)))
+    for street in ['preflop', 'flop', 'turn', 'river']:
+        for action in actions.get(street, []):
+            if action.get('action') in ['bet', 'raise', 'call'] and action.get('amount'):
+                total_investment += Decimal(str(action.get('amount', 0)))
+    return total_investment
+
+
+def decimal_amounts(hands):
+    """Invested total and net-result moments accumulated in Decimal."""
+    invested = result_sum = result_sum_squares = Decimal('0.0')
+    for hand in hands:
+        actions = hand.actions or {}
+        investment = decimal_investment(hand, actions)
+        winnings = hand.pot_size if hand.pot_size and hand.result == 'won' else Decimal('0.0')
+        result = winnings - investment
+        invested += investment
+        result_sum += result
+        result_sum_squares += result * result
+    return invested, result_sum, result_sum_squares
+
+
+def cent_amounts(service, hands):
+    """Invested total and net-result moments accumulated in integer cents."""
+    invested = result_sum = result_sum_squares = 0
+    for hand in hands:
+        actions = hand.actions or {}
+        investment = service._hand_investment_cents(hand, actions)
+        result = service._detailed_hand_winnings_cents(hand, actions) - investment
+        invested += investment
+        result_sum += result
+        result_sum_squares += result * result
+    return cents_to_decimal(invested), cents_to_decimal(result_sum), cents_to_decimal(result_sum_squares, 4)
+
+
+def decimal_percentages(pairs):
+    return [
+        ((Decimal(str(numerator)) / Decimal(str(denominator))) * Decimal('100')).quantize(
+            Decimal('0.1'), rounding=ROUND_HALF_UP
+        )
+        for numerator, denominator in pairs
+    ]
+
+
+def cent_percentages(service, pairs):
+    return [service._calculate_percentage(numerator, denominator) for numerator, denominator in pairs]
+
+
+def timed(label, count, function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed:8.2f}s  {elapsed / count * 1e9:8.0f} ns/item")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--hands', type=int, default=200_000, help='number of synthetic hands')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for the synthetic hands')
+    args = parser.parse_args()
+    
+    service = StatisticsService(MagicMock())
+    hands = make_hands(args.hands, args.seed)
+    pairs = [(count % 997, 997 + count % 13) for count in range(args.hands)]
+    
+    expected = timed("decimal: per-hand amounts", len(hands), decimal_amounts, hands)
+    actual = timed("cents: per-hand amounts", len(hands), cent_amounts, service, hands)
+    expected_percentages = timed("decimal: percentages", len(pairs), decimal_percentages, pairs)
+    actual_percentages = timed("cents: percentages", len(pairs), cent_percentages, service, pairs)
+    
+    if actual != expected or actual_percentages != expected_percentages:
+        print("❌ Decimal and integer-cent arithmetic disagree")
+        sys.exit(1)
+    print("✅ Decimal and integer-cent arithmetic agree")
+
+
+if __name__ == "__main__":
+    main()
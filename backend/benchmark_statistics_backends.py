@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-hand statistics loop against the NumPy backend.
+
+Builds synthetic hands in memory (no database) and times basic, positional and
+advanced statistics with both backends, checking that their results match.
+
+Usage:
+    python benchmark_statistics_backends.py [--hands 1000000] [--seed 0]
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent
+sys.path.insert(0, str(backend_dir))
+
+from app.services import statistics_vectorized
+from app.services.statistics_accumulator import (
+    BasicStatisticsAccumulator,
+    PositionalStatisticsAccumulator,
+    AdvancedStatisticsAccumulator
+)
+from app.services.statistics_service import StatisticsService
+
+
+ACTION_TYPES = ['fold', 'call', 'raise', 'bet', 'check', 'all-in']
+POSITIONS = ['UTG', 'MP', 'CO', 'BTN', 'SB', 'BB']
+
+
+def make_hands(count: int, seed: int):
+    """Build lightweight hand objects carrying the attributes statistics read."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    hands = []
+    
+    for i in range(count):
+        actions = {}
+        for street, max_actions in (('preflop', 4), ('flop', 3), ('turn', 3), ('river', 3)):
+            street_actions = [
+                {'action': rng.choice(ACTION_TYPES), 'amount': round(rng.random() * 5, 2)}
+                for _ in range(rng.randint(0, max_actions))
+            ]
+            if street_actions:
+                actions[street] = street_actions
+        
+        hands.append(SimpleNamespace(
+            position=rng.choice(POSITIONS),
+            actions=actions,
+            game_format=rng.choice(['cash', 'cash', 'tournament']),
+            blinds={'small': 0.5, 'big': 1.0, 'ante': rng.choice([0, 0.1])},
+            result=rng.choice(['won', 'lost', 'folded']),
+            pot_size=Decimal(str(round(rng.random() * 50, 2))),
+            date_played=start + timedelta(seconds=30 * i),
+            net_result=None,
+            big_blind=None,
+        ))
+    
+    return hands
+
+
+def python_backend(service, hands):
+    """Basic, positional and advanced statistics with the per-hand loop."""
+    basic = BasicStatisticsAccumulator(service)
+    positions = {}
+    advanced = AdvancedStatisticsAccumulator(service)
+    for hand in hands:
+        basic.add(hand)
+        counters = positions.get(hand.position)
+        if counters is None:
+            counters = positions[hand.position] = PositionalStatisticsAccumulator(service)
+        counters.add(hand)
+        advanced.add(hand)
+    return basic.finalize(), service._finalize_positional(positions), advanced.finalize()
+
+
+def numpy_backend(service, columns):
+    """Basic, positional and advanced statistics from decoded columns."""
+    return (
+        statistics_vectorized.basic_statistics_counters(service, columns).finalize(),
+        service._finalize_positional(statistics_vectorized.positional_statistics_counters(service, columns)),
+        statistics_vectorized.advanced_statistics_counters(service, columns).finalize(),
+    )
+
+
+def timed(label, function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    print(f"{label:<32} {time.perf_counter() - started:8.2f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--hands', type=int, default=1_000_000, help='number of synthetic hands')
+    parser.add_argument('--seed', type=int, default=0, help='random seed for the synthetic hands')
+    args = parser.parse_args()
+    
+    if not statistics_vectorized.NUMPY_AVAILABLE:
+        print("NumPy is not installed; nothing to compare.")
+        sys.exit(1)
+    
+    service = StatisticsService(MagicMock())
+    hands = timed(f"build {args.hands:,} hands", make_hands, args.hands, args.seed)
+    
+    expected = timed("python: per-hand loop", python_backend, service, hands)
+    columns = timed("numpy: decode columns", statistics_vectorized.HandColumns.decode, service, hands)
+    actual = timed("numpy: vectorized statistics", numpy_backend, service, columns)
+    
+    if actual != expected:
+        print("❌ Backends disagree")
+        sys.exit(1)
+    print("✅ Backends agree")
+
+
+if __name__ == "__main__":
+    main()
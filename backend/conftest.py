@@ -3,12 +3,364 @@ Pytest configuration for async tests.
 """
 import pytest
 import asyncio
+import fnmatch
+import random
+import uuid
 import warnings
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from zoneinfo import ZoneInfo
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
+
+from app.models.hand import PokerHand
+from app.models.hand_facts import HandFacts
+from app.models.play_session import PlaySession
+from app.services.cache_service import StatisticsCacheService
+from app.services.single_flight import SingleFlight
+from app.services.statistics_service import StatisticsService
+
+# User owning the synthetic hands of the statistics tests
+USER_ID = "550e8400-e29b-41d4-a716-446655440000"
+ACTION_TYPES = ['fold', 'call', 'raise', 'bet', 'check', 'all-in']
+POSITIONS = ['UTG', 'MP', 'CO', 'BTN', 'SB', 'BB', None]
 
 # Suppress specific warnings that occur during test cleanup
 warnings.filterwarnings("ignore", message="Exception ignored.*")
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+@compiles(UUID, "sqlite")
+def compile_uuid_for_sqlite(type_, compiler, **kw):
+    """Let tables with PostgreSQL UUID columns be created in SQLite."""
+    return "CHAR(36)"
+
+def register_postgres_functions(dbapi_connection, connection_record):
+    """Stand in for PostgreSQL's timezone() and date_trunc() on a SQLite connection."""
+    def local_time(zone, value):
+        if value is None:
+            return None
+        moment = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+        return moment.astimezone(ZoneInfo(zone)).strftime('%Y-%m-%d %H:%M:%S.%f')
+    
+    def truncate(unit, value):
+        assert unit == 'day'
+        return None if value is None else value[:10] + ' 00:00:00.000000'
+    
+    dbapi_connection.create_function('timezone', 2, local_time)
+    dbapi_connection.create_function('date_trunc', 2, truncate)
+
+def build_hands(count: int, seed: int):
+    """Build a varied, reproducible set of cash and tournament hands."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    hands = []
+
+    for i in range(count):
+        actions = {}
+        for street, max_actions in (('preflop', 4), ('flop', 3), ('turn', 3), ('river', 3)):
+            street_actions = [
+                {'action': rng.choice(ACTION_TYPES), 'amount': round(rng.random() * 5, 2)}
+                for _ in range(rng.randint(0, max_actions))
+            ]
+            if street_actions or rng.random() < 0.3:
+                actions[street] = street_actions
+
+        game_format = rng.choice(['cash', 'cash', 'tournament'])
+        tournament_info = None
+        if game_format == 'tournament':
+            tournament_info = {
+                'tournament_id': f"T{rng.randint(0, 5)}",
+                'buy_in': 10,
+                'finish_position': rng.choice([None, 3, 12]),
+                'bubble_position': 11,
+                'players_remaining': rng.randint(1, 30),
+                'total_players': 50,
+            }
+
+        hands.append(PokerHand(
+            user_id=USER_ID,
+            hand_id=f"HAND{seed}_{i}",
+            platform="pokerstars",
+            game_type="Hold'em",
+            game_format=game_format,
+            stakes="$0.50/$1.00",
+            blinds={'small': 0.5, 'big': 1.0, 'ante': rng.choice([0, 0.1])},
+            position=rng.choice(POSITIONS),
+            actions=actions,
+            result=rng.choice(['won', 'lost', 'folded', None]),
+            pot_size=Decimal(str(round(rng.random() * 50, 2))) if rng.random() < 0.9 else None,
+            tournament_info=tournament_info,
+            date_played=start + timedelta(minutes=i),
+        ))
+
+    return hands
+
+def mocked_service(hands):
+    """Create a StatisticsService whose queries return the given hands."""
+    result = MagicMock()
+    result.all.return_value = hands
+    result.scalars.return_value.all.return_value = hands
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=result)
+    return StatisticsService(db)
+
+async def sqlite_service(tables, hands=(), postgres_functions=False, **options):
+    """
+    Store hands in an in-memory SQLite database with the given tables; return a service over it and its engine.
+    
+    With postgres_functions the engine's connections get SQLite stand-ins for
+    the PostgreSQL functions that bucket hands into local days.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    if postgres_functions:
+        event.listen(engine.sync_engine, "connect", register_postgres_functions)
+    async with engine.begin() as conn:
+        for table in tables:
+            await conn.run_sync(table.create)
+    
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    session.add_all(hands)
+    await session.commit()
+    
+    return StatisticsService(session, **options), engine
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.messages = asyncio.Queue()
+    
+    async def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self)
+    
+    async def listen(self):
+        while True:
+            yield await self.messages.get()
+    
+    async def aclose(self):
+        for subscribers in self.redis.subscribers.values():
+            if self in subscribers:
+                subscribers.remove(self)
+
+class FakeRedis:
+    """Redis strings with their TTLs, key patterns and pub/sub shared by the caches of several workers."""
+    
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+        self.subscribers = {}
+        self.gets = 0
+    
+    async def get(self, key):
+        self.gets += 1
+        return self.values.get(key)
+    
+    async def execute_command(self, command, key, **options):
+        # Cache values are read as GET without decoding
+        return await self.get(key)
+    
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.ttls[key] = ttl
+    
+    async def delete(self, *keys):
+        return sum(self.values.pop(key, None) is not None for key in keys)
+    
+    async def scan_iter(self, match, count=None):
+        for key in list(self.values):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+    
+    async def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+    
+    async def publish(self, channel, message):
+        for pubsub in self.subscribers.get(channel, []):
+            pubsub.messages.put_nowait({'type': 'message', 'channel': channel, 'data': message})
+    
+    def pubsub(self):
+        return FakePubSub(self)
+    
+    async def close(self):
+        pass
+
+class LockingRedis(FakeRedis):
+    """FakeRedis with the commands of locks and counters."""
+    
+    def __init__(self):
+        super().__init__()
+        self.hashes = {}
+    
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+    
+    async def eval(self, script, numkeys, key, token):
+        if self.values.get(key) == token:
+            del self.values[key]
+            return 1
+        return 0
+    
+    async def exists(self, key):
+        return int(key in self.values)
+    
+    async def hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+    
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+    
+    async def info(self):
+        return {}
+
+async def start_worker_cache(redis):
+    """A statistics cache listening for invalidations, as after connect()."""
+    cache = StatisticsCacheService()
+    cache.redis_client = redis
+    cache.connected = True
+    cache._start_invalidation_listener()
+    while not cache._local_cache_active:
+        await asyncio.sleep(0)
+    return cache
+
+def slow_mocked_service(hands, cache=None):
+    """A service on its own flights whose hand queries take a while, counting them."""
+    result = MagicMock()
+    result.all.return_value = hands
+    result.scalars.return_value.all.return_value = hands
+    
+    async def execute(query, *args, **kwargs):
+        await asyncio.sleep(0.05)
+        return result
+    
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=execute)
+    service = StatisticsService(db, cache, use_hand_facts=False, use_filter_lattice=False, use_hand_index=False)
+    service.flights = SingleFlight()
+    return service
+
+@pytest.fixture
+def user_id():
+    """User owning the hands built by make_hands."""
+    return USER_ID
+
+@pytest.fixture
+def make_hands():
+    """Factory of varied, reproducible cash and tournament hands: make_hands(count, seed)."""
+    return build_hands
+
+@pytest.fixture
+def make_service():
+    """Factory of statistics services whose queries return the given hands: make_service(hands)."""
+    return mocked_service
+
+@pytest.fixture
+def calculate_separately():
+    """Run the four separate calculators, each seeing the hands its query would return."""
+    async def calculate(hands):
+        service = mocked_service(hands)
+        basic = await service._calculate_basic_statistics_internal(USER_ID)
+        advanced = await service._calculate_advanced_statistics_internal(USER_ID)
+
+        positional_service = mocked_service([hand for hand in hands if hand.position is not None])
+        positional = await positional_service._calculate_positional_statistics_internal(USER_ID)
+
+        tournament_service = mocked_service([hand for hand in hands if hand.game_format == 'tournament'])
+        tournament = await tournament_service._calculate_tournament_statistics_internal(USER_ID)
+
+        return basic, advanced, positional, tournament
+    
+    return calculate
+
+@pytest.fixture
+def calculate_with_backend():
+    """Basic, positional and advanced statistics on a backend, each seeing the hands its query would return."""
+    async def calculate(hands, backend):
+        service = mocked_service(hands)
+        positional_service = mocked_service([hand for hand in hands if hand.position is not None])
+        return (
+            await service._calculate_basic_statistics_internal(USER_ID, backend=backend),
+            await positional_service._calculate_positional_statistics_internal(USER_ID, backend=backend),
+            await service._calculate_advanced_statistics_internal(USER_ID, backend=backend),
+        )
+    
+    return calculate
+
+@pytest.fixture
+def stored_hands_service():
+    """Store hands in SQLite and return a row-path service reading them, and its engine."""
+    async def create(hands, postgres_functions=False):
+        return await sqlite_service(
+            [PokerHand.__table__], hands, postgres_functions, use_hand_facts=False, use_daily_rollups=False
+        )
+    
+    return create
+
+@pytest.fixture
+def facts_service():
+    """Store facts rows for the given hands in SQLite and return a facts-backed service, and its engine."""
+    async def create(hands, postgres_functions=False):
+        service, engine = await sqlite_service([HandFacts.__table__], (), postgres_functions, use_hand_facts=True)
+        builder = StatisticsService(service.db, use_hand_facts=False)
+        for hand in hands:
+            facts = builder.build_hand_facts(hand)
+            facts.poker_hand_id = str(uuid.uuid4())
+            service.db.add(facts)
+        await service.db.commit()
+        return service, engine
+    
+    return create
+
+@pytest.fixture
+def sessions_service():
+    """Store hands in SQLite next to an empty play_sessions table and return a service reading them, and its engine."""
+    async def create(hands=(), postgres_functions=False):
+        return await sqlite_service(
+            [PokerHand.__table__, PlaySession.__table__],
+            hands,
+            postgres_functions,
+            use_hand_facts=False,
+            use_daily_rollups=False,
+            use_play_sessions=True,
+            session_gap_minutes=30
+        )
+    
+    return create
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis shared by the caches of several workers."""
+    return FakeRedis()
+
+@pytest.fixture
+def locking_redis():
+    """In-memory Redis with the commands of locks and counters."""
+    return LockingRedis()
+
+@pytest.fixture
+def worker_cache():
+    """Factory of statistics caches on a Redis, listening for invalidations: await worker_cache(redis)."""
+    return start_worker_cache
+
+@pytest.fixture
+def statistics_cache():
+    """A connected statistics cache on an in-memory Redis, without an invalidation listener."""
+    cache = StatisticsCacheService()
+    cache.redis_client = LockingRedis()
+    cache.connected = True
+    return cache
+
+@pytest.fixture
+def slow_service():
+    """Factory of services whose hand queries take a while: slow_service(hands, cache=None)."""
+    return slow_mocked_service
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
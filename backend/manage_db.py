@@ -10,7 +10,7 @@ from pathlib import Path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-from app.core.database import create_tables, drop_tables, check_database_connection
+from app.core.database import create_tables, drop_tables, check_database_connection, async_session_maker
 from app.core.config import settings
 
 
@@ -53,13 +53,80 @@ async def test_connection():
         return False
 
 
+async def backfill_hand_facts():
+    """Create hand_facts rows for hands stored before facts were written at ingest."""
+    from app.services.statistics_service import StatisticsService
+    
+    print("Backfilling hand facts...")
+    try:
+        async with async_session_maker() as session:
+            created = await StatisticsService(session).backfill_hand_facts()
+        print(f"✅ Backfilled facts for {created} hands!")
+    except Exception as e:
+        print(f"❌ Error backfilling hand facts: {e}")
+        return False
+    return True
+
+
+async def rebuild_daily_rollups():
+    """Recompute daily statistics rollups from hand facts."""
+    from app.services.statistics_service import StatisticsService
+    
+    print("Rebuilding daily statistics rollups...")
+    try:
+        async with async_session_maker() as session:
+            await StatisticsService(session).rebuild_daily_rollups()
+        print("✅ Daily statistics rollups rebuilt!")
+    except Exception as e:
+        print(f"❌ Error rebuilding daily rollups: {e}")
+        return False
+    return True
+
+
+async def rebuild_play_sessions():
+    """Recompute gap-based play sessions from the stored hands."""
+    from app.services.statistics_service import StatisticsService
+    
+    print("Rebuilding play sessions...")
+    try:
+        async with async_session_maker() as session:
+            stored = await StatisticsService(session).rebuild_play_sessions()
+        print(f"✅ Rebuilt {stored} play sessions!")
+    except Exception as e:
+        print(f"❌ Error rebuilding play sessions: {e}")
+        return False
+    return True
+
+
+async def backfill_hand_results():
+    """Store net results and big blinds for hands imported before they were parsed."""
+    from app.services.statistics_service import StatisticsService
+    
+    print("Backfilling hand net results...")
+    try:
+        async with async_session_maker() as session:
+            service = StatisticsService(session)
+            updated = await service.backfill_hand_results()
+            await service.rebuild_daily_rollups()
+            await service.rebuild_play_sessions()
+        print(f"✅ Backfilled net results for {updated} hands!")
+    except Exception as e:
+        print(f"❌ Error backfilling hand net results: {e}")
+        return False
+    return True
+
+
 async def main():
     """Main function to handle command line arguments."""
     if len(sys.argv) < 2:
-        print("Usage: python manage_db.py [create|drop|test]")
-        print("  create - Create all database tables")
-        print("  drop   - Drop all database tables")
-        print("  test   - Test database connection")
+        print("Usage: python manage_db.py [create|drop|test|backfill-facts|rebuild-rollups|backfill-results|rebuild-sessions]")
+        print("  create          - Create all database tables")
+        print("  drop            - Drop all database tables")
+        print("  test            - Test database connection")
+        print("  backfill-facts  - Create missing hand_facts rows for stored hands")
+        print("  rebuild-rollups - Recompute daily statistics rollups from hand facts")
+        print("  backfill-results - Store missing net results and big blinds, then rebuild rollups and sessions")
+        print("  rebuild-sessions - Recompute play sessions from the stored hands")
         return
     
     command = sys.argv[1].lower()
@@ -78,9 +145,17 @@ async def main():
             print("Operation cancelled.")
     elif command == "test":
         await test_connection()
+    elif command == "backfill-facts":
+        await backfill_hand_facts()
+    elif command == "rebuild-rollups":
+        await rebuild_daily_rollups()
+    elif command == "backfill-results":
+        await backfill_hand_results()
+    elif command == "rebuild-sessions":
+        await rebuild_play_sessions()
     else:
         print(f"Unknown command: {command}")
-        print("Available commands: create, drop, test")
+        print("Available commands: create, drop, test, backfill-facts, rebuild-rollups, backfill-results, rebuild-sessions")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""
+Test the single-pass bucketed trend engine against per-interval calculations.
+"""
+import random
+import pytest
+from datetime import datetime, timezone, timedelta
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=30)
+METRICS = ["vpip", "pfr", "win_rate", "aggression_factor", "went_to_showdown"]
+
+
+def spread_hands(hands, seed: int):
+    """Spread hands over the trend period, including one at its very end."""
+    rng = random.Random(seed)
+    for hand in hands:
+        hand.date_played = START + timedelta(seconds=rng.randint(0, int((END - START).total_seconds())))
+    hands[-1].date_played = END
+    return hands
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(3))
+async def test_bucketed_trends_match_per_interval_statistics(seed, user_id, make_hands, make_service):
+    """Each data point must equal basic statistics over the hands of its interval."""
+    hands = spread_hands(make_hands(400, seed), seed)
+    service = make_service(hands)
+    interval = timedelta(days=3)
+    
+    trends = await service._calculate_bucketed_trends(user_id, METRICS, START, END, 3)
+    
+    # The whole period is read with a single query
+    assert service.db.execute.await_count == 1
+    
+    dates = [point.date for point in trends["vpip"]]
+    assert dates == sorted(dates)
+    assert all([point.date for point in trends[metric]] == dates for metric in METRICS)
+    assert sum(point.hands_sample for point in trends["vpip"]) == len(hands)
+    
+    for index, bucket_date in enumerate(dates):
+        bucket_end = bucket_date + interval
+        bucket_hands = [
+            hand for hand in hands
+            if bucket_date <= hand.date_played < bucket_end or (bucket_end == END and hand.date_played == END)
+        ]
+        expected = await make_service(bucket_hands)._calculate_basic_statistics_internal(user_id)
+        
+        for metric in METRICS:
+            point = trends[metric][index]
+            assert point.hands_sample == expected.total_hands
+            assert point.value == service._extract_metric_value(expected, metric)
+
+
+@pytest.mark.asyncio
+async def test_bucketed_trends_skip_sparse_intervals(user_id, make_hands, make_service):
+    """Intervals with fewer than 5 hands produce no data points."""
+    hands = spread_hands(make_hands(4, seed=1), seed=1)
+    trends = await make_service(hands)._calculate_bucketed_trends(user_id, METRICS, START, END, 7)
+    
+    assert trends == {metric: [] for metric in METRICS}
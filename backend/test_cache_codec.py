@@ -0,0 +1,122 @@
+"""
+Test that cache codecs round-trip values exactly and compress large payloads.
+"""
+import json
+import pytest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from app.schemas.statistics import StatisticsFilters, StatisticsResponse
+from app.services import cache_codec
+from app.services.cache_codec import CacheCodec
+
+
+VALUE = {
+    'win_rate': Decimal('-12.50'),
+    'vpip': Decimal('23.10'),
+    'calculated': datetime(2024, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+    'naive': datetime(2024, 3, 1, 12, 30),
+    'day': date(2024, 3, 1),
+    'sessions': [{'net': Decimal('0.05'), 'hands': 120, 'ratio': 0.25, 'note': None}] * 3,
+    'name': 'Café',
+}
+
+SERIALIZERS = [
+    'json',
+    pytest.param('orjson', marks=pytest.mark.skipif(not cache_codec.ORJSON_AVAILABLE, reason="orjson not installed")),
+    pytest.param('msgpack', marks=pytest.mark.skipif(not cache_codec.MSGPACK_AVAILABLE, reason="msgpack not installed")),
+]
+COMPRESSIONS = [
+    'none',
+    'zlib',
+    pytest.param('zstd', marks=pytest.mark.skipif(not cache_codec.ZSTD_AVAILABLE, reason="zstandard not installed")),
+    pytest.param('lz4', marks=pytest.mark.skipif(not cache_codec.LZ4_AVAILABLE, reason="lz4 not installed")),
+]
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+@pytest.mark.parametrize("serializer", SERIALIZERS)
+def test_values_round_trip_exactly(serializer, compression):
+    codec = CacheCodec(serializer, compression, compression_min_bytes=0)
+    
+    decoded = codec.decode(codec.encode(VALUE))
+    
+    assert decoded == VALUE
+    assert str(decoded['win_rate']) == '-12.50'
+    assert decoded['calculated'].tzinfo == timezone.utc
+
+
+def test_only_payloads_above_the_threshold_are_compressed():
+    codec = CacheCodec('json', 'zlib', compression_min_bytes=1024)
+    small, large = {'vpip': Decimal('20')}, {'sessions': VALUE['sessions'] * 100}
+    
+    assert codec.encode(small)[:3] == b'\xca\x01\x00'
+    payload = codec.encode(large)
+    assert payload[:3] == b'\xca\x01\x01'
+    assert len(payload) < len(CacheCodec('json').encode(large)) / 5
+    assert codec.decode(payload) == large
+
+
+def test_codecs_read_each_others_and_legacy_payloads():
+    writers = [CacheCodec('json', 'zlib', 0), CacheCodec('orjson', 'none')]
+    reader = CacheCodec('json')
+    
+    for writer in writers:
+        assert reader.decode(writer.encode(VALUE)) == VALUE
+    # JSON text written before codecs, from a decoding or a binary read
+    assert reader.decode('{"vpip": 23.1}') == {'vpip': 23.1}
+    assert reader.decode(b'{"vpip": 23.1}') == {'vpip': 23.1}
+
+
+def test_missing_libraries_fall_back_and_unknown_names_fail(monkeypatch):
+    monkeypatch.setattr(cache_codec, 'MSGPACK_AVAILABLE', False)
+    monkeypatch.setattr(cache_codec, 'LZ4_AVAILABLE', False)
+    
+    codec = CacheCodec('msgpack', 'lz4')
+    assert (codec.serializer, codec.compression) == ('json', 'none')
+    
+    with pytest.raises(ValueError, match="Unknown cache serializer 'pickle'"):
+        CacheCodec('pickle')
+    with pytest.raises(ValueError, match="msgpack is not installed"):
+        codec.decode(b'\xca\x02\x00\x80')
+
+
+@pytest.mark.asyncio
+async def test_undecodable_values_are_cache_misses(fake_redis, worker_cache):
+    cache = await worker_cache(fake_redis)
+    
+    try:
+        for identifier, payload in [
+            ('corrupt-zlib', b'\xca\x01\x01not zlib'),
+            ('unknown-format', b'\xca\x09\x00{}'),
+            ('truncated', b'\xca'),
+            ('not-json', b'<html>'),
+        ]:
+            fake_redis.values[cache._generate_cache_key('hand_analysis', identifier)] = payload
+            assert await cache.get('hand_analysis', identifier) is None
+            assert await cache.get_entry('hand_analysis', identifier) == (None, False)
+        assert not cache.local_cache._entries
+    finally:
+        await cache.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_cached_statistics_equal_the_calculated_response(
+    user_id, make_hands, make_service, fake_redis, worker_cache
+):
+    cache = await worker_cache(fake_redis)
+    service = make_service(make_hands(300, seed=1))
+    service.cache_service = cache
+    service.use_filter_lattice = False
+    filters = StatisticsFilters(cash_only=True)
+    
+    try:
+        calculated = await service.calculate_filtered_statistics(user_id, filters)
+        # Read back from Redis rather than the worker's in-process tier
+        cache.local_cache.clear()
+        cached = StatisticsResponse(**await cache.get_user_statistics(user_id, filters))
+    finally:
+        await cache.disconnect()
+    
+    assert cached == calculated
+    assert json.loads(cached.model_dump_json()) == json.loads(calculated.model_dump_json())
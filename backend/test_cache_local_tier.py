@@ -0,0 +1,154 @@
+"""
+Test the in-process cache tier in front of Redis and its invalidation across workers.
+"""
+import asyncio
+import time
+import pytest
+
+from app.schemas.statistics import StatisticsFilters
+from app.services.cache_service import StatisticsCacheService
+from app.services.local_cache import LocalCache
+
+
+async def settle():
+    """Let the listeners handle published invalidations."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_lru_evicts_by_count_and_size():
+    cache = LocalCache(max_entries=3, max_bytes=100, ttl_seconds=60)
+    for key in 'abc':
+        cache.set(key, key.upper(), size=10)
+    cache.get('a')
+    
+    cache.set('d', 'D', size=10)
+    assert cache.get('b') is None
+    assert [cache.get(key) for key in 'acd'] == ['A', 'C', 'D']
+    
+    cache.set('e', 'E', size=85)
+    assert cache.stats()['bytes'] <= 100
+    assert cache.get('e') == 'E' and cache.get('a') is None
+    
+    cache.set('huge', 'H', size=101)
+    assert cache.get('huge') is None
+
+
+def test_entries_expire_after_the_shorter_ttl(monkeypatch):
+    cache = LocalCache(max_entries=10, max_bytes=1000, ttl_seconds=60)
+    now = time.monotonic()
+    cache.set('short', 1, size=1, ttl_seconds=5)
+    cache.set('long', 2, size=1, ttl_seconds=600)
+    
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 10)
+    assert cache.get('short') is None and cache.get('long') == 2
+    
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 61)
+    assert cache.get('long') is None
+    assert cache.stats()['entries'] == 0
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_skip_redis(fake_redis, worker_cache):
+    writer, reader = await worker_cache(fake_redis), await worker_cache(fake_redis)
+    filters = StatisticsFilters(position='BTN')
+    
+    try:
+        # Each worker reads the user's generation once and the entry at most once
+        await writer.set_user_statistics('user-1', filters, {'sample_size': 100})
+        assert await writer.get_user_statistics('user-1', filters) == {'sample_size': 100}
+        assert fake_redis.gets == 1
+        
+        for _ in range(10):
+            assert await reader.get_user_statistics('user-1', filters) == {'sample_size': 100}
+        assert fake_redis.gets == 3
+    finally:
+        await writer.disconnect()
+        await reader.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_every_worker(fake_redis, worker_cache):
+    workers = [await worker_cache(fake_redis) for _ in range(3)]
+    filters = StatisticsFilters()
+    
+    try:
+        await workers[0].set_user_statistics('user-1', filters, {'sample_size': 1})
+        await workers[0].set_user_statistics('user-2', filters, {'sample_size': 2})
+        for worker in workers:
+            await worker.get_user_statistics('user-1', filters)
+            await worker.get_user_statistics('user-2', filters)
+        
+        await workers[1].invalidate_user_cache('user-1')
+        await settle()
+        
+        for worker in workers:
+            assert await worker.get_user_statistics('user-1', filters) is None
+            assert worker._unwrap(worker.local_cache.get(worker._generate_cache_key(
+                'user_stats', 'user-2', filters=worker._filters_key(filters)
+            ))) == ({'sample_size': 2}, False)
+    finally:
+        for worker in workers:
+            await worker.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_local_tier_is_bypassed_without_a_listener(fake_redis):
+    cache = StatisticsCacheService()
+    cache.redis_client = fake_redis
+    cache.connected = True
+    filters = StatisticsFilters()
+    
+    await cache.set_user_statistics('user-1', filters, {'sample_size': 1})
+    await cache.get_user_statistics('user-1', filters)
+    await cache.get_user_statistics('user-1', filters)
+    
+    # The generation and the entry are read from Redis every time
+    assert fake_redis.gets == 5
+    assert cache.local_cache.stats()['entries'] == 0
+
+
+@pytest.mark.asyncio
+async def test_user_invalidation_is_one_increment(fake_redis, worker_cache):
+    cache = await worker_cache(fake_redis)
+    filters = StatisticsFilters()
+    
+    try:
+        for user_id in ('user-1', 'user-2'):
+            await cache.set_user_statistics(user_id, filters, {'user': user_id})
+            await cache.set_trend_data(user_id, '30d', filters, {'user': user_id})
+        keys_before = set(fake_redis.values)
+        
+        assert await cache.invalidate_user_cache('user-1') == 1
+        await settle()
+        
+        # Nothing was deleted; only the generation counter was written
+        assert set(fake_redis.values) - keys_before == {'cache:generation:user:user-1'}
+        assert await cache.get_user_statistics('user-1', filters) is None
+        assert await cache.get_trend_data('user-1', '30d', filters) is None
+        assert await cache.get_user_statistics('user-2', filters) == {'user': 'user-2'}
+        
+        await cache.set_user_statistics('user-1', filters, {'fresh': True})
+        assert await cache.get_user_statistics('user-1', filters) == {'fresh': True}
+        assert any(key.startswith('stats:user:user-1:g1:') for key in fake_redis.values)
+    finally:
+        await cache.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_pattern_invalidation_scans_in_batches(fake_redis, worker_cache):
+    cache = await worker_cache(fake_redis)
+    
+    try:
+        for index in range(1200):
+            await cache.set('parsing_results', f'file-{index}', {'index': index})
+        await cache.set('hand_analysis', 'hand-1', {'kept': True})
+        
+        deleted = await cache.invalidate_pattern('parse:file:*', batch_size=500)
+        await settle()
+    finally:
+        await cache.disconnect()
+    
+    assert deleted == 1200
+    assert list(fake_redis.values) == ['analysis:hand:hand-1']
+    assert cache.local_cache.invalidate_pattern('parse:file:*') == 0
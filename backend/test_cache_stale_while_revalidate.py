@@ -0,0 +1,134 @@
+"""
+Test that statistics and trends past their cache TTL are served stale while one background task refreshes them.
+"""
+import asyncio
+import time
+import pytest
+from contextlib import asynccontextmanager
+
+from app.schemas.statistics import StatisticsFilters
+from app.services import cache_service as cache_module
+
+
+def refreshing_service(service):
+    """Make a slow service refresh stale results in the background on its own database mock."""
+    service.refreshes = {}
+    
+    @asynccontextmanager
+    async def session_factory():
+        yield service.db
+    
+    service.refresh_session_factory = session_factory
+    return service
+
+
+def hours_later(monkeypatch, hours):
+    """Move the wall clock the cache compares freshness with forward."""
+    now = time.time()
+    monkeypatch.setattr(cache_module.time, 'time', lambda: now + hours * 3600)
+
+
+async def finish_refreshes(*services):
+    for service in services:
+        await asyncio.gather(*list(service.refreshes.values()))
+
+
+@pytest.mark.asyncio
+async def test_entries_are_kept_past_their_ttl_until_the_hard_ttl(monkeypatch, locking_redis, worker_cache):
+    cache = await worker_cache(locking_redis)
+    filters = StatisticsFilters()
+    
+    try:
+        await cache.set_user_statistics('user-1', filters, {'sample_size': 1})
+        await cache.set('hand_analysis', 'hand-1', {'kept': True})
+        assert sorted(locking_redis.ttls.values()) == [86400, 86400]
+        
+        assert await cache.get_user_statistics_entry('user-1', filters) == ({'sample_size': 1}, False)
+        hours_later(monkeypatch, 2)
+        assert await cache.get_user_statistics('user-1', filters) is None
+        assert await cache.get_user_statistics_entry('user-1', filters) == ({'sample_size': 1}, True)
+        assert await cache.get('hand_analysis', 'hand-1') == {'kept': True}
+    finally:
+        await cache.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_trends_are_cached_per_metric_list(locking_redis, worker_cache):
+    cache = await worker_cache(locking_redis)
+    filters = StatisticsFilters()
+    
+    try:
+        await cache.set_trend_data('user-1', '30d', filters, [{'metric': 'vpip'}], metrics=['vpip'])
+        assert await cache.get_trend_data('user-1', '30d', filters, metrics=['pfr']) is None
+        assert await cache.get_trend_data_entry('user-1', '30d', filters, metrics=['vpip']) == (
+            [{'metric': 'vpip'}], False
+        )
+    finally:
+        await cache.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_stale_statistics_are_served_while_one_refresh_runs(
+    monkeypatch, user_id, make_hands, locking_redis, worker_cache, slow_service
+):
+    cache = await worker_cache(locking_redis)
+    service = refreshing_service(slow_service(make_hands(200, seed=1), cache))
+    filters = StatisticsFilters(cash_only=True)
+    
+    try:
+        first = await service.calculate_filtered_statistics(user_id, filters)
+        hours_later(monkeypatch, 2)
+        
+        responses = await asyncio.gather(*(service.calculate_filtered_statistics(user_id, filters) for _ in range(5)))
+        # Served from the cache without waiting for the refresh scheduled by the first request
+        assert [task.done() for task in service.refreshes.values()] == [False]
+        assert {response.calculation_date for response in responses} == {first.calculation_date}
+        
+        await finish_refreshes(service)
+        refreshed, stale = await cache.get_user_statistics_entry(user_id, filters)
+    finally:
+        await cache.disconnect()
+    
+    assert service.db.execute.await_count == 2
+    assert not stale and refreshed['calculation_date'] != first.calculation_date.isoformat()
+    assert not service.refreshes
+
+
+@pytest.mark.asyncio
+async def test_one_worker_refreshes_a_stale_entry(
+    monkeypatch, user_id, make_hands, locking_redis, worker_cache, slow_service
+):
+    caches = [await worker_cache(locking_redis) for _ in range(3)]
+    services = [refreshing_service(slow_service(make_hands(100, seed=2), cache)) for cache in caches]
+    filters = StatisticsFilters()
+    
+    try:
+        await services[0].calculate_filtered_statistics(user_id, filters)
+        hours_later(monkeypatch, 2)
+        
+        await asyncio.gather(*(service.calculate_filtered_statistics(user_id, filters) for service in services))
+        await finish_refreshes(*services)
+    finally:
+        for cache in caches:
+            await cache.disconnect()
+    
+    assert sum(service.db.execute.await_count for service in services) == 2
+    assert not [key for key in locking_redis.values if key.startswith('lock:')]
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_recalculated_without_a_refresh_session(
+    monkeypatch, user_id, make_hands, locking_redis, worker_cache, slow_service
+):
+    cache = await worker_cache(locking_redis)
+    service = slow_service(make_hands(50, seed=3), cache)
+    filters = StatisticsFilters()
+    
+    try:
+        await service.calculate_filtered_statistics(user_id, filters)
+        hours_later(monkeypatch, 2)
+        await service.calculate_filtered_statistics(user_id, filters)
+    finally:
+        await cache.disconnect()
+    
+    assert service.db.execute.await_count == 2
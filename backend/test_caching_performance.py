@@ -82,12 +82,14 @@ def test_data_serialization():
     
     # Serialize and deserialize
     serialized = cache_service._serialize_data(test_data)
-    assert isinstance(serialized, str)
+    assert isinstance(serialized, bytes)
     
     deserialized = cache_service._deserialize_data(serialized)
     assert isinstance(deserialized, dict)
     assert deserialized['string'] == 'test'
     assert deserialized['number'] == 42
+    assert deserialized['decimal'] == Decimal('3.14')
+    assert deserialized['datetime'] == test_data['datetime']
     
     print("✓ Data serialization test passed")
 
@@ -56,6 +56,9 @@ class MockRedisClient:
             self.stats['keyspace_misses'] += 1
             return None
     
+    async def execute_command(self, command: str, key: str, **options):
+        return await self.get(key)
+    
     async def setex(self, key: str, ttl: int, value: str):
         self.data[key] = value
         self.ttl_data[key] = time.time() + ttl
@@ -77,6 +80,16 @@ class MockRedisClient:
         import fnmatch
         return [key for key in self.data.keys() if fnmatch.fnmatch(key, pattern)]
     
+    async def scan_iter(self, match: str = None, count: int = None):
+        import fnmatch
+        for key in list(self.data.keys()):
+            if match is None or fnmatch.fnmatch(key, match):
+                yield key
+    
+    async def incr(self, key: str):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+    
     async def info(self):
         return self.stats
     
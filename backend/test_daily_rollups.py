@@ -0,0 +1,107 @@
+"""
+Test that date-ranged statistics read from daily rollups match a full recompute.
+"""
+import random
+import pytest
+from datetime import datetime, timezone, timedelta
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.models.hand import PokerHand
+from app.models.statistics import DailyStatisticsRollup
+from app.schemas.statistics import StatisticsFilters
+from app.services.statistics_accumulator import PositionalStatisticsAccumulator
+from app.services.statistics_service import StatisticsService
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+DIMENSIONS = ('platform', 'game_type', 'game_format', 'stakes', 'position', 'is_play_money')
+
+
+def spread_hands(hands, seed: int):
+    """Spread hands over ten days."""
+    rng = random.Random(seed)
+    for hand in hands:
+        hand.date_played = START + timedelta(minutes=rng.randint(0, 10 * 24 * 60))
+        hand.is_play_money = False
+    return hands
+
+
+def build_rollups(service, hands):
+    """Sum hands into rollup rows the way the ingest INSERT ... SELECT does."""
+    rows = {}
+    for hand in hands:
+        key = (hand.user_id, service._utc_midnight(hand.date_played).date()) + tuple(
+            getattr(hand, dimension) if getattr(hand, dimension) is not None else ''
+            for dimension in DIMENSIONS
+        )
+        counters = rows.get(key)
+        if counters is None:
+            counters = rows[key] = PositionalStatisticsAccumulator(service)
+        counters.add(hand)
+    
+    return [
+        DailyStatisticsRollup(user_id=key[0], day=key[1], **dict(zip(DIMENSIONS, key[2:])), **counters.to_dict())
+        for key, counters in rows.items()
+    ]
+
+
+async def rollup_service(hands):
+    """Store hands and their rollups in SQLite and return a rollup-backed service."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(PokerHand.__table__.create)
+        await conn.run_sync(DailyStatisticsRollup.__table__.create)
+    
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    service = StatisticsService(session, use_hand_facts=False, use_daily_rollups=True)
+    session.add_all(hands)
+    session.add_all(build_rollups(service, hands))
+    await session.commit()
+    
+    return service, engine
+
+
+FILTER_CASES = [
+    StatisticsFilters(start_date=START + timedelta(days=1, hours=7), end_date=START + timedelta(days=6, hours=13)),
+    StatisticsFilters(start_date=START + timedelta(days=2), end_date=START + timedelta(days=5)),
+    StatisticsFilters(start_date=START + timedelta(days=3, hours=2)),
+    StatisticsFilters(end_date=START + timedelta(days=4, hours=20)),
+    StatisticsFilters(start_date=START + timedelta(days=4, hours=1), end_date=START + timedelta(days=4, hours=9)),
+    StatisticsFilters(start_date=START + timedelta(days=1, hours=12), end_date=START + timedelta(days=8), game_format='cash'),
+    StatisticsFilters(start_date=START, end_date=START + timedelta(days=9, hours=6), position='BTN'),
+]
+
+
+def in_range(hand, filters):
+    """Whether the row-based query would select the hand."""
+    if filters.start_date and hand.date_played < filters.start_date:
+        return False
+    if filters.end_date and hand.date_played > filters.end_date:
+        return False
+    if filters.game_format and hand.game_format != filters.game_format:
+        return False
+    if filters.position and hand.position != filters.position:
+        return False
+    return True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters", FILTER_CASES)
+async def test_rollup_statistics_match_full_recompute(filters, user_id, make_hands, make_service):
+    """Rollups plus edge hands must give exactly the statistics of all hands in range."""
+    hands = spread_hands(make_hands(400, seed=3), seed=3)
+    service, engine = await rollup_service(hands)
+    
+    try:
+        basic = await service.calculate_basic_statistics(user_id, filters)
+        positional = await service.calculate_positional_statistics(user_id, filters)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    selected = [hand for hand in hands if in_range(hand, filters)]
+    assert basic.total_hands == len(selected)
+    assert basic == await make_service(selected)._calculate_basic_statistics_internal(user_id)
+    assert positional == await make_service(
+        [hand for hand in selected if hand.position is not None]
+    )._calculate_positional_statistics_internal(user_id)
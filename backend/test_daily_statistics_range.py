@@ -0,0 +1,135 @@
+"""
+Test that daily statistics bucketed into local days by the database match bucketing each hand in Python.
+"""
+import random
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.hand import PokerHand
+from app.schemas.statistics import StatisticsFilters
+from app.services.statistics_accumulator import SessionStatisticsAccumulator
+from app.services.statistics_sessions import sessionize
+
+
+START = datetime(2024, 3, 5, tzinfo=timezone.utc)
+TIMEZONE = 'America/New_York'
+
+
+def spread_hands(hands, seed):
+    """Spread hands over twelve days, across the daylight saving change of 2024-03-10."""
+    rng = random.Random(seed)
+    for hand in hands:
+        hand.date_played = START + timedelta(minutes=rng.randint(0, 12 * 24 * 60))
+    return hands
+
+
+def expected_days(service, hands, first_day, last_day):
+    """Daily statistics from converting each hand to New York time in Python."""
+    days = {}
+    for hand in hands:
+        local_day = hand.date_played.astimezone(ZoneInfo(TIMEZONE)).date()
+        if first_day <= local_day <= last_day:
+            days.setdefault(local_day, []).append(hand)
+    
+    return [
+        SessionStatisticsAccumulator(service).add_all(days[local_day]).finalize(
+            datetime.combine(local_day, datetime.min.time(), tzinfo=timezone.utc)
+        )
+        for local_day in sorted(days)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(3))
+async def test_rows_and_facts_match_python_bucketing(
+    seed, user_id, make_hands, make_service, stored_hands_service, facts_service
+):
+    hands = spread_hands(make_hands(200, seed), seed)
+    first_day, last_day = date(2024, 3, 6), date(2024, 3, 14)
+    rows_service, rows_engine = await stored_hands_service(hands, postgres_functions=True)
+    fact_service, facts_engine = await facts_service(hands, postgres_functions=True)
+    
+    try:
+        from_rows = await rows_service.calculate_daily_statistics_range(user_id, first_day, last_day, TIMEZONE)
+        from_facts = await fact_service.calculate_daily_statistics_range(user_id, first_day, last_day, TIMEZONE)
+    finally:
+        await rows_service.db.close()
+        await fact_service.db.close()
+        await rows_engine.dispose()
+        await facts_engine.dispose()
+    
+    expected = expected_days(make_service(hands), hands, first_day, last_day)
+    assert from_rows == expected
+    assert from_facts == expected
+
+
+@pytest.mark.asyncio
+async def test_filters_apply_to_the_range(user_id, make_hands, make_service, stored_hands_service):
+    hands = spread_hands(make_hands(200, seed=4), seed=4)
+    service, engine = await stored_hands_service(hands, postgres_functions=True)
+    
+    try:
+        days = await service.calculate_daily_statistics_range(
+            user_id, date(2024, 3, 5), date(2024, 3, 17), TIMEZONE, StatisticsFilters(game_format='cash')
+        )
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    cash = [hand for hand in hands if hand.game_format == 'cash']
+    assert days == expected_days(make_service(cash), cash, date(2024, 3, 5), date(2024, 3, 17))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("first_day, last_day", [(date(2024, 3, 4), date(2024, 3, 17)), (date(2024, 3, 7), date(2024, 3, 11))])
+async def test_play_sessions_match_python_bucketing(
+    first_day, last_day, user_id, make_hands, make_service, sessions_service
+):
+    """Sessions crossing a local midnight or the ends of the range count their hands on the days they were played."""
+    hands = spread_hands(make_hands(300, seed=5), seed=5)
+    service, engine = await sessions_service(hands, postgres_functions=True)
+    
+    try:
+        await service.rebuild_play_sessions(user_id)
+        days = await service.calculate_daily_statistics_range(user_id, first_day, last_day, TIMEZONE)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    sessions = sessionize(make_service(hands), hands, timedelta(minutes=30))
+    # Enough hands for sessions across local midnights, and the whole sessions within a day
+    assert any(
+        counters.first_played.astimezone(ZoneInfo(TIMEZONE)).date()
+        != counters.last_played.astimezone(ZoneInfo(TIMEZONE)).date()
+        for counters in sessions
+    )
+    assert days == expected_days(make_service(hands), hands, first_day, last_day)
+
+
+def test_days_are_bucketed_by_postgres(make_service):
+    """The local day is computed in the query rather than per hand in Python."""
+    service = make_service([])
+    day = service._local_day(PokerHand.__table__.c.date_played, TIMEZONE)
+    
+    sql = str(day.compile(dialect=postgresql.dialect(), compile_kwargs={'literal_binds': True}))
+    
+    assert sql == "date_trunc('day', timezone('America/New_York', poker_hands.date_played))"
+
+
+@pytest.mark.asyncio
+async def test_unknown_timezone_falls_back_to_utc(user_id, make_hands, stored_hands_service):
+    hands = spread_hands(make_hands(100, seed=6), seed=6)
+    service, engine = await stored_hands_service(hands, postgres_functions=True)
+    
+    try:
+        unknown = await service.calculate_daily_statistics_range(user_id, date(2024, 3, 5), date(2024, 3, 17), 'Mars/Olympus')
+        utc = await service.calculate_daily_statistics_range(user_id, date(2024, 3, 5), date(2024, 3, 17), 'UTC')
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    assert unknown == utc
+    assert sum(stats.hands_played for stats in utc) == len(hands)
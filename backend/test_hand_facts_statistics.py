@@ -0,0 +1,56 @@
+"""
+Test that statistics aggregated from the hand_facts table match the row-based calculators.
+"""
+import uuid
+import pytest
+from decimal import Decimal
+
+from app.schemas.statistics import StatisticsFilters
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(5))
+async def test_facts_statistics_match_row_calculators(seed, user_id, make_hands, make_service, facts_service):
+    """Aggregating facts in SQL must reproduce the row-based statistics."""
+    hands = make_hands(150, seed)
+    service, engine = await facts_service(hands)
+    
+    try:
+        basic = await service._calculate_basic_statistics_from_facts(user_id)
+        positional = await service._calculate_positional_statistics_from_facts(user_id)
+        advanced = await service._calculate_advanced_statistics_from_facts(user_id)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    row_service = make_service(hands)
+    assert basic == await row_service._calculate_basic_statistics_internal(user_id)
+    assert positional == await make_service(
+        [hand for hand in hands if hand.position is not None]
+    )._calculate_positional_statistics_internal(user_id)
+    
+    # Moments are exact decimal sums in SQL, so only the floating-point noise may differ
+    expected = await row_service._calculate_advanced_statistics_internal(user_id)
+    moment_fields = {'expected_value', 'variance', 'standard_deviations'}
+    assert advanced.model_dump(exclude=moment_fields) == expected.model_dump(exclude=moment_fields)
+    for field in moment_fields:
+        assert abs(getattr(advanced, field) - getattr(expected, field)) < Decimal('0.0001')
+
+
+@pytest.mark.asyncio
+async def test_facts_statistics_apply_filters(user_id, make_hands, make_service, facts_service):
+    """Filters must be applied to the facts table columns."""
+    hands = make_hands(120, seed=7)
+    service, engine = await facts_service(hands)
+    filters = StatisticsFilters(game_format='cash')
+    
+    try:
+        basic = await service._calculate_basic_statistics_from_facts(user_id, filters)
+        empty = await service._calculate_basic_statistics_from_facts(str(uuid.uuid4()))
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    cash_hands = [hand for hand in hands if hand.game_format == 'cash']
+    assert basic == await make_service(cash_hands)._calculate_basic_statistics_internal(user_id)
+    assert empty.total_hands == 0
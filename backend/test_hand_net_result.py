@@ -0,0 +1,158 @@
+"""
+Test stored per-hand net results and big blinds and the bb/100 win rate built on them.
+"""
+import random
+import pytest
+from decimal import Decimal
+
+from app.services import statistics_vectorized
+from app.services.pokerstars_parser import PokerStarsParser
+from app.services.statistics_accumulator import BasicStatisticsAccumulator
+
+
+CASH_HAND = """PokerStars Hand #234567890: Hold'em No Limit ($0.50/$1.00 USD) - 2024/01/15 20:05:00 ET
+Table 'TestTable' 6-max Seat #3 is the button
+Seat 1: Player1 ($100.00 in chips)
+Seat 2: Player2 ($95.50 in chips)
+Seat 3: Player3 ($120.25 in chips)
+Player1: posts small blind $0.50
+Player2: posts big blind $1.00
+*** HOLE CARDS ***
+Dealt to Player1 [Qd Qh]
+Player3: raises $3.00 to $4.00
+Player1: calls $3.50
+Player2: folds
+*** FLOP *** [9s 4c 2h]
+Player1: checks
+Player3: bets $6.00
+Player1: raises $18.00 to $24.00
+Player3: folds
+Uncalled bet ($18.00) returned to Player1
+Player1 collected $21.00 from pot
+*** SUMMARY ***
+Total pot $21.00 | Rake $1.00
+Board [9s 4c 2h]
+Seat 1: Player1 (small blind) collected ($21.00)
+Seat 2: Player2 (big blind) folded before Flop
+Seat 3: Player3 (button) folded on the Flop"""
+
+PLAY_MONEY_HAND = """PokerStars Hand #345678901: Hold'em No Limit (Play Money) ($10/$20) - 2024/01/15 20:10:00 ET
+Table 'PlayTable' 6-max Seat #1 is the button
+Seat 1: Player1 (2000 in chips)
+Seat 2: Player2 (1800 in chips)
+Player2: posts small blind 10
+Player1: posts big blind 20
+*** HOLE CARDS ***
+Dealt to Player1 [Kc Ks]
+Player2: calls 10
+Player1: raises 40 to 60
+Player2: calls 40
+*** FLOP *** [2h 7s Qd]
+Player1: bets 80
+Player2: folds
+Uncalled bet (80) returned to Player1
+Player1 collected 120 from pot
+*** SUMMARY ***
+Total pot 120 | Rake 0
+Board [2h 7s Qd]
+Seat 1: Player1 (big blind) collected (120)
+Seat 2: Player2 (small blind) folded on the Flop"""
+
+
+DEAD_BLIND_HAND = """PokerStars Hand #456789012: Hold'em No Limit ($0.05/$0.10 USD) - 2024/01/15 20:15:00 ET
+Table 'TestTable' 6-max Seat #1 is the button
+Seat 1: Player1 ($10.00 in chips)
+Seat 2: Player2 ($10.00 in chips)
+Seat 3: Player3 ($0.30 in chips)
+Seat 4: Player4 ($10.00 in chips)
+Player2: posts small blind $0.05
+Player3: posts big blind $0.10
+Player4: posts small & big blinds $0.15
+*** HOLE CARDS ***
+Dealt to Player4 [Ah Kh]
+Player4: raises $0.80 to $0.90
+Player1: folds
+Player2: folds
+Player3: calls $0.20 and is all-in
+Uncalled bet ($0.60) returned to Player4
+*** FLOP *** [Kd 7c 2s]
+*** TURN *** [Kd 7c 2s] [4h]
+*** RIVER *** [Kd 7c 2s 4h] [9d]
+*** SHOW DOWN ***
+Player3: shows [Qc Qd] (a pair of Queens)
+Player4: shows [Ah Kh] (a pair of Kings)
+Player4 collected $0.65 from pot
+*** SUMMARY ***
+Total pot $0.70 | Rake $0.05
+Board [Kd 7c 2s 4h 9d]
+Seat 3: Player3 (big blind) showed [Qc Qd] and lost with a pair of Queens
+Seat 4: Player4 showed [Ah Kh] and won ($0.65) with a pair of Kings"""
+
+def with_net_results(hands, seed):
+    """Give most cash hands a stored net result and big blind, as the parsers now do."""
+    rng = random.Random(seed)
+    for hand in hands:
+        if hand.game_format == 'cash' and rng.random() < 0.8:
+            hand.net_result = Decimal(str(round(rng.uniform(-30, 40), 2)))
+            hand.big_blind = Decimal(rng.choice(['1.00', '0.25']))
+    return hands
+
+
+@pytest.mark.parametrize("hand_text, player, expected", [
+    (CASH_HAND, None, Decimal('11.00')),
+    (CASH_HAND, 'Player3', Decimal('-10.00')),
+    (CASH_HAND, 'Player2', Decimal('-1.00')),
+    (PLAY_MONEY_HAND, None, Decimal('60')),
+    (PLAY_MONEY_HAND, 'Player2', Decimal('-60')),
+    (DEAD_BLIND_HAND, None, Decimal('0.30')),
+])
+def test_parser_calculates_net_result(hand_text, player, expected):
+    """Collected amounts minus chips put in, with raises counted to their total and uncalled bets returned."""
+    assert PokerStarsParser(player).calculate_net_result(hand_text) == expected
+
+
+def test_parsed_hand_stores_net_result_and_big_blind():
+    hand = PokerStarsParser().parse_hands(CASH_HAND)[0]
+    
+    assert hand.net_result == Decimal('11.00')
+    assert hand.big_blind == Decimal('1.00')
+
+
+def test_bb_per_100_uses_stored_results(make_hands, make_service):
+    """Cash win rate is the mean stored result in big blinds, times 100."""
+    hands = with_net_results(make_hands(200, seed=1), seed=1)
+    service = make_service(hands)
+    counters = BasicStatisticsAccumulator(service).add_all(hands)
+    
+    stored = [hand for hand in hands if hand.net_result is not None]
+    expected = sum(hand.net_result / hand.big_blind for hand in stored) / len(stored) * 100
+    
+    assert counters.big_blind_hands == len(stored)
+    assert abs(counters.finalize().win_rate - expected) < Decimal('0.01')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(3))
+async def test_vectorized_backend_matches_with_stored_results(seed, make_hands, calculate_with_backend):
+    """The column backend reads stored results exactly like the per-hand loop."""
+    if not statistics_vectorized.NUMPY_AVAILABLE:
+        pytest.skip("NumPy is not installed")
+    
+    hands = with_net_results(make_hands(150, seed), seed)
+    
+    assert await calculate_with_backend(hands, 'numpy') == await calculate_with_backend(hands, 'python')
+
+
+@pytest.mark.asyncio
+async def test_facts_win_rate_matches_rows(user_id, make_hands, make_service, facts_service):
+    """Summing the stored big blinds won in SQL reproduces the row-based win rate."""
+    hands = with_net_results([hand for hand in make_hands(150, seed=4) if hand.game_format == 'cash'], seed=4)
+    service, engine = await facts_service(hands)
+    
+    try:
+        basic = await service._calculate_basic_statistics_from_facts(user_id)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    assert basic == BasicStatisticsAccumulator(make_service(hands)).add_all(hands).finalize()
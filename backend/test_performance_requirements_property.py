@@ -153,6 +153,9 @@ async def mock_cache_service():
             await asyncio.sleep(lookup_time)
             return self.data.get(key)
         
+        async def execute_command(self, command: str, key: str, **options):
+            return await self.get(key)
+        
         async def setex(self, key: str, ttl: int, value: str):
             # Simulate cache write time
             write_time = 0.003 + (len(value) * 0.000001)  # Increases with data size
@@ -0,0 +1,115 @@
+"""
+Test that play sessions maintained at ingest match splitting all hands at idle gaps.
+"""
+import random
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.models.play_session import PlaySession
+from app.schemas.statistics import StatisticsFilters
+from app.services.statistics_sessions import merge_sessions, sessionize
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+GAP = timedelta(minutes=30)
+SESSION_COLUMNS = (
+    'start_time', 'end_time', 'total_hands', 'vpip_hands', 'pfr_hands',
+    'aggressive_actions', 'passive_actions', 'total_winnings', 'biggest_win', 'biggest_loss',
+)
+
+
+def spread_into_sessions(hands, seed):
+    """Play hands in bursts a minute apart, separated by idle breaks of up to three hours."""
+    rng = random.Random(seed)
+    played = START
+    for hand in hands:
+        played += timedelta(minutes=rng.choice([1, 1, 1, 2, 29, 30, 31, 180]))
+        hand.date_played = played
+    return hands
+
+
+async def stored_sessions(service):
+    result = await service.db.execute(select(PlaySession).order_by(PlaySession.start_time))
+    return result.scalars().all()
+
+
+def session_rows(rows):
+    """Stored columns of session rows, without their ids."""
+    return [{name: getattr(row, name) for name in SESSION_COLUMNS} for row in rows]
+
+
+def test_sessionize_splits_at_gaps_longer_than_the_threshold(make_hands, make_service):
+    hands = make_hands(6, seed=1)
+    for hand, minutes in zip(hands, [0, 30, 61, 62, 200, 230]):
+        hand.date_played = START + timedelta(minutes=minutes)
+    hands[3].date_played = None
+    
+    sessions = sessionize(make_service(hands), list(reversed(hands)), GAP)
+    
+    assert [counters.total_hands for counters in sessions] == [2, 1, 2]
+    assert sessions[0].first_played == START
+    assert sessions[2].last_played == START + timedelta(minutes=230)
+
+
+def test_merging_batches_matches_sessionizing_all_hands(make_hands, make_service):
+    """Joining the sessions of any split of the hands gives the sessions of all of them."""
+    hands = spread_into_sessions(make_hands(200, seed=2), seed=2)
+    service = make_service(hands)
+    shuffled = random.Random(2).sample(hands, len(hands))
+    
+    batches = [sessionize(service, shuffled[index:index + 17], GAP) for index in range(0, len(shuffled), 17)]
+    joined = merge_sessions([(counters, None) for batch in batches for counters in batch], GAP)
+    
+    assert [counters for counters, _ in joined] == sessionize(service, hands, GAP)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(3))
+async def test_incremental_sessions_match_rebuild(seed, user_id, make_hands, make_service, sessions_service):
+    """Hands ingested in out-of-order batches leave the same sessions as a rebuild."""
+    hands = spread_into_sessions(make_hands(150, seed), seed)
+    service, engine = await sessions_service(hands)
+    shuffled = random.Random(seed).sample(hands, len(hands))
+    
+    try:
+        for index in range(0, len(shuffled), 20):
+            await service.update_play_sessions(user_id, shuffled[index:index + 20])
+            await service.db.commit()
+        incremental = session_rows(await stored_sessions(service))
+        
+        await service.rebuild_play_sessions(user_id)
+        rebuilt = session_rows(await stored_sessions(service))
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    assert incremental == rebuilt
+    assert len(rebuilt) == len(sessionize(make_service(hands), hands, GAP))
+
+
+@pytest.mark.asyncio
+async def test_session_list_reads_stored_sessions(user_id, make_hands, sessions_service):
+    """Stored sessions give the same session list as splitting the hands, with session ids."""
+    hands = spread_into_sessions(make_hands(200, seed=4), seed=4)
+    service, engine = await sessions_service(hands)
+    
+    try:
+        await service.rebuild_play_sessions(user_id)
+        filters = StatisticsFilters(start_date=START + timedelta(hours=6))
+        stored = await service.calculate_session_statistics(user_id, filters)
+        
+        service.use_play_sessions = False
+        split = await service.calculate_session_statistics(user_id, filters)
+        details = await service.get_session_details(user_id, stored[0].session_id)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    # Sessions started before the range are left out rather than cut at its start
+    assert [session.model_copy(update={'session_id': None}) for session in stored] == split[:len(stored)]
+    assert all(session.session_id for session in stored)
+    assert details.hands == stored[0].hands_played
+    assert details.profit == stored[0].net_result
+    assert details.stakes == "$0.50/$1.00"
@@ -0,0 +1,143 @@
+"""
+Test that statistics accumulators merge to the same result as a single pass.
+"""
+import pickle
+import pytest
+from datetime import datetime, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from unittest.mock import MagicMock
+
+from app.services.statistics_accumulator import (
+    BasicStatisticsAccumulator,
+    PositionalStatisticsAccumulator,
+    AdvancedStatisticsAccumulator,
+    SessionStatisticsAccumulator,
+    cents_to_decimal,
+    to_cents
+)
+from app.services.statistics_service import StatisticsService
+
+
+ACCUMULATORS = [
+    BasicStatisticsAccumulator,
+    PositionalStatisticsAccumulator,
+    AdvancedStatisticsAccumulator,
+    SessionStatisticsAccumulator,
+]
+
+
+def split_and_merge(accumulator_type, service, hands, parts):
+    """Accumulate hands in several chunks and merge the chunks together."""
+    size = len(hands) // parts + 1
+    merged = accumulator_type(service)
+    for start in range(0, len(hands), size):
+        merged.merge(accumulator_type(service).add_all(hands[start:start + size]))
+    return merged
+
+
+@pytest.mark.parametrize("accumulator_type", ACCUMULATORS)
+@pytest.mark.parametrize("seed", range(5))
+def test_merged_accumulators_match_single_pass(accumulator_type, seed, make_hands, make_service):
+    """Merging accumulators over split hand sets equals one accumulator over all hands."""
+    hands = make_hands(150, seed)
+    service = make_service(hands)
+    
+    single = accumulator_type(service).add_all(hands)
+    merged = split_and_merge(accumulator_type, service, hands, parts=4)
+    
+    assert merged == single
+
+
+def test_merged_accumulators_finalize_identically(user_id, make_hands, make_service):
+    """Finalized statistics from merged accumulators match the single-pass results."""
+    hands = make_hands(200, seed=7)
+    service = make_service(hands)
+    session_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    
+    assert (
+        split_and_merge(BasicStatisticsAccumulator, service, hands, 3).finalize(user_id)
+        == BasicStatisticsAccumulator(service).add_all(hands).finalize(user_id)
+    )
+    assert (
+        split_and_merge(PositionalStatisticsAccumulator, service, hands, 3).finalize('BTN')
+        == PositionalStatisticsAccumulator(service).add_all(hands).finalize('BTN')
+    )
+    assert (
+        split_and_merge(AdvancedStatisticsAccumulator, service, hands, 3).finalize()
+        == AdvancedStatisticsAccumulator(service).add_all(hands).finalize()
+    )
+    assert (
+        split_and_merge(SessionStatisticsAccumulator, service, hands, 3).finalize(session_date)
+        == SessionStatisticsAccumulator(service).add_all(hands).finalize(session_date)
+    )
+
+
+@pytest.mark.parametrize("accumulator_type", ACCUMULATORS)
+def test_accumulator_pickle_round_trip(accumulator_type, make_hands, make_service):
+    """Pickled accumulators keep their counters and can be finalized with a service again."""
+    hands = make_hands(50, seed=3)
+    service = make_service(hands)
+    accumulator = accumulator_type(service).add_all(hands)
+    
+    restored = pickle.loads(pickle.dumps(accumulator))
+    
+    assert restored.features is None
+    assert restored == accumulator
+    restored.features = service
+    assert restored.merge(accumulator_type(service)) == accumulator
+
+
+@pytest.mark.asyncio
+async def test_session_statistics_use_session_accumulator(user_id, make_hands, make_service):
+    """Session statistics match the session accumulator over each session's hands."""
+    hands = make_hands(100, seed=11)
+    service = make_service(hands)
+    
+    sessions = await service.calculate_session_statistics(user_id)
+    
+    expected = SessionStatisticsAccumulator(service).add_all(hands).finalize(
+        datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+    assert sessions == [expected]
+    assert expected.hands_played == 100
+    assert expected.duration_minutes == 99
+
+
+@pytest.mark.parametrize("amount, cents", [
+    (Decimal('12.34'), 1234),
+    (Decimal('-0.05'), -5),
+    (0.1 + 0.2, 30),
+    (19.99, 1999),
+    (3, 300),
+    ('1.50', 150),
+])
+def test_to_cents_converts_amounts_exactly(amount, cents):
+    """Amounts of any stored type convert to integer cents and back without loss."""
+    assert to_cents(amount) == cents
+    assert cents_to_decimal(cents) == Decimal(str(amount)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+
+def test_integer_percentages_match_decimal_rounding():
+    """Integer percentage rounding gives exactly the Decimal ROUND_HALF_UP results."""
+    service = StatisticsService(MagicMock())
+    
+    for denominator in range(1, 400):
+        for numerator in range(denominator + 1):
+            expected = (Decimal(str(numerator)) / Decimal(str(denominator)) * Decimal('100')).quantize(
+                Decimal('0.1'), rounding=ROUND_HALF_UP
+            )
+            percentage = service._calculate_percentage(numerator, denominator)
+            assert percentage == expected
+            assert str(percentage) == str(expected)
+
+
+def test_accumulator_amounts_are_integer_cents(make_hands, make_service):
+    """Accumulated amounts stay integers until finalize; to_dict reports them as Decimal."""
+    hands = make_hands(80, seed=5)
+    service = make_service(hands)
+    advanced = AdvancedStatisticsAccumulator(service).add_all(hands)
+    
+    for name in AdvancedStatisticsAccumulator.AMOUNTS:
+        assert type(getattr(advanced, name)) is int
+    assert advanced.to_dict()['result_sum'] == cents_to_decimal(advanced.result_sum)
+    assert advanced.to_dict()['result_sum_squares'] == cents_to_decimal(advanced.result_sum_squares, 4)
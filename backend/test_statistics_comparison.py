@@ -0,0 +1,114 @@
+"""
+Test statistics comparisons between periods and the shared scan behind them.
+"""
+import pytest
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+
+from app.schemas.statistics import StatisticsFilters
+from app.services import statistics_comparison
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def hourly_periods(hours, **filters):
+    """Consecutive one-hour periods from the first hand of make_hands."""
+    return [
+        StatisticsFilters(
+            start_date=START + timedelta(hours=hour),
+            end_date=START + timedelta(hours=hour + 1) - timedelta(microseconds=1),
+            **filters
+        )
+        for hour in range(hours)
+    ]
+
+
+def components(response):
+    return response.model_dump(include={'basic_stats', 'advanced_stats', 'positional_stats', 'tournament_stats'})
+
+
+@pytest.mark.asyncio
+async def test_shared_scan_matches_each_period_calculated_alone(user_id, make_hands, stored_hands_service):
+    hands = make_hands(600, seed=1)
+    periods = hourly_periods(10, cash_only=True) + [StatisticsFilters(cash_only=True), StatisticsFilters(position='BTN')]
+    service, engine = await stored_hands_service(hands)
+    
+    try:
+        shared = await service.calculate_statistics_for_periods(user_id, periods)
+        alone = [await service.calculate_filtered_statistics(user_id, filters) for filters in periods]
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    assert [components(response) for response in shared] == [components(response) for response in alone]
+    assert [response.filters_applied for response in shared] == periods
+    assert sum(response.sample_size for response in shared[:10]) == shared[10].sample_size
+
+
+@pytest.mark.asyncio
+async def test_periods_differing_in_dates_share_one_query(user_id, make_hands, make_service):
+    service = make_service(make_hands(300, seed=2))
+    
+    responses = await service.calculate_statistics_for_periods(user_id, hourly_periods(5))
+    
+    assert service.db.execute.await_count == 1
+    assert [response.sample_size for response in responses] == [60] * 5
+
+
+@pytest.mark.asyncio
+async def test_cached_periods_are_reused(user_id, make_hands, make_service, statistics_cache):
+    service = make_service(make_hands(300, seed=3))
+    service.cache_service = statistics_cache
+    service.use_filter_lattice = False
+    periods = hourly_periods(3)
+    
+    first = await service.calculate_statistics_for_periods(user_id, periods[:2])
+    second = await service.calculate_statistics_for_periods(user_id, periods)
+    
+    # Only the third period was read from the database the second time
+    assert service.db.execute.await_count == 2
+    assert [response.basic_stats.vpip for response in second[:2]] == [response.basic_stats.vpip for response in first]
+    assert [response.sample_size for response in second] == [60, 60, 60]
+
+
+@pytest.mark.asyncio
+async def test_compare_periods_reports_changes(user_id, make_hands, make_service):
+    service = make_service(make_hands(300, seed=4))
+    
+    comparison = await service.compare_periods(user_id, hourly_periods(4), ['vpip', 'win_rate', 'three_bet_percentage'])
+    
+    vpip = comparison.metric_values['vpip']
+    assert vpip == [response.basic_stats.vpip for response in comparison.period_stats]
+    assert comparison.period_changes['vpip'] == [None] + [later - earlier for earlier, later in zip(vpip, vpip[1:])]
+    assert len(comparison.metric_values['three_bet_percentage']) == 4
+
+
+@pytest.mark.asyncio
+async def test_unknown_metrics_are_rejected_before_calculating(user_id, make_hands, make_service):
+    service = make_service(make_hands(10, seed=5))
+    
+    with pytest.raises(ValueError, match="Unknown metric 'luck'"):
+        await service.compare_statistics(user_id, StatisticsFilters(), StatisticsFilters(), ['vpip', 'luck'])
+    assert service.db.execute.await_count == 0
+
+
+@pytest.mark.asyncio
+async def test_compare_statistics_flags_significant_rate_changes(user_id, make_hands, make_service):
+    service = make_service(make_hands(300, seed=6))
+    base, comparison = await service.calculate_statistics_for_periods(user_id, hourly_periods(2))
+    base.sample_size = comparison.sample_size = 5000
+    base.basic_stats.vpip, comparison.basic_stats.vpip = Decimal('22.00'), Decimal('26.00')
+    base.basic_stats.pfr, comparison.basic_stats.pfr = Decimal('18.00'), Decimal('18.50')
+    
+    result = statistics_comparison.compare_responses(base, comparison, ['vpip', 'pfr', 'win_rate'])
+    
+    assert result.differences['vpip'] == Decimal('4.00')
+    assert [change['metric'] for change in result.significant_changes] == ['vpip']
+    assert result.significant_changes[0]['z_score'] == pytest.approx(4.68, abs=0.01)
+    assert result.differences['win_rate'] == comparison.basic_stats.win_rate - base.basic_stats.win_rate
+
+
+def test_rate_change_z_score_needs_hands():
+    assert statistics_comparison.rate_change_z_score(Decimal('20'), 0, Decimal('30'), 100) is None
+    assert statistics_comparison.rate_change_z_score(Decimal('0'), 100, Decimal('0'), 100) is None
@@ -0,0 +1,70 @@
+"""
+Test that statistics components computed concurrently match the fused kernel.
+"""
+import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.models.hand import PokerHand
+from app.schemas.statistics import StatisticsFilters
+from app.services.statistics_service import StatisticsService
+
+
+@pytest.fixture
+async def session_factory(tmp_path, make_hands):
+    """Session factory over a file-backed SQLite database holding synthetic hands."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'hands.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(PokerHand.__table__.create)
+    
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add_all(make_hands(150, seed=6))
+        await session.commit()
+    
+    yield factory
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_type", [None, ThreadPoolExecutor, ProcessPoolExecutor])
+async def test_concurrent_components_match_fused_kernel(session_factory, executor_type, user_id):
+    """Concurrent components on separate sessions give the fused kernel's results."""
+    executor = executor_type(max_workers=2) if executor_type else None
+    try:
+        async with session_factory() as session:
+            fused = await StatisticsService(
+                session, use_hand_facts=False, use_daily_rollups=False
+            )._calculate_all_statistics_internal(user_id)
+            
+            service = StatisticsService(
+                session,
+                use_hand_facts=False,
+                use_daily_rollups=False,
+                session_factory=session_factory,
+                reduction_executor=executor
+            )
+            components, timings = await service._calculate_components_concurrently(user_id)
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    assert components == fused
+    assert set(timings) == {'basic', 'advanced', 'positional', 'tournament', 'total'}
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+@pytest.mark.asyncio
+async def test_filtered_statistics_report_component_timings(session_factory, user_id):
+    """Filtered statistics report per-component timings on both the concurrent and fused paths."""
+    async with session_factory() as session:
+        concurrent = await StatisticsService(
+            session, use_hand_facts=False, use_daily_rollups=False, session_factory=session_factory
+        ).calculate_filtered_statistics(user_id, StatisticsFilters())
+        fused = await StatisticsService(
+            session, use_hand_facts=False, use_daily_rollups=False
+        ).calculate_filtered_statistics(user_id, StatisticsFilters())
+    
+    assert set(concurrent.component_timings) == {'basic', 'advanced', 'positional', 'tournament', 'total'}
+    assert set(fused.component_timings) == {'fused'}
+    assert concurrent.basic_stats == fused.basic_stats
@@ -0,0 +1,48 @@
+"""
+Test that the fused single-pass statistics kernel matches the separate calculators.
+"""
+import pytest
+from decimal import Decimal
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(10))
+async def test_fused_statistics_match_separate_calculators(
+    seed, user_id, make_hands, make_service, calculate_separately
+):
+    """Fused kernel results must be identical to the four separate calculators."""
+    hands = make_hands(200, seed)
+
+    fused = await make_service(hands)._calculate_all_statistics_internal(user_id)
+    separate = await calculate_separately(hands)
+
+    assert fused == separate
+
+
+@pytest.mark.asyncio
+async def test_fused_statistics_empty_hand_set(user_id, make_service, calculate_separately):
+    """Fused kernel must match the separate calculators when there are no hands."""
+    fused = await make_service([])._calculate_all_statistics_internal(user_id)
+    separate = await calculate_separately([])
+
+    assert fused == separate
+    basic, advanced, positional, tournament = fused
+    assert basic.total_hands == 0
+    assert advanced.variance == Decimal('0.0')
+    assert positional == []
+    assert tournament is None
+
+
+@pytest.mark.asyncio
+async def test_positional_statistics_skip_hands_without_position(user_id, make_hands, make_service):
+    """Hands without a position are left out of positional statistics on every path."""
+    hands = make_hands(60, seed=42)
+    for hand in hands[:20]:
+        hand.position = None
+
+    service = make_service(hands)
+    standalone = await service._calculate_positional_statistics_internal(user_id)
+    _, _, fused, _ = await service._calculate_all_statistics_internal(user_id)
+
+    assert standalone == fused
+    assert all(stat.position is not None for stat in standalone)
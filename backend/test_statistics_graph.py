@@ -0,0 +1,109 @@
+"""
+Test the streaming winnings graph: running moments, bounded sampling and LTTB.
+"""
+import random
+import statistics
+import pytest
+from decimal import Decimal
+
+from app.services.statistics_accumulator import AdvancedStatisticsAccumulator
+from app.services.statistics_graph import RunningMoments, SeriesSampler, WinningsGraphBuilder, lttb
+from benchmark_statistics_backends import make_hands as make_synthetic_hands
+
+
+def test_running_moments_match_population_variance():
+    """Welford moments match the two-pass mean and population variance, also when merged."""
+    rng = random.Random(1)
+    values = [rng.randint(-50_000, 50_000) for _ in range(5000)]
+    
+    single = RunningMoments()
+    for value in values:
+        single.add(value)
+    
+    left, right = RunningMoments(), RunningMoments()
+    for value in values[:1234]:
+        left.add(value)
+    for value in values[1234:]:
+        right.add(value)
+    merged = left.merge(right)
+    
+    for moments in (single, merged):
+        assert moments.count == len(values)
+        assert moments.mean == pytest.approx(statistics.fmean(values))
+        assert moments.variance == pytest.approx(statistics.pvariance(values))
+
+
+def test_lttb_keeps_endpoints_and_threshold():
+    """LTTB returns exactly threshold points in x order, starting and ending with the line's ends."""
+    points = [(x, (x * 37) % 101 - 50) for x in range(1, 1001)]
+    
+    sampled = lttb(points, 50)
+    
+    assert len(sampled) == 50
+    assert sampled[0] == points[0] and sampled[-1] == points[-1]
+    assert [x for x, _ in sampled] == sorted(x for x, _ in sampled)
+    assert lttb(points[:10], 50) == points[:10]
+
+
+def test_series_sampler_memory_is_bounded_and_keeps_extremes():
+    """The sampler never holds more buckets than asked for and keeps the global extremes."""
+    rng = random.Random(2)
+    sampler = SeriesSampler(40)
+    y = 0
+    points = []
+    for x in range(1, 100_001):
+        y += rng.randint(-100, 100)
+        points.append((x, y))
+        sampler.add(x, y)
+        assert len(sampler.buckets) <= 40
+    
+    candidates = sampler.candidates()
+    assert candidates[0] == points[0] and candidates[-1] == points[-1]
+    assert min(points, key=lambda point: point[1])[1] == min(y for _, y in candidates)
+    assert max(points, key=lambda point: point[1])[1] == max(y for _, y in candidates)
+
+
+def test_graph_matches_advanced_statistics_moments(make_hands, make_service):
+    """Graph totals and moments agree with the exact advanced statistics accumulators."""
+    hands = make_hands(300, seed=4)
+    service = make_service(hands)
+    
+    graph = WinningsGraphBuilder(service, points=20).add_all(hands).finalize()
+    advanced = AdvancedStatisticsAccumulator(service).add_all(hands).finalize()
+    
+    assert graph.total_hands == 300
+    assert graph.net_result == graph.showdown_result + graph.non_showdown_result
+    assert float(graph.expected_value) == pytest.approx(float(advanced.expected_value), abs=1e-6)
+    assert float(graph.variance) == pytest.approx(float(advanced.variance), abs=1e-6)
+    assert graph.total_line[-1].value == graph.net_result
+    assert graph.total_line[-1].hand_number == 300
+    for line in (graph.total_line, graph.showdown_line, graph.non_showdown_line):
+        assert len(line) <= 20
+
+
+def test_graph_size_does_not_grow_with_hands(make_service):
+    """A graph over many hands ships no more points than requested."""
+    service = make_service([])
+    hands = make_synthetic_hands(50_000, seed=0)
+    
+    graph = WinningsGraphBuilder(service, points=100).add_all(hands).finalize()
+    
+    assert graph.total_hands == 50_000
+    assert len(graph.total_line) == 100
+    assert len(graph.model_dump_json()) < 20_000
+    assert graph.total_line[0].hand_number == 1
+    assert graph.total_line[-1].value == graph.net_result
+
+
+@pytest.mark.asyncio
+async def test_calculate_winnings_graph_streams_hands(user_id, make_hands, make_service):
+    """The service builds the graph from the queried hands."""
+    hands = make_hands(120, seed=9)
+    service = make_service(hands)
+    
+    graph = await service.calculate_winnings_graph(user_id, points=10)
+    
+    assert graph == WinningsGraphBuilder(service, points=10).add_all(hands).finalize()
+    assert isinstance(graph.variance, Decimal)
+    with pytest.raises(ValueError):
+        WinningsGraphBuilder(service, points=2)
@@ -0,0 +1,139 @@
+"""
+Test that statistics answered from the per-user bitmap index match the filtered queries.
+"""
+import pytest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.schemas.statistics import StatisticsFilters
+from app.services import statistics_vectorized
+from app.services.statistics_index import (
+    HandBitmapIndex,
+    HandIndexRegistry,
+    bitmap_from_ordinals,
+    bitmap_ordinals
+)
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+FILTERS = [
+    None,
+    StatisticsFilters(position='BTN'),
+    StatisticsFilters(stakes_filter=['$1/$2', '$0.50/$1.00'], cash_only=True),
+    StatisticsFilters(platform='ggpoker', exclude_play_money=True, position='SB'),
+    StatisticsFilters(start_date=START + timedelta(hours=1), end_date=START + timedelta(hours=2), tournament_only=True),
+    StatisticsFilters(play_money_only=True, game_type="Hold'em", stakes_filter=['$1/$2']),
+    StatisticsFilters(stakes_filter=['$5/$10']),
+]
+
+
+def vary_dimensions(hands):
+    """Spread hands over platforms, stakes and real and play money."""
+    for index, hand in enumerate(hands):
+        hand.platform = 'ggpoker' if index % 3 == 0 else 'pokerstars'
+        hand.stakes = '$1/$2' if index % 5 == 0 else '$0.50/$1.00'
+        hand.is_play_money = index % 4 == 0
+    return hands
+
+
+def test_bitmap_ordinals_round_trip():
+    """Ordinals survive a round trip through a bitmap, including byte boundaries."""
+    ordinals = [0, 7, 8, 9, 63, 64, 999]
+    
+    bitmap = bitmap_from_ordinals(ordinals, 1000)
+    
+    assert bitmap_ordinals(bitmap) == ordinals
+    assert bitmap_ordinals(0) == []
+    assert bin(bitmap).count('1') == len(ordinals)
+
+
+def test_date_range_is_a_contiguous_run_of_ordinals(user_id, make_hands):
+    """Date bounds are inclusive and select the hands played between them."""
+    hands = make_hands(100, seed=3)
+    index = HandBitmapIndex(user_id, hands)
+    start, end = START + timedelta(minutes=30), START + timedelta(minutes=90)
+    
+    selected = index.hands_for(index.date_range(start, end))
+    
+    assert selected == sorted(
+        (hand for hand in hands if start <= hand.date_played <= end), key=lambda hand: hand.date_played
+    )
+    assert index.date_range(end, start) == 0
+    assert index.date_range() == index.all
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ['python', 'numpy'])
+async def test_hand_index_matches_filtered_queries(backend, user_id, make_hands, stored_hands_service):
+    """Every filter combination gives the same statistics from the index as from SQL."""
+    if backend == 'numpy' and not statistics_vectorized.NUMPY_AVAILABLE:
+        pytest.skip("NumPy is not installed")
+    
+    hands = vary_dimensions(make_hands(300, seed=6))
+    service, engine = await stored_hands_service(hands)
+    service.backend = backend
+    service.hand_indexes = HandIndexRegistry(max_users=4, max_bytes=2 ** 40)
+    
+    try:
+        for filters in FILTERS:
+            expected = await service._calculate_all_statistics_internal(user_id, filters)
+            assert await service._calculate_from_hand_index(user_id, filters) == expected
+    finally:
+        await service.db.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_registry_rebuilds_index_when_hands_change(user_id, make_hands, stored_hands_service):
+    """An index is reused until the user's hands change, and the least recent user is evicted."""
+    hands = make_hands(50, seed=1)
+    service, engine = await stored_hands_service(hands)
+    registry = HandIndexRegistry(max_users=1, max_bytes=2 ** 40)
+    
+    try:
+        index = await registry.get(service.db, user_id)
+        assert await registry.get(service.db, user_id) is index
+        assert index.size == 50
+        
+        service.db.add_all(make_hands(5, seed=2))
+        await service.db.commit()
+        rebuilt = await registry.get(service.db, user_id)
+        assert rebuilt is not index
+        assert rebuilt.size == 55
+        
+        other = await registry.get(service.db, 'another-user')
+        assert other.size == 0
+        assert await registry.get(service.db, user_id) is not rebuilt
+    finally:
+        await service.db.close()
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_registry_keeps_indexes_within_its_memory_cap(user_id, make_hands, stored_hands_service):
+    """The least recent index is evicted past max_bytes, and an index over the cap is not kept."""
+    other_user = str(uuid.uuid4())
+    hands = make_hands(50, seed=1)
+    for hand in make_hands(50, seed=2):
+        hand.user_id = other_user
+        hands.append(hand)
+    service, engine = await stored_hands_service(hands)
+    
+    try:
+        size = (await HandIndexRegistry(1, 2 ** 40).get(service.db, user_id)).nbytes
+        registry = HandIndexRegistry(max_users=2, max_bytes=int(size * 1.5))
+        
+        index = await registry.get(service.db, user_id)
+        assert await registry.get(service.db, user_id) is index
+        other = await registry.get(service.db, other_user)
+        assert registry.nbytes == other.nbytes
+        assert await registry.get(service.db, user_id) is not index
+        
+        registry.max_bytes = size // 2
+        registry.invalidate()
+        assert await registry.get(service.db, user_id) is not await registry.get(service.db, user_id)
+        assert registry.nbytes == 0
+    finally:
+        await service.db.close()
+        await engine.dispose()
@@ -0,0 +1,136 @@
+"""
+Test that filtered statistics answered from the filter lattice match direct calculation.
+"""
+import itertools
+import pytest
+from datetime import datetime, timezone
+
+from app.schemas.statistics import StatisticsFilters
+from app.services.statistics_lattice import StatisticsCube, normalize_filters, split_filters
+
+
+def vary_dimensions(hands):
+    """Spread hands over both platforms and real and play money."""
+    for index, hand in enumerate(hands):
+        hand.platform = 'ggpoker' if index % 3 == 0 else 'pokerstars'
+        hand.is_play_money = index % 4 == 0
+    return hands
+
+
+def matches(hand, selection):
+    values = {
+        'position': hand.position,
+        'game_format': hand.game_format,
+        'platform': hand.platform,
+        'is_play_money': bool(hand.is_play_money),
+    }
+    return all(values[name] == value for name, value in selection.items())
+
+
+SELECTIONS = [
+    {},
+    {'position': 'BTN'},
+    {'game_format': 'cash'},
+    {'platform': 'ggpoker', 'is_play_money': False},
+    {'position': 'SB', 'game_format': 'tournament', 'platform': 'pokerstars'},
+]
+
+
+def test_equivalent_filters_normalize_identically():
+    """Format flags, false flags and stakes order do not change the canonical filters."""
+    assert normalize_filters(StatisticsFilters(tournament_only=True)) == normalize_filters(
+        StatisticsFilters(game_format='tournament', cash_only=False)
+    )
+    assert normalize_filters(StatisticsFilters(stakes_filter=['b', 'a', 'b'])).stakes_filter == ['a', 'b']
+    assert normalize_filters(StatisticsFilters(exclude_play_money=False)) == StatisticsFilters()
+    assert normalize_filters(None) == StatisticsFilters()
+
+
+def test_split_filters_separates_mergeable_dimensions():
+    """Base filters keep dates and stakes; position, format, platform and money become the selection."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    base, selection = split_filters(StatisticsFilters(
+        start_date=start, position='BTN', cash_only=True, platform='ggpoker', exclude_play_money=True
+    ))
+    
+    assert base == StatisticsFilters(start_date=start)
+    assert selection == {'position': 'BTN', 'game_format': 'cash', 'platform': 'ggpoker', 'is_play_money': False}
+    assert split_filters(StatisticsFilters(tournament_only=True, cash_only=True)) is None
+    assert split_filters(StatisticsFilters(play_money_only=True, exclude_play_money=True)) is None
+
+
+@pytest.mark.parametrize("selection", SELECTIONS)
+def test_cube_selection_matches_filtered_counters(selection, make_hands, make_service, statistics_cache):
+    """Merging the selected cells, after a cache round trip, equals counting the selected hands."""
+    hands = vary_dimensions(make_hands(300, seed=2))
+    service = make_service(hands)
+    cache = statistics_cache
+    
+    cube = StatisticsCube(service).add_all(hands)
+    state = cache._deserialize_data(cache._serialize_data(cube.to_state()))
+    totals, advanced, positions = StatisticsCube.from_state(service, state).select(selection)
+    
+    selected = [hand for hand in hands if matches(hand, selection)]
+    expected = StatisticsCube(service).add_all(selected).select({})
+    assert (totals, advanced, positions) == expected
+    assert totals.total_hands == len(selected)
+
+
+@pytest.mark.asyncio
+async def test_facts_cube_matches_row_cube(user_id, make_hands, make_service, facts_service):
+    """The grouped hand_facts query fills the same cube cells as counting rows."""
+    hands = vary_dimensions(make_hands(200, seed=5))
+    service, engine = await facts_service(hands)
+    
+    try:
+        facts_cube = await service._build_statistics_cube(user_id, StatisticsFilters())
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    row_cube = StatisticsCube(make_service(hands)).add_all(hands)
+    for selection in SELECTIONS:
+        assert facts_cube.select(selection) == row_cube.select(selection)
+
+
+@pytest.mark.asyncio
+async def test_filtered_statistics_reuse_cached_breakdown(user_id, make_hands, stored_hands_service, statistics_cache):
+    """A position filter is answered from the unfiltered breakdown and counted as reuse."""
+    hands = vary_dimensions(make_hands(250, seed=8))
+    service, engine = await stored_hands_service(hands)
+    cache = statistics_cache
+    service.cache_service = cache
+    service.use_filter_lattice = True
+    
+    def components(response):
+        return response.model_dump(include={'basic_stats', 'advanced_stats', 'positional_stats', 'tournament_stats'})
+    
+    try:
+        responses = {}
+        for filters in (StatisticsFilters(), StatisticsFilters(position='BTN'), StatisticsFilters(cash_only=True, platform='ggpoker')):
+            responses[filters.model_dump_json()] = components(await service.calculate_filtered_statistics(user_id, filters))
+        # Same filters again, spelled differently: an exact hit
+        await service.calculate_filtered_statistics(user_id, StatisticsFilters(game_format='cash', platform='ggpoker'))
+        
+        service.cache_service = None
+        service.use_filter_lattice = False
+        for key, response in responses.items():
+            filters = StatisticsFilters.model_validate_json(key)
+            assert response == components(await service.calculate_filtered_statistics(user_id, filters))
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    reuse = (await cache.get_cache_stats())['filter_reuse']
+    assert reuse == {'exact_hits': 1, 'lattice_hits': 2, 'misses': 1, 'reuse_rate': 75.0}
+    assert len([key for key in cache.redis_client.values if key.startswith('stats:breakdown:user')]) == 1
+
+
+@pytest.mark.parametrize("position, game_format", itertools.product(['BTN', None], ['tournament', None]))
+def test_split_filters_round_trip(position, game_format):
+    """Base filters with the selection re-applied select the same hands as the original filters."""
+    filters = StatisticsFilters(position=position, game_format=game_format, stakes_filter=['$1/$2'])
+    base, selection = split_filters(filters)
+    
+    assert base.stakes_filter == ['$1/$2']
+    assert base.model_copy(update=selection) == normalize_filters(filters)
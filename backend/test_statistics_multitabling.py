@@ -0,0 +1,94 @@
+"""
+Test the sweep-line multi-tabling analysis.
+"""
+import random
+import pytest
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from app.services.statistics_multitabling import MultiTablingBuilder, concurrency_segments, table_intervals
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def at_table(hands, table, first_minute):
+    """Seat hands at a cash table, one a minute from first_minute on."""
+    for minute, hand in enumerate(hands, start=first_minute):
+        hand.game_format = 'cash'
+        hand.cash_game_info = {'table_name': table}
+        hand.date_played = START + timedelta(minutes=minute)
+    return hands
+
+
+def test_sweep_matches_counting_open_intervals():
+    """Each segment's table count equals the intervals covering it, and segments cover exactly the open time."""
+    rng = random.Random(7)
+    intervals = []
+    for _ in range(300):
+        start = rng.randint(0, 5000)
+        intervals.append((float(start), float(start + rng.randint(1, 300))))
+    
+    segments = concurrency_segments(intervals)
+    
+    for start, end, tables in segments:
+        middle = (start + end) / 2
+        assert tables == sum(1 for low, high in intervals if low <= middle < high)
+    for point in range(0, 5300, 7):
+        open_tables = sum(1 for low, high in intervals if low <= point < high)
+        inside = any(start <= point < end for start, end, _ in segments)
+        assert inside == (open_tables > 0)
+
+
+def test_table_intervals_split_at_idle_gaps():
+    """A table closes after the idle gap and its last hand lasts the interval's average hand time."""
+    records = [(float(second), 'A', 0, None, False) for second in (0, 60, 120, 1000, 5000)]
+    
+    intervals = sorted(table_intervals(records, idle_seconds=600))
+    
+    assert intervals == [(0.0, 180.0), (1000.0, 1060.0), (5000.0, 5060.0)]
+
+
+def test_hands_per_hour_and_win_rate_by_tables(make_hands, make_service):
+    """Two overlapping tables give one-table and two-table buckets with their hands and hours."""
+    hands = at_table(make_hands(60, seed=1), 'Alpha', 0) + at_table(make_hands(60, seed=2), 'Beta', 30)
+    for hand in hands:
+        hand.net_result = Decimal('0.50')
+        hand.big_blind = Decimal('1.00')
+    
+    analysis = MultiTablingBuilder(make_service(hands), timedelta(minutes=10)).add_all(hands).finalize(True)
+    
+    one, two = analysis.buckets
+    assert (one.tables, one.hands, one.hours, one.hands_per_hour) == (1, 60, Decimal('1.00'), Decimal('60.00'))
+    assert (two.tables, two.hands, two.hours, two.hands_per_hour) == (2, 60, Decimal('0.50'), Decimal('120.00'))
+    assert one.win_rate == two.win_rate == Decimal('50.00')
+    assert analysis.max_tables == 2
+    assert analysis.tables_played == 2
+    assert analysis.average_tables == Decimal('1.33')
+    assert [segment.tables for segment in analysis.timeline] == [1, 2, 1]
+    assert analysis.timeline[-1].end == START + timedelta(minutes=90)
+
+
+@pytest.mark.asyncio
+async def test_service_analyses_stored_hands(user_id, make_hands, stored_hands_service):
+    """Tournament hands are tables of their own; hands without a table are left out."""
+    cash = at_table(make_hands(40, seed=3), 'Alpha', 0)
+    tournament = make_hands(40, seed=4)
+    for minute, hand in enumerate(tournament):
+        hand.game_format = 'tournament'
+        hand.tournament_info = {'tournament_id': 'T1'}
+        hand.date_played = START + timedelta(minutes=minute, seconds=30)
+    unknown = at_table(make_hands(5, seed=5), None, 0)
+    service, engine = await stored_hands_service(cash + tournament + unknown)
+    
+    try:
+        analysis = await service.calculate_multitabling(user_id)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    assert analysis.total_hands == 80
+    assert analysis.tables_played == 2
+    assert analysis.max_tables == 2
+    assert analysis.timeline is None
+    assert sum(bucket.hands for bucket in analysis.buckets) == 80
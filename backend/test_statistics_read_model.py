@@ -0,0 +1,34 @@
+"""
+Test that statistics read through the column-projected query match ORM-loaded hands.
+"""
+import pytest
+
+from app.models.hand import PokerHand
+from app.services.statistics_read_model import select_statistics_hands
+
+
+def test_statistics_query_skips_unused_columns(user_id):
+    """The projected query selects none of the large hand columns."""
+    sql = str(select_statistics_hands(PokerHand.user_id == user_id))
+    
+    for column in ('raw_text', 'player_stacks', 'timebank_info', 'player_cards'):
+        assert column not in sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(3))
+async def test_projected_rows_match_orm_hands(seed, user_id, make_hands, make_service, stored_hands_service):
+    """Statistics over projected rows equal those over full PokerHand objects."""
+    hands = make_hands(120, seed)
+    for hand in hands:
+        hand.raw_text = "PokerStars Hand #1: " + "x" * 2000
+    expected = await make_service(hands)._calculate_all_statistics_internal(user_id)
+    
+    service, engine = await stored_hands_service(hands)
+    try:
+        actual = await service._calculate_all_statistics_internal(user_id)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    assert actual == expected
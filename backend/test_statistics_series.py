@@ -0,0 +1,141 @@
+"""
+Test the NumPy time-series engine and the trend options built on it.
+"""
+import random
+import numpy as np
+import pytest
+from datetime import datetime, timezone, timedelta
+from decimal import Decimal
+
+from app.schemas.statistics import TrendOptions
+from app.services import statistics_series
+
+
+def noisy_series(count, seed, shifts=()):
+    """Bucket rates around 25 with hand counts as weights, plus level shifts at (index, size)."""
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(5, 80, size=count).astype(float)
+    values = rng.normal(25, 40 / np.sqrt(weights))
+    for index, size in shifts:
+        values[index:] += size
+    return values, weights
+
+
+def recent_hands(hands, seed, days):
+    """Spread hands over the last days, so every trend period covers them."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    for hand in hands:
+        hand.date_played = now - timedelta(seconds=rng.randint(60, days * 24 * 3600))
+    return hands
+
+
+def test_ewma_matches_recursive_definition():
+    """Blockwise decayed sums equal the one-value-at-a-time recursion over a long series."""
+    values, weights = noisy_series(5000, seed=1)
+    alpha = 2 / 31
+    numerator = denominator = 0.0
+    expected = []
+    for value, weight in zip(values, weights):
+        numerator = numerator * (1 - alpha) + value * weight
+        denominator = denominator * (1 - alpha) + weight
+        expected.append(numerator / denominator)
+    
+    assert np.allclose(statistics_series.ewma(values, weights, span=30), expected, rtol=1e-12)
+
+
+def test_rolling_mean_is_weighted_window_mean():
+    values, weights = noisy_series(50, seed=2)
+    
+    means = statistics_series.rolling_mean(values, weights, window=7)
+    
+    assert np.isnan(means[:6]).all()
+    for end in range(7, 51):
+        assert means[end - 1] == pytest.approx(np.average(values[end - 7:end], weights=weights[end - 7:end]))
+
+
+def test_linear_trend_matches_weighted_least_squares():
+    values, weights = noisy_series(40, seed=3)
+    positions = np.arange(40) * 2.0
+    values += 0.3 * positions
+    
+    line = statistics_series.linear_trend(positions, values, weights)
+    
+    slope, intercept = np.polyfit(positions, values, 1, w=np.sqrt(weights))
+    assert line.slope == pytest.approx(slope)
+    assert line.intercept == pytest.approx(intercept)
+    assert line.is_significant
+
+
+@pytest.mark.parametrize("t_statistic, degrees_of_freedom, p_value", [
+    (2.228, 10, 0.05),
+    (12.706, 1, 0.05),
+    (2.763, 28, 0.01),
+    (0.0, 5, 1.0),
+])
+def test_t_test_p_values(t_statistic, degrees_of_freedom, p_value):
+    assert statistics_series._t_test_p_value(t_statistic, degrees_of_freedom) == pytest.approx(p_value, abs=1e-4)
+
+
+def test_slopes_of_noise_are_rarely_significant():
+    """About one flat series in twenty has a significant slope at the 5% level."""
+    significant = sum(
+        statistics_series.linear_trend(np.arange(30), *noisy_series(30, seed)).is_significant
+        for seed in range(500)
+    )
+    
+    assert 10 <= significant <= 40
+
+
+def test_change_points_find_level_shifts():
+    values, weights = noisy_series(200, seed=1, shifts=[(60, -8), (120, 10)])
+    
+    found = statistics_series.change_points(values, weights)
+    
+    assert len(found) == 2
+    assert abs(found[0] - 60) <= 3 and abs(found[1] - 120) <= 3
+
+
+def test_change_points_ignore_noise():
+    assert all(statistics_series.change_points(*noisy_series(200, seed)) == [] for seed in range(20))
+
+
+@pytest.mark.asyncio
+async def test_trend_options_add_series_analysis(user_id, make_hands, make_service):
+    hands = recent_hands(make_hands(3000, seed=4), seed=4, days=85)
+    service = make_service(hands)
+    options = TrendOptions(interval_days=2, rolling_window=5, ewma_span=4, change_points=True)
+    
+    plain = await service._calculate_performance_trends_internal(user_id, "90d", ["vpip"])
+    trend, = await service._calculate_performance_trends_internal(user_id, "90d", ["vpip"], options)
+    
+    points = trend.data_points
+    assert plain[0].slope is None and plain[0].data_points[0].ewma is None
+    assert len(points) > len(plain[0].data_points)
+    assert all(later.date - earlier.date >= timedelta(days=2) for earlier, later in zip(points, points[1:]))
+    assert [point.rolling_average for point in points[:4]] == [None] * 4
+    window = points[:5]
+    expected = sum(point.value * point.hands_sample for point in window) / sum(point.hands_sample for point in window)
+    assert abs(points[4].rolling_average - expected) <= Decimal('0.01')
+    assert all(point.ewma is not None for point in points)
+    assert Decimal('0') <= trend.p_value <= Decimal('1')
+    assert all(date in [point.date for point in points] for date in trend.change_points)
+
+
+@pytest.mark.asyncio
+async def test_all_period_starts_at_the_first_hand(user_id, make_hands, stored_hands_service):
+    hands = recent_hands(make_hands(400, seed=5), seed=5, days=600)
+    service, engine = await stored_hands_service(hands)
+    
+    try:
+        trend, = await service._calculate_performance_trends_internal(
+            user_id, "all", ["vpip"], TrendOptions(interval_days=30)
+        )
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    first_played = min(hand.date_played for hand in hands)
+    assert trend.data_points[0].date <= first_played < trend.data_points[0].date + timedelta(days=30)
+    assert sum(point.hands_sample for point in trend.data_points) == len(hands)
+    assert trend.slope is None
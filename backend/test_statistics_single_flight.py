@@ -0,0 +1,125 @@
+"""
+Test that identical concurrent statistics requests share one calculation, in a process and across workers.
+"""
+import asyncio
+import pytest
+
+from app.schemas.statistics import StatisticsFilters
+from app.services.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_calculate_once(user_id, make_hands, slow_service):
+    service = slow_service(make_hands(200, seed=1))
+    filters = StatisticsFilters(cash_only=True)
+    
+    responses = await asyncio.gather(*(service.calculate_filtered_statistics(user_id, filters) for _ in range(5)))
+    
+    assert service.db.execute.await_count == 1
+    assert service.flights.coalesced == 4
+    assert all(response is responses[0] for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_coalesced(user_id, make_hands, slow_service):
+    service = slow_service(make_hands(200, seed=2))
+    
+    await asyncio.gather(
+        service.calculate_filtered_statistics(user_id, StatisticsFilters(cash_only=True)),
+        service.calculate_filtered_statistics(user_id, StatisticsFilters(tournament_only=True)),
+        service.calculate_basic_statistics(user_id, StatisticsFilters(cash_only=True)),
+    )
+    
+    assert service.db.execute.await_count == 3
+    assert service.flights.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_workers_wait_for_the_lock_holder(user_id, make_hands, locking_redis, worker_cache, slow_service):
+    caches = [await worker_cache(locking_redis) for _ in range(3)]
+    services = [slow_service(make_hands(200, seed=3), cache) for cache in caches]
+    filters = StatisticsFilters()
+    
+    try:
+        responses = await asyncio.gather(*(
+            service.calculate_filtered_statistics(user_id, filters) for service in services for _ in range(2)
+        ))
+        stats = await caches[0].get_cache_stats()
+    finally:
+        for cache in caches:
+            await cache.disconnect()
+    
+    assert sum(service.db.execute.await_count for service in services) == 1
+    # The calculation or exact cached copies of it
+    assert all(response == responses[0] for response in responses)
+    assert responses[0].sample_size == 200
+    assert stats['coalesced_requests'] == {'in_process': 3, 'cross_worker': 2}
+    assert not [key for key in locking_redis.values if key.startswith('lock:')]
+
+
+@pytest.mark.asyncio
+async def test_waiters_calculate_when_the_lock_holder_fails(
+    user_id, make_hands, locking_redis, worker_cache, slow_service
+):
+    cache = await worker_cache(locking_redis)
+    service = slow_service(make_hands(50, seed=4), cache)
+    service.retry_config['max_attempts'] = 1
+    flight_key = service._flight_key("calculate_filtered_statistics", user_id, StatisticsFilters())
+    token = await cache.acquire_lock(flight_key, 30)
+    
+    async def failing_holder():
+        await asyncio.sleep(0.1)
+        await cache.release_lock(flight_key, token)
+    
+    try:
+        response, _ = await asyncio.gather(
+            service.calculate_filtered_statistics(user_id, StatisticsFilters()), failing_holder()
+        )
+    finally:
+        await cache.disconnect()
+    
+    assert response.sample_size == 50
+    assert service.db.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_followers_share_the_leaders_error_and_retry_after():
+    flights = SingleFlight()
+    calls = []
+    
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+    
+    results = await asyncio.gather(*(flights.run('key', failing) for _ in range(3)), return_exceptions=True)
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    
+    async def working():
+        calls.append(1)
+        return 42
+    
+    assert await flights.run('key', working) == (42, False)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_a_follower_takes_over_from_a_cancelled_leader():
+    flights = SingleFlight()
+    started = []
+    
+    async def calculate():
+        started.append(1)
+        await asyncio.sleep(0.05)
+        return len(started)
+    
+    leader = asyncio.create_task(flights.run('key', calculate))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flights.run('key', calculate))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    
+    assert await follower == (2, False)
+    with pytest.raises(asyncio.CancelledError):
+        await leader
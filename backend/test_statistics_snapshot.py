@@ -0,0 +1,117 @@
+"""
+Test that calculators given a request's loaded hands match their own queries.
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from app.api.v1.endpoints.stats import get_statistics_summary
+from app.core.config import settings
+from app.schemas.statistics import StatisticsFilters
+from app.services.statistics_service import StatisticsService
+
+
+FILTERS = [
+    None,
+    StatisticsFilters(game_format='cash'),
+    StatisticsFilters(position='BTN'),
+    StatisticsFilters(start_date=datetime(2024, 1, 1, 1, tzinfo=timezone.utc), stakes_filter=['$0.50/$1.00']),
+    StatisticsFilters(tournament_only=True, end_date=datetime(2024, 1, 1, 2, tzinfo=timezone.utc)),
+]
+
+
+def matches(hand, filters):
+    """Python version of the filters the statistics queries apply."""
+    if filters is None:
+        return True
+    return (
+        (not filters.game_format or hand.game_format == filters.game_format)
+        and (not filters.position or hand.position == filters.position)
+        and (not filters.start_date or hand.date_played >= filters.start_date)
+        and (not filters.end_date or hand.date_played <= filters.end_date)
+        and (not filters.stakes_filter or hand.stakes in filters.stakes_filter)
+        and (not filters.tournament_only or hand.game_format == 'tournament')
+    )
+
+
+def recent_hands(hands):
+    """Play hands in sessions of 20 a day over the last weeks, in order."""
+    start = datetime.now(timezone.utc) - timedelta(days=len(hands) // 20 + 1)
+    for i, hand in enumerate(hands):
+        hand.date_played = start + timedelta(days=i // 20, minutes=2 * (i % 20))
+    return hands
+
+
+def counting_queries(monkeypatch, session):
+    """Count the statements a session executes."""
+    calls = []
+    execute = session.execute
+    
+    async def counted(*args, **kwargs):
+        calls.append(args[0])
+        return await execute(*args, **kwargs)
+    
+    monkeypatch.setattr(session, 'execute', counted)
+    return calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("filters", FILTERS)
+async def test_calculators_given_hands_match_their_queries(filters, user_id, make_hands, calculate_separately):
+    hands = [hand for hand in make_hands(200, seed=4) if matches(hand, filters)]
+    db = MagicMock()
+    db.execute = AsyncMock(side_effect=AssertionError("hand query reached the database"))
+    service = StatisticsService(db, use_hand_facts=False, use_daily_rollups=False)
+    
+    actual = (
+        await service._calculate_basic_statistics_internal(user_id, filters, hands=hands),
+        await service._calculate_advanced_statistics_internal(user_id, filters, hands=hands),
+        await service._calculate_positional_statistics_internal(user_id, filters, hands=hands),
+        await service._calculate_tournament_statistics_internal(user_id, filters, hands=hands),
+    )
+    
+    assert actual == await calculate_separately(hands)
+
+
+@pytest.mark.asyncio
+async def test_summary_loads_hands_in_one_query(monkeypatch, user_id, make_hands, stored_hands_service):
+    service, engine = await stored_hands_service(recent_hands(make_hands(300, seed=2)))
+    user = MagicMock(id=user_id)
+    queries = counting_queries(monkeypatch, service.db)
+    
+    try:
+        summary = await get_statistics_summary(current_user=user, db=service.db)
+        snapshot_queries = len(queries)
+        
+        # Users with more hands than the snapshot holds are queried per calculator
+        monkeypatch.setattr(settings, 'STATISTICS_SNAPSHOT_MAX_HANDS', 100)
+        queried = await get_statistics_summary(current_user=user, db=service.db)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    assert snapshot_queries == 1
+    assert len(queries) > 2
+    assert summary.recent_sessions
+    assert summary.model_dump(exclude={'last_updated'}) == queried.model_dump(exclude={'last_updated'})
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_bounded_and_filtered(user_id, make_hands, stored_hands_service):
+    hands = make_hands(50, seed=3)
+    service, engine = await stored_hands_service(hands)
+    
+    try:
+        service.snapshot_max_hands = 50
+        snapshot = await service.load_snapshot(user_id)
+        cash = await service.load_snapshot(user_id, StatisticsFilters(game_format='cash'))
+        service.snapshot_max_hands = 49
+        too_many = await service.load_snapshot(user_id)
+    finally:
+        await service.db.close()
+        await engine.dispose()
+    
+    assert [hand.id for hand in snapshot.hands] == [hand.id for hand in hands]
+    assert len(cash.hands) == sum(hand.game_format == 'cash' for hand in hands)
+    assert too_many is None
+    assert len(snapshot.played_since(hands[10].date_played)) == 40
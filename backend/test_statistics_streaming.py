@@ -0,0 +1,49 @@
+"""
+Test that streaming hands in chunks gives the same statistics as loading them at once.
+"""
+import pytest
+
+from app.models.hand import PokerHand
+from app.services.statistics_read_model import select_statistics_hands
+
+
+@pytest.fixture
+async def streaming_service(make_hands, stored_hands_service):
+    """Row-path service over stored hands, streaming them in chunks of 7."""
+    service, engine = await stored_hands_service(make_hands(150, seed=5))
+    service.stream_chunk_size = 7
+    yield service
+    await service.db.close()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_hand_chunks_are_bounded(streaming_service, user_id):
+    """The cursor yields every matching hand in chunks no larger than the chunk size."""
+    chunks = [
+        chunk async for chunk in streaming_service._iter_hand_chunks(
+            select_statistics_hands(PokerHand.user_id == user_id)
+        )
+    ]
+    
+    assert max(len(chunk) for chunk in chunks) <= 7
+    assert sum(len(chunk) for chunk in chunks) == 150
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ['python', 'numpy'])
+async def test_streamed_statistics_match_loading_all_hands(streaming_service, backend, user_id):
+    """Every calculator gives identical results whether hands are streamed or loaded at once."""
+    async def calculate_all():
+        return (
+            await streaming_service._calculate_all_statistics_internal(user_id),
+            await streaming_service._calculate_basic_statistics_internal(user_id, backend=backend),
+            await streaming_service._calculate_positional_statistics_internal(user_id, backend=backend),
+            await streaming_service._calculate_advanced_statistics_internal(user_id, backend=backend),
+        )
+    
+    streamed = await calculate_all()
+    streaming_service.stream_chunk_size = 0
+    loaded = await calculate_all()
+    
+    assert streamed == loaded
@@ -0,0 +1,60 @@
+"""
+Test that the NumPy statistics backend matches the per-hand loop.
+"""
+import random
+import numpy as np
+import pytest
+
+from app.services import statistics_vectorized
+from app.services.statistics_vectorized import HandColumns, _exact_sum_of_squares
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", range(5))
+async def test_numpy_backend_matches_python_loop(seed, make_hands, calculate_with_backend):
+    """Vectorized statistics are identical to the per-hand loop."""
+    hands = make_hands(300, seed)
+    
+    assert await calculate_with_backend(hands, 'numpy') == await calculate_with_backend(hands, 'python')
+
+
+@pytest.mark.asyncio
+async def test_numpy_backend_empty_hand_set(calculate_with_backend):
+    """Vectorized statistics match the per-hand loop when there are no hands."""
+    assert await calculate_with_backend([], 'numpy') == await calculate_with_backend([], 'python')
+
+
+@pytest.mark.asyncio
+async def test_backend_defaults_to_service_setting(user_id, make_hands, make_service):
+    """Calls without a backend use the service's backend, and unknown backends are rejected."""
+    hands = make_hands(50, seed=1)
+    service = make_service(hands)
+    service.backend = 'numpy'
+    
+    assert service._use_vectorized_backend(None)
+    assert not service._use_vectorized_backend('python')
+    with pytest.raises(ValueError):
+        await service._calculate_basic_statistics_internal(user_id, backend='fortran')
+
+
+def test_decoded_columns_keep_position_order(make_hands, make_service):
+    """Position codes follow first-seen order and hands without a position get no code."""
+    hands = make_hands(80, seed=2)
+    columns = HandColumns.decode(make_service(hands), hands)
+    
+    seen = list(dict.fromkeys(hand.position for hand in hands if hand.position is not None))
+    assert columns.positions == seen
+    assert len(columns) == len(hands)
+    assert [
+        columns.positions[code] if code != statistics_vectorized.NO_POSITION else None
+        for code in columns.column('position_code')
+    ] == [hand.position for hand in hands]
+
+
+@pytest.mark.parametrize("magnitude", [10 ** 3, 10 ** 8, 10 ** 12])
+def test_exact_sum_of_squares(magnitude):
+    """Sums of squares are exact for small values and for values that overflow int64 squares."""
+    rng = random.Random(magnitude)
+    values = [rng.randint(-magnitude, magnitude) for _ in range(1000)]
+    
+    assert _exact_sum_of_squares(np.array(values, dtype=np.int64)) == sum(value * value for value in values)